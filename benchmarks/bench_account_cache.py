@@ -0,0 +1,115 @@
+"""
+잔고/대기 주문 캐시 벤치마크
+
+로컬 업비트 스탠드인 서버에서 에이전트의 전형적인 매매 흐름(잔고 조회 -> 대기 주문 조회 -> 지정가 주문 ->
+대기 주문/잔고 확인 -> 취소 -> 대기 주문/잔고 확인)을 도구 함수로 반복하면서, 캐시 없이(TTL 0),
+TTL 캐시 + 주문/취소 반영(write-through), 내 주문/자산 웹소켓 스탠드인 연결 세 방식의
+비공개 API 요청 수와 소요 시간을 비교합니다. 매 단계에서 도구가 돌려준 대기 주문/KRW 잔고가
+스탠드인 계정의 실제 상태와 같은지도 확인합니다 (불일치가 있으면 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_account_cache [--rounds 20] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import warnings
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+ACCESS_KEY = "bench-access-key"
+SECRET_KEY = "bench-secret-key"
+MARKET = "KRW-XRP"
+
+
+async def _session(server: MockUpbitServer, rounds: int, errors: list[str], mode: str) -> None:
+    from tools.cancel_order import cancel_order
+    from tools.create_order import create_order
+    from tools.get_accounts import get_accounts
+    from tools.get_orders import get_orders
+
+    def truth_open() -> set[str]:
+        with server.lock:
+            return {o["uuid"] for o in server.account.orders if o["state"] == "wait" and o["market"] == MARKET}
+
+    def truth_krw() -> str:
+        with server.lock:
+            return f"{server.account.balances['KRW'][0]:.8f}"
+
+    async def check_orders(step: str) -> None:
+        orders = await get_orders(market=MARKET, state="wait")
+        if {o["uuid"] for o in orders} != truth_open():
+            errors.append(f"{mode} {step}: open orders differ from the account")
+
+    async def check_accounts(step: str) -> None:
+        krw = next(a for a in await get_accounts() if a["currency"] == "KRW")
+        if abs(float(krw["balance"]) - float(truth_krw())) > 1e-6:
+            errors.append(f"{mode} {step}: KRW balance {krw['balance']} != {truth_krw()}")
+
+    for i in range(rounds):
+        await check_accounts("before order")
+        await check_orders("before order")
+        order = await create_order(MARKET, "bid", "limit", volume="1", price=str(1000 + i))
+        await check_orders("after order")
+        await check_accounts("after order")
+        await cancel_order(order["uuid"])
+        await check_orders("after cancel")
+        await check_accounts("after cancel")
+
+
+async def main(rounds: int, latency: float) -> None:
+    from benchmarks.mock_upbit_ws import MockPrivateWebSocket
+
+    with MockUpbitServer(latency=latency, secret_key=SECRET_KEY) as server, \
+            MockPrivateWebSocket(server.account, secret_key=SECRET_KEY) as ws:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_ACCESS_KEY"] = ACCESS_KEY
+        os.environ["UPBIT_SECRET_KEY"] = SECRET_KEY
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core.account_state import get_account_state
+        from core.http import http_lifespan
+
+        # fastmcp 0.4 의 Context 가 없으므로 경고는 없지만, 웹소켓 종료 시 경고를 숨긴다
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        state = get_account_state()
+        errors, rows = [], []
+        async with http_lifespan():
+            for mode, ttl, live in (("no cache", 0.0, False), ("ttl 2s", 2.0, False), ("websocket", 0.0, True)):
+                state.ttl = ttl
+                state.invalidate()
+                if live:
+                    state.ws_url = ws.url
+                    state.start()
+                    while not state.live:
+                        await asyncio.sleep(0.01)
+                server.reset_counts()
+                start = time.perf_counter()
+                await _session(server, rounds, errors, mode)
+                elapsed = time.perf_counter() - start
+                rows.append((mode, elapsed, server.request_count))
+                if live:
+                    await state.stop()
+
+    calls = rounds * 8
+    print(f"{rounds} rounds x 8 tool calls ({calls} calls), {latency * 1000:.0f}ms latency")
+    base = rows[0][2]
+    for mode, elapsed, requests in rows:
+        print(f"{mode:10s}: {elapsed:6.2f}s  {requests:4d} private requests  "
+              f"({requests / calls:.2f}/call, {1 - requests / base:.0%} fewer)")
+    print(f"websocket events received: {ws.events}")
+    print(f"check: {len(errors)} errors")
+    for error in errors[:10]:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds, args.latency))
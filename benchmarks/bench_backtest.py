@@ -0,0 +1,211 @@
+"""
+백테스트 검증 및 벤치마크
+
+core.backtest 의 벡터화된 신호/체결 계산이 캔들을 하나씩 도는 단순 구현과 같은 결과를 내는지
+모든 전략과 몇 가지 파라미터 조합에 대해 확인합니다 (불일치가 있으면 종료 코드 1).
+단순 구현은 technical_analysis 의 신호 판단을 캔들마다 그대로 적용하고, 현금/수량으로 체결을 따라갑니다.
+이어서 여러 마켓 x 파라미터 조합 스윕의 초당 실행 수를 단순 구현과 비교합니다.
+
+실행:
+    python -m benchmarks.bench_backtest [--markets 20] [--candles 1000]
+"""
+import argparse
+import itertools
+import math
+import sys
+import time
+
+import numpy as np
+
+from core.backtest import KRW_TICK_TABLE, STRATEGIES, backtest_task, param_grid
+from core.indicators import bollinger, compute_all, sma
+
+FEE = 0.0005
+RTOL = 1e-9
+
+SWEEP = {
+    "ma_fast": [3, 5, 10],
+    "ma_slow": [20, 30, 60],
+    "rsi_oversold": [20, 25, 30, 35, 40],
+    "rsi_overbought": [60, 65, 70, 75, 80],
+}
+
+
+def _arrays(markets: int, candles: int, seed: int = 0) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = rng.choice([500.0, 30_000.0, 1_500_000.0], (markets, 1)) \
+        * np.exp(np.cumsum(rng.normal(0, 0.01, (markets, candles)), axis=1))
+    opening = np.concatenate([close[:, :1], close[:, :-1]], axis=1) * (1 + rng.normal(0, 0.001, close.shape))
+    spread = rng.random(close.shape) * 0.01
+    return {
+        "opening_price": opening,
+        "high_price": np.maximum(close, opening) * (1 + spread),
+        "low_price": np.minimum(close, opening) * (1 - spread),
+        "trade_price": close,
+    }
+
+
+def _tick(price: float) -> float:
+    for bound, tick in KRW_TICK_TABLE:
+        if price >= bound:
+            return tick
+    return KRW_TICK_TABLE[-1][1]
+
+
+def _fill(price: float, up: bool) -> float:
+    tick = _tick(price)
+    steps = price / tick
+    if math.isclose(steps, round(steps), rel_tol=1e-9, abs_tol=1e-8):
+        steps = round(steps)
+    return (math.ceil(steps) if up else math.floor(steps)) * tick
+
+
+def _labels(i: int, s: dict, close: float, p: dict) -> dict:
+    """technical_analysis 와 같은 방식의 캔들 i 시점 규칙별 라벨"""
+    def value(name):
+        x = float(s[name][i])
+        return None if math.isnan(x) else x
+
+    result = {}
+    fast, slow = value("fast"), value("slow")
+    if fast and slow:
+        result["ma"] = "상승 추세 (황금 교차)" if fast > slow else "하락 추세 (죽음의 교차)" if fast < slow else "중립"
+    rsi = value("rsi")
+    if rsi is not None:
+        result["rsi"] = "과매수" if rsi > p["rsi_overbought"] else "과매도" if rsi < p["rsi_oversold"] else "중립"
+    upper, lower = value("bb_upper"), value("bb_lower")
+    if upper and lower:
+        result["bb"] = "과매수 (상단 돌파)" if close > upper else "과매도 (하단 돌파)" if close < lower else "중립 (밴드 내)"
+    line, signal = value("macd"), value("macd_signal")
+    if line is not None and signal is not None:
+        result["macd"] = "매수 신호" if line > signal else "매도 신호" if line < signal else "중립"
+    k, d = value("stoch_k"), value("stoch_d")
+    if k is not None and d is not None:
+        if k > 80 and d > 80:
+            result["stoch"] = "과매수"
+        elif k < 20 and d < 20:
+            result["stoch"] = "과매도"
+        else:
+            result["stoch"] = "상승 중" if k > d else "하락 중" if k < d else "중립"
+    return result
+
+
+def _decide(strategy: str, labels: dict, holding: bool) -> bool:
+    if strategy == "overall":
+        count = len(labels)
+        buys = sum(1 for x in labels.values() if "매수" in x or "상승" in x)
+        sells = sum(1 for x in labels.values() if "매도" in x or "하락" in x)
+        oversold = sum(1 for x in labels.values() if "과매도" in x)
+        overbought = sum(1 for x in labels.values() if "과매수" in x)
+        if count > 0:
+            if buys / count > 0.6 or oversold >= 2:
+                return True
+            if sells / count > 0.6 or overbought >= 2:
+                return False
+        return holding
+    key = {"ma_cross": "ma", "rsi": "rsi", "bollinger": "bb", "macd": "macd", "stochastic": "stoch"}[strategy]
+    label = labels.get(key)
+    if strategy in ("ma_cross", "macd"):
+        return label is not None and ("상승" in label or "매수" in label)
+    if label is None:
+        return holding
+    if "과매도" in label:
+        return True
+    if "과매수" in label:
+        return False
+    return holding
+
+
+def loop_backtest(arrays: dict, row: int, strategy: str, p: dict) -> dict:
+    """캔들을 하나씩 도는 참조 구현 (현금/수량으로 체결을 따라감)"""
+    o, h, low, c = (arrays[name][row] for name in ("opening_price", "high_price", "low_price", "trade_price"))
+    s = compute_all(h, low, c, np.ones_like(c))
+    s["fast"], s["slow"] = sma(c, int(p["ma_fast"])), sma(c, int(p["ma_slow"]))
+    s["bb_upper"], _, s["bb_lower"] = bollinger(c, 20, p["bb_width"])
+
+    cash, qty, target = 1.0, 0.0, False
+    equity_peak, drawdown, trades, wins, closed, held_candles = 1.0, 0.0, 0, 0, 0, 0
+    entry_equity = 1.0
+    for i in range(len(c)):
+        if i > 0:
+            if target and qty == 0:
+                entry_equity = cash
+                qty = cash / (_fill(o[i], True) * (1 + FEE))
+                cash = 0.0
+                trades += 1
+            elif not target and qty > 0:
+                cash = qty * _fill(o[i], False) * (1 - FEE)
+                qty = 0.0
+                closed += 1
+                wins += cash > entry_equity
+        held_candles += qty > 0
+        equity = cash + qty * c[i]
+        equity_peak = max(equity_peak, equity)
+        drawdown = max(drawdown, 1 - equity / equity_peak)
+        target = _decide(strategy, _labels(i, s, c[i], p), target)
+    return {
+        "total_return": cash + qty * c[-1] - 1,
+        "max_drawdown": drawdown,
+        "trades": trades,
+        "win_rate": wins / closed if closed else math.nan,
+        "exposure": held_candles / len(c),
+    }
+
+
+def check_parity(arrays: dict, markets: list[str]) -> int:
+    grid = {"ma_fast": [3, 5], "ma_slow": [20], "rsi_oversold": [25, 30], "rsi_overbought": [70], "bb_width": [1.5, 2.0]}
+    params = param_grid(grid)
+    errors, checks = [], 0
+    for strategy in STRATEGIES:
+        runs = backtest_task(arrays, markets, strategy, grid, FEE)
+        for run in runs:
+            row = markets.index(run["market"])
+            expected = loop_backtest(arrays, row, strategy, run["params"])
+            checks += 1
+            for name, value in expected.items():
+                actual = run[name]
+                if math.isnan(value) and math.isnan(actual):
+                    continue
+                if not math.isclose(actual, value, rel_tol=RTOL, abs_tol=1e-12):
+                    errors.append(f"{strategy} {run['market']} {run['params']} {name}: vectorized={actual} loop={value}")
+    print(f"parity: {checks} runs ({len(STRATEGIES)} strategies x {len(markets)} markets x "
+          f"{len(params['ma_fast'])} param combos) checked, {len(errors)} mismatches")
+    for error in errors[:10]:
+        print("  " + error)
+    return len(errors)
+
+
+def main(markets: int, candles: int) -> None:
+    arrays = _arrays(markets, candles)
+    names = [f"KRW-M{i:03d}" for i in range(markets)]
+
+    mismatches = check_parity({k: v[:3] for k, v in arrays.items()}, names[:3])
+
+    combos = len(param_grid(SWEEP)["ma_fast"])
+    runs = markets * combos
+    print(f"sweep: {markets} markets x {combos} param combos = {runs} runs on {candles} candles")
+    for strategy in ("rsi", "overall"):
+        start = time.perf_counter()
+        results = backtest_task(arrays, names, strategy, SWEEP, FEE)
+        elapsed = time.perf_counter() - start
+        assert len(results) == runs
+        print(f"  {strategy:8s} vectorized : {elapsed * 1e3:8.1f}ms  {runs / elapsed:10.0f} runs/s")
+
+    # 단순 구현은 느리므로 일부 조합만 재서 초당 실행 수로 환산
+    sample = list(itertools.islice(itertools.product(*SWEEP.values()), 10))
+    start = time.perf_counter()
+    for values in sample:
+        loop_backtest(arrays, 0, "overall", {**dict(zip(SWEEP, values)), "bb_width": 2.0})
+    elapsed = time.perf_counter() - start
+    print(f"  overall  loop       : {elapsed / len(sample) * 1e3:8.1f}ms/run {len(sample) / elapsed:10.0f} runs/s")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--markets", type=int, default=20)
+    parser.add_argument("--candles", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.markets, args.candles)
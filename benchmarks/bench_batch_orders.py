@@ -0,0 +1,119 @@
+"""
+일괄 주문/취소 벤치마크
+
+업비트와 같은 요청 수 한도(주문 생성 초당 8회, 취소 등 그 밖의 거래 API 초당 30회)와 지연이 있는
+로컬 업비트 스탠드인 서버에서, 지정가 분할 주문 N개를
+create_order 도구 N번 호출로 넣는 방식과 create_orders 한 번으로 넣는 방식, 그리고 cancel_order N번과
+cancel_all 한 번을 메모리 스트림으로 연결한 MCP 클라이언트로 비교합니다.
+한 주문에 400 오류를 주입해 일부 실패가 주문별로 보고되는지, 잘못된 주문이 섞이면 아무 주문도
+나가지 않는지, 끝난 뒤 계정에 대기 주문이 남지 않는지도 확인합니다 (실패 시 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_batch_orders [--orders 20] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+ACCESS_KEY = "bench-access-key"
+SECRET_KEY = "bench-secret-key"
+MARKET = "KRW-XRP"
+
+
+def _payload(result) -> dict:
+    return json.loads(result.content[0].text)
+
+
+def _ladder(count: int) -> list[dict]:
+    return [{"market": MARKET, "side": "bid", "ord_type": "limit", "volume": "10", "price": str(500 + i)}
+            for i in range(count)]
+
+
+async def main(count: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency, rate_limit={"order": 8, "default": 30}, secret_key=SECRET_KEY) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_ACCESS_KEY"] = ACCESS_KEY
+        os.environ["UPBIT_SECRET_KEY"] = SECRET_KEY
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = tempfile.mkdtemp(prefix="bench-batch-")
+
+        from mcp.shared.memory import create_connected_server_and_client_session
+        import main as server_main
+
+        warnings.filterwarnings("ignore", message="coroutine .* was never awaited", category=RuntimeWarning)
+        logging.getLogger("mcp").setLevel(logging.WARNING)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        def open_orders(side: str = "bid") -> int:
+            with server.lock:
+                return sum(1 for o in server.account.orders
+                           if o["state"] == "wait" and o["market"] == MARKET and o["side"] == side)
+
+        errors, rows = [], []
+        baseline = open_orders()
+        asks = open_orders("ask")
+        async with server_main.lifespan(server_main.mcp):
+            async with create_connected_server_and_client_session(server_main.mcp._mcp_server) as session:
+                async def timed(label: str, calls: list[tuple[str, dict]]) -> list[dict]:
+                    server.reset_counts()
+                    start = time.perf_counter()
+                    results = [_payload(await session.call_tool(name, args)) for name, args in calls]
+                    rows.append((label, len(calls), time.perf_counter() - start, server.request_count,
+                                 server.throttled_count))
+                    return results
+
+                created = await timed("create_order x N", [("create_order", o) for o in _ladder(count)])
+                if any("error" in r for r in created) or open_orders() != baseline + count:
+                    errors.append("create_order loop: orders missing")
+                await timed("cancel_order x N", [("cancel_order", {"uuid": r["uuid"]}) for r in created])
+                if open_orders() != baseline:
+                    errors.append("cancel_order loop: orders left open")
+
+                await asyncio.sleep(1.1)  # 앞선 측정의 요청이 서버의 1초 구간에 남지 않도록
+                (batch,) = await timed("create_orders", [("create_orders", {"orders": _ladder(count)})])
+                if batch.get("succeeded") != count or open_orders() != baseline + count:
+                    errors.append(f"create_orders: {batch.get('succeeded')} of {count} placed")
+                await asyncio.sleep(1.1)
+                (cancelled,) = await timed("cancel_all", [("cancel_all", {"market": MARKET, "side": "bid"})])
+                if open_orders() != 0 or open_orders("ask") != asks or cancelled.get("failed"):
+                    errors.append(f"cancel_all: {open_orders()} bids left open, asks {asks} -> {open_orders('ask')}")
+
+                # 일부 실패: 한 주문만 거부되고 나머지는 들어가야 함
+                await asyncio.sleep(1.1)
+                server.fail("POST", "/orders", 1, status=400)
+                partial = _payload(await session.call_tool("create_orders", {"orders": _ladder(count)}))
+                if partial.get("succeeded") != count - 1 or partial.get("failed") != 1:
+                    errors.append(f"partial failure not reported per order: {partial.get('failed')} failed")
+                await session.call_tool("cancel_all", {"market": MARKET})
+
+                # 사전 검사: 잘못된 주문이 하나라도 있으면 아무것도 보내지 않음
+                server.reset_counts()
+                invalid = _payload(await session.call_tool(
+                    "create_orders", {"orders": _ladder(3) + [{"market": MARKET, "side": "bid", "ord_type": "limit"}]}
+                ))
+                if "invalid" not in invalid or server.group_counts.get("order"):
+                    errors.append("invalid batch was not rejected up front")
+
+    print(f"{count} limit orders, {latency * 1000:.0f}ms latency, order quota 8/s, cancel/default 30/s (client limiter on)")
+    for label, calls, elapsed, requests, throttled in rows:
+        print(f"{label:18s}: {elapsed:6.2f}s  {calls:3d} tool calls  {requests:3d} requests  {throttled} x 429")
+    print(f"check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.latency))
@@ -0,0 +1,70 @@
+"""
+로컬 캔들 저장소 벤치마크
+
+요청 수 제한(초당 10회)과 지연이 있는 로컬 업비트 스탠드인 서버에서 같은 분봉 구간을
+반복해서 읽을 때, 저장소 없이 매번 받는 경우와 저장소를 거치는 경우의 소요 시간과 업스트림 요청 수를 비교합니다.
+더 과거까지 늘려 읽을 때는 빠진 구간만 받아오는지도 확인합니다.
+
+실행:
+    python -m benchmarks.bench_candle_store [--count 5000] [--repeat 5] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+TO = "2025-01-01T00:00:00Z"
+
+
+async def _timed(server, fn, *args) -> tuple[float, int, object]:
+    server.request_count = 0
+    start = time.perf_counter()
+    result = await fn(*args)
+    return time.perf_counter() - start, server.request_count, result
+
+
+async def main(count: int, repeat: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency, rate_limit=10) as server, tempfile.TemporaryDirectory() as root:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = root
+
+        from core.http import http_lifespan
+        from core.candles import fetch_candles
+        from core.candle_store import get_candle_store, records_to_candles
+
+        store = get_candle_store()
+        async with http_lifespan():
+            rows = []
+            for _ in range(repeat):
+                await asyncio.sleep(1.1)
+                rows.append(("no store", *await _timed(server, fetch_candles, "KRW-BTC", "minute1", count, TO)))
+            direct = rows[-1][3]
+
+            for i in range(repeat):
+                await asyncio.sleep(1.1 if i == 0 else 0)
+                rows.append(("store (cold)" if i == 0 else "store (warm)",
+                             *await _timed(server, store.read, "KRW-BTC", "minute1", count, TO)))
+            stored = records_to_candles(rows[-1][3], "KRW-BTC", "minute1")
+
+            await asyncio.sleep(1.1)
+            rows.append(("store (+1000 older)",
+                         *await _timed(server, store.read, "KRW-BTC", "minute1", count + 1000, TO)))
+
+    assert [c["candle_date_time_utc"] for c in stored] == [c["candle_date_time_utc"] for c in direct]
+    assert [c["trade_price"] for c in stored] == [c["trade_price"] for c in direct]
+    print(f"{count} minute candles x {repeat}, {latency * 1000:.0f}ms latency, 10 req/s quota")
+    for label, elapsed, requests, result in rows:
+        print(f"{label:<20} {elapsed * 1000:9.2f}ms  upstream requests={requests:3d}  candles={len(result)}")
+    print(f"store stats: {store.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.repeat, args.latency))
@@ -0,0 +1,63 @@
+"""
+캔들 페이지 조회 벤치마크
+
+요청 수 제한(초당 10회)과 지연이 있는 로컬 업비트 스탠드인 서버에서 분봉 10,000개를
+to 커서를 한 페이지씩 따라가며 받는 방식과, 페이지 구간을 미리 계산해 동시에 받는 방식으로 비교합니다.
+
+실행:
+    python -m benchmarks.bench_candles [--count 10000] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+async def _walk_cursor(market: str, interval: str, count: int) -> list[dict]:
+    """이전처럼 to 커서를 한 페이지씩 순차로 따라가는 방식"""
+    from core.candles import fetch_page, parse_to
+
+    candles, to = [], None
+    while len(candles) < count:
+        page = await fetch_page(market, interval, min(200, count - len(candles)), to)
+        if not page:
+            break
+        candles.extend(page)
+        to = parse_to(page[-1]["candle_date_time_utc"])
+    return candles
+
+
+async def main(count: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency, rate_limit=10) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+
+        from core.http import http_lifespan
+        from core.candles import fetch_candles, candles_to_columns
+
+        async with http_lifespan():
+            start = time.perf_counter()
+            sequential = await _walk_cursor("KRW-BTC", "minute1", count)
+            sequential_elapsed = time.perf_counter() - start
+
+            await asyncio.sleep(1.1)
+            start = time.perf_counter()
+            paged = await fetch_candles("KRW-BTC", "minute1", count, to="2025-01-01T00:00:00Z")
+            columns = candles_to_columns(paged)
+            paged_elapsed = time.perf_counter() - start
+
+    times = [c["candle_date_time_utc"] for c in paged]
+    assert len(set(times)) == len(times) == count, "duplicate or missing candles"
+    assert times == sorted(times, reverse=True)
+    print(f"{count} minute candles, {latency * 1000:.0f}ms latency, 10 req/s quota")
+    print(f"sequential cursor walk : {sequential_elapsed:6.2f}s ({len(sequential)} candles)")
+    print(f"concurrent paging      : {paged_elapsed:6.2f}s ({len(columns['trade_price'])} candles, columnar)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.latency))
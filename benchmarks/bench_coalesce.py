@@ -0,0 +1,56 @@
+"""
+티커 요청 묶음(coalescing) 벤치마크
+
+여러 세션이 동시에 서로 다른 마켓의 get_ticker를 호출하는 상황을 흉내 내어,
+마켓마다 요청을 보내는 방식과 짧은 구간 동안 모아 한 번에 보내는 방식의
+업스트림 요청 수와 소요 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_coalesce [--symbols 50] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer, MARKETS
+
+
+async def main(symbols: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+
+        from core.http import http_lifespan, get_client
+        from tools.get_ticker import get_ticker
+
+        markets = [m["market"] for m in MARKETS if m["market"].startswith("KRW-")][:symbols]
+
+        async with http_lifespan():
+            client = get_client()
+
+            async def direct(symbol: str) -> dict:
+                res = await client.get(f"{server.api_base}/ticker", params={"markets": symbol})
+                return res.json()[0]
+
+            server.request_count = 0
+            start = time.perf_counter()
+            await asyncio.gather(*(direct(m) for m in markets))
+            direct_elapsed, direct_requests = time.perf_counter() - start, server.request_count
+
+            await asyncio.sleep(1.1)
+            server.request_count = 0
+            start = time.perf_counter()
+            await asyncio.gather(*(get_ticker(m) for m in markets))
+            batched_elapsed, batched_requests = time.perf_counter() - start, server.request_count
+
+    print(f"{symbols} concurrent get_ticker calls, {latency * 1000:.0f}ms upstream latency")
+    print(f"one request per symbol: {direct_requests:3d} requests {direct_elapsed * 1000:8.1f}ms")
+    print(f"coalesced             : {batched_requests:3d} requests {batched_elapsed * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.symbols, args.latency))
@@ -0,0 +1,92 @@
+"""
+응답 디코딩 벤치마크 (서버 불필요)
+
+업비트 응답과 같은 형태의 큰 본문(캔들 200개 한 페이지, 캔들 1만 개, 전체 마켓 티커, 체결 500개)을
+표준 json(httpx res.json()과 같은 경로: 바이트 -> 문자열 -> json.loads)과 core.decode.loads(orjson)로
+디코딩하는 시간, 그리고 캔들 목록을 지표 계산용 NumPy 열로 바꾸는 시간(행마다 목록을 만드는 이전 방식 vs
+필드별로 배열을 바로 채우는 방식)을 비교합니다. 두 경로의 결과가 같은지도 확인합니다 (불일치 시 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_decode [--repeat 20]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.mock_upbit import MARKETS, make_candles, make_ticker, make_trades
+
+
+def _timed(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _rowwise_columns(candles: list[dict], fields: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """이전 candles_to_columns: 행마다 필드 목록을 만든 뒤 2차원 배열을 열로 나눔"""
+    rows = candles[::-1]
+    table = np.array([[c[f] for f in fields] for c in rows], dtype=np.float64).reshape(-1, len(fields))
+    columns = {field: table[:, i] for i, field in enumerate(fields)}
+    columns["timestamp"] = columns["timestamp"].astype(np.int64)
+    return columns
+
+
+def main(repeat: int) -> None:
+    from core.candles import NUMERIC_FIELDS, candles_to_columns
+    from core.decode import loads, orjson_available
+
+    page = make_candles("KRW-BTC", "minutes/1", 200)
+    candles = []
+    for _ in range(50):
+        candles.extend(page)
+    payloads = {
+        "candles 200": json.dumps(page).encode(),
+        "candles 10k": json.dumps(candles).encode(),
+        f"tickers {len(MARKETS)}": json.dumps([make_ticker(m["market"]) for m in MARKETS]).encode(),
+        "trades 500": json.dumps(make_trades("KRW-BTC", 500)).encode(),
+    }
+
+    errors = []
+    print(f"decoder: {'orjson' if orjson_available() else 'json (orjson not installed)'}, median of {repeat} runs")
+    for label, body in payloads.items():
+        baseline = _timed(lambda: json.loads(body.decode("utf-8")), repeat)
+        fast = _timed(lambda: loads(body), repeat)
+        if loads(body) != json.loads(body):
+            errors.append(f"{label}: decoded values differ")
+        print(f"{label:12s} {len(body) / 1024:8.1f} KiB  json {baseline * 1000:7.2f}ms  "
+              f"decode {fast * 1000:7.2f}ms  ({baseline / fast:4.1f}x)")
+
+    body = payloads["candles 10k"]
+    decoded = loads(body)
+    old = _timed(lambda: _rowwise_columns(decoded, NUMERIC_FIELDS), repeat)
+    new = _timed(lambda: candles_to_columns(decoded), repeat)
+    before, after = _rowwise_columns(decoded, NUMERIC_FIELDS), candles_to_columns(decoded)
+    for field in NUMERIC_FIELDS:
+        if before[field].dtype != after[field].dtype or not np.array_equal(before[field], after[field]):
+            errors.append(f"candles_to_columns {field}: values differ")
+    print(f"10k candles -> columns: row-wise {old * 1000:7.2f}ms  per-field {new * 1000:7.2f}ms  ({old / new:4.1f}x)")
+
+    end_to_end_old = _timed(lambda: _rowwise_columns(json.loads(body.decode("utf-8")), NUMERIC_FIELDS), repeat)
+    end_to_end_new = _timed(lambda: candles_to_columns(loads(body)), repeat)
+    print(f"10k candles bytes -> columns: before {end_to_end_old * 1000:7.2f}ms  after {end_to_end_new * 1000:7.2f}ms  "
+          f"({end_to_end_old / end_to_end_new:4.1f}x)")
+
+    print(f"check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
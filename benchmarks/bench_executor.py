@@ -0,0 +1,135 @@
+"""
+분석 작업 실행기 벤치마크
+
+무거운 마켓 스캔(150개 마켓 x 5000 캔들)을 돌리는 동안 get_ticker 를 계속 호출해,
+스캔을 이벤트 루프에서 바로 계산할 때와 프로세스 풀로 넘길 때의 get_ticker 지연을 비교합니다.
+같은 배열을 피클로 넘길 때와 공유 메모리로 넘길 때의 전달 비용, 제한 시간 초과 후 복구도 확인합니다.
+
+실행:
+    python -m benchmarks.bench_executor [--markets 150] [--candles 5000] [--latency 0.005]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import numpy as np
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+def _matrix(markets: int, candles: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    close = 1_000_000 * np.exp(np.cumsum(rng.normal(0, 0.003, (markets, candles)), axis=1))
+    return {
+        "high_price": close * 1.001,
+        "low_price": close * 0.999,
+        "trade_price": close,
+        "candle_acc_trade_volume": rng.random((markets, candles)),
+    }
+
+
+def _touch(arrays: dict[str, np.ndarray]) -> float:
+    """전달 비용 측정용: 배열을 한 번 읽기만 함"""
+    return float(sum(a[..., -1].sum() for a in arrays.values()))
+
+
+def _sleep(arrays: dict[str, np.ndarray], seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _ticker_latency(get_ticker, stop: asyncio.Event) -> list[tuple[float, float]]:
+    """(호출 지연, 직전 응답 이후 경과 시간) 목록"""
+    samples = []
+    last = time.perf_counter()
+    while not stop.is_set():
+        start = time.perf_counter()
+        await get_ticker("KRW-BTC")
+        end = time.perf_counter()
+        samples.append((end - start, end - last))
+        last = end
+        await asyncio.sleep(0.005)
+    return samples
+
+
+async def _scan_with_probe(executor, get_ticker, matrix) -> tuple[float, list[float]]:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_ticker_latency(get_ticker, stop))
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await executor.run("scan_task", matrix, signals=["rsi_oversold"], match="any",
+                       cross_within=3, sort_by="rsi", limit=20)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.05)
+    stop.set()
+    return elapsed, await probe
+
+
+def _describe(samples: list[tuple[float, float]]) -> str:
+    p50 = statistics.median(latency for latency, _ in samples)
+    gap = max(gap for _, gap in samples)
+    return f"get_ticker n={len(samples):3d} p50={p50 * 1e3:7.2f}ms longest stall={gap * 1e3:8.2f}ms"
+
+
+async def main(markets: int, candles: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core import executor as executor_module
+        from core.executor import AnalyticsExecutor, AnalyticsTimeoutError
+        from core.http import http_lifespan
+        import core.scan  # noqa: F401  (scan_task 등록)
+        from tools.get_ticker import get_ticker
+
+        executor_module.analytics_task(_touch)
+        executor_module.analytics_task(_sleep)
+        matrix = _matrix(markets, candles)
+        size_mb = sum(a.nbytes for a in matrix.values()) / 1e6
+
+        inline = AnalyticsExecutor(inline_bytes=1 << 62)
+        pooled = AnalyticsExecutor(workers=2, inline_bytes=0)
+        async with http_lifespan():
+            await get_ticker("KRW-BTC")
+            await pooled.run("_touch", matrix)  # 작업자 프로세스 미리 시작
+
+            inline_elapsed, inline_samples = await _scan_with_probe(inline, get_ticker, matrix)
+            pooled_elapsed, pooled_samples = await _scan_with_probe(pooled, get_ticker, matrix)
+
+            # 전달 비용: 공유 메모리 vs 배열 피클링
+            start = time.perf_counter()
+            for _ in range(5):
+                await pooled.run("_touch", matrix)
+            shared = (time.perf_counter() - start) / 5
+            loop = asyncio.get_running_loop()
+            pool = pooled._get_pool()
+            start = time.perf_counter()
+            for _ in range(5):
+                await loop.run_in_executor(pool, _touch, matrix)
+            pickled = (time.perf_counter() - start) / 5
+
+            # 제한 시간 초과 후 복구
+            try:
+                await pooled.run("_sleep", matrix, timeout=0.3, seconds=5)
+                timed_out = False
+            except AnalyticsTimeoutError:
+                timed_out = True
+            recovered = await pooled.run("_touch", matrix) is not None
+            pooled.shutdown()
+
+    print(f"scan of {markets}x{candles} candles ({size_mb:.0f}MB input), "
+          f"{latency * 1000:.0f}ms REST latency, cpus={os.cpu_count()}")
+    print(f"inline on event loop : scan {inline_elapsed * 1e3:8.1f}ms  {_describe(inline_samples)}")
+    print(f"process pool         : scan {pooled_elapsed * 1e3:8.1f}ms  {_describe(pooled_samples)}")
+    print(f"transfer per task    : shared memory {shared * 1e3:.1f}ms, pickled arrays {pickled * 1e3:.1f}ms")
+    print(f"timeout raised: {timed_out}, pool recovered: {recovered}, stats: {pooled.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--markets", type=int, default=150)
+    parser.add_argument("--candles", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    asyncio.run(main(args.markets, args.candles, args.latency))
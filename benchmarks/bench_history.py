@@ -0,0 +1,109 @@
+"""
+주문/입출금 전체 이력 조회 벤치마크
+
+요청 수 제한(초당 30회)과 지연이 있는 로컬 업비트 스탠드인 서버의 계정에 주문 이력을 채워 두고,
+이전처럼 page를 하나씩 올리며 짧은 페이지가 나올 때까지 받는 방식과 core.history 의
+동시 페이지 조회(get_orders all_pages=True 와 같은 경로)를 비교합니다.
+두 방식이 같은 주문 집합을 받는지, 기간/상태 조건 결과가 스탠드인 데이터로 직접 센 값과 같은지도
+확인합니다 (불일치가 있으면 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_history [--orders 3000] [--latency 0.05] [--concurrency 4]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.mock_upbit import MockUpbitServer, make_order_history
+
+ACCESS_KEY = "bench-access-key"
+SECRET_KEY = "bench-secret-key"
+STATES = ["done", "cancel"]
+
+
+async def _page_by_page(params: dict) -> list[dict]:
+    """이전처럼 한 페이지씩 순차로 받는 방식"""
+    from core.private_api import private_request
+
+    orders, page = [], 1
+    while True:
+        rows = await private_request("GET", "/orders", {**params, "page": page, "limit": 100})
+        orders.extend(rows)
+        if len(rows) < 100:
+            return orders
+        page += 1
+
+
+async def main(size: int, latency: float, concurrency: int) -> None:
+    with MockUpbitServer(latency=latency, rate_limit=30, secret_key=SECRET_KEY) as server:
+        now = datetime.now(timezone.utc)
+        server.account.orders = make_order_history(now, size)
+        server.account.by_uuid = {order["uuid"]: order for order in server.account.orders}
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_ACCESS_KEY"] = ACCESS_KEY
+        os.environ["UPBIT_SECRET_KEY"] = SECRET_KEY
+        os.environ["UPBIT_HISTORY_FETCH_CONCURRENCY"] = str(concurrency)
+        os.environ["UPBIT_HISTORY_MAX_PAGES"] = str(size // 100 + 1)
+
+        from core.history import collect_orders, iter_history
+        from core.http import http_lifespan
+
+        params = {"states[]": STATES}
+        expected = [o for o in server.account.orders if o["state"] in STATES]
+        errors = []
+        async with http_lifespan():
+            server.reset_counts()
+            start = time.perf_counter()
+            sequential = await _page_by_page({**params, "order_by": "desc"})
+            seq_time, seq_requests = time.perf_counter() - start, server.request_count
+
+            await asyncio.sleep(1.1)  # 앞선 측정의 요청이 서버의 1초 구간에 남지 않도록
+            server.reset_counts()
+            start = time.perf_counter()
+            streamed = [row async for row in iter_history("/orders", params)]
+            con_time, con_requests = time.perf_counter() - start, server.request_count
+            con_429 = server.throttled_count
+
+            if [o["uuid"] for o in streamed] != [o["uuid"] for o in sequential]:
+                errors.append("concurrent paging returned a different order list")
+            if len(streamed) != len(expected):
+                errors.append(f"expected {len(expected)} orders, got {len(streamed)}")
+
+            # 최근 30일: 이후 페이지는 요청하지 않아야 함
+            begin = now - timedelta(days=30)
+            await asyncio.sleep(1.1)
+            server.reset_counts()
+            start = time.perf_counter()
+            summary = await collect_orders(params, start=begin, max_rows=50)
+            range_time, range_requests = time.perf_counter() - start, server.request_count
+            in_range = [o for o in expected if datetime.fromisoformat(o["created_at"]) >= begin]
+            if summary["total"] != len(in_range):
+                errors.append(f"date range: expected {len(in_range)} orders, got {summary['total']}")
+            if sum(summary["by_state"].values()) != summary["total"] or len(summary["orders"]) != min(50, len(in_range)):
+                errors.append("date range: inconsistent summary")
+            if summary["pages_exhausted"]:
+                errors.append("date range: stopped at the page limit")
+
+    print(f"{len(expected)} done/cancel orders of {size}, {latency * 1000:.0f}ms latency, 30 req/s limit")
+    print(f"page by page          : {seq_time:7.2f}s  {seq_requests:4d} requests")
+    print(f"concurrent (x{concurrency})       : {con_time:7.2f}s  {con_requests:4d} requests  "
+          f"({seq_time / con_time:.1f}x, {con_429} x 429)")
+    print(f"last 30 days summary  : {range_time:7.2f}s  {range_requests:4d} requests  "
+          f"({summary['total']} orders, {len(summary['by_market'])} markets)")
+    print(f"check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.latency, args.concurrency))
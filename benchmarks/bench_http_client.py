@@ -0,0 +1,67 @@
+"""
+공유 HTTP 클라이언트 벤치마크
+
+로컬 업비트 스탠드인 서버를 대상으로, 호출마다 새 httpx.AsyncClient를 만드는 방식과
+커넥션 풀을 공유하는 방식의 get_ticker 호출 지연을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_http_client [--calls 300]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+async def _per_call_client(api_base: str, symbol: str) -> dict:
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        res = await client.get(f"{api_base}/ticker", params={"markets": symbol})
+        return res.json()[0]
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples_ms = sorted(s * 1000 for s in samples)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1]
+    print(
+        f"{name:<24} mean={statistics.mean(samples_ms):7.3f}ms "
+        f"p50={statistics.median(samples_ms):7.3f}ms p95={p95:7.3f}ms"
+    )
+
+
+async def main(calls: int) -> None:
+    with MockUpbitServer() as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        # 커넥션 비용만 비교하기 위해 요청 수 제한은 끈다
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core.http import http_lifespan
+        from tools.get_ticker import get_ticker
+
+        baseline = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            await _per_call_client(server.api_base, "KRW-BTC")
+            baseline.append(time.perf_counter() - start)
+
+        pooled = []
+        async with http_lifespan():
+            for _ in range(calls):
+                start = time.perf_counter()
+                await get_ticker("KRW-BTC")
+                pooled.append(time.perf_counter() - start)
+
+    _report("per-call AsyncClient", baseline)
+    _report("shared pooled client", pooled)
+    print(f"speedup (mean): {statistics.mean(baseline) / statistics.mean(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,101 @@
+"""
+지표 계산 마이크로 벤치마크
+
+캔들 10,000개(랜덤 워크) 입력에 대해 core.indicators 의 지표별 전체 시계열 계산 시간과
+compute_all 한 번의 시장당 비용을 측정합니다. 비교를 위해 파이썬 반복문으로 계산한
+RSI / EMA 와, 여러 마켓을 (마켓 x 시간) 행렬로 묶어 한 번에 계산했을 때의 마켓당 비용도 출력합니다.
+
+실행:
+    python -m benchmarks.bench_indicators [--candles 10000] [--markets 150] [--runs 20]
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from core import indicators
+
+
+def _median_time(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _candles(rng: np.random.Generator, shape: tuple[int, ...]) -> tuple[np.ndarray, ...]:
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.002, shape), axis=-1))
+    high = close * (1 + rng.random(shape) * 0.003)
+    low = close * (1 - rng.random(shape) * 0.003)
+    volume = rng.random(shape) * 10
+    return high, low, close, volume
+
+
+def _loop_ema(x: np.ndarray, period: int) -> np.ndarray:
+    """비교용: 파이썬 반복문 EMA"""
+    alpha = 2 / (period + 1)
+    out = np.full(len(x), np.nan)
+    state = x[:period].mean()
+    out[period - 1] = state
+    for i in range(period, len(x)):
+        state = (1 - alpha) * state + alpha * x[i]
+        out[i] = state
+    return out
+
+
+def _loop_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """비교용: 이전 technical_analysis 방식의 반복문 RSI (시계열 전체)"""
+    delta = np.diff(close)
+    gain = np.where(delta > 0, delta, 0)
+    loss = np.where(delta < 0, -delta, 0)
+    out = np.full(len(close), np.nan)
+    avg_gain, avg_loss = gain[:period].mean(), loss[:period].mean()
+    for i in range(period - 1, len(delta)):
+        if i >= period:
+            avg_gain = (avg_gain * (period - 1) + gain[i]) / period
+            avg_loss = (avg_loss * (period - 1) + loss[i]) / period
+        out[i + 1] = 100 - 100 / (1 + avg_gain / avg_loss) if avg_loss else 100
+    return out
+
+
+def main(candles: int, markets: int, runs: int) -> None:
+    rng = np.random.default_rng(0)
+    high, low, close, volume = _candles(rng, (candles,))
+
+    cases = {
+        "sma(20)": lambda: indicators.sma(close, 20),
+        "ema(12)": lambda: indicators.ema(close, 12),
+        "rsi(14)": lambda: indicators.rsi(close),
+        "macd(12,26,9)": lambda: indicators.macd(close),
+        "bollinger(20,2)": lambda: indicators.bollinger(close),
+        "stochastic(14,3)": lambda: indicators.stochastic(high, low, close),
+        "atr(14)": lambda: indicators.atr(high, low, close),
+        "obv": lambda: indicators.obv(close, volume),
+        "compute_all": lambda: indicators.compute_all(high, low, close, volume),
+        "loop ema(12)": lambda: _loop_ema(close, 12),
+        "loop rsi(14)": lambda: _loop_rsi(close),
+    }
+
+    assert np.allclose(indicators.ema(close, 12), _loop_ema(close, 12), equal_nan=True)
+    assert np.allclose(indicators.rsi(close), _loop_rsi(close), equal_nan=True)
+
+    print(f"{candles} candles, median of {runs} runs")
+    for name, fn in cases.items():
+        print(f"{name:<18} {_median_time(fn, runs) * 1e3:8.3f}ms")
+
+    matrix = _candles(rng, (markets, candles))
+    elapsed = _median_time(lambda: indicators.compute_all(*matrix), max(3, runs // 5))
+    print(f"compute_all on {markets}x{candles} matrix: {elapsed * 1e3:8.1f}ms "
+          f"({elapsed / markets * 1e3:.3f}ms per market)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candles", type=int, default=10000)
+    parser.add_argument("--markets", type=int, default=150)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    main(args.candles, args.markets, args.runs)
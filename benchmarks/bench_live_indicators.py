@@ -0,0 +1,56 @@
+"""
+증분 지표 상태 벤치마크
+
+랜덤 워크(중간에 가격이 멈춘 구간 포함) 캔들을 하나씩 core.live_indicators.LiveIndicators 에 넣을 때
+캔들 하나당 갱신 비용과, 매번 캔들 100개로 처음부터 다시 계산하는 비용을 비교합니다.
+증분 값과 한 번에 계산한 값이 같은지는 tests/test_live_indicators.py 가 확인합니다.
+
+실행:
+    python -m benchmarks.bench_live_indicators [--candles 3000]
+"""
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from core.indicators import compute_all
+from core.live_indicators import LiveIndicators
+
+
+def _candles(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 1_000_000 * np.exp(np.cumsum(rng.normal(0, 0.003, n)))
+    close[n // 3: n // 3 + 40] = close[n // 3]  # 거래가 멈춘 구간 (변동폭 0, 하락 0)
+    spread = rng.random(n) * 0.002
+    spread[n // 3: n // 3 + 40] = 0
+    high = close * (1 + spread)
+    low = close * (1 - spread)
+    volume = rng.random(n) * 10
+    return np.stack([high, low, close, volume])
+
+
+def measure(candles: np.ndarray) -> None:
+    state = LiveIndicators("TEST", "minute1")
+    n = candles.shape[1]
+    rows = candles.T.tolist()
+    start = time.perf_counter()
+    for i, (high, low, close, volume) in enumerate(rows):
+        state.update(i, high, low, close, volume, closed=False)
+        state.update(i, high, low, close, volume, closed=True)
+    per_update = (time.perf_counter() - start) / (2 * n)
+
+    samples = []
+    for i in range(100, n, max(1, n // 200)):
+        start = time.perf_counter()
+        compute_all(*candles[:, i - 100:i])
+        samples.append(time.perf_counter() - start)
+    print(f"incremental update : {per_update * 1e6:8.2f}us per candle")
+    print(f"batch recompute    : {statistics.median(samples) * 1e6:8.2f}us per call (100 candles)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candles", type=int, default=3000)
+    args = parser.parse_args()
+    measure(_candles(args.candles))
@@ -0,0 +1,75 @@
+"""
+웹소켓 시세 엔진 벤치마크
+
+로컬 REST / 웹소켓 스탠드인 서버를 띄우고, 같은 마켓에 대한 get_ticker / get_orderbook /
+get_trades 호출 지연을 REST 경로와 웹소켓 로컬 상태 경로로 나누어 비교합니다.
+마지막으로 연결을 강제로 끊어 재연결 및 재구독이 되는지 확인합니다.
+
+실행:
+    python -m benchmarks.bench_market_stream [--calls 200] [--latency 0.01]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+from benchmarks.mock_upbit_ws import MockUpbitWebSocket
+
+
+async def _measure(fn, symbol: str, calls: int) -> float:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await fn(symbol)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def main(calls: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency) as rest, MockUpbitWebSocket() as ws:
+        os.environ["UPBIT_API_BASE"] = rest.api_base
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core.http import http_lifespan
+        from core.market_stream import get_market_stream
+        from tools.get_ticker import get_ticker
+        from tools.get_orderbook import get_orderbook
+        from tools.get_trades import get_trades
+
+        stream = get_market_stream()
+        stream.url = ws.url
+        tools = {"get_ticker": get_ticker, "get_orderbook": get_orderbook, "get_trades": get_trades}
+
+        async with http_lifespan():
+            rest_latency = {name: await _measure(fn, "KRW-BTC", calls) for name, fn in tools.items()}
+
+            await stream.subscribe(["KRW-BTC"])
+            await stream.wait_connected(5)
+            while stream.ticker("KRW-BTC") is None or stream.recent_trades("KRW-BTC") is None \
+                    or stream.orderbook("KRW-BTC") is None:
+                await asyncio.sleep(0.01)
+            rest.request_count = 0
+            ws_latency = {name: await _measure(fn, "KRW-BTC", calls) for name, fn in tools.items()}
+            upstream = rest.request_count
+
+            ws.drop_connections()
+            await asyncio.sleep(0.1)
+            reconnected = await stream.wait_connected(5)
+            await stream.stop()
+
+    print(f"median latency per call ({latency * 1000:.0f}ms REST latency)")
+    for name in tools:
+        print(f"{name:<14} REST={rest_latency[name] * 1e3:8.3f}ms  stream={ws_latency[name] * 1e6:8.1f}us")
+    print(f"REST requests while subscribed: {upstream}")
+    print(f"reconnected after drop: {reconnected}, reconnects={stream.reconnects}, "
+          f"resubscriptions seen by server={len(ws.subscriptions)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.latency))
@@ -0,0 +1,67 @@
+"""
+get_market_summary 벤치마크
+
+지연이 있는 로컬 업비트 스탠드인 서버에서, 50개 단위 티커 청크를 순차로 받아 전체 정렬하던
+이전 방식과 청크를 동시에 받아 힙으로 상위 k개를 고르는 현재 방식의 소요 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_market_summary [--latency 0.05] [--runs 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+async def _sequential_summary(api_base: str) -> dict:
+    """청크를 순차로 받고 두 번 전체 정렬하던 이전 구현"""
+    from core.http import get_client
+
+    client = get_client()
+    markets = (await client.get(f"{api_base}/market/all")).json()
+    krw = [m["market"] for m in markets if m["market"].startswith("KRW-")]
+    tickers = []
+    for i in range(0, len(krw), 50):
+        res = await client.get(f"{api_base}/ticker", params={"markets": ",".join(krw[i:i + 50])})
+        tickers.extend(res.json())
+    by_volume = sorted(tickers, key=lambda x: x["acc_trade_price_24h"], reverse=True)[:5]
+    by_change = sorted(tickers, key=lambda x: x["signed_change_rate"], reverse=True)
+    return {"top_volume": by_volume, "top_gainers": by_change[:5], "top_losers": by_change[-5:]}
+
+
+async def main(latency: float, runs: int) -> None:
+    with MockUpbitServer(latency=latency) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core.http import http_lifespan
+        from tools.get_market_summary import get_market_summary
+
+        async with http_lifespan():
+            sequential, concurrent = [], []
+            for _ in range(runs):
+                start = time.perf_counter()
+                await _sequential_summary(server.api_base)
+                sequential.append(time.perf_counter() - start)
+
+            # 마켓 목록 캐시를 채운 뒤 티커 조회 경로만 측정
+            await get_market_summary()
+            for _ in range(runs):
+                start = time.perf_counter()
+                await get_market_summary(rankings=["volume", "gainers", "losers", "volatility"])
+                concurrent.append(time.perf_counter() - start)
+
+    print(f"upstream latency: {latency * 1000:.0f}ms per request")
+    print(f"sequential chunks + full sort : {statistics.mean(sequential) * 1000:8.1f}ms")
+    print(f"concurrent chunks + heap top-k: {statistics.mean(concurrent) * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.runs))
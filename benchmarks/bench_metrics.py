@@ -0,0 +1,177 @@
+"""
+지표 수집 오버헤드 벤치마크
+
+1. 마이크로 벤치마크 (서버 불필요): 히스토그램 관측 한 번, 빈 도구 호출(도구 관리자 call_tool)과
+   가짜 httpx 전송 요청 한 번에 지표 수집이 더하는 시간을 지표 없이 실행한 경우와 비교합니다.
+2. 로컬 업비트 스탠드인 서버에 get_ticker/get_market_summary/get_trades 를 호출해, 지표 수집 비용이
+   실제 도구 호출 지연 시간에서 차지하는 비율을 보여 주고, 기록된 값을 확인합니다
+   (도구 호출 수, 업비트 요청 수 = 스탠드인 서버가 받은 요청 수, 실행 중인 호출 0,
+   Prometheus 출력의 +Inf 구간 = _count). 불일치 시 종료 코드 1.
+
+실행:
+    python -m benchmarks.bench_metrics [--iterations 50000] [--calls 50]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+MARKETS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-DOGE"]
+
+
+async def _noop(x: int = 0) -> dict:
+    return {"x": x}
+
+
+class _OkTransport:
+    """바로 200을 돌려주는 전송 계층 (네트워크 없이 감싸는 비용만 재기 위해)"""
+
+    async def handle_async_request(self, request):
+        import httpx
+
+        return httpx.Response(200, request=request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _per_op(total: float, n: int) -> float:
+    return total / n * 1e6
+
+
+async def micro(iterations: int) -> tuple[float, float]:
+    import httpx
+    from fastmcp import FastMCP
+
+    from core.metrics import Histogram, Metrics, MetricsTransport, instrument_tools
+
+    histogram = Histogram()
+    start = time.perf_counter()
+    for i in range(iterations):
+        histogram.observe(0.0123)
+    observe = _per_op(time.perf_counter() - start, iterations)
+
+    async def calls(manager) -> float:
+        start = time.perf_counter()
+        for i in range(iterations):
+            await manager.call_tool("noop", {"x": i})
+        return _per_op(time.perf_counter() - start, iterations)
+
+    plain, timed = FastMCP("plain"), FastMCP("timed")
+    plain.add_tool(_noop, name="noop")
+    timed.add_tool(_noop, name="noop")
+    instrument_tools(timed)
+    tool_plain = statistics.median([await calls(plain._tool_manager) for _ in range(3)])
+    tool_timed = statistics.median([await calls(timed._tool_manager) for _ in range(3)])
+
+    request = httpx.Request("GET", "https://api.upbit.com/v1/ticker?markets=KRW-BTC")
+
+    async def requests(transport) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await transport.handle_async_request(request)
+        return _per_op(time.perf_counter() - start, iterations)
+
+    http_plain = statistics.median([await requests(_OkTransport()) for _ in range(3)])
+    http_timed = statistics.median([await requests(MetricsTransport(_OkTransport(), Metrics())) for _ in range(3)])
+
+    print(f"micro, {iterations} iterations")
+    print(f"  Histogram.observe          {observe:7.3f}us")
+    print(f"  tool call (no-op tool)     plain {tool_plain:7.3f}us  instrumented {tool_timed:7.3f}us  "
+          f"(+{tool_timed - tool_plain:.3f}us)")
+    print(f"  transport request          plain {http_plain:7.3f}us  instrumented {http_timed:7.3f}us  "
+          f"(+{http_timed - http_plain:.3f}us)")
+    return tool_timed - tool_plain, http_timed - http_plain
+
+
+async def end_to_end(server: MockUpbitServer, calls: int, tool_overhead_us: float,
+                     http_overhead_us: float) -> list[str]:
+    import main as server_main
+    from core.metrics import get_metrics
+
+    errors = []
+    cases = {
+        "get_ticker": lambda i: {"symbol": MARKETS[i % len(MARKETS)]},
+        "get_market_summary": lambda i: {"quote": "KRW"},
+        "get_trades": lambda i: {"symbol": MARKETS[i % len(MARKETS)], "count": 50},
+    }
+    async with server_main.lifespan(server_main.mcp):
+        for name, arguments in cases.items():
+            await server_main.mcp.call_tool(name, arguments(0))  # 모듈 불러오기/캐시 채우기
+        metrics = get_metrics()
+        upstream_before = sum(h.count for h in metrics.http.values())
+        upstream_total = 0
+
+        print(f"end to end against the stand-in server, {calls} calls per tool")
+        for name, arguments in cases.items():
+            server.reset_counts()
+            before = metrics.tools[name].count
+            latencies = []
+            for i in range(calls):
+                start = time.perf_counter()
+                await server_main.mcp.call_tool(name, arguments(i))
+                latencies.append(time.perf_counter() - start)
+            upstream_total += server.request_count
+            p50 = statistics.median(latencies) * 1e6
+            overhead = tool_overhead_us + http_overhead_us * server.request_count / calls
+            print(f"  {name:20s} p50 {p50 / 1000:7.2f}ms  upstream/call {server.request_count / calls:4.2f}  "
+                  f"metrics cost ~{overhead:.1f}us ({overhead / p50:.3%})")
+            if metrics.tools[name].count - before != calls:
+                errors.append(f"{name}: recorded {metrics.tools[name].count - before} calls, made {calls}")
+
+        recorded = sum(h.count for h in metrics.http.values()) - upstream_before
+        if recorded != upstream_total:
+            errors.append(f"upstream: recorded {recorded} requests, stand-in server saw {upstream_total}")
+        stats = metrics.stats()
+        if stats["tools_in_flight"] or stats["upstream_in_flight"]:
+            errors.append(f"in-flight gauges not back to 0: {stats['tools_in_flight']}, {stats['upstream_in_flight']}")
+
+        text = await server_main.mcp.read_resource("metrics://prometheus")
+        counts, infs = {}, {}
+        for line in text.splitlines():
+            if line.startswith("#"):
+                continue
+            series, value = line.rsplit(" ", 1)
+            if "_bucket{" in series and 'le="+Inf"' in series:
+                infs[series.replace("_bucket", "").replace(',le="+Inf"', "")] = float(value)
+            elif series.split("{")[0].endswith("_count"):
+                counts[series.replace("_count", "")] = float(value)
+        if not counts or counts != infs:
+            errors.append("prometheus: +Inf bucket does not match _count")
+        summary = await server_main.mcp.read_resource("metrics://server")
+        print(f"  metrics://server {len(summary)} bytes, metrics://prometheus {len(text)} bytes, "
+              f"{len(stats['upstream'])} endpoints, caches: {', '.join(stats['caches'])}")
+    return errors
+
+
+async def main(iterations: int, calls: int) -> None:
+    with MockUpbitServer() as server:
+        # config는 import 시 환경 변수를 읽으므로 프로젝트 모듈을 불러오기 전에 설정
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = tempfile.mkdtemp(prefix="bench-metrics-")
+        os.environ["UPBIT_METRICS"] = "true"
+        warnings.filterwarnings("ignore", message="coroutine .* was never awaited", category=RuntimeWarning)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        tool_overhead, http_overhead = await micro(iterations)
+        errors = await end_to_end(server, calls, tool_overhead, http_overhead)
+    print(f"check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.calls))
@@ -0,0 +1,114 @@
+"""
+응답 크기/직렬화 벤치마크
+
+로컬 업비트 스탠드인 서버에서 시세 도구 결과를 받아, MCP 서버가 실제로 하는 변환
+(도구 결과 -> TextContent, 목록은 항목마다 TextContent 하나)과 JSON 직렬화를 거친 크기와 시간을
+전체 필드(records), 필드 선택(fields), 열 기반(format="columnar") 출력별로 비교합니다.
+열 기반 출력을 행으로 되돌리면 필드 선택 결과와 같은지, 숫자가 숫자로 남는지도 확인합니다
+(불일치 시 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_payload [--repeat 50]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+TICKER_FIELDS = ["market", "trade_price", "signed_change_rate", "acc_trade_price_24h"]
+CANDLE_FIELDS = ["candle_date_time_kst", "opening_price", "high_price", "low_price", "trade_price",
+                 "candle_acc_trade_volume"]
+TRADE_FIELDS = ["timestamp", "trade_price", "trade_volume", "ask_bid"]
+
+
+def _serialize(result) -> int:
+    """MCP 서버와 같은 방식으로 TextContent를 만들고 JSON으로 직렬화한 바이트 수"""
+    from fastmcp.server import _convert_to_content
+
+    return sum(len(content.model_dump_json()) for content in _convert_to_content(result))
+
+
+def _measure(result, repeat: int) -> tuple[int, float]:
+    size = _serialize(result)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _serialize(result)
+        times.append(time.perf_counter() - start)
+    return size, statistics.median(times)
+
+
+def _rows(columns: dict[str, list]) -> list[dict]:
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def _check(label: str, projected, columnar, errors: list) -> None:
+    sections = projected.items() if isinstance(projected, dict) else [(label, projected)]
+    for name, rows in sections:
+        if not isinstance(rows, list):
+            continue
+        cols = columnar[name] if isinstance(projected, dict) else columnar
+        if _rows(cols) != rows:
+            errors.append(f"{label} {name}: columnar rows differ from projected rows")
+        for field, values in cols.items():
+            numeric = isinstance(rows[0][field], (int, float)) if rows else False
+            if numeric and not all(isinstance(v, (int, float)) for v in values):
+                errors.append(f"{label} {name}.{field}: numbers were not kept as numbers")
+
+
+async def main(repeat: int) -> None:
+    with MockUpbitServer() as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = tempfile.mkdtemp(prefix="bench-payload-")
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        from core.http import http_lifespan
+        from benchmarks.mock_upbit import BASES
+        from tools.get_candels import get_candles
+        from tools.get_market_summary import get_market_summary
+        from tools.get_ticker import get_tickers
+        from tools.get_trades import get_trades
+
+        markets = [f"KRW-{base}" for base in BASES]
+        cases = {
+            "get_market_summary": (lambda **kw: get_market_summary("KRW", 5, **kw), TICKER_FIELDS),
+            "get_tickers x20": (lambda **kw: get_tickers(markets, **kw), TICKER_FIELDS),
+            "get_candles 1000": (lambda **kw: get_candles("KRW-BTC", "minute1", 1000, **kw), CANDLE_FIELDS),
+            "get_trades 500": (lambda **kw: get_trades("KRW-BTC", count=500, **kw), TRADE_FIELDS),
+        }
+        rows, errors = [], []
+        async with http_lifespan():
+            for label, (call, fields) in cases.items():
+                full = await call()
+                projected = await call(fields=fields)
+                columnar = await call(fields=fields, format="columnar")
+                _check(label, projected, columnar, errors)
+                for variant, result in (("records", full), ("fields", projected), ("fields+columnar", columnar)):
+                    rows.append((label, variant, *_measure(result, repeat)))
+
+    print(f"serialized MCP tool result (TextContent JSON), median of {repeat} runs")
+    baseline = {}
+    for label, variant, size, seconds in rows:
+        baseline.setdefault(label, (size, seconds))
+        base_size, base_seconds = baseline[label]
+        print(f"{label:20s} {variant:16s}: {size / 1024:8.1f} KiB ({size / base_size:6.1%})  "
+              f"{seconds * 1000:7.2f}ms ({seconds / base_seconds:6.1%})")
+    print(f"check: {len(errors)} errors")
+    for error in errors[:10]:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
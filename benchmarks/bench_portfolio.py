@@ -0,0 +1,111 @@
+"""
+포트폴리오 평가 벤치마크
+
+로컬 업비트 스탠드인 계정에 KRW 마켓 코인 N종(그중 일부는 BTC 마켓으로만 평가)을 채워 두고,
+이전 방식(잔고 조회 후 자산마다 get_ticker 호출)과 portfolio_valuation 한 번의 요청 수/시간을 비교합니다.
+벡터화된 평가금액/손익/비중이 자산마다 따로 계산한 값과 같은지도 확인합니다 (불일치 시 종료 코드 1).
+
+실행:
+    python -m benchmarks.bench_portfolio [--latency 0.02]
+"""
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+
+from benchmarks.mock_upbit import BASES, MockUpbitServer, make_ticker
+
+ACCESS_KEY = "bench-access-key"
+SECRET_KEY = "bench-secret-key"
+
+
+def _reference(accounts: list[dict]) -> dict[str, dict]:
+    """자산 하나씩 계산한 평가금액/손익 (KRW 마켓, 없으면 BTC 마켓 x KRW-BTC)"""
+    btc = make_ticker("KRW-BTC")["trade_price"]
+    cash = sum(float(a["balance"]) + float(a["locked"]) for a in accounts if a["currency"] == "KRW")
+    rows = {}
+    for a in accounts:
+        if a["currency"] == "KRW":
+            continue
+        market = f"KRW-{a['currency']}" if a["currency"] in BASES else f"BTC-{a['currency']}"
+        price = make_ticker(market)["trade_price"] * (1 if market.startswith("KRW-") else btc)
+        quantity = float(a["balance"]) + float(a["locked"])
+        rows[a["currency"]] = {"value": quantity * price, "pnl": quantity * (price - float(a["avg_buy_price"]))}
+    total = cash + sum(r["value"] for r in rows.values())
+    for r in rows.values():
+        r["weight"] = r["value"] / total
+    return rows
+
+
+async def main(latency: float) -> None:
+    with MockUpbitServer(latency=latency, secret_key=SECRET_KEY) as server:
+        # 보유 코인을 BASES 전체로 늘린다
+        for base in BASES:
+            server.account.balances.setdefault(base, [float(len(base)), 0.0])
+            server.account.avg_prices.setdefault(base, make_ticker(f"KRW-{base}")["trade_price"] * 0.95)
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_ACCESS_KEY"] = ACCESS_KEY
+        os.environ["UPBIT_SECRET_KEY"] = SECRET_KEY
+        os.environ["UPBIT_RATE_LIMIT"] = "false"
+
+        from core.http import http_lifespan
+        from tools.get_accounts import get_accounts
+        from tools.get_ticker import get_ticker
+        from tools.portfolio_valuation import portfolio_valuation
+        from prompts.analyze_portfolio import analyze_portfolio
+
+        async with http_lifespan():
+            accounts = await get_accounts(refresh=True)
+            await portfolio_valuation()  # 마켓 목록 캐시 채우기
+
+            server.reset_counts()
+            start = time.perf_counter()
+            accounts = await get_accounts(refresh=True)
+            for a in accounts:
+                if a["currency"] != "KRW":
+                    await get_ticker(f"KRW-{a['currency']}")
+            loop_time, loop_requests = time.perf_counter() - start, server.request_count
+
+            await asyncio.sleep(2.1)  # 잔고 캐시 만료
+            server.reset_counts()
+            start = time.perf_counter()
+            valuation = await portfolio_valuation(min_value=0)
+            tool_time, tool_requests = time.perf_counter() - start, server.request_count
+            prompt = await analyze_portfolio()
+
+    errors = []
+    expected = _reference(accounts)
+    actual = {h["currency"]: h for h in valuation["holdings"]}
+    if set(actual) != set(expected):
+        errors.append(f"holdings differ: {sorted(set(actual) ^ set(expected))}")
+    for currency, ref in expected.items():
+        got = actual.get(currency)
+        if got is None:
+            continue
+        for key, got_key, tol in (("value", "value", 0.01), ("pnl", "unrealized_pnl", 0.01), ("weight", "weight", 1e-6)):
+            if not math.isclose(got[got_key], ref[key], rel_tol=1e-9, abs_tol=tol):
+                errors.append(f"{currency} {key}: vectorized={got[got_key]} loop={ref[key]}")
+    if "총 평가금액" not in prompt:
+        errors.append("analyze_portfolio prompt did not include the valuation")
+
+    coins = len(accounts) - 1
+    print(f"{coins} coins, {latency * 1000:.0f}ms latency")
+    print(f"get_accounts + get_ticker per coin: {loop_time * 1000:7.1f}ms  {loop_requests:3d} requests "
+          f"({coins + 1} tool calls)")
+    print(f"portfolio_valuation               : {tool_time * 1000:7.1f}ms  {tool_requests:3d} requests (1 tool call)")
+    print(f"total {valuation['total_value_krw']:,.0f} KRW, pnl {valuation['unrealized_pnl_krw']:+,.0f} KRW, "
+          f"top3 weight {valuation['concentration']['top3_weight']:.1%}")
+    print(f"check: {len(errors)} errors")
+    for error in errors[:10]:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency))
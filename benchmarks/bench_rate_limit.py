@@ -0,0 +1,59 @@
+"""
+요청 수 제한기 벤치마크
+
+초당 요청 한도가 있는 로컬 업비트 스탠드인 서버에 get_ticker 호출을 한꺼번에 보내고,
+제한기 없이 보냈을 때와 제한기를 거쳤을 때의 성공/429 건수와 처리량을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_rate_limit [--calls 60] [--limit 10]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+async def _burst(client, api_base: str, calls: int) -> tuple[int, int, float]:
+    async def one(i: int) -> int:
+        res = await client.get(f"{api_base}/ticker", params={"markets": "KRW-BTC"})
+        return res.status_code
+
+    start = time.perf_counter()
+    statuses = await asyncio.gather(*(one(i) for i in range(calls)))
+    elapsed = time.perf_counter() - start
+    return statuses.count(200), statuses.count(429), elapsed
+
+
+async def main(calls: int, limit: int) -> None:
+    with MockUpbitServer(rate_limit=limit) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+
+        import httpx
+        from core.http import http_lifespan, get_client
+        from core.rate_limit import get_rate_limiter
+
+        async with httpx.AsyncClient() as raw:
+            ok, throttled, elapsed = await _burst(raw, server.api_base, calls)
+        print(f"{'no limiter':<14} ok={ok:4d} 429={throttled:4d} elapsed={elapsed:6.2f}s")
+
+        # 서버측 윈도우가 비워질 때까지 대기
+        await asyncio.sleep(1.1)
+        server.throttled_count = 0
+
+        async with http_lifespan():
+            ok, throttled, elapsed = await _burst(get_client(), server.api_base, calls)
+        print(
+            f"{'rate limiter':<14} ok={ok:4d} 429={throttled:4d} elapsed={elapsed:6.2f}s "
+            f"(server saw {server.throttled_count} throttled, ideal {calls / limit:.2f}s)"
+        )
+        print(get_rate_limiter().stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=60)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.limit))
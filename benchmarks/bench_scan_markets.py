@@ -0,0 +1,65 @@
+"""
+마켓 스캔 벤치마크
+
+로컬 업비트 스탠드인 서버(KRW 마켓 150개)에서 전체 KRW 마켓을 스캔할 때,
+technical_analysis 를 마켓마다 순차 호출하는 방식과 scan_markets 한 번으로 처리하는 방식을 비교합니다.
+scan_markets 는 로컬 캔들 저장소가 비어 있을 때(cold)와 채워진 뒤(warm)를 나누어 측정합니다.
+
+실행:
+    python -m benchmarks.bench_scan_markets [--latency 0.02] [--rate-limit 10]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.mock_upbit import MockUpbitServer
+
+
+async def _timed(server, coro) -> tuple[float, int, object]:
+    server.request_count = 0
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, server.request_count, result
+
+
+async def main(latency: float, rate_limit: int) -> None:
+    with MockUpbitServer(latency=latency, rate_limit=rate_limit) as server, \
+            tempfile.TemporaryDirectory() as root:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = root
+
+        from core.http import http_lifespan
+        from core.market_cache import get_market_cache
+        from tools.scan_markets import scan_markets
+        from tools.technical_analysis import technical_analysis
+
+        async with http_lifespan():
+            markets = [m["market"] for m in await get_market_cache().get() if m["market"].startswith("KRW-")]
+
+            async def per_market_loop():
+                return [await technical_analysis(market, "minute60") for market in markets]
+
+            rows = [("scan_markets (cold)", *await _timed(server, scan_markets(
+                interval="minute60", signals=["rsi_oversold"], match="any")))]
+            for _ in range(3):
+                rows.append(("scan_markets (warm)", *await _timed(server, scan_markets(
+                    interval="minute60", signals=["rsi_oversold", "macd_cross_up"], match="any"))))
+            await asyncio.sleep(1.1)
+            rows.append(("technical_analysis x N", *await _timed(server, per_market_loop())))
+
+    print(f"{len(markets)} KRW markets, minute60, {latency * 1000:.0f}ms latency, {rate_limit} req/s quota")
+    for label, elapsed, requests, _ in rows:
+        print(f"{label:<24} {elapsed * 1000:10.1f}ms  upstream requests={requests}")
+    result = rows[-2][3]
+    print(f"last scan: scanned={result['scanned']} matched={result['matched']} "
+          f"top={[r['market'] for r in result['results'][:5]]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--rate-limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.rate_limit))
@@ -0,0 +1,102 @@
+"""
+비공개 API 서명 벤치마크
+
+이전 방식(쿼리 문자열을 직접 이어 붙이고 요청마다 SHA512 + PyJWT 인코딩)과
+core.private_api 의 UpbitSigner(헤더/HMAC 키 재사용, 같은 쿼리의 query_hash 캐시)의
+초당 서명 수를 비교합니다. 새 토큰이 PyJWT로 검증되는지, 배열 파라미터(states[])가
+요청과 같은 문자열로 해시되는지도 확인합니다 (실패 시 종료 코드 1). 서버는 필요 없습니다.
+
+실행:
+    python -m benchmarks.bench_signing [--tokens 20000]
+"""
+import argparse
+import hashlib
+import sys
+import time
+import uuid
+from urllib.parse import unquote
+
+import jwt
+
+from core.private_api import UpbitSigner, encode_params
+
+ACCESS_KEY = "bench-access-key-0123456789abcdef0123"
+SECRET_KEY = "bench-secret-key-0123456789abcdef0123456789abcdef"
+
+QUERIES = [
+    None,
+    {"state": "wait", "page": 1, "limit": 100},
+    {"market": "KRW-BTC", "side": "bid", "ord_type": "limit", "volume": "0.01", "price": "50000000"},
+    {"states[]": ["done", "cancel"], "limit": 100, "order_by": "desc"},
+]
+
+
+def legacy_token(query_params=None) -> str:
+    """이전 config.generate_upbit_token 과 같은 방식"""
+    payload = {"access_key": ACCESS_KEY, "nonce": str(uuid.uuid4())}
+    if query_params:
+        query_string = "&".join([f"{key}={value}" for key, value in query_params.items()])
+        m = hashlib.sha512()
+        m.update(query_string.encode())
+        payload["query_hash"] = m.hexdigest()
+        payload["query_hash_alg"] = "SHA512"
+    return jwt.encode(payload, SECRET_KEY)
+
+
+def check() -> int:
+    signer = UpbitSigner(ACCESS_KEY, SECRET_KEY)
+    errors = []
+    for params in QUERIES:
+        query = encode_params(params)
+        claims = jwt.decode(signer.token(query), SECRET_KEY, algorithms=["HS256"])
+        if claims["access_key"] != ACCESS_KEY:
+            errors.append(f"access_key mismatch for {params}")
+        if query and claims.get("query_hash") != hashlib.sha512(unquote(query).encode()).hexdigest():
+            errors.append(f"query_hash mismatch for {params}")
+    nonces = {jwt.decode(signer.token(), SECRET_KEY, algorithms=["HS256"])["nonce"] for _ in range(100)}
+    if len(nonces) != 100:
+        errors.append("nonce reused")
+
+    array = {"states[]": ["done", "cancel"]}
+    print(f"array params on the wire : {unquote(encode_params(array))}")
+    print(f"legacy hashed string     : {'&'.join(f'{k}={v}' for k, v in array.items())}")
+    print(f"token check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    return len(errors)
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return count / (time.perf_counter() - start)
+
+
+def main(tokens: int) -> None:
+    failures = check()
+    signer = UpbitSigner(ACCESS_KEY, SECRET_KEY)
+    params = QUERIES[2]
+    fixed_query = encode_params(params)
+
+    legacy = _rate(lambda i: legacy_token(params), tokens)
+    repeated = _rate(lambda i: signer.token(encode_params(params)), tokens)
+    presigned = _rate(lambda i: signer.token(fixed_query), tokens)
+    unique = _rate(lambda i: signer.token(encode_params({**params, "identifier": f"id-{i}"})), tokens)
+    empty = _rate(lambda i: signer.token(), tokens)
+
+    print(f"\nsigning {tokens} tokens (order params)")
+    print(f"legacy PyJWT + join + sha512       : {legacy:10.0f} tokens/s")
+    print(f"UpbitSigner, encode + sign         : {repeated:10.0f} tokens/s  ({repeated / legacy:.1f}x)")
+    print(f"UpbitSigner, sign pre-encoded query: {presigned:10.0f} tokens/s  ({presigned / legacy:.1f}x)")
+    print(f"UpbitSigner, unique query each call: {unique:10.0f} tokens/s  ({unique / legacy:.1f}x)")
+    print(f"UpbitSigner, no query (accounts)   : {empty:10.0f} tokens/s")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.tokens)
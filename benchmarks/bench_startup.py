@@ -0,0 +1,189 @@
+"""
+서버 시작 시간 벤치마크 (서버 불필요)
+
+새 파이썬 프로세스에서 `python -X importtime -c "import main"`을 실행해 모듈별 import 시간을
+패키지별로 묶어 보여 주고, 도구 등록을 모듈을 모두 불러오는 즉시 등록과 매니페스트를 쓰는 지연 등록으로
+나눠 비교합니다. 도구 목록 조회(list_tools)까지 걸리는 시간과, 지연 등록한 도구를 처음 호출할 때
+모듈을 불러오는 비용도 함께 측정합니다.
+
+다음 중 하나라도 어기면 종료 코드 1:
+  - 프로젝트 모듈(main, config, core, tools, prompts, resources)의 import 시간 합이 --budget-ms 초과
+  - 서버 시작 시 numpy, 분석/시세 처리 모듈, 도구 모듈을 불러옴
+  - 즉시 등록된 도구가 있음 (매니페스트가 없거나 도구 소스가 바뀜)
+  - tools/manifest.json 이 실제 도구 정의와 다름 (python -m core.lazy_tools 로 다시 생성)
+
+같은 검사를 tests/test_startup.py 가 pytest로 실행합니다.
+
+실행:
+    python -m benchmarks.bench_startup [--repeat 5] [--budget-ms 30]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = 30.0
+PROJECT_PACKAGES = ("main", "config", "core", "tools", "prompts", "resources")
+
+# 서버 시작 시 불러오면 안 되는 모듈 (처음 쓰는 도구가 불러옴)
+DEFERRED_MODULES = ("numpy", "websockets", "core.indicators", "core.backtest", "core.scan", "core.candles",
+                    "core.candle_store", "core.live_indicators", "core.trade_tape", "core.portfolio",
+                    "core.orderbook", "core.coalesce")
+
+_STARTUP = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+asyncio.run(main.mcp.list_tools())
+listed = time.perf_counter()
+from core.lazy_tools import LazyTool
+tools = main.mcp._tool_manager.list_tools()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "ready_ms": (listed - start) * 1000,
+    "modules": sorted(sys.modules),
+    "eager": [t.name for t in tools if not isinstance(t, LazyTool)],
+    "loaded": [t.name for t in tools if isinstance(t, LazyTool) and t.loaded],
+}))
+"""
+
+_REGISTER = """
+import json, sys, time
+from fastmcp import FastMCP
+from core.lazy_tools import MANIFEST_PATH, register_tools
+from tools import TOOLS
+path = MANIFEST_PATH if sys.argv[1] == "lazy" else MANIFEST_PATH + ".missing"
+start = time.perf_counter()
+register_tools(FastMCP("bench"), TOOLS, path=path)
+print(json.dumps({"register_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+_FIRST_CALL = """
+import json, time
+import main
+loads = {}
+for tool in main.mcp._tool_manager.list_tools():
+    start = time.perf_counter()
+    tool.load()
+    loads[tool.name] = (time.perf_counter() - start) * 1000
+print(json.dumps(loads))
+"""
+
+
+def _python(code: str, *args: str, importtime: bool = False) -> tuple[dict, str]:
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code, *args]
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def _parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """-X importtime 출력 -> 모듈 이름: (자체 시간 us, 누적 시간 us)"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _package(name: str) -> str:
+    top = name.split(".")[0]
+    return "project" if top in PROJECT_PACKAGES else top
+
+
+def measure_imports(repeat: int) -> tuple[dict, dict[str, float], list[dict]]:
+    """
+    `-X importtime`으로 main을 repeat번 불러와 측정
+
+    Returns:
+        tuple: (마지막 실행 결과, 모듈 이름 -> 자체 import 시간 중앙값(ms), 실행별 결과)
+    """
+    runs = [_python(_STARTUP, importtime=True) for _ in range(repeat)]
+    # -X importtime 자체가 시간을 더하므로 모듈별 시간은 실행별 중앙값으로 봄
+    per_run = [_parse_importtime(stderr) for _, stderr in runs]
+    modules = set().union(*per_run)
+    self_ms = {name: statistics.median(run.get(name, (0, 0))[0] for run in per_run) / 1000 for name in modules}
+    return runs[-1][0], self_ms, [result for result, _ in runs]
+
+
+def project_ms(self_ms: dict[str, float]) -> float:
+    """프로젝트 모듈 import 시간 합 (ms)"""
+    return sum(ms for name, ms in self_ms.items() if _package(name) == "project")
+
+
+def check_startup(result: dict, self_ms: dict[str, float], budget_ms: float = BUDGET_MS) -> list[str]:
+    """시작 예산/지연 로딩/매니페스트 검사 (위반 목록, 없으면 빈 목록)"""
+    errors = []
+    spent = project_ms(self_ms)
+    if spent > budget_ms:
+        errors.append(f"project imports took {spent:.1f}ms (budget {budget_ms:g}ms)")
+    loaded = set(result["modules"])
+    for name in DEFERRED_MODULES:
+        if name in loaded:
+            errors.append(f"{name} imported at startup")
+    for name in sorted(loaded):
+        if name.startswith("tools."):
+            errors.append(f"tool module {name} imported at startup")
+    if result["eager"]:
+        errors.append(f"registered without manifest: {', '.join(result['eager'])}")
+    if result["loaded"]:
+        errors.append(f"loaded before first call: {', '.join(result['loaded'])}")
+
+    from core.lazy_tools import stale_entries
+    from tools import TOOLS
+
+    stale = stale_entries(TOOLS)
+    if stale:
+        errors.append(f"tools/manifest.json is stale for {', '.join(stale)} (run python -m core.lazy_tools)")
+    return errors
+
+
+def main(repeat: int, budget_ms: float) -> None:
+    result, self_ms, runs = measure_imports(repeat)
+    packages: dict[str, float] = {}
+    for name, ms in self_ms.items():
+        packages[_package(name)] = packages.get(_package(name), 0.0) + ms
+    total = sum(packages.values())
+
+    print(f"python -X importtime -c 'import main', median of {repeat} runs: {total:.1f}ms of imports")
+    for package, ms in sorted(packages.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {package:20s} {ms:7.1f}ms ({ms / total:5.1%})")
+    project = sorted(((ms, name) for name, ms in self_ms.items() if _package(name) == "project"), reverse=True)
+    print("  slowest project modules: " + ", ".join(f"{name} {ms:.1f}ms" for ms, name in project[:5]))
+
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    ready_ms = statistics.median(r["ready_ms"] for r in runs)
+    print(f"import main {import_ms:7.1f}ms, first list_tools answered at {ready_ms:7.1f}ms (with importtime overhead)")
+
+    plain = [_python(_STARTUP)[0] for _ in range(repeat)]
+    print(f"without importtime: import main {statistics.median(r['import_ms'] for r in plain):7.1f}ms, "
+          f"ready {statistics.median(r['ready_ms'] for r in plain):7.1f}ms")
+
+    eager = statistics.median(_python(_REGISTER, "eager")[0]["register_ms"] for _ in range(repeat))
+    lazy = statistics.median(_python(_REGISTER, "lazy")[0]["register_ms"] for _ in range(repeat))
+    print(f"tool registration: import every tool module {eager:7.1f}ms, manifest {lazy:7.1f}ms ({eager / lazy:4.1f}x)")
+
+    loads, _ = _python(_FIRST_CALL)
+    slowest = sorted(loads.items(), key=lambda item: -item[1])[:5]
+    print("first call module load: " + ", ".join(f"{name} {ms:.1f}ms" for name, ms in slowest))
+
+    print(f"budget: project imports {project_ms(self_ms):.1f}ms / {budget_ms:g}ms")
+    errors = check_startup(result, self_ms, budget_ms)
+    print(f"check: {len(errors)} errors")
+    for error in errors:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="project module import time budget")
+    args = parser.parse_args()
+    main(args.repeat, args.budget_ms)
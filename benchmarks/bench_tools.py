@@ -0,0 +1,256 @@
+"""
+MCP 도구 전체 부하 벤치마크
+
+로컬 업비트 REST 스탠드인 서버(선택적으로 웹소켓 서버)를 띄우고, main.py 에 등록된 모든 도구를
+FastMCP 서버에 메모리 스트림으로 연결한 MCP 클라이언트로 호출합니다. 동시 호출 수를 늘려 가며
+도구별 p50/p95/p99 지연, 처리량, 오류 수, 업스트림 요청 수(429 포함)를 측정하고 JSON으로 저장합니다.
+--baseline 으로 이전 결과 파일을 주면 p50/p95 변화율을 함께 출력해 릴리스 간 회귀를 확인할 수 있습니다.
+
+실행:
+    python -m benchmarks.bench_tools [--concurrency 1,8,32] [--calls 32] [--latency 0.005]
+        [--rate-limit 30] [--ws] [--tools get_ticker,get_orders] [--output bench_tools.json]
+        [--baseline previous.json]
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.mock_upbit import BASES, MockUpbitServer
+
+ACCESS_KEY = "bench-access-key"
+SECRET_KEY = "bench-secret-key"
+
+KRW_MARKETS = [f"KRW-{base}" for base in BASES]
+
+
+def _cancel_target(server: MockUpbitServer, i: int) -> dict:
+    """취소할 대기 주문을 스탠드인 계정에 미리 만들어 둔다 (측정 시간에는 포함되지 않음)"""
+    with server.lock:
+        _, order = server.account.create({"market": "KRW-XRP", "side": "bid", "ord_type": "limit",
+                                          "volume": "1", "price": "1000"})
+    return {"uuid": order["uuid"]}
+
+
+def _cancel_targets(server: MockUpbitServer, i: int) -> dict:
+    return {"uuids": [_cancel_target(server, i)["uuid"] for _ in range(3)]}
+
+
+# 도구 이름 -> (스탠드인 서버, 호출 번호) -> 호출 인자
+SCENARIOS = {
+    "get_ticker": lambda s, i: {"symbol": KRW_MARKETS[i % len(KRW_MARKETS)]},
+    "get_tickers": lambda s, i: {"symbols": KRW_MARKETS[i % 10: i % 10 + 10]},
+    "get_orderbook": lambda s, i: {"symbol": KRW_MARKETS[i % len(KRW_MARKETS)]},
+    "get_orderbooks": lambda s, i: {"symbols": KRW_MARKETS[i % 10: i % 10 + 5]},
+    "analyze_orderbook": lambda s, i: {"market": KRW_MARKETS[i % 5], "side": "bid", "amount": 10_000_000},
+    "get_trades": lambda s, i: {"symbol": KRW_MARKETS[i % len(KRW_MARKETS)]},
+    "get_trade_flow": lambda s, i: {"market": KRW_MARKETS[i % 5]},
+    "get_candles": lambda s, i: {"market": KRW_MARKETS[i % 5], "interval": "minute60"},
+    "get_accounts": lambda s, i: {},
+    "portfolio_valuation": lambda s, i: {},
+    "create_order": lambda s, i: {"market": "KRW-XRP", "side": "bid", "ord_type": "limit",
+                                  "volume": "1", "price": "1000"},
+    "get_orders": lambda s, i: {"state": "wait"},
+    "get_order": lambda s, i: {"uuid": f"00000000-0000-4000-8000-{i % 300:012d}"},
+    "cancel_order": _cancel_target,
+    "create_orders": lambda s, i: {"orders": [{"market": "KRW-XRP", "side": "bid", "ord_type": "limit",
+                                               "volume": "1", "price": str(1000 - k)} for k in range(3)]},
+    "cancel_orders": _cancel_targets,
+    "cancel_all": lambda s, i: {"market": "KRW-XRP", "side": "bid"},
+    "get_market_summary": lambda s, i: {"quote": "KRW"},
+    "technical_analysis": lambda s, i: {"market": KRW_MARKETS[i % 5], "interval": "minute60"},
+    "scan_markets": lambda s, i: {"interval": "minute60", "signals": ["rsi_oversold", "macd_cross_up"],
+                                  "match": "any"},
+    "get_live_indicators": lambda s, i: {"market": KRW_MARKETS[i % 5], "interval": "minute60"},
+    "backtest_strategy": lambda s, i: {"markets": KRW_MARKETS[:5], "interval": "day", "count": 500,
+                                       "rsi_oversold": [25, 30, 35]},
+    "get_deposits_withdrawals": lambda s, i: {"transaction_type": ("deposit", "withdraw")[i % 2]},
+    "subscribe_market_data": lambda s, i: {"symbols": ["KRW-BTC"], "types": ["ticker"]},
+    "unsubscribe_market_data": lambda s, i: {"symbols": ["KRW-DOGE"], "types": ["ticker"]},
+}
+
+
+def _is_error(result) -> bool:
+    """MCP 오류 응답이거나 도구가 {"error": ...} (또는 그 목록)를 돌려준 경우"""
+    if result.isError:
+        return True
+    for content in result.content:
+        text = getattr(content, "text", "")
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(payload, list) and payload and isinstance(payload[0], dict):
+            payload = payload[0]
+        if isinstance(payload, dict) and "error" in payload:
+            return True
+    return False
+
+
+async def _run_level(session, server: MockUpbitServer, tool: str, calls: int, concurrency: int) -> dict:
+    factory = SCENARIOS.get(tool, lambda s, i: {})
+    arguments = [factory(server, i) for i in range(calls)]
+    latencies, errors = [], 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(args: dict) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(tool, args)
+                failed = _is_error(result)
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            errors += failed
+
+    server.reset_counts()
+    start = time.perf_counter()
+    await asyncio.gather(*[call(args) for args in arguments])
+    wall = time.perf_counter() - start
+    ms = np.array(latencies) * 1000
+    return {
+        "tool": tool,
+        "concurrency": concurrency,
+        "calls": calls,
+        "errors": errors,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "throughput_rps": round(calls / wall, 1),
+        "upstream_requests": server.request_count,
+        "upstream_per_call": round(server.request_count / calls, 3),
+        "upstream_429": server.throttled_count,
+        "upstream_groups": dict(server.group_counts),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(results: list[dict], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["tool"], r["concurrency"]): r for r in json.load(f)["results"]}
+    print(f"\nvs baseline {baseline_path} (p50 / p95 change, + is slower)")
+    for r in results:
+        old = baseline.get((r["tool"], r["concurrency"]))
+        if not old:
+            continue
+        p50 = r["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+        p95 = r["p95_ms"] / old["p95_ms"] - 1 if old["p95_ms"] else 0.0
+        flag = "  <-- regression" if p95 > 0.2 else ""
+        print(f"  {r['tool']:26s} c={r['concurrency']:<3d} p50 {p50:+7.1%}  p95 {p95:+7.1%}{flag}")
+
+
+async def main(args) -> None:
+    levels = [int(x) for x in args.concurrency.split(",")]
+    ws = None
+    with MockUpbitServer(latency=args.latency, rate_limit=args.rate_limit, secret_key=SECRET_KEY) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+        os.environ["UPBIT_ACCESS_KEY"] = ACCESS_KEY
+        os.environ["UPBIT_SECRET_KEY"] = SECRET_KEY
+        os.environ["UPBIT_CANDLE_STORE_DIR"] = tempfile.mkdtemp(prefix="bench-tools-")
+        if not args.client_rate_limit:
+            os.environ["UPBIT_RATE_LIMIT"] = "false"
+        if args.ws:
+            from benchmarks.mock_upbit_ws import MockUpbitWebSocket
+            ws = MockUpbitWebSocket().start()
+            os.environ["UPBIT_WS_URL"] = ws.url
+            os.environ["UPBIT_WS_SUBSCRIBE"] = ",".join(KRW_MARKETS)
+
+        from mcp.shared.memory import create_connected_server_and_client_session
+        import main as server_main
+
+        # fastmcp 0.4 의 Context.info/error 는 비동기 로그 전송을 기다리지 않는다 (측정과 무관한 경고)
+        warnings.filterwarnings("ignore", message="coroutine .* was never awaited", category=RuntimeWarning)
+        # 요청마다 찍히는 "Processing request" 로그가 결과 출력을 덮지 않도록
+        logging.getLogger("mcp").setLevel(logging.WARNING)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        results, cold = [], {}
+        async with server_main.lifespan(server_main.mcp):
+            async with create_connected_server_and_client_session(server_main.mcp._mcp_server) as session:
+                tools = [tool.name for tool in (await session.list_tools()).tools]
+                if args.tools:
+                    tools = [name for name in tools if name in args.tools.split(",")]
+                missing = [name for name in tools if name not in SCENARIOS]
+                if missing:
+                    print(f"no scenario for {', '.join(missing)} (called without arguments)")
+                if args.ws:
+                    await asyncio.sleep(0.5)  # 첫 프레임 수신 대기
+
+                for tool in tools:
+                    # 첫 호출(캐시/저장소가 빈 상태)은 따로 기록하고 측정에서 제외
+                    server.reset_counts()
+                    start = time.perf_counter()
+                    await session.call_tool(tool, SCENARIOS.get(tool, lambda s, i: {})(server, 0))
+                    cold[tool] = {"ms": round((time.perf_counter() - start) * 1000, 3),
+                                  "upstream_requests": server.request_count}
+                    for concurrency in levels:
+                        result = await _run_level(session, server, tool, args.calls, concurrency)
+                        results.append(result)
+                        print(f"{tool:26s} c={concurrency:<3d} p50={result['p50_ms']:9.2f}ms "
+                              f"p95={result['p95_ms']:9.2f}ms p99={result['p99_ms']:9.2f}ms "
+                              f"{result['throughput_rps']:8.1f}/s err={result['errors']:<3d} "
+                              f"upstream/call={result['upstream_per_call']:.2f} 429={result['upstream_429']}")
+    if ws is not None:
+        ws.stop()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "latency": args.latency,
+            "rate_limit": args.rate_limit,
+            "client_rate_limit": args.client_rate_limit,
+            "websocket": args.ws,
+            "calls_per_level": args.calls,
+            "concurrency": levels,
+        },
+        "cold": cold,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nsaved {len(results)} results to {args.output}")
+    if args.baseline:
+        _compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", default="1,8,32", help="comma separated in-flight call counts")
+    parser.add_argument("--calls", type=int, default=32, help="calls per tool per concurrency level")
+    parser.add_argument("--latency", type=float, default=0.005, help="mock REST latency in seconds")
+    parser.add_argument("--rate-limit", type=int, default=None, help="mock per-group requests/s before 429")
+    parser.add_argument("--client-rate-limit", action="store_true", help="keep the client-side rate limiter on")
+    parser.add_argument("--ws", action="store_true", help="also start the mock WebSocket server")
+    parser.add_argument("--tools", default=None, help="comma separated subset of tools")
+    parser.add_argument("--output", default="bench_tools.json")
+    parser.add_argument("--baseline", default=None, help="previous JSON result to compare against")
+    args = parser.parse_args()
+    # 설정(config)은 스탠드인 서버 주소를 넣은 뒤에 읽혀야 하므로 여기서는 프로젝트 모듈을 import 하지 않는다
+    if args.ws and importlib.util.find_spec("websockets") is None:
+        sys.exit("--ws requires the websockets package")
+    asyncio.run(main(args))
@@ -0,0 +1,161 @@
+"""
+체결 테이프 벤치마크
+
+로컬 업비트 스탠드인 서버(250ms마다 체결 하나)에서 15분 체결 흐름을 N번 갱신해 봅니다.
+get_trades를 커서로 이어 호출해 15분치 원본 체결을 매번 받는 방식과 get_trade_flow(처음에만 채우고
+이후에는 새 체결만 받음)의 요청 수, 모델에 전달되는 응답 크기, 시간을 비교합니다.
+증분 집계가 원본 체결로 다시 계산한 VWAP/체결량 불균형/체결 수와 같은지, 겹치는 체결이
+한 번만 집계되는지, 작은 링 버퍼가 넘칠 때도 합계가 맞는지 확인합니다 (불일치 시 종료 코드 1).
+마지막으로 체결 하나씩 넣을 때의 증분 갱신 비용을 구간 전체 재계산과 비교합니다 (서버 불필요).
+
+실행:
+    python -m benchmarks.bench_trade_tape [--polls 10] [--latency 0.02]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.mock_upbit import MockUpbitServer, make_trades
+
+MARKET = "KRW-BTC"
+# 갱신 사이에 생기는 새 체결 수 (250ms 간격이므로 30초)
+NEW_PER_POLL = 120
+
+
+def _reference(trades: list[dict], windows: tuple[int, ...]) -> dict[str, dict]:
+    """중복을 뺀 원본 체결로 구간별 값을 다시 계산"""
+    unique = {t["sequential_id"]: t for t in trades}.values()
+    ts = np.array([t["timestamp"] for t in unique])
+    price = np.array([t["trade_price"] for t in unique])
+    volume = np.array([t["trade_volume"] for t in unique])
+    buy = np.array([t["ask_bid"] == "BID" for t in unique])
+    result = {}
+    for seconds in windows:
+        mask = ts > ts.max() - seconds * 1000
+        v, b = volume[mask].sum(), volume[mask & buy].sum()
+        result[f"{seconds}s"] = {"trades": int(mask.sum()), "vwap": (price[mask] * volume[mask]).sum() / v,
+                                 "imbalance": (2 * b - v) / v}
+    return result
+
+
+def _compare(label: str, summary: dict, expected: dict, errors: list) -> None:
+    for name, ref in expected.items():
+        got = summary["windows"][name]
+        if got["trades"] != ref["trades"]:
+            errors.append(f"{label} {name}: trades {got['trades']} != {ref['trades']}")
+        for key in ("vwap", "imbalance"):
+            if not math.isclose(got[key], ref[key], rel_tol=1e-8, abs_tol=1e-6):
+                errors.append(f"{label} {name}: {key} {got[key]} != {ref[key]}")
+
+
+async def _raw_window(get_trades, seconds: int) -> list[dict]:
+    """get_trades를 커서로 이어 호출해 최근 seconds초 원본 체결 수집"""
+    trades, cursor = [], None
+    while True:
+        page = await get_trades(MARKET, count=500, cursor=cursor)
+        trades.extend(page)
+        if len(page) < 500 or trades[0]["timestamp"] - page[-1]["timestamp"] >= seconds * 1000:
+            return trades
+        cursor = str(page[-1]["sequential_id"])
+
+
+def _ring_check(errors: list) -> None:
+    from core.trade_tape import TradeTape, WINDOWS, to_ticks
+
+    # 1000개 링에 겹치는 300개 묶음을 넣어 여러 번 넘치게 한다 (구간 재계산 포함)
+    tape = TradeTape(MARKET, capacity=1000, windows=WINDOWS)
+    batches = [make_trades(MARKET, 300, head=1_000_000 + 250 * i) for i in range(12)]
+    for batch in batches:
+        tape.append(to_ticks(batch))
+    kept = sorted({t["sequential_id"]: t for b in batches for t in b}.values(), key=lambda t: t["timestamp"])[-1000:]
+    if tape.size != 1000 or tape.duplicates != 12 * 300 - (250 * 11 + 300):
+        errors.append(f"ring: size {tape.size}, duplicates {tape.duplicates}")
+    _compare("ring", tape.summary(), _reference(kept, WINDOWS), errors)
+
+
+def _update_cost() -> tuple[float, float]:
+    from core.trade_tape import TradeTape, to_ticks
+
+    ticks = to_ticks(make_trades(MARKET, 8000))[::-1]
+    tape = TradeTape(MARKET, capacity=20000)
+    tape.append(ticks[:4000])
+    start = time.perf_counter()
+    for i in range(4000, 8000):
+        tape.append(ticks[i:i + 1])
+    incremental = (time.perf_counter() - start) / 4000
+
+    start = time.perf_counter()
+    for i in range(4000, 4400):
+        window = ticks[:i + 1]
+        for seconds in (60, 300, 900):
+            w = window[window["timestamp"] > window["timestamp"][-1] - seconds * 1000]
+            (w["price"] * w["volume"]).sum() / w["volume"].sum()
+            w["volume"][w["side"] > 0].sum()
+    full = (time.perf_counter() - start) / 400
+    return incremental, full
+
+
+async def main(polls: int, latency: float) -> None:
+    with MockUpbitServer(latency=latency) as server:
+        os.environ["UPBIT_API_BASE"] = server.api_base
+
+        from core.http import http_lifespan
+        from core.trade_tape import WINDOWS, get_trade_tapes, to_ticks
+        from tools.get_trades import get_trades
+        from tools.get_trade_flow import get_trade_flow
+
+        errors, rows = [], {}
+        async with http_lifespan():
+            for label in ("get_trades pages", "get_trade_flow"):
+                await asyncio.sleep(1.1)  # 앞선 측정의 요청이 체결 그룹 한도에 남지 않도록
+                head = server.trade_head
+                server.reset_counts()
+                elapsed = size = 0.0
+                for _ in range(polls):
+                    server.advance_trades(NEW_PER_POLL)
+                    start = time.perf_counter()
+                    if label == "get_trade_flow":
+                        result = await get_trade_flow(MARKET)
+                    else:
+                        result = await _raw_window(get_trades, max(WINDOWS))
+                    elapsed += time.perf_counter() - start
+                    size += len(json.dumps(result))
+                    if label == "get_trade_flow":
+                        raw = make_trades(MARKET, max(WINDOWS) * 4 + 400, head=server.trade_head)
+                        _compare(f"poll {server.trade_head - head}", result, _reference(raw, WINDOWS), errors)
+                rows[label] = (elapsed, server.request_count, size)
+
+            # 이미 받은 페이지를 다시 넣어도 추가되지 않아야 함
+            tape = get_trade_tapes().get(MARKET)
+            before = tape.summary()
+            page = await get_trades(MARKET, count=500)
+            if tape.append(to_ticks(page)) != 0 or tape.summary() != before:
+                errors.append("overlapping page was counted twice")
+
+        _ring_check(errors)
+        incremental, full = _update_cost()
+
+    print(f"{polls} refreshes of 15-minute trade flow, {NEW_PER_POLL} new trades between refreshes, "
+          f"{latency * 1000:.0f}ms latency")
+    for label, (elapsed, requests, size) in rows.items():
+        print(f"{label:16s}: {elapsed:6.2f}s  {requests:4d} requests  {size / polls / 1024:8.1f} KiB per refresh to the model")
+    print(f"per-trade update: incremental {incremental * 1e6:.1f}us, full window recompute {full * 1e6:.1f}us")
+    print(f"check: {len(errors)} errors")
+    for error in errors[:10]:
+        print("  " + error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--polls", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.polls, args.latency))
@@ -0,0 +1,726 @@
+"""
+업비트 REST API를 흉내 내는 로컬 테스트 서버
+
+벤치마크에서 실제 api.upbit.com 대신 사용합니다. HTTP/1.1 keep-alive를 지원하며
+응답 지연(latency)과 그룹별 초당 요청 한도(rate_limit, 모든 그룹에 같은 값 또는 그룹 -> 한도)를
+설정할 수 있습니다.
+한도를 넘는 요청에는 실제 거래소처럼 429와 Remaining-Req 헤더를 반환합니다.
+시세 API와 함께 계정/주문/입출금 비공개 API도 메모리 안의 계정(MockAccount)으로 흉내 냅니다.
+
+사용 예:
+    server = MockUpbitServer(latency=0.002)
+    server.start()
+    os.environ["UPBIT_API_BASE"] = server.api_base
+    ...
+    server.stop()
+"""
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+
+import jwt
+
+QUOTES = ["KRW", "BTC", "USDT"]
+BASES = [
+    "BTC", "ETH", "XRP", "SOL", "ADA", "DOGE", "AVAX", "DOT", "MATIC", "LINK",
+    "TRX", "ATOM", "ETC", "BCH", "NEAR", "APT", "ARB", "OP", "SUI", "SEI",
+]
+
+
+def _market_list() -> list[dict]:
+    markets = []
+    for quote in QUOTES:
+        for base in BASES:
+            if quote == "BTC" and base == "BTC":
+                continue
+            markets.append({
+                "market": f"{quote}-{base}",
+                "korean_name": base,
+                "english_name": base,
+            })
+    # KRW 마켓은 실제 거래소처럼 100개 이상이 되도록 채운다
+    for i in range(130):
+        markets.append({
+            "market": f"KRW-C{i:03d}",
+            "korean_name": f"C{i:03d}",
+            "english_name": f"C{i:03d}",
+        })
+    return markets
+
+
+MARKETS = _market_list()
+MARKET_CODES = {m["market"] for m in MARKETS}
+
+
+def make_ticker(market: str) -> dict:
+    """시장별로 결정적인(재현 가능한) 티커 데이터를 생성"""
+    rng = random.Random(market)
+    price = round(rng.uniform(10, 100_000_000), 2)
+    change_rate = round(rng.uniform(-0.2, 0.2), 4)
+    return {
+        "market": market,
+        "trade_date": "20250101",
+        "trade_time": "000000",
+        "trade_date_kst": "20250101",
+        "trade_time_kst": "090000",
+        "trade_timestamp": 1735689600000,
+        "opening_price": price * (1 - change_rate),
+        "high_price": price * 1.05,
+        "low_price": price * 0.95,
+        "trade_price": price,
+        "prev_closing_price": price * (1 - change_rate),
+        "change": "RISE" if change_rate > 0 else "FALL",
+        "change_price": abs(price * change_rate),
+        "change_rate": abs(change_rate),
+        "signed_change_price": price * change_rate,
+        "signed_change_rate": change_rate,
+        "trade_volume": rng.uniform(0, 10),
+        "acc_trade_price": rng.uniform(1e6, 1e11),
+        "acc_trade_price_24h": rng.uniform(1e6, 1e11),
+        "acc_trade_volume": rng.uniform(1, 1e6),
+        "acc_trade_volume_24h": rng.uniform(1, 1e6),
+        "highest_52_week_price": price * 2,
+        "highest_52_week_date": "2024-03-14",
+        "lowest_52_week_price": price / 2,
+        "lowest_52_week_date": "2024-08-05",
+        "timestamp": 1735689600000,
+    }
+
+
+def make_orderbook(market: str, levels: int = 15) -> dict:
+    rng = random.Random(market + "/ob")
+    mid = make_ticker(market)["trade_price"]
+    tick = max(mid * 0.0005, 0.0001)
+    units = []
+    for i in range(levels):
+        units.append({
+            "ask_price": mid + tick * (i + 1),
+            "bid_price": mid - tick * (i + 1),
+            "ask_size": rng.uniform(0.01, 5),
+            "bid_size": rng.uniform(0.01, 5),
+        })
+    return {
+        "market": market,
+        "timestamp": 1735689600000,
+        "total_ask_size": sum(u["ask_size"] for u in units),
+        "total_bid_size": sum(u["bid_size"] for u in units),
+        "orderbook_units": units,
+        "level": 0,
+    }
+
+
+# 스탠드인 체결 테이프: n번째 체결은 sequential_id TRADE_SEQ_BASE + n, TRADE_SPACING_MS 간격.
+# 기본 최신 체결(TRADE_HEAD)의 시각이 2025-01-01 00:00:00 UTC
+TRADE_HEAD = 1_000_000
+TRADE_SEQ_BASE = 17356896000000000 - TRADE_HEAD
+TRADE_SPACING_MS = 250
+TRADE_EPOCH_MS = 1735689600000
+
+
+def make_trade(market: str, n: int, price: float | None = None) -> dict:
+    rng = random.Random(f"{market}/trades/{n}")
+    price = make_ticker(market)["trade_price"] if price is None else price
+    timestamp = TRADE_EPOCH_MS + (n - TRADE_HEAD) * TRADE_SPACING_MS
+    dt = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
+    return {
+        "market": market,
+        "trade_date_utc": dt.strftime("%Y-%m-%d"),
+        "trade_time_utc": dt.strftime("%H:%M:%S"),
+        "timestamp": timestamp,
+        "trade_price": price * (1 + rng.uniform(-0.001, 0.001)),
+        "trade_volume": rng.uniform(0.001, 1),
+        "prev_closing_price": price,
+        "change_price": 0.0,
+        "ask_bid": rng.choice(["ASK", "BID"]),
+        "sequential_id": TRADE_SEQ_BASE + n,
+    }
+
+
+def make_trades(market: str, count: int = 5, cursor: str | int | None = None, head: int = TRADE_HEAD) -> list[dict]:
+    """최신순 체결 목록 (cursor를 주면 그 sequential_id보다 이전 체결부터)"""
+    start = head if cursor is None else min(head, int(cursor) - TRADE_SEQ_BASE - 1)
+    price = make_ticker(market)["trade_price"]
+    return [make_trade(market, n, price) for n in range(start, max(start - count, -1), -1)]
+
+
+# 스탠드인 캔들 데이터의 기준 시각 (이 시각 이전 캔들만 존재)과 시작 시각
+CANDLE_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+CANDLE_HISTORY_START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _candle_minutes(unit: str) -> int:
+    """캔들 경로의 단위 부분(minutes/1, days, weeks, months 등)을 분 단위로 변환"""
+    if unit.startswith("minutes/"):
+        return int(unit.split("/")[1])
+    if unit.startswith("minute"):
+        return int(unit.removeprefix("minute"))
+    return {"days": 1440, "weeks": 10080, "months": 43200}[unit]
+
+
+def _parse_to(value: str | None) -> datetime:
+    if not value:
+        return CANDLE_NOW
+    value = value.replace(" ", "T").removesuffix("Z")
+    dt = datetime.fromisoformat(value)
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def make_candles(market: str, unit: str, count: int, to: str | None = None) -> list[dict]:
+    """
+    to 이전(미포함)의 캔들을 최신순으로 생성
+
+    같은 시각의 캔들은 어떤 요청으로 받아도 같은 값을 가지므로 페이지 경계 중복 제거를 확인할 수 있습니다.
+    """
+    minutes = _candle_minutes(unit)
+    step = minutes * 60
+    end = min(_parse_to(to), CANDLE_NOW)
+    start_ts = int(CANDLE_HISTORY_START.timestamp())
+    # to 이전에 시작한 마지막 캔들의 인덱스
+    last = (int(end.timestamp()) - 1 - start_ts) // step
+    base = make_ticker(market)["trade_price"]
+    candles = []
+    for i in range(last, max(last - count, -1), -1):
+        rng = random.Random(f"{market}/{unit}/{i}")
+        open_ = base * (1 + 0.05 * math.sin(i / 50))
+        close = open_ * (1 + rng.uniform(-0.01, 0.01))
+        candle_time = datetime.fromtimestamp(start_ts + i * step, tz=timezone.utc)
+        candles.append({
+            "market": market,
+            "candle_date_time_utc": candle_time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "candle_date_time_kst": (candle_time + timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "opening_price": open_,
+            "high_price": max(open_, close) * (1 + rng.uniform(0, 0.004)),
+            "low_price": min(open_, close) * (1 - rng.uniform(0, 0.004)),
+            "trade_price": close,
+            "timestamp": (start_ts + (i + 1) * step) * 1000 - 1,
+            "candle_acc_trade_price": rng.uniform(1e6, 1e9),
+            "candle_acc_trade_volume": rng.uniform(1, 1000),
+            "unit": minutes,
+        })
+    return candles
+
+
+# 스탠드인 계정의 보유 자산 (통화, 수량, 평균 매수가 비율)
+ACCOUNT_HOLDINGS = (("BTC", 0.5, 0.9), ("ETH", 4.0, 1.1), ("XRP", 3000.0, 0.8), ("SOL", 20.0, 1.05),
+                    ("DOGE", 10000.0, 0.7))
+ORDER_HISTORY_SIZE = 300
+TRANSFER_HISTORY_SIZE = 150
+FEE_RATE = 0.0005
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone(timedelta(hours=9))).isoformat(timespec="seconds")
+
+
+def _price(market: str) -> float:
+    return make_ticker(market)["trade_price"]
+
+
+def make_order(market: str, side: str, ord_type: str, volume: float | None, price: float | None,
+               state: str, created_at: datetime, identifier: str | None = None, uid: str | None = None) -> dict:
+    """업비트 주문 응답 형식의 주문 데이터"""
+    executed = volume if state == "done" and volume else 0.0
+    order = {
+        "uuid": uid or str(uuid.uuid4()),
+        "side": side,
+        "ord_type": ord_type,
+        "price": None if price is None else f"{price:g}",
+        "state": state,
+        "market": market,
+        "created_at": _iso(created_at),
+        "volume": None if volume is None else f"{volume:g}",
+        "remaining_volume": None if volume is None else f"{(volume - executed):g}",
+        "reserved_fee": f"{(price or 0) * (volume or 1) * FEE_RATE:g}",
+        "remaining_fee": "0",
+        "paid_fee": f"{(price or 0) * executed * FEE_RATE:g}",
+        "locked": "0",
+        "executed_volume": f"{executed:g}",
+        # 시장가 주문(price 없음)은 현재가에 체결된 것으로 봄
+        "executed_funds": f"{executed * (price if price is not None else _price(market)):g}",
+        "trades_count": 1 if executed else 0,
+    }
+    if identifier:
+        order["identifier"] = identifier
+    return order
+
+
+def make_order_history(now: datetime, size: int = ORDER_HISTORY_SIZE) -> list[dict]:
+    """최근 90일에 걸친 재현 가능한 주문 이력 (최신순), 일부는 대기 주문"""
+    rng = random.Random("orders")
+    markets = [f"KRW-{base}" for base, _, _ in ACCOUNT_HOLDINGS]
+    orders = []
+    for i in range(size):
+        market = rng.choice(markets)
+        price = _price(market) * rng.uniform(0.9, 1.1)
+        state = "wait" if i < 12 else rng.choice(["done", "done", "cancel"])
+        created = now - timedelta(minutes=i * 431 + rng.randint(0, 400))
+        orders.append(make_order(market, rng.choice(["bid", "ask"]), "limit", rng.uniform(0.001, 2), price,
+                                 state, created, uid=f"00000000-0000-4000-8000-{i:012d}"))
+    return orders
+
+
+def make_transfers(kind: str, now: datetime, size: int = TRANSFER_HISTORY_SIZE) -> list[dict]:
+    """입금(deposit)/출금(withdraw) 이력 (최신순)"""
+    rng = random.Random(kind)
+    transfers = []
+    for i in range(size):
+        currency = rng.choice(["KRW", "BTC", "ETH", "XRP"])
+        created = now - timedelta(hours=i * 13 + rng.randint(0, 12))
+        state = rng.choice(["ACCEPTED", "ACCEPTED", "DONE", "REJECTED"] if kind == "deposit"
+                           else ["DONE", "DONE", "CANCELED", "REJECTED"])
+        transfers.append({
+            "type": kind,
+            "uuid": f"{'d' if kind == 'deposit' else 'w'}0000000-0000-4000-8000-{i:012d}",
+            "currency": currency,
+            "net_type": None if currency == "KRW" else currency,
+            "txid": f"{kind}-{i:06d}",
+            "state": state,
+            "created_at": _iso(created),
+            "done_at": _iso(created + timedelta(minutes=10)) if state in ("ACCEPTED", "DONE") else None,
+            "amount": f"{rng.uniform(1e4, 1e7) if currency == 'KRW' else rng.uniform(0.01, 10):.8f}",
+            "fee": "0" if kind == "deposit" else "0.0005",
+            "transaction_type": "default",
+        })
+    return transfers
+
+
+class MockAccount:
+    """
+    주문/취소에 따라 잔고가 바뀌는 스탠드인 계정
+
+    지정가 주문은 대기(wait) 상태로 남아 잔고를 묶고(locked), 시장가 주문은 현재가로 바로 체결됩니다.
+    """
+
+    def __init__(self, now: datetime | None = None):
+        now = now or datetime.now(timezone.utc)
+        self.balances = {"KRW": [100_000_000.0, 0.0]}
+        self.avg_prices = {"KRW": 0.0}
+        for currency, amount, ratio in ACCOUNT_HOLDINGS:
+            self.balances[currency] = [amount, 0.0]
+            self.avg_prices[currency] = _price(f"KRW-{currency}") * ratio
+        self.orders = make_order_history(now)
+        self.by_uuid = {order["uuid"]: order for order in self.orders}
+        self.by_identifier: dict[str, dict] = {}
+        self.transfers = {kind: make_transfers(kind, now) for kind in ("deposit", "withdraw")}
+        # 주문/잔고가 바뀔 때 myOrder/myAsset 웹소켓 프레임을 받는 콜백 (다른 스레드에서 호출됨)
+        self.listeners: list = []
+
+    def accounts(self) -> list[dict]:
+        return [
+            {
+                "currency": currency,
+                "balance": f"{balance:.8f}",
+                "locked": f"{locked:.8f}",
+                "avg_buy_price": f"{self.avg_prices[currency]:g}",
+                "avg_buy_price_modified": False,
+                "unit_currency": "KRW",
+            }
+            for currency, (balance, locked) in self.balances.items()
+        ]
+
+    def _lock(self, order: dict, sign: int) -> None:
+        """대기 주문만큼 잔고를 묶거나(sign=1) 푼다(sign=-1)"""
+        currency = order["market"].split("-")[1]
+        if order["side"] == "bid":
+            amount = float(order["price"]) * float(order["remaining_volume"]) * (1 + FEE_RATE)
+            currency = "KRW"
+        else:
+            amount = float(order["remaining_volume"])
+        balance = self.balances.setdefault(currency, [0.0, 0.0])
+        balance[0] -= sign * amount
+        balance[1] += sign * amount
+        self.avg_prices.setdefault(currency, 0.0)
+
+    def create(self, params: dict) -> tuple[int, dict]:
+        market, side, ord_type = params.get("market"), params.get("side"), params.get("ord_type")
+        if market not in MARKET_CODES or side not in ("bid", "ask") or ord_type not in ("limit", "price", "market"):
+            return 400, {"error": {"name": "invalid_parameter", "message": "잘못된 주문 파라미터입니다."}}
+        identifier = params.get("identifier")
+        if identifier and identifier in self.by_identifier:
+            return 400, {"error": {"name": "duplicate_identifier", "message": "이미 사용된 identifier 입니다."}}
+        volume = float(params["volume"]) if params.get("volume") else None
+        price = float(params["price"]) if params.get("price") else None
+        state = "wait" if ord_type == "limit" else "done"
+        if ord_type == "price":
+            volume = price / _price(market)
+            price = None
+        order = make_order(market, side, ord_type, volume, price, state, datetime.now(timezone.utc), identifier)
+        if state == "wait":
+            self._lock(order, 1)
+        else:
+            currency = market.split("-")[1]
+            value = _price(market) * volume
+            sign = 1 if side == "bid" else -1
+            self.balances.setdefault(currency, [0.0, 0.0])[0] += sign * volume
+            self.avg_prices.setdefault(currency, _price(market))
+            self.balances["KRW"][0] -= sign * value + value * FEE_RATE
+        self.orders.insert(0, order)
+        self.by_uuid[order["uuid"]] = order
+        if identifier:
+            self.by_identifier[identifier] = order
+        self._publish(order)
+        return 201, order
+
+    def find(self, params: dict) -> dict | None:
+        if params.get("uuid"):
+            return self.by_uuid.get(params["uuid"])
+        if params.get("identifier"):
+            return self.by_identifier.get(params["identifier"])
+        return None
+
+    def cancel(self, params: dict) -> tuple[int, dict]:
+        order = self.find(params)
+        if order is None:
+            return 404, {"error": {"name": "order_not_found", "message": "주문을 찾지 못했습니다."}}
+        if order["state"] != "wait":
+            return 400, {"error": {"name": "order_not_cancelable", "message": "취소할 수 없는 주문입니다."}}
+        self._lock(order, -1)
+        order["state"] = "cancel"
+        self._publish(order)
+        return 200, order
+
+    def _publish(self, order: dict) -> None:
+        """주문 변경을 업비트 내 주문/자산 웹소켓(DEFAULT 포맷) 프레임으로 알림"""
+        if not self.listeners:
+            return
+        now = int(time.time() * 1000)
+        created = int(datetime.fromisoformat(order["created_at"]).timestamp() * 1000)
+
+        def number(value):
+            return None if value is None else float(value)
+
+        my_order = {
+            "type": "myOrder", "code": order["market"], "uuid": order["uuid"], "ask_bid": order["side"].upper(),
+            "order_type": order["ord_type"], "state": order["state"], "price": number(order["price"]),
+            "volume": number(order["volume"]), "remaining_volume": number(order["remaining_volume"]),
+            "executed_volume": number(order["executed_volume"]), "trades_count": order["trades_count"],
+            "reserved_fee": number(order["reserved_fee"]), "remaining_fee": number(order["remaining_fee"]),
+            "paid_fee": number(order["paid_fee"]), "locked": number(order["locked"]),
+            "identifier": order.get("identifier"), "order_timestamp": created, "timestamp": now,
+            "stream_type": "REALTIME",
+        }
+        currencies = ["KRW", order["market"].split("-")[1]]
+        my_asset = {
+            "type": "myAsset", "asset_uuid": str(uuid.uuid4()),
+            "assets": [{"currency": c, "balance": self.balances[c][0], "locked": self.balances[c][1]}
+                       for c in currencies if c in self.balances],
+            "asset_timestamp": now, "timestamp": now, "stream_type": "REALTIME",
+        }
+        for listener in list(self.listeners):
+            listener(my_order)
+            listener(my_asset)
+
+    def list_orders(self, params: dict) -> list[dict]:
+        states = params.get("states[]") or [params.get("state", "wait")]
+        uuids = set(params.get("uuids[]") or [])
+        identifiers = set(params.get("identifiers[]") or [])
+        orders = [
+            o for o in self.orders
+            if o["state"] in states
+            and (not params.get("market") or o["market"] == params["market"])
+            and (not uuids or o["uuid"] in uuids)
+            and (not identifiers or o.get("identifier") in identifiers)
+        ]
+        return _paginate(orders, params)
+
+    def list_transfers(self, kind: str, params: dict) -> list[dict]:
+        states = set(params.get("states[]") or ([params["state"]] if params.get("state") else []))
+        uuids = set(params.get("uuids[]") or [])
+        txids = set(params.get("txids[]") or ([params["txid"]] if params.get("txid") else []))
+        transfers = [
+            t for t in self.transfers[kind]
+            if (not params.get("currency") or t["currency"] == params["currency"])
+            and (not states or t["state"] in states)
+            and (not uuids or t["uuid"] in uuids)
+            and (not txids or t["txid"] in txids)
+        ]
+        return _paginate(transfers, params)
+
+    def withdraw(self, params: dict) -> tuple[int, dict]:
+        currency = params.get("currency", "KRW")
+        amount = float(params.get("amount") or 0)
+        balance = self.balances.get(currency)
+        if amount <= 0 or balance is None or balance[0] < amount:
+            return 400, {"error": {"name": "insufficient_funds_withdraw", "message": "출금 가능 잔고가 부족합니다."}}
+        balance[0] -= amount
+        transfer = {**self.transfers["withdraw"][0], "uuid": str(uuid.uuid4()), "currency": currency,
+                    "state": "PROCESSING", "amount": f"{amount:.8f}", "created_at": _iso(datetime.now(timezone.utc)),
+                    "done_at": None, "txid": None}
+        self.transfers["withdraw"].insert(0, transfer)
+        return 201, transfer
+
+
+def _paginate(items: list[dict], params: dict) -> list[dict]:
+    page = max(int(params.get("page", "1")), 1)
+    limit = min(max(int(params.get("limit", "100")), 1), 100)
+    if params.get("order_by") == "asc":
+        items = items[::-1]
+    return items[(page - 1) * limit: page * limit]
+
+
+def _group(method: str, path: str) -> str:
+    """core.rate_limit.quota_group 과 같은 기준의 요청 수 제한 그룹"""
+    for prefix, group in (("/market/", "market"), ("/candles/", "candles"), ("/ticker", "ticker"),
+                          ("/orderbook", "orderbook"), ("/trades/", "trades")):
+        if path.startswith(prefix):
+            return group
+    if path == "/orders" and method == "POST":
+        return "order"
+    return "default"
+
+
+def _query_params(query: str) -> dict:
+    """쿼리 문자열을 딕셔너리로 (states[] 같은 배열 파라미터는 리스트로 유지)"""
+    params = {}
+    for key, values in parse_qs(query).items():
+        params[key] = values if key.endswith("[]") else values[0]
+    return params
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    _remaining_req = ""
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        # 클라이언트가 취소한 요청(미리 보낸 페이지 등)에 응답을 쓰다 끊긴 경우는 무시
+        try:
+            super().handle()
+        except ConnectionError:
+            pass
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self._remaining_req:
+            self.send_header("Remaining-Req", self._remaining_req)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        server: "MockUpbitServer" = self.server.mock
+        url = urlparse(self.path)
+        params = _query_params(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if body:
+            params.update(json.loads(body))
+        path = url.path.removeprefix("/v1")
+
+        allowed, self._remaining_req = server.admit(_group(method, path))
+        if server.latency:
+            time.sleep(server.latency)
+        if not allowed:
+            return self._send_json(
+                {"error": {"name": "too_many_requests", "message": "Too many API requests."}}, 429
+            )
+        failure = server.take_failure(method, path)
+        if failure and not failure[1]:
+            return self._send_json({"error": {"name": "server_error", "message": "injected"}}, failure[0])
+        if path in PRIVATE_PATHS:
+            status, payload = self._private(server, method, path, url.query, body, params)
+            if failure:
+                # 요청은 처리했지만 응답을 잃어버린 것처럼 오류를 돌려준다
+                return self._send_json({"error": {"name": "server_error", "message": "injected"}}, failure[0])
+            return self._send_json(payload, status)
+        if method != "GET":
+            return self._send_json({"error": {"name": "not_found", "message": path}}, 404)
+
+        if path == "/market/all":
+            return self._send_json(MARKETS)
+        if path in ("/ticker", "/orderbook"):
+            markets = [m for m in params.get("markets", "").split(",") if m]
+            if not markets or any(m not in MARKET_CODES for m in markets):
+                return self._send_json({"error": {"name": "404", "message": "Code not found"}}, 404)
+            make = make_ticker if path == "/ticker" else make_orderbook
+            return self._send_json([make(m) for m in markets])
+        if path == "/trades/ticks":
+            count = min(int(params.get("count", "5")), 500)
+            return self._send_json(make_trades(params.get("market", ""), count, params.get("cursor"),
+                                               server.trade_head))
+        if path.startswith("/candles/"):
+            if params.get("market") not in MARKET_CODES:
+                return self._send_json({"error": {"name": "404", "message": "Code not found"}}, 404)
+            count = min(int(params.get("count", "1")), 200)
+            unit = path.removeprefix("/candles/")
+            return self._send_json(make_candles(params.get("market", ""), unit, count, params.get("to")))
+        return self._send_json({"error": {"name": "not_found", "message": path}}, 404)
+
+    def _private(self, server: "MockUpbitServer", method: str, path: str, query: str, body: bytes,
+                 params: dict) -> tuple[int, object]:
+        """비공개 API 요청 처리 -> (상태 코드, 응답 본문)"""
+        error = server.verify(self.headers.get("Authorization", ""), query, body)
+        if error:
+            return 401, {"error": {"name": error, "message": "인증에 실패했습니다."}}
+        account = server.account
+        with server.lock:
+            if path == "/accounts" and method == "GET":
+                return 200, account.accounts()
+            if path == "/orders" and method == "GET":
+                return 200, account.list_orders(params)
+            if path == "/orders" and method == "POST":
+                return account.create(params)
+            if path == "/order" and method == "GET":
+                order = account.find(params)
+                if order is None:
+                    return 404, {"error": {"name": "order_not_found", "message": "주문을 찾지 못했습니다."}}
+                return 200, order
+            if path == "/order" and method == "DELETE":
+                return account.cancel(params)
+            if path in ("/deposits", "/withdraws") and method == "GET":
+                return 200, account.list_transfers(path.strip("/").removesuffix("s"), params)
+            if path.startswith("/withdraws/") and method == "POST":
+                return account.withdraw(params)
+        return 404, {"error": {"name": "not_found", "message": path}}
+
+
+PRIVATE_PATHS = {"/accounts", "/orders", "/order", "/deposits", "/withdraws", "/withdraws/coin", "/withdraws/krw"}
+
+
+class MockUpbitServer:
+    """
+    백그라운드 스레드에서 실행되는 업비트 REST 스탠드인 서버
+
+    secret_key를 주면 비공개 API 요청의 JWT 서명과 query_hash(쿼리 문자열 또는 본문의 SHA512)를
+    실제 거래소처럼 확인하고, 맞지 않으면 401을 반환합니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 rate_limit: int | dict[str, int] | None = None, secret_key: str | None = None):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.secret_key = secret_key
+        self.request_count = 0
+        self.throttled_count = 0
+        self.group_counts: dict[str, int] = {}
+        self.account = MockAccount()
+        # 최신 체결 번호 (advance_trades로 새 체결이 생긴 것처럼 늘림)
+        self.trade_head = TRADE_HEAD
+        self.lock = threading.Lock()
+        self.failures: list[list] = []
+        self._windows: dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: threading.Thread | None = None
+
+    def admit(self, group: str) -> tuple[bool, str]:
+        """
+        그룹별 1초 슬라이딩 윈도우로 요청 허용 여부를 결정
+
+        Returns:
+            tuple: (허용 여부, Remaining-Req 헤더 값)
+        """
+        with self._lock:
+            self.request_count += 1
+            self.group_counts[group] = self.group_counts.get(group, 0) + 1
+            # dict면 그룹별 한도 (없는 그룹은 제한 없음)
+            limit = self.rate_limit.get(group) if isinstance(self.rate_limit, dict) else self.rate_limit
+            enforced, limit = limit is not None, limit or 10
+            now = time.monotonic()
+            window = self._windows.setdefault(group, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if enforced and len(window) >= limit:
+                self.throttled_count += 1
+                return False, f"group={group}; min=0; sec=0"
+            window.append(now)
+            return True, f"group={group}; min={limit * 60}; sec={max(limit - len(window), 0)}"
+
+    def verify(self, authorization: str, query: str, body: bytes) -> str | None:
+        """
+        비공개 API 인증 헤더 확인
+
+        Returns:
+            str | None: 실패 시 업비트 오류 이름, 성공 시 None
+        """
+        if not authorization.startswith("Bearer "):
+            return "jwt_verification"
+        if self.secret_key is None:
+            return None
+        try:
+            payload = jwt.decode(authorization.removeprefix("Bearer "), self.secret_key, algorithms=["HS256", "HS512"])
+        except jwt.InvalidTokenError:
+            return "jwt_verification"
+        if query:
+            signed = unquote(query)
+        elif body:
+            # JSON 본문은 key=value&... 형태로 바꿔 해시한다
+            signed = unquote(urlencode(json.loads(body), doseq=True))
+        else:
+            signed = ""
+        if signed:
+            expected = hashlib.sha512(signed.encode()).hexdigest()
+            if payload.get("query_hash") != expected:
+                return "invalid_query_payload"
+        return None
+
+    def fail(self, method: str, path: str, times: int = 1, status: int = 503, processed: bool = False) -> None:
+        """
+        다음 요청 times개에 status 오류를 응답하도록 설정 (재시도 확인용)
+
+        processed=True면 요청은 실제로 처리한 뒤 응답만 오류로 바꿔, 응답을 잃어버린 상황을 흉내 냅니다.
+        """
+        with self._lock:
+            self.failures.append([method, path, times, status, processed])
+
+    def take_failure(self, method: str, path: str) -> tuple[int, bool] | None:
+        with self._lock:
+            for failure in self.failures:
+                if failure[0] == method and failure[1] == path and failure[2] > 0:
+                    failure[2] -= 1
+                    return failure[3], failure[4]
+        return None
+
+    def advance_trades(self, count: int) -> None:
+        """모든 마켓에 새 체결 count개가 생긴 것으로 처리"""
+        self.trade_head += count
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.request_count = 0
+            self.throttled_count = 0
+            self.group_counts = {}
+
+    @property
+    def api_base(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockUpbitServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,210 @@
+"""
+업비트 웹소켓을 흉내 내는 로컬 테스트 서버
+
+구독 요청을 받으면 해당 마켓/스트림의 프레임을 interval 간격으로 반복 전송합니다.
+프레임은 JSON Lines 파일(한 줄에 웹소켓 메시지 하나)로 녹화된 것을 재생하거나,
+파일이 없으면 mock_upbit의 REST 데이터로부터 만들어 사용합니다.
+drop_connections()로 연결을 강제로 끊어 재연결 동작을 확인할 수 있습니다.
+MockPrivateWebSocket은 내 주문/자산(myOrder/myAsset) 웹소켓을 흉내 내며, REST 스탠드인 계정
+(MockAccount)의 주문/취소를 이벤트로 보냅니다.
+
+websockets>=13 패키지가 필요합니다.
+"""
+import asyncio
+import json
+import threading
+
+import jwt
+
+from benchmarks.mock_upbit import make_ticker, make_orderbook, make_trades
+
+
+def load_frames(path: str) -> list[dict]:
+    """녹화된 웹소켓 프레임(JSON Lines)을 읽어옴"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthesize_frames(code: str) -> list[dict]:
+    """REST 스탠드인 데이터로 웹소켓 DEFAULT 포맷 프레임 생성"""
+    ticker = {k: v for k, v in make_ticker(code).items() if k != "market"}
+    orderbook = {k: v for k, v in make_orderbook(code).items() if k != "market"}
+    frames = [
+        {"type": "ticker", "code": code, **ticker, "stream_type": "REALTIME"},
+        {"type": "orderbook", "code": code, **orderbook, "stream_type": "REALTIME"},
+    ]
+    for trade in make_trades(code, 5):
+        frames.append({
+            "type": "trade",
+            "code": code,
+            "trade_price": trade["trade_price"],
+            "trade_volume": trade["trade_volume"],
+            "ask_bid": trade["ask_bid"],
+            "prev_closing_price": trade["prev_closing_price"],
+            "change_price": trade["change_price"],
+            "trade_date": trade["trade_date_utc"],
+            "trade_time": trade["trade_time_utc"],
+            "trade_timestamp": trade["timestamp"],
+            "timestamp": trade["timestamp"],
+            "sequential_id": trade["sequential_id"],
+            "stream_type": "REALTIME",
+        })
+    return frames
+
+
+class MockUpbitWebSocket:
+    """백그라운드 스레드의 이벤트 루프에서 실행되는 업비트 웹소켓 스탠드인 서버"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, interval: float = 0.01,
+                 frames: list[dict] | None = None):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        self.frames = frames
+        self.connections = 0
+        self.subscriptions: list[list] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/websocket/v1"
+
+    def _frames_for(self, types: dict[str, set[str]]) -> list[bytes]:
+        codes = set().union(*types.values()) if types else set()
+        source = self.frames if self.frames is not None else [
+            frame for code in sorted(codes) for frame in synthesize_frames(code)
+        ]
+        return [
+            json.dumps(frame).encode()
+            for frame in source
+            if frame["code"] in types.get(frame["type"], ())
+        ]
+
+    async def _handler(self, ws):
+        self.connections += 1
+        frames: list[bytes] = []
+
+        async def reader():
+            nonlocal frames
+            async for raw in ws:
+                request = json.loads(raw)
+                self.subscriptions.append(request)
+                types = {f["type"]: set(f["codes"]) for f in request if "type" in f}
+                frames = self._frames_for(types)
+
+        reader_task = asyncio.ensure_future(reader())
+        try:
+            while not reader_task.done():
+                for frame in frames:
+                    await ws.send(frame)
+                await asyncio.sleep(self.interval)
+        except Exception:
+            pass
+        finally:
+            reader_task.cancel()
+
+    def _serve(self) -> None:
+        from websockets.asyncio.server import serve
+
+        async def main():
+            self._server = await serve(self._handler, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._server.wait_closed()
+
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(main())
+
+    def start(self) -> "MockUpbitWebSocket":
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def drop_connections(self) -> None:
+        """열린 연결을 모두 끊음 (클라이언트 재연결 확인용)"""
+        def close_all():
+            for connection in list(self._server.connections):
+                asyncio.ensure_future(connection.close())
+        self._loop.call_soon_threadsafe(close_all)
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class MockPrivateWebSocket(MockUpbitWebSocket):
+    """
+    내 주문/자산 웹소켓 스탠드인 서버
+
+    연결 시 Authorization 헤더의 JWT를 secret_key로 확인하고 (실패 시 4001로 종료),
+    myOrder/myAsset 구독 후 계정의 변경 이벤트를 전달합니다.
+    """
+
+    def __init__(self, account, secret_key: str | None = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__(host, port)
+        self.account = account
+        self.secret_key = secret_key
+        self.events = 0
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/websocket/v1/private"
+
+    def _authorized(self, ws) -> bool:
+        header = ws.request.headers.get("Authorization", "")
+        if not header.startswith("Bearer "):
+            return False
+        if self.secret_key is None:
+            return True
+        try:
+            jwt.decode(header.removeprefix("Bearer "), self.secret_key, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            return False
+        return True
+
+    async def _handler(self, ws):
+        self.connections += 1
+        if not self._authorized(ws):
+            await ws.close(4001, "invalid token")
+            return
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        types: set[str] = set()
+
+        def listener(frame: dict) -> None:
+            if frame["type"] in types:
+                loop.call_soon_threadsafe(queue.put_nowait, json.dumps(frame).encode())
+
+        async def reader():
+            async for raw in ws:
+                request = json.loads(raw)
+                self.subscriptions.append(request)
+                types.clear()
+                types.update(f["type"] for f in request if "type" in f)
+
+        self.account.listeners.append(listener)
+        reader_task = asyncio.ensure_future(reader())
+        try:
+            while not reader_task.done():
+                try:
+                    frame = await asyncio.wait_for(queue.get(), 0.5)
+                except asyncio.TimeoutError:
+                    continue
+                await ws.send(frame)
+                self.events += 1
+        except Exception:
+            pass
+        finally:
+            self.account.listeners.remove(listener)
+            reader_task.cancel()
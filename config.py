@@ -1,7 +1,4 @@
 import os
-import uuid
-import jwt
-import hashlib
 from dotenv import load_dotenv
 
 # .env 파일에서 환경 변수 로드
@@ -12,37 +9,94 @@ UPBIT_ACCESS_KEY = os.environ.get("UPBIT_ACCESS_KEY")
 UPBIT_SECRET_KEY = os.environ.get("UPBIT_SECRET_KEY")
 
 # API 기본 URL
-API_BASE = "https://api.upbit.com/v1"
+API_BASE = os.environ.get("UPBIT_API_BASE", "https://api.upbit.com/v1")
 
-# API 키 검증
-if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
-    print("경고: 업비트 API 키가 설정되지 않았습니다. 공개 API만 사용 가능합니다.")
+# 웹소켓 URL 및 시세 스트림 설정
+WS_URL = os.environ.get("UPBIT_WS_URL", "wss://api.upbit.com/websocket/v1")
+WS_SUBSCRIBE = [code.strip() for code in os.environ.get("UPBIT_WS_SUBSCRIBE", "").split(",") if code.strip()]
+WS_TRADE_BUFFER = int(os.environ.get("UPBIT_WS_TRADE_BUFFER", "100"))
+
+# 내 주문/자산 웹소켓 (켜면 잔고/대기 주문 캐시를 실시간으로 갱신, API 키 필요)
+PRIVATE_WS_ENABLED = os.environ.get("UPBIT_PRIVATE_WS", "false").lower() in ("1", "true", "yes")
+PRIVATE_WS_URL = os.environ.get("UPBIT_PRIVATE_WS_URL", "wss://api.upbit.com/websocket/v1/private")
+
+# HTTP 클라이언트 설정 (커넥션 풀, 타임아웃, HTTP/2)
+HTTP_TIMEOUT = float(os.environ.get("UPBIT_HTTP_TIMEOUT", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("UPBIT_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("UPBIT_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("UPBIT_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("UPBIT_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.environ.get("UPBIT_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# 요청 수 제한 설정 (Remaining-Req 헤더 기반 클라이언트측 제한)
+RATE_LIMIT_ENABLED = os.environ.get("UPBIT_RATE_LIMIT", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_MAX_RETRIES = int(os.environ.get("UPBIT_RATE_LIMIT_MAX_RETRIES", "3"))
+
+# 비공개 API 재시도 설정 (조회와 identifier가 있는 주문 생성만 재시도, 대기 시간은 시도마다 2배)
+PRIVATE_MAX_RETRIES = int(os.environ.get("UPBIT_PRIVATE_MAX_RETRIES", "2"))
+PRIVATE_RETRY_BACKOFF = float(os.environ.get("UPBIT_PRIVATE_RETRY_BACKOFF", "0.2"))
+
+# 잔고/대기 주문 캐시 유지 시간 (초, 0이면 내 주문/자산 웹소켓이 연결된 동안에만 캐시)
+ACCOUNT_CACHE_TTL = float(os.environ.get("UPBIT_ACCOUNT_CACHE_TTL", "2"))
+
+# 일괄 주문/취소 시 동시에 보내는 요청 수 (초당 한도는 요청 수 제한기가 주문 그룹 기준으로 적용)
+ORDER_BATCH_CONCURRENCY = int(os.environ.get("UPBIT_ORDER_BATCH_CONCURRENCY", "8"))
+
+# 마켓 목록 캐시 설정 (초)
+MARKET_CACHE_TTL = float(os.environ.get("UPBIT_MARKET_CACHE_TTL", "600"))
+MARKET_CACHE_MAX_STALE = float(os.environ.get("UPBIT_MARKET_CACHE_MAX_STALE", "3600"))
+
+# 여러 마켓 티커를 나누어 조회할 때 동시에 보내는 요청 수
+TICKER_FETCH_CONCURRENCY = int(os.environ.get("UPBIT_TICKER_FETCH_CONCURRENCY", "4"))
+
+# 로컬 캔들 저장소 설정 (마켓/간격별 열 기반 파일)
+CANDLE_STORE_ENABLED = os.environ.get("UPBIT_CANDLE_STORE", "true").lower() in ("1", "true", "yes")
+CANDLE_STORE_DIR = os.environ.get(
+    "UPBIT_CANDLE_STORE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "upbit-mcp-server", "candles"),
+)
+
+# CPU 분석 작업을 실행할 프로세스 풀 설정 (작업자 수 0이면 스레드에서 실행)
+ANALYTICS_WORKERS = int(os.environ.get("UPBIT_ANALYTICS_WORKERS", str(min(4, os.cpu_count() or 1))))
+ANALYTICS_TIMEOUT = float(os.environ.get("UPBIT_ANALYTICS_TIMEOUT", "30"))
+# 입력 배열이 이보다 작으면 프로세스로 보내는 비용이 더 커서 바로 계산
+ANALYTICS_INLINE_BYTES = int(os.environ.get("UPBIT_ANALYTICS_INLINE_BYTES", "262144"))
+
+# 200개를 넘는 캔들을 나누어 조회할 때 동시에 보내는 요청 수
+CANDLE_FETCH_CONCURRENCY = int(os.environ.get("UPBIT_CANDLE_FETCH_CONCURRENCY", "8"))
+
+# 주문/입출금 이력 전체 조회 시 동시에 보내는 페이지 요청 수와 최대 페이지 수 (페이지당 100개)
+HISTORY_FETCH_CONCURRENCY = int(os.environ.get("UPBIT_HISTORY_FETCH_CONCURRENCY", "4"))
+HISTORY_MAX_PAGES = int(os.environ.get("UPBIT_HISTORY_MAX_PAGES", "100"))
+
+# 동시에 들어온 단일 마켓 티커/호가 요청을 하나로 묶는 대기 시간(초)과 최대 묶음 크기
+COALESCE_WINDOW = float(os.environ.get("UPBIT_COALESCE_WINDOW", "0.005"))
+COALESCE_MAX_BATCH = int(os.environ.get("UPBIT_COALESCE_MAX_BATCH", "100"))
+
+# 체결 테이프: 마켓별로 보관할 최근 체결 수와 처음 채우거나 따라잡을 때 요청할 최대 페이지 수 (페이지당 500개)
+TRADE_TAPE_SIZE = int(os.environ.get("UPBIT_TRADE_TAPE_SIZE", "20000"))
+TRADE_TAPE_MAX_PAGES = int(os.environ.get("UPBIT_TRADE_TAPE_MAX_PAGES", "10"))
+
+# 도구 호출/업비트 API 요청 지표 수집 (metrics://server, metrics://prometheus 리소스)
+METRICS_ENABLED = os.environ.get("UPBIT_METRICS", "true").lower() in ("1", "true", "yes")
 
 # Upbit API 인증을 위한 JWT 토큰 생성 함수
 def generate_upbit_token(query_params=None):
     """
     업비트 API 인증을 위한 JWT 토큰 생성
-    
+
+    core.private_api 의 공유 서명기를 사용하며, 쿼리 문자열은 요청과 같은 방식
+    (배열 파라미터 포함)으로 인코딩합니다.
+
     Args:
         query_params (dict, optional): 쿼리 파라미터
-        
+
     Returns:
         str: JWT 토큰
     """
-    payload = {
-        'access_key': UPBIT_ACCESS_KEY,
-        'nonce': str(uuid.uuid4()),
-    }
-    
-    if query_params:
-        query_string = '&'.join([f"{key}={value}" for key, value in query_params.items()])
-        m = hashlib.sha512()
-        m.update(query_string.encode())
-        query_hash = m.hexdigest()
-        payload['query_hash'] = query_hash
-        payload['query_hash_alg'] = 'SHA512'
-    
-    return jwt.encode(payload, UPBIT_SECRET_KEY)
+    from core.private_api import encode_params, get_signer
+
+    return get_signer().token(encode_params(query_params))
 
 # 마켓 코드 유효성 검사 함수
 def is_valid_market(market_code):
@@ -66,7 +120,13 @@ def is_valid_market(market_code):
     market_type, ticker = parts
     if market_type not in ['KRW', 'BTC', 'USDT']:
         return False
-        
+
+    # 마켓 목록이 캐시되어 있으면 실제 상장 여부까지 확인
+    from core.market_cache import get_market_cache
+    codes = get_market_cache().peek_codes()
+    if codes is not None:
+        return market_code in codes
+
     return True
 
 # 주문 유형 유효성 검사 함수
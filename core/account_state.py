@@ -0,0 +1,346 @@
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from config import ACCOUNT_CACHE_TTL, PRIVATE_WS_URL
+from core.decode import loads
+from core.history import stream_pages
+from core.private_api import get_signer, private_request
+
+# 재연결 대기 시간 (초): 실패할 때마다 두 배, 최대값까지
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+# 아직 체결/취소되지 않은 주문 상태 (웹소켓 trade는 일부 체결된 대기 주문)
+OPEN_STATES = ("wait", "watch", "trade")
+
+# 웹소켓 연결 중 우리 주문 뒤 잔고를 조회할 때 myAsset 이벤트를 기다리는 최대 시간 (초, 넘으면 REST 조회)
+ASSET_EVENT_WAIT = 0.2
+
+# 끝난 주문 uuid를 기억하는 개수 (늦게 도착한 응답이 끝난 주문을 되살리지 않도록)
+CLOSED_ORDER_MEMORY = 1000
+
+KST = timezone(timedelta(hours=9))
+
+
+def _decimal(value) -> str | None:
+    """웹소켓의 숫자 값을 REST 응답처럼 문자열로 변환"""
+    if value is None or isinstance(value, str):
+        return value
+    return f"{value:.8f}".rstrip("0").rstrip(".") or "0"
+
+
+def order_from_ws(message: dict) -> dict:
+    """myOrder 웹소켓 메시지를 REST /order 응답과 같은 형태로 변환"""
+    timestamp = message.get("order_timestamp") or message.get("timestamp")
+    order = {
+        "uuid": message["uuid"],
+        "side": message.get("ask_bid", "").lower(),
+        "ord_type": message.get("order_type"),
+        "price": _decimal(message.get("price")),
+        "state": "wait" if message.get("state") == "trade" else message.get("state"),
+        "market": message.get("code"),
+        "created_at": datetime.fromtimestamp(timestamp / 1000, KST).isoformat(timespec="seconds") if timestamp else None,
+        "volume": _decimal(message.get("volume")),
+        "remaining_volume": _decimal(message.get("remaining_volume")),
+        "reserved_fee": _decimal(message.get("reserved_fee")),
+        "remaining_fee": _decimal(message.get("remaining_fee")),
+        "paid_fee": _decimal(message.get("paid_fee")),
+        "locked": _decimal(message.get("locked")),
+        "executed_volume": _decimal(message.get("executed_volume")),
+        "trades_count": message.get("trades_count"),
+    }
+    if message.get("identifier"):
+        order["identifier"] = message["identifier"]
+    return order
+
+
+class _Snapshot:
+    """조회 한 종류(잔고 또는 대기 주문)의 캐시 상태"""
+
+    def __init__(self):
+        self.data = None
+        self.fetched_at = 0.0
+        self.version = 0
+        # 우리 주문으로 바뀌었지만 아직 새 값을 받지 못한 상태
+        self.dirty = False
+        self.inflight: asyncio.Task | None = None
+
+
+class AccountState:
+    """
+    잔고(/accounts)와 대기 주문(/orders?state=wait) 캐시
+
+    - TTL 이내: 메모리에서 바로 반환, 동시에 들어온 갱신은 하나의 요청을 공유 (single-flight)
+    - 주문 생성/취소 성공 시: 대기 주문 목록은 바로 고치고(write-through) 잔고는 다음 조회 때 새로 받음
+      (웹소켓 연결 중이면 뒤이어 오는 myAsset 이벤트로 채움)
+    - 내 주문/자산 웹소켓(myOrder/myAsset)이 연결되어 있으면: 연결 후 받은 스냅샷에 이벤트를
+      반영하며 TTL과 관계없이 사용, 연결이 끊기면 다음 조회에서 REST로 새로 받음
+    갱신 요청이 진행되는 동안 캐시가 고쳐지면 그 응답은 저장하지 않습니다 (이전 상태로 덮어쓰지 않도록).
+    """
+
+    def __init__(self, ttl: float = ACCOUNT_CACHE_TTL, ws_url: str = PRIVATE_WS_URL):
+        self.ttl = ttl
+        self.ws_url = ws_url
+        self._accounts = _Snapshot()
+        self._orders = _Snapshot()
+        self._task: asyncio.Task | None = None
+        self._connected_at: float | None = None
+        self._closed: dict[str, None] = {}
+        # 통화별 마지막 myAsset 수신 시각과 우리 주문 뒤 아직 이벤트를 받지 못한 통화
+        self._asset_updates: dict[str, float] = {}
+        self._pending_assets: set[str] = set()
+        self._asset_event = asyncio.Event()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.events = 0
+        self.reconnects = 0
+
+    @property
+    def live(self) -> bool:
+        return self._connected_at is not None
+
+    # 조회
+
+    def _fresh(self, snapshot: _Snapshot) -> bool:
+        if snapshot.data is None or snapshot.dirty:
+            return False
+        if self._connected_at is not None and snapshot.fetched_at >= self._connected_at:
+            return True
+        return time.monotonic() - snapshot.fetched_at < self.ttl
+
+    async def _load(self, snapshot: _Snapshot, fetch):
+        version = snapshot.version
+        data = await fetch()
+        if snapshot.version == version:
+            snapshot.data = data
+            snapshot.fetched_at = time.monotonic()
+            snapshot.dirty = False
+            if snapshot is self._accounts:
+                self._pending_assets.clear()
+        return data
+
+    async def _get(self, snapshot: _Snapshot, fetch, refresh: bool):
+        if not refresh and self._fresh(snapshot):
+            self.hits += 1
+            return snapshot.data
+        self.misses += 1
+        if snapshot.inflight is None or snapshot.inflight.done():
+            snapshot.inflight = asyncio.ensure_future(self._load(snapshot, fetch))
+        return await asyncio.shield(snapshot.inflight)
+
+    async def accounts(self, refresh: bool = False) -> list[dict]:
+        """
+        보유 자산 목록 반환
+
+        Args:
+            refresh (bool): 캐시와 관계없이 새로 조회할지 여부
+
+        Returns:
+            list[dict]: /accounts 응답과 같은 형식
+        """
+        async def fetch():
+            return {item["currency"]: item for item in await private_request("GET", "/accounts")}
+
+        if self.live and self._pending_assets and not refresh:
+            # 주문 직후라면 곧 도착할 myAsset 이벤트를 잠시 기다린다
+            deadline = time.monotonic() + ASSET_EVENT_WAIT
+            while self._pending_assets and time.monotonic() < deadline:
+                self._asset_event.clear()
+                try:
+                    await asyncio.wait_for(self._asset_event.wait(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+
+        accounts = await self._get(self._accounts, fetch, refresh)
+        return [dict(item) for item in accounts.values()]
+
+    async def open_orders(self, market: str | None = None, refresh: bool = False) -> list[dict]:
+        """
+        대기 주문 목록 반환 (최신순)
+
+        Args:
+            market (str, optional): 마켓 코드 (없으면 전체)
+            refresh (bool): 캐시와 관계없이 새로 조회할지 여부
+
+        Returns:
+            list[dict]: /orders?state=wait 응답과 같은 형식
+        """
+        async def fetch():
+            orders = {}
+            async for page in stream_pages("/orders", {"state": "wait", "order_by": "desc"}):
+                orders.update((order["uuid"], order) for order in page)
+            return orders
+
+        orders = await self._get(self._orders, fetch, refresh)
+        return [dict(order) for order in orders.values() if market is None or order["market"] == market]
+
+    # 쓰기 반영
+
+    def _touch(self, snapshot: _Snapshot) -> None:
+        snapshot.version += 1
+
+    def invalidate(self, orders: bool = True) -> None:
+        """다음 조회에서 잔고(와 대기 주문)를 새로 받도록 만료 처리"""
+        self.invalidations += 1
+        for snapshot in (self._accounts, self._orders) if orders else (self._accounts,):
+            self._touch(snapshot)
+            snapshot.fetched_at = 0.0
+
+    def _apply_order(self, order: dict) -> None:
+        snapshot = self._orders
+        self._touch(snapshot)
+        is_open = order.get("state") in OPEN_STATES
+        if not is_open:
+            self._closed[order["uuid"]] = None
+            if len(self._closed) > CLOSED_ORDER_MEMORY:
+                del self._closed[next(iter(self._closed))]
+        if snapshot.data is None:
+            return
+        if is_open and order["uuid"] not in self._closed:
+            snapshot.data[order["uuid"]] = {**snapshot.data.get(order["uuid"], {}), **order}
+            # 최신 주문이 앞에 오도록
+            if len(snapshot.data) > 1 and next(iter(snapshot.data)) != order["uuid"]:
+                snapshot.data = {order["uuid"]: snapshot.data.pop(order["uuid"]), **snapshot.data}
+        else:
+            snapshot.data.pop(order["uuid"], None)
+
+    def _balances_changed(self, order: dict, sent_at: float | None) -> None:
+        # 웹소켓이 연결되어 있으면 myAsset 이벤트가, 아니면 다음 REST 조회가 새 잔고를 채운다
+        currencies = set(order.get("market", "").split("-"))
+        if self.live and sent_at is not None:
+            # 요청을 보낸 뒤 두 통화의 이벤트를 이미 받았으면 캐시가 최신
+            currencies = {c for c in currencies if self._asset_updates.get(c, 0.0) <= sent_at}
+            if not currencies:
+                return
+            self._pending_assets |= currencies
+        self._touch(self._accounts)
+        self._accounts.dirty = True
+
+    def order_created(self, order: dict, sent_at: float | None = None) -> None:
+        """
+        주문 생성 성공을 캐시에 반영 (대기 주문이면 목록에 추가, 잔고는 새 값을 받을 때까지 사용하지 않음)
+
+        Args:
+            order (dict): POST /orders 응답
+            sent_at (float, optional): 요청을 보낸 시각 (time.monotonic)
+        """
+        self._apply_order(order)
+        self._balances_changed(order, sent_at)
+
+    def order_cancelled(self, order: dict, sent_at: float | None = None) -> None:
+        """
+        주문 취소 성공을 캐시에 반영 (대기 주문 목록에서 제거, 잔고는 새 값을 받을 때까지 사용하지 않음)
+
+        Args:
+            order (dict): DELETE /order 응답 (취소 요청 직후라 state가 wait일 수 있음)
+            sent_at (float, optional): 요청을 보낸 시각 (time.monotonic)
+        """
+        self._apply_order({**order, "state": "cancel"})
+        self._balances_changed(order, sent_at)
+
+    # 내 주문/자산 웹소켓
+
+    def handle_message(self, raw: bytes | str) -> None:
+        """수신한 myOrder/myAsset 메시지 하나를 캐시에 반영"""
+        message = loads(raw)
+        stream_type = message.get("type")
+        if stream_type == "myOrder" and message.get("uuid"):
+            self.events += 1
+            self._apply_order(order_from_ws(message))
+        elif stream_type == "myAsset":
+            self.events += 1
+            now = time.monotonic()
+            for asset in message.get("assets", []):
+                self._asset_updates[asset["currency"]] = now
+                self._pending_assets.discard(asset["currency"])
+            self._asset_event.set()
+            snapshot = self._accounts
+            self._touch(snapshot)
+            if snapshot.data is None:
+                return
+            for asset in message.get("assets", []):
+                currency = asset["currency"]
+                current = snapshot.data.get(currency) or {
+                    "currency": currency, "avg_buy_price": "0", "avg_buy_price_modified": False,
+                    "unit_currency": "KRW",
+                }
+                balance, locked = _decimal(asset.get("balance")), _decimal(asset.get("locked"))
+                if float(balance or 0) == 0 and float(locked or 0) == 0:
+                    snapshot.data.pop(currency, None)
+                else:
+                    snapshot.data[currency] = {**current, "balance": balance, "locked": locked}
+            snapshot.dirty = bool(self._pending_assets)
+
+    def start(self) -> None:
+        """내 주문/자산 웹소켓 연결 시작 (API 키와 websockets 패키지 필요)"""
+        get_signer()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._connected_at = None
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        delay = RECONNECT_MIN_DELAY
+        subscription = json.dumps([
+            {"ticket": str(uuid.uuid4())}, {"type": "myOrder"}, {"type": "myAsset"}, {"format": "DEFAULT"},
+        ])
+        while True:
+            try:
+                headers = {"Authorization": f"Bearer {get_signer().token()}"}
+                async with connect(self.ws_url, additional_headers=headers, max_size=None) as ws:
+                    await ws.send(subscription)
+                    # 연결 전 캐시는 이벤트를 놓쳤을 수 있으므로 연결 이후 스냅샷만 믿는다
+                    self._connected_at = time.monotonic()
+                    delay = RECONNECT_MIN_DELAY
+                    async for raw in ws:
+                        self.handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            finally:
+                if self._connected_at is not None:
+                    self.invalidate()
+                self._connected_at = None
+                self._pending_assets.clear()
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def stats(self) -> dict:
+        return {
+            "live": self.live,
+            "cached_accounts": len(self._accounts.data) if self._accounts.data is not None else 0,
+            "cached_open_orders": len(self._orders.data) if self._orders.data is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "events": self.events,
+            "reconnects": self.reconnects,
+        }
+
+
+_state: AccountState | None = None
+
+
+def get_account_state() -> AccountState:
+    """서버 전체에서 공유하는 잔고/대기 주문 캐시 반환"""
+    global _state
+    if _state is None:
+        _state = AccountState()
+    return _state
@@ -0,0 +1,320 @@
+import itertools
+import numpy as np
+from core.executor import analytics_task
+from core.indicators import macd, rolling_std, rsi, sma, stochastic
+
+# 업비트 KRW 마켓 호가 단위: (이 가격 이상, 호가 단위), 높은 가격부터
+KRW_TICK_TABLE = (
+    (2_000_000, 1000.0),
+    (1_000_000, 500.0),
+    (500_000, 100.0),
+    (100_000, 50.0),
+    (10_000, 10.0),
+    (1_000, 1.0),
+    (100, 1.0),
+    (10, 0.1),
+    (1, 0.01),
+    (0.1, 0.001),
+    (0.01, 0.0001),
+    (0.001, 0.00001),
+    (0.0001, 0.000001),
+    (0, 0.0000001),
+)
+
+# KRW 이외 마켓의 최소 가격 단위
+QUOTE_TICKS = {"BTC": 0.00000001, "USDT": 0.001}
+
+STRATEGIES = ("ma_cross", "rsi", "bollinger", "macd", "stochastic", "overall")
+
+# 파라미터 이름 -> 기본값 (technical_analysis 규칙과 같은 값)
+DEFAULT_PARAMS = {
+    "ma_fast": 5,
+    "ma_slow": 20,
+    "rsi_oversold": 30.0,
+    "rsi_overbought": 70.0,
+    "bb_width": 2.0,
+}
+
+
+def tick_size(price: np.ndarray, quote: str = "KRW") -> np.ndarray:
+    """가격별 호가 단위"""
+    price = np.asarray(price, dtype=np.float64)
+    if quote != "KRW":
+        return np.full(price.shape, QUOTE_TICKS.get(quote, 0.00000001))
+    bounds = np.array([bound for bound, _ in KRW_TICK_TABLE[::-1]])
+    ticks = np.array([tick for _, tick in KRW_TICK_TABLE[::-1]])
+    return ticks[np.clip(np.searchsorted(bounds, price, side="right") - 1, 0, len(ticks) - 1)]
+
+
+def round_to_tick(price: np.ndarray, quote: str = "KRW", up: bool = True) -> np.ndarray:
+    """
+    호가 단위에 맞춰 가격을 올림(매수) 또는 내림(매도)
+
+    Args:
+        price (np.ndarray): 가격
+        quote (str): 기준 통화
+        up (bool): True면 올림 (불리한 쪽으로 체결된다고 가정한 매수가)
+
+    Returns:
+        np.ndarray: 호가 단위로 맞춘 가격
+    """
+    tick = tick_size(price, quote)
+    steps = np.asarray(price, dtype=np.float64) / tick
+    # 부동소수점 오차로 이미 맞는 가격이 한 단위 밀리지 않도록 반올림 허용
+    steps = np.where(np.isclose(steps, np.round(steps), rtol=1e-9, atol=1e-8), np.round(steps), steps)
+    return (np.ceil(steps) if up else np.floor(steps)) * tick
+
+
+def hold_from_events(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    매수/매도 신호를 보유 여부로 변환 (다음 신호까지 상태 유지, 동시에 나오면 매도 우선)
+
+    Args:
+        buy (np.ndarray): 매수 신호 (..., n)
+        sell (np.ndarray): 매도 신호 (..., n)
+
+    Returns:
+        np.ndarray: 각 시점 신호 처리 후 보유 여부 (bool)
+    """
+    event = np.where(sell, 0, np.where(buy, 1, -1))
+    event[..., 0] = np.where(event[..., 0] < 0, 0, event[..., 0])
+    index = np.where(event >= 0, np.arange(event.shape[-1]), 0)
+    index = np.maximum.accumulate(index, axis=-1)
+    return np.take_along_axis(event, index, axis=-1) == 1
+
+
+def _label_flags(label: str) -> tuple[bool, bool, bool, bool]:
+    """technical_analysis 종합 신호와 같은 기준: (매수 계열, 매도 계열, 과매도, 과매수)"""
+    return (
+        "매수" in label or "상승" in label,
+        "매도" in label or "하락" in label,
+        "과매도" in label,
+        "과매수" in label,
+    )
+
+
+def _vote(rules: list[tuple[np.ndarray, list[tuple[np.ndarray, str]]]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    규칙별 라벨로 technical_analysis 의 overall_signal(매수 고려/매도 고려)을 시점마다 계산
+
+    Args:
+        rules: (규칙이 계산되는 시점 마스크, [(조건, 라벨), ...]) 목록. 조건은 앞에서부터 우선.
+
+    Returns:
+        tuple: (매수 고려 여부, 매도 고려 여부)
+    """
+    shape = np.broadcast_shapes(*(valid.shape for valid, _ in rules))
+    count = np.zeros(shape)
+    buys = np.zeros(shape)
+    sells = np.zeros(shape)
+    oversold = np.zeros(shape)
+    overbought = np.zeros(shape)
+    for valid, branches in rules:
+        count += valid
+        taken = np.zeros(shape, dtype=bool)
+        for condition, label in branches:
+            hit = valid & condition & ~taken
+            taken |= hit
+            is_buy, is_sell, is_oversold, is_overbought = _label_flags(label)
+            buys += hit * is_buy
+            sells += hit * is_sell
+            oversold += hit * is_oversold
+            overbought += hit * is_overbought
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buy = (count > 0) & ((buys / count > 0.6) | (oversold >= 2))
+        sell = (count > 0) & ~buy & ((sells / count > 0.6) | (overbought >= 2))
+    return buy, sell
+
+
+def _truthy(x: np.ndarray) -> np.ndarray:
+    """technical_analysis 의 `if value` 조건 (None/NaN/0 제외)"""
+    return ~np.isnan(x) & (x != 0)
+
+
+def target_positions(strategy: str, columns: dict[str, np.ndarray], params: dict[str, np.ndarray],
+                     cache: dict | None = None) -> np.ndarray:
+    """
+    규칙에 따른 시점별 목표 보유 여부 (파라미터 조합 x 시간)
+
+    Args:
+        strategy (str): STRATEGIES 중 하나
+        columns (dict): 한 마켓의 시간순 캔들 열 (high_price, low_price, trade_price)
+        params (dict): 파라미터 이름 -> 조합별 값 배열 (길이 C)
+        cache (dict, optional): 같은 마켓에서 재사용할 지표 캐시
+
+    Returns:
+        np.ndarray: (C, n) bool 배열
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"지원하지 않는 전략입니다: {strategy}")
+    cache = {} if cache is None else cache
+    close, high, low = columns["trade_price"], columns["high_price"], columns["low_price"]
+    combos = len(next(iter(params.values())))
+
+    def cached(key, fn):
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
+
+    def col(name):
+        return np.asarray(params[name], dtype=np.float64)[:, None]
+
+    def ma_rule():
+        fast = np.stack([cached(("sma", int(p)), lambda p=p: sma(close, int(p))) for p in params["ma_fast"]])
+        slow = np.stack([cached(("sma", int(p)), lambda p=p: sma(close, int(p))) for p in params["ma_slow"]])
+        return (_truthy(fast) & _truthy(slow),
+                [(fast > slow, "상승 추세 (황금 교차)"), (fast < slow, "하락 추세 (죽음의 교차)"), (True, "중립")])
+
+    def rsi_rule():
+        value = cached("rsi", lambda: rsi(close))[None, :]
+        return (~np.isnan(value) & np.ones((combos, 1), dtype=bool),
+                [(value > col("rsi_overbought"), "과매수"), (value < col("rsi_oversold"), "과매도"), (True, "중립")])
+
+    def bb_rule():
+        middle = cached("bb_middle", lambda: sma(close, 20))[None, :]
+        std = cached("bb_std", lambda: rolling_std(close, 20))[None, :]
+        upper, lower = middle + col("bb_width") * std, middle - col("bb_width") * std
+        return (_truthy(upper) & _truthy(lower),
+                [(close > upper, "과매수 (상단 돌파)"), (close < lower, "과매도 (하단 돌파)"), (True, "중립 (밴드 내)")])
+
+    def macd_rule():
+        line, signal, _ = cached("macd", lambda: macd(close))
+        valid = ~np.isnan(line) & ~np.isnan(signal)
+        return (np.broadcast_to(valid, (combos, len(close))),
+                [(line > signal, "매수 신호"), (line < signal, "매도 신호"), (True, "중립")])
+
+    def stoch_rule():
+        k, d = cached("stoch", lambda: stochastic(high, low, close))
+        valid = ~np.isnan(k) & ~np.isnan(d)
+        return (np.broadcast_to(valid, (combos, len(close))),
+                [((k > 80) & (d > 80), "과매수"), ((k < 20) & (d < 20), "과매도"),
+                 (k > d, "상승 중"), (k < d, "하락 중"), (True, "중립")])
+
+    rules = {"ma_cross": ma_rule, "rsi": rsi_rule, "bollinger": bb_rule, "macd": macd_rule,
+             "stochastic": stoch_rule}
+    if strategy == "overall":
+        buy, sell = _vote([rule() for rule in rules.values()])
+        return hold_from_events(buy, sell)
+
+    valid, branches = rules[strategy]()
+    (up, up_label), (down, _), *_ = branches
+    up, down = valid & up, valid & down
+    if strategy in ("ma_cross", "macd"):
+        # 추세 규칙: 상승 상태인 동안 보유
+        return np.broadcast_to(up, (combos, len(close))).copy()
+    # 과매수/과매도 규칙: 과매도(또는 하단 돌파)에서 매수, 과매수(또는 상단 돌파)에서 매도
+    buy, sell = (down, up) if "과매수" in up_label else (up, down)
+    return hold_from_events(np.broadcast_to(buy, (combos, len(close))), np.broadcast_to(sell, (combos, len(close))))
+
+
+def simulate(target: np.ndarray, open_: np.ndarray, close: np.ndarray, fee_rate: float,
+             quote: str = "KRW") -> dict[str, np.ndarray]:
+    """
+    목표 보유 여부로 체결을 흉내내고 성과를 계산 (실행 수 x 시간 한 번에)
+
+    t 시점 종가의 신호는 t+1 캔들 시가에 체결되며, 매수가는 호가 단위로 올림, 매도가는 내림합니다.
+    매수/매도 모두 체결 금액에 fee_rate 수수료를 냅니다. 마지막까지 보유 중이면 마지막 종가로 평가합니다.
+
+    Args:
+        target (np.ndarray): (R, n) 목표 보유 여부
+        open_ (np.ndarray): (n,) 시가
+        close (np.ndarray): (n,) 종가
+        fee_rate (float): 수수료율 (예: 0.0005)
+        quote (str): 기준 통화 (호가 단위 계산용)
+
+    Returns:
+        dict: total_return, max_drawdown, trades, win_rate, exposure, open_position (각 (R,) 배열)
+    """
+    runs, n = target.shape
+    held = np.zeros((runs, n), dtype=bool)
+    held[:, 1:] = target[:, :-1]
+    prev_held = np.zeros_like(held)
+    prev_held[:, 1:] = held[:, :-1]
+    entries = held & ~prev_held
+    exits = ~held & prev_held
+
+    buy_px = round_to_tick(open_, quote, up=True)
+    sell_px = round_to_tick(open_, quote, up=False)
+    prev_close = np.empty_like(close)
+    prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+
+    growth = np.ones((runs, n))
+    growth = np.where(held & prev_held, close / prev_close, growth)
+    growth = np.where(entries, close / (buy_px * (1 + fee_rate)), growth)
+    growth = np.where(exits, sell_px * (1 - fee_rate) / prev_close, growth)
+    equity = np.cumprod(growth, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    drawdown = (1 - equity / peak).max(axis=1)
+
+    # 청산까지 끝난 거래별 수익률 (k번째 진입과 k번째 청산을 짝지음)
+    entry_run, entry_t = np.nonzero(entries)
+    exit_run, exit_t = np.nonzero(exits)
+    exits_per_run = np.bincount(exit_run, minlength=runs)
+    entries_per_run = np.bincount(entry_run, minlength=runs)
+    starts = np.concatenate([[0], np.cumsum(entries_per_run)[:-1]])
+    rank = np.arange(len(entry_run)) - starts[entry_run]
+    closed = rank < exits_per_run[entry_run]
+    trade_returns = equity[exit_run, exit_t] / equity[entry_run[closed], entry_t[closed] - 1] - 1
+    wins = np.bincount(exit_run, weights=trade_returns > 0, minlength=runs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = np.where(exits_per_run > 0, wins / exits_per_run, np.nan)
+    return {
+        "total_return": equity[:, -1] - 1,
+        "max_drawdown": drawdown,
+        "trades": entries_per_run,
+        "win_rate": win_rate,
+        "exposure": held.mean(axis=1),
+        "open_position": held[:, -1],
+    }
+
+
+def param_grid(grid: dict[str, list]) -> dict[str, np.ndarray]:
+    """
+    파라미터 후보 목록의 모든 조합 (지정하지 않은 파라미터는 DEFAULT_PARAMS)
+
+    Returns:
+        dict: 파라미터 이름 -> 조합별 값 배열
+    """
+    unknown = [name for name in grid if name not in DEFAULT_PARAMS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 파라미터입니다: {', '.join(unknown)}")
+    names = list(DEFAULT_PARAMS)
+    values = [list(grid.get(name) or [DEFAULT_PARAMS[name]]) for name in names]
+    combos = list(itertools.product(*values))
+    return {name: np.array([combo[i] for combo in combos]) for i, name in enumerate(names)}
+
+
+@analytics_task
+def backtest_task(arrays: dict[str, np.ndarray], markets: list[str], strategy: str,
+                  grid: dict[str, list], fee_rate: float) -> list[dict]:
+    """
+    여러 마켓 x 파라미터 조합을 한 번에 백테스트하는 분석 작업 (프로세스 풀용)
+
+    Args:
+        arrays (dict): opening_price/high_price/low_price/trade_price 의 (마켓 수, n) 배열
+        markets (list[str]): 행 순서의 마켓 코드
+        strategy (str): 전략 이름
+        grid (dict): 파라미터 이름 -> 후보 목록
+        fee_rate (float): 수수료율
+
+    Returns:
+        list[dict]: 실행(마켓 x 조합)별 성과
+    """
+    params = param_grid(grid)
+    results = []
+    for row, market in enumerate(markets):
+        columns = {name: arrays[name][row] for name in ("high_price", "low_price", "trade_price")}
+        close = columns["trade_price"]
+        target = target_positions(strategy, columns, params)
+        stats = simulate(target, arrays["opening_price"][row], close, fee_rate, market.split("-")[0])
+        buy_and_hold = float(close[-1] / close[0] - 1)
+        for i in range(target.shape[0]):
+            results.append({
+                "market": market,
+                "params": {name: values[i].item() for name, values in params.items()},
+                **{name: values[i].item() for name, values in stats.items()},
+                "buy_and_hold_return": buy_and_hold,
+            })
+    return results
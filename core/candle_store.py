@@ -0,0 +1,400 @@
+import asyncio
+import json
+import os
+import numpy as np
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from config import CANDLE_STORE_DIR, CANDLE_STORE_ENABLED
+from core.candles import (
+    candles_to_columns, current_candle_start, fetch_candles, format_to, parse_to, periods_between,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 저장 레코드 형식 (time: 캔들 시작 시각, UTC epoch 초)
+CANDLE_DTYPE = np.dtype([
+    ("time", "<i8"),
+    ("opening_price", "<f8"),
+    ("high_price", "<f8"),
+    ("low_price", "<f8"),
+    ("trade_price", "<f8"),
+    ("candle_acc_trade_price", "<f8"),
+    ("candle_acc_trade_volume", "<f8"),
+    ("timestamp", "<i8"),
+    ("prev_closing_price", "<f8"),
+    ("change_price", "<f8"),
+    ("change_rate", "<f8"),
+])
+
+# 일봉에만 있는 필드 (다른 간격에서는 NaN으로 저장)
+_OPTIONAL_FIELDS = ("prev_closing_price", "change_price", "change_rate")
+
+# 저장하지 않는 필드가 응답에 들어 있는 간격 (주봉/월봉의 first_day_of_period).
+# load_candles는 이 간격을 저장소 없이 업비트에서 바로 받아 응답 형태를 그대로 유지합니다.
+# (converted_trade_price는 convertingPriceUnit을 보낸 일봉 요청에만 붙는데, 이 서버는 보내지 않습니다)
+_UNSTORED_FIELD_INTERVALS = ("week", "month")
+
+# 상장 이전까지 모두 받은 경우 구간 시작으로 사용하는 값
+HISTORY_START = 0
+
+
+def candles_to_records(candles: list[dict]) -> np.ndarray:
+    """
+    업비트 캔들 응답을 시간순 레코드 배열로 변환
+
+    Args:
+        candles (list[dict]): 업비트 캔들 응답 (순서 무관)
+
+    Returns:
+        np.ndarray: CANDLE_DTYPE 구조 배열 (time 오름차순, 중복 없음)
+    """
+    records = np.empty(len(candles), dtype=CANDLE_DTYPE)
+    if not candles:
+        return records
+    records["time"] = np.array(
+        [c["candle_date_time_utc"] for c in candles], dtype="datetime64[s]"
+    ).astype(np.int64)
+    for name in CANDLE_DTYPE.names[1:]:
+        if name in _OPTIONAL_FIELDS:
+            records[name] = [c.get(name, np.nan) for c in candles]
+        else:
+            records[name] = [c[name] for c in candles]
+    _, unique = np.unique(records["time"], return_index=True)
+    return records[unique]
+
+
+def records_to_candles(records: np.ndarray, market: str, interval: str) -> list[dict]:
+    """
+    레코드 배열을 업비트 캔들 응답 형태(최신순)로 변환
+
+    Args:
+        records (np.ndarray): CANDLE_DTYPE 구조 배열 (시간순)
+        market (str): 마켓 코드
+        interval (str): 캔들 간격
+
+    Returns:
+        list[dict]: 캔들 목록 (최신순)
+    """
+    times = records["time"].astype("datetime64[s]")
+    utc = np.datetime_as_string(times)
+    kst = np.datetime_as_string(times + np.timedelta64(9, "h"))
+    unit = int(interval.removeprefix("minute")) if interval.startswith("minute") else None
+    fields = [name for name in CANDLE_DTYPE.names[1:]
+              if name not in _OPTIONAL_FIELDS or interval == "day"]
+    columns = {name: records[name].tolist() for name in fields}
+
+    candles = []
+    for i in range(len(records) - 1, -1, -1):
+        candle = {
+            "market": market,
+            "candle_date_time_utc": str(utc[i]),
+            "candle_date_time_kst": str(kst[i]),
+        }
+        for name in fields:
+            candle[name] = columns[name][i]
+        if unit is not None:
+            candle["unit"] = unit
+        candles.append(candle)
+    return candles
+
+
+def _merge_ranges(ranges: list[list[int]]) -> list[list[int]]:
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _epoch(dt: datetime) -> int:
+    return int(dt.timestamp())
+
+
+def _datetime(epoch: int) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+
+class CandleSeries:
+    """
+    마켓/간격 하나의 캔들 파일
+
+    - {interval}.bin: CANDLE_DTYPE 레코드가 time 오름차순으로 이어진 파일 (memmap으로 읽음)
+    - {interval}.json: 레코드 수와, 빈틈 없이 받아 둔 시간 구간 목록 [[start, end), ...]
+    최신 구간 뒤에 이어지는 캔들은 파일 끝에 덧붙이고, 중간 구간을 채울 때만 파일을 다시 씁니다.
+    """
+
+    def __init__(self, root: str, market: str, interval: str):
+        self.market = market
+        self.interval = interval
+        directory = os.path.join(root, market)
+        os.makedirs(directory, exist_ok=True)
+        self.data_path = os.path.join(directory, f"{interval}.bin")
+        self.meta_path = os.path.join(directory, f"{interval}.json")
+        self.lock = asyncio.Lock()
+        self._rows: np.ndarray | None = None
+        self._meta: dict | None = None
+        self._meta_mtime = None
+
+    # 파일 입출력
+
+    @contextmanager
+    def _file_lock(self):
+        """다른 프로세스와 같은 파일을 동시에 쓰지 않도록 잠금 (POSIX만 해당)"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.meta_path + ".lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        try:
+            mtime = os.stat(self.meta_path).st_mtime_ns
+        except FileNotFoundError:
+            self._meta, self._rows = {"rows": 0, "ranges": []}, np.empty(0, dtype=CANDLE_DTYPE)
+            return
+        if mtime == self._meta_mtime and self._rows is not None:
+            return
+        with open(self.meta_path, encoding="utf-8") as f:
+            self._meta = json.load(f)
+        self._meta_mtime = mtime
+        rows = self._meta["rows"]
+        self._rows = (
+            np.memmap(self.data_path, dtype=CANDLE_DTYPE, mode="r", shape=(rows,))
+            if rows else np.empty(0, dtype=CANDLE_DTYPE)
+        )
+
+    def _write_meta(self, rows: int, ranges: list[list[int]]) -> None:
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"rows": rows, "ranges": ranges}, f)
+        os.replace(tmp, self.meta_path)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """저장된 레코드 (읽기 전용 memmap, 시간순)"""
+        self._load()
+        return self._rows
+
+    @property
+    def ranges(self) -> list[list[int]]:
+        """빈틈 없이 받아 둔 시간 구간 목록"""
+        self._load()
+        return self._meta["ranges"]
+
+    def store(self, records: np.ndarray, start: int, end: int) -> None:
+        """
+        [start, end) 구간을 모두 받았다고 기록하고 레코드를 병합해 저장
+
+        Args:
+            records (np.ndarray): 구간 안의 레코드 (시간순)
+            start (int): 구간 시작 (epoch 초)
+            end (int): 구간 끝 (epoch 초, 미포함)
+        """
+        with self._file_lock():
+            self._meta_mtime = None
+            self._load()
+            rows = self._rows
+            ranges = _merge_ranges(self._meta["ranges"] + [[start, end]])
+            if len(records) and (not len(rows) or records["time"][0] > rows["time"][-1]):
+                # 기존 데이터 뒤에 이어지는 경우: 파일 끝에 덧붙임
+                with open(self.data_path, "ab") as f:
+                    f.write(records.tobytes())
+                total = len(rows) + len(records)
+            elif len(records):
+                merged = np.concatenate([np.asarray(rows), records])
+                _, unique = np.unique(merged["time"], return_index=True)
+                merged = merged[unique]
+                tmp = self.data_path + ".tmp"
+                merged.tofile(tmp)
+                os.replace(tmp, self.data_path)
+                total = len(merged)
+            else:
+                total = len(rows)
+            self._write_meta(total, ranges)
+            self._meta_mtime = None
+
+    def covering_range(self, point: int) -> list[int] | None:
+        """point 직전까지 이어진 구간 (start < point <= end)"""
+        for start, end in self.ranges:
+            if start < point <= end:
+                return [start, end]
+        return None
+
+    def previous_range(self, point: int) -> list[int] | None:
+        """point 이전에 끝나는 가장 최근 구간"""
+        candidates = [r for r in self.ranges if r[1] <= point]
+        return candidates[-1] if candidates else None
+
+    def slice(self, start: int, end: int) -> np.ndarray:
+        """[start, end) 구간의 레코드 (memmap 뷰, 복사 없음)"""
+        rows = self.rows
+        times = rows["time"]
+        lo = int(np.searchsorted(times, start, side="left"))
+        hi = int(np.searchsorted(times, end, side="left"))
+        return rows[lo:hi]
+
+
+class CandleStore:
+    """
+    마켓/간격별 로컬 캔들 저장소
+
+    요청 범위 중 이미 받아 둔 구간은 파일에서 읽고, 빠진 최신 구간과 과거 구간만 업비트에서 받아옵니다.
+    아직 끝나지 않은 캔들(진행 중인 캔들)은 저장하지 않고 매번 새로 받습니다.
+    """
+
+    def __init__(self, root: str = CANDLE_STORE_DIR):
+        self.root = root
+        self._series: dict[tuple[str, str], CandleSeries] = {}
+        self.fetched_candles = 0
+        self.served_candles = 0
+
+    def series(self, market: str, interval: str) -> CandleSeries:
+        key = (market, interval)
+        if key not in self._series:
+            self._series[key] = CandleSeries(self.root, market, interval)
+        return self._series[key]
+
+    async def _fetch_into(self, series: CandleSeries, count: int, end: int,
+                          closed_before: int) -> tuple[np.ndarray, bool]:
+        """
+        end 이전 캔들 count개를 받아 마감된 부분을 저장하고, 진행 중인 캔들을 반환
+
+        Returns:
+            tuple: (진행 중인 캔들 레코드, 상장 시점까지 내려갔는지 여부)
+        """
+        candles = await fetch_candles(series.market, series.interval, count, format_to(_datetime(end)))
+        self.fetched_candles += len(candles)
+        records = candles_to_records(candles)
+        exhausted = len(candles) < count
+
+        closed = records[records["time"] < closed_before]
+        live = records[records["time"] >= closed_before]
+        covered_end = min(end, closed_before)
+        if exhausted:
+            covered_start = HISTORY_START
+        elif len(records):
+            covered_start = int(records["time"][0])
+        else:
+            covered_start = covered_end
+        if covered_start < covered_end:
+            series.store(closed[closed["time"] >= covered_start], covered_start, covered_end)
+        return live, exhausted
+
+    async def read(self, market: str, interval: str, count: int, to: str | None = None) -> np.ndarray:
+        """
+        to 이전 최신 캔들 count개를 레코드 배열로 반환 (시간순)
+
+        Args:
+            market (str): 마켓 코드
+            interval (str): 캔들 간격
+            count (int): 캔들 개수
+            to (str, optional): 마지막 캔들 시각 (미포함, 기본: 현재)
+
+        Returns:
+            np.ndarray: CANDLE_DTYPE 구조 배열 (오래된 캔들이 앞)
+        """
+        now = datetime.now(timezone.utc)
+        end_dt = min(parse_to(to), now)
+        end = _epoch(end_dt)
+        closed_before = _epoch(current_candle_start(interval, now))
+        series = self.series(market, interval)
+
+        async with series.lock:
+            live = np.empty(0, dtype=CANDLE_DTYPE)
+
+            # 1) 최신 구간: 받아 둔 구간이 end까지 이어지지 않으면 빠진 꼬리만 받음
+            block = series.covering_range(min(end, closed_before))
+            if block is None or end > closed_before:
+                previous = block or series.previous_range(end)
+                tail_start = previous[1] if previous else None
+                if tail_start is None:
+                    need = count
+                else:
+                    need = min(count, periods_between(_datetime(tail_start), end_dt, interval) + 1)
+                live, exhausted = await self._fetch_into(series, need, end, closed_before)
+                block = series.covering_range(min(end, closed_before))
+                if exhausted:
+                    count = min(count, len(series.slice(HISTORY_START, end)) + len(live))
+
+            # 2) 과거 구간: 개수가 모자라면 구간 시작 이전을 이어 받음
+            while block is not None:
+                stored = series.slice(block[0], min(end, closed_before))
+                missing = count - len(live) - len(stored)
+                if missing <= 0 or block[0] == HISTORY_START:
+                    break
+                previous = series.previous_range(block[0])
+                need = missing
+                if previous is not None:
+                    need = min(need, periods_between(_datetime(previous[1]), _datetime(block[0]), interval) + 1)
+                await self._fetch_into(series, need, block[0], closed_before)
+                new_block = series.covering_range(min(end, closed_before))
+                if new_block == block:
+                    break
+                block = new_block
+
+            stored = series.slice(block[0], min(end, closed_before)) if block else series.slice(0, 0)
+            wanted = max(count - len(live), 0)
+            stored = stored[max(len(stored) - wanted, 0):] if wanted else stored[:0]
+            self.served_candles += len(stored)
+            if not len(live):
+                return stored
+            return np.concatenate([np.asarray(stored), live])
+
+    def stats(self) -> dict:
+        return {
+            "series": len(self._series),
+            "fetched_candles": self.fetched_candles,
+            "served_from_store": self.served_candles,
+        }
+
+
+_store: CandleStore | None = None
+
+
+def get_candle_store() -> CandleStore:
+    """서버 전체에서 공유하는 캔들 저장소 반환"""
+    global _store
+    if _store is None:
+        _store = CandleStore()
+    return _store
+
+
+async def load_candles(market: str, interval: str, count: int, to: str | None = None) -> list[dict]:
+    """
+    캔들 목록 조회 (저장소가 켜져 있으면 저장소를 거쳐서)
+
+    주봉/월봉은 저장하지 않는 필드(first_day_of_period)가 있으므로 항상 업비트에서 받습니다.
+
+    Returns:
+        list[dict]: 업비트 캔들 응답 형태 (최신순)
+    """
+    if not CANDLE_STORE_ENABLED or interval in _UNSTORED_FIELD_INTERVALS:
+        return await fetch_candles(market, interval, count, to)
+    records = await get_candle_store().read(market, interval, count, to)
+    return records_to_candles(records, market, interval)
+
+
+async def load_columns(market: str, interval: str, count: int, to: str | None = None) -> dict[str, np.ndarray]:
+    """
+    지표 계산용 열 기반 캔들 조회 (오래된 캔들이 앞)
+
+    저장소가 켜져 있으면 저장된 레코드의 열을 복사 없이 그대로 반환합니다.
+
+    Returns:
+        dict: 필드 이름 -> 배열 (time 포함)
+    """
+    if not CANDLE_STORE_ENABLED:
+        columns = candles_to_columns(await fetch_candles(market, interval, count, to))
+        columns["time"] = columns.pop("candle_date_time_utc").astype("datetime64[s]").astype(np.int64)
+        return columns
+    records = await get_candle_store().read(market, interval, count, to)
+    return {name: records[name] for name in CANDLE_DTYPE.names}
@@ -0,0 +1,215 @@
+import asyncio
+import calendar
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+from config import API_BASE, CANDLE_FETCH_CONCURRENCY
+from core.decode import decode
+from core.http import get_client, UpbitAPIError
+
+# 업비트 캔들 API 한 번에 받을 수 있는 최대 개수
+PAGE_SIZE = 200
+
+# 한 번의 호출로 받을 수 있는 최대 캔들 수 (요청 수 제한을 고려한 안전 장치)
+MAX_CANDLE_COUNT = 50_000
+
+# 수치형 캔들 필드 (열 기반 결과에 포함)
+NUMERIC_FIELDS = (
+    "opening_price", "high_price", "low_price", "trade_price",
+    "candle_acc_trade_price", "candle_acc_trade_volume", "timestamp",
+)
+
+
+def candle_path(interval: str) -> str:
+    """
+    캔들 간격에 해당하는 업비트 API 경로
+
+    Args:
+        interval (str): minute1~minute240, day, week, month
+
+    Returns:
+        str: API_BASE 이후 경로 (예: /candles/minutes/1, /candles/days)
+    """
+    if interval.startswith("minute"):
+        return f"/candles/minutes/{interval.removeprefix('minute')}"
+    return f"/candles/{interval}s"
+
+
+def interval_seconds(interval: str) -> int | None:
+    """캔들 하나의 길이(초). 월봉처럼 길이가 일정하지 않으면 None"""
+    if interval.startswith("minute"):
+        return int(interval.removeprefix("minute")) * 60
+    return {"day": 86_400, "week": 604_800}.get(interval)
+
+
+def periods_between(start: datetime, end: datetime, interval: str) -> int:
+    """start 이후 end 이전 구간에 들어갈 수 있는 캔들 수 (올림)"""
+    if end <= start:
+        return 0
+    seconds = interval_seconds(interval)
+    if seconds is None:
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    return -(-int((end - start).total_seconds()) // seconds)
+
+
+def current_candle_start(interval: str, now: datetime) -> datetime:
+    """now가 속한 (진행 중인) 캔들의 시작 시각 (UTC 기준 격자)"""
+    now = now.astimezone(timezone.utc)
+    seconds = interval_seconds(interval)
+    if interval == "month":
+        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if interval == "week":
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return day - timedelta(days=day.weekday())
+    epoch = int(now.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=timezone.utc)
+
+
+def shift_back(dt: datetime, interval: str, periods: int) -> datetime:
+    """dt에서 캔들 periods개 만큼 이전 시각을 계산 (월봉은 달력 기준)"""
+    if interval.startswith("minute"):
+        return dt - timedelta(minutes=int(interval.removeprefix("minute")) * periods)
+    if interval == "day":
+        return dt - timedelta(days=periods)
+    if interval == "week":
+        return dt - timedelta(weeks=periods)
+    month_index = dt.year * 12 + dt.month - 1 - periods
+    year, month = divmod(month_index, 12)
+    day = min(dt.day, calendar.monthrange(year, month + 1)[1])
+    return dt.replace(year=year, month=month + 1, day=day)
+
+
+def format_to(dt: datetime) -> str:
+    """업비트 to 파라미터 형식 (UTC)"""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_to(value: str | None) -> datetime:
+    """to 파라미터 문자열을 UTC datetime으로 변환 (없으면 현재 시각)"""
+    if not value:
+        return datetime.now(timezone.utc)
+    dt = datetime.fromisoformat(value.replace(" ", "T").replace("Z", "+00:00"))
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+
+def plan_pages(interval: str, count: int, to: datetime) -> list[tuple[datetime, int]]:
+    """
+    요청 범위를 200개 단위 페이지의 (to, count) 목록으로 미리 나눔
+
+    거래가 없어 캔들이 빠진 구간이 있으면 페이지가 실제로 더 과거까지 내려가므로
+    페이지끼리 겹칠 수는 있어도 빈 구간은 생기지 않습니다. 겹친 부분은 병합 시 제거됩니다.
+    """
+    pages = []
+    for offset in range(0, count, PAGE_SIZE):
+        pages.append((shift_back(to, interval, offset), min(PAGE_SIZE, count - offset)))
+    return pages
+
+
+async def fetch_page(market: str, interval: str, count: int, to: datetime | None) -> list[dict]:
+    """캔들 한 페이지 조회 (최신순)"""
+    params = {"market": market, "count": str(count)}
+    if to is not None:
+        params["to"] = format_to(to)
+    client = get_client()
+    res = await client.get(f"{API_BASE}{candle_path(interval)}", params=params)
+    if res.status_code != 200:
+        raise UpbitAPIError(res.status_code, res.text)
+    return decode(res)
+
+
+async def stream_candles(
+    market: str,
+    interval: str,
+    count: int,
+    to: str | None = None,
+    concurrency: int = CANDLE_FETCH_CONCURRENCY,
+) -> AsyncIterator[list[dict]]:
+    """
+    캔들을 페이지 단위로 최신순 스트리밍
+
+    필요한 페이지 구간을 미리 계산해 동시에 요청하고 (요청 수 제한은 공유 클라이언트가 적용),
+    완료된 페이지를 최신 페이지부터 순서대로, 앞 페이지와 겹치는 캔들은 제거해서 내보냅니다.
+    빠진 캔들 때문에 개수가 모자라면 가장 오래된 캔들 이전 구간을 다시 계획해서 이어 받습니다.
+
+    Args:
+        market (str): 마켓 코드
+        interval (str): 캔들 간격
+        count (int): 받을 캔들 수
+        to (str, optional): 마지막 캔들 시각 (미포함, 기본: 현재)
+        concurrency (int): 동시에 보낼 최대 요청 수
+
+    Yields:
+        list[dict]: 중복이 제거된 최신순 캔들 묶음
+    """
+    count = min(count, MAX_CANDLE_COUNT)
+    semaphore = asyncio.Semaphore(concurrency)
+    seen: set[str] = set()
+    remaining = count
+    end = parse_to(to)
+
+    async def fetch(page_to: datetime, page_count: int) -> list[dict]:
+        async with semaphore:
+            return await fetch_page(market, interval, page_count, page_to)
+
+    while remaining > 0:
+        pages = plan_pages(interval, remaining, end)
+        tasks = [asyncio.ensure_future(fetch(page_to, page_count)) for page_to, page_count in pages]
+        exhausted = False
+        oldest = None
+        try:
+            for (_, page_count), task in zip(pages, tasks):
+                page = await task
+                fresh = []
+                for candle in page:
+                    key = candle["candle_date_time_utc"]
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    fresh.append(candle)
+                fresh = fresh[:remaining]
+                remaining -= len(fresh)
+                if page and (oldest is None or page[-1]["candle_date_time_utc"] < oldest):
+                    # 요청 구간이 모두 최신 캔들 이후라 같은 캔들만 돌려받은 페이지도 있으므로 최소값을 유지
+                    oldest = page[-1]["candle_date_time_utc"]
+                if fresh:
+                    yield fresh
+                if len(page) < page_count:
+                    # 상장 이전 구간까지 내려감
+                    exhausted = True
+                if remaining <= 0 or exhausted:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        if exhausted or oldest is None:
+            break
+        end = parse_to(oldest)
+
+
+async def fetch_candles(market: str, interval: str, count: int, to: str | None = None) -> list[dict]:
+    """stream_candles의 결과를 하나의 최신순 목록으로 모아 반환"""
+    candles: list[dict] = []
+    async for page in stream_candles(market, interval, count, to):
+        candles.extend(page)
+    return candles
+
+
+def candles_to_columns(candles: list[dict], chronological: bool = True) -> dict[str, np.ndarray]:
+    """
+    캔들 목록을 열 기반 NumPy 배열로 변환
+
+    Args:
+        candles (list[dict]): 업비트 캔들 응답 (최신순)
+        chronological (bool): True면 오래된 캔들이 앞에 오도록 정렬
+
+    Returns:
+        dict: 필드 이름 -> 배열 (candle_date_time_utc 포함)
+    """
+    rows = candles[::-1] if chronological else candles
+    # 행마다 목록을 만드는 대신 필드마다 한 번씩 훑어 바로 배열을 채운다 (중간 float/list 객체 없음)
+    columns = {
+        field: np.fromiter((c[field] for c in rows), np.int64 if field == "timestamp" else np.float64, len(rows))
+        for field in NUMERIC_FIELDS
+    }
+    columns["candle_date_time_utc"] = np.array([c["candle_date_time_utc"] for c in rows])
+    return columns
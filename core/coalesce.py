@@ -0,0 +1,108 @@
+import asyncio
+from config import API_BASE, COALESCE_WINDOW, COALESCE_MAX_BATCH
+from core.decode import decode
+from core.http import get_client, UpbitAPIError
+
+
+class Coalescer:
+    """
+    단일 마켓 요청을 짧은 시간 동안 모아 하나의 다중 마켓 요청으로 보내는 계층
+
+    업비트 /ticker, /orderbook 은 markets 파라미터에 여러 마켓을 쉼표로 받을 수 있습니다.
+    window 동안 들어온 요청(같은 마켓은 하나로 합침)을 한 번에 조회한 뒤
+    응답의 market 필드로 결과를 각 호출자에게 나눠줍니다.
+    """
+
+    def __init__(self, path: str, window: float = COALESCE_WINDOW, max_batch: int = COALESCE_MAX_BATCH):
+        self.path = path
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+        self.requests = 0
+        self.batches = 0
+
+    async def get(self, market: str) -> dict:
+        """
+        마켓 하나의 데이터를 조회 (다른 동시 요청과 묶여서 전송됨)
+
+        Args:
+            market (str): 마켓 코드 (예: KRW-BTC)
+
+        Returns:
+            dict: 해당 마켓의 응답 항목
+
+        Raises:
+            UpbitAPIError: 업비트 API 오류 또는 응답에 마켓이 없는 경우
+        """
+        self.requests += 1
+        future = self._pending.get(market)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[market] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    async def get_many(self, markets: list[str]) -> list[dict | BaseException]:
+        """여러 마켓을 조회하고 마켓별 결과 또는 예외를 입력 순서대로 반환"""
+        return await asyncio.gather(*[self.get(m) for m in markets], return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        asyncio.ensure_future(self._dispatch(batch))
+
+    async def _request(self, markets: list[str]) -> list[dict]:
+        client = get_client()
+        res = await client.get(f"{API_BASE}{self.path}", params={"markets": ",".join(markets)})
+        if res.status_code != 200:
+            raise UpbitAPIError(res.status_code, res.text)
+        return decode(res)
+
+    async def _dispatch(self, batch: dict[str, asyncio.Future]) -> None:
+        self.batches += 1
+        markets = list(batch)
+        try:
+            items = await self._request(markets)
+        except UpbitAPIError as e:
+            # 잘못된 마켓 하나 때문에 묶음 전체가 실패하지 않도록 마켓별로 다시 요청
+            if len(markets) > 1 and 400 <= e.status_code < 500 and e.status_code != 429:
+                for market, future in batch.items():
+                    asyncio.ensure_future(self._dispatch({market: future}))
+                return
+            self._fail(batch, e)
+            return
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        by_market = {item["market"]: item for item in items}
+        for market, future in batch.items():
+            if future.done():
+                continue
+            if market in by_market:
+                future.set_result(by_market[market])
+            else:
+                future.set_exception(UpbitAPIError(404, f"{market} 데이터를 찾을 수 없습니다."))
+
+    @staticmethod
+    def _fail(batch: dict[str, asyncio.Future], error: BaseException) -> None:
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "batches": self.batches}
+
+
+ticker_coalescer = Coalescer("/ticker")
+orderbook_coalescer = Coalescer("/orderbook")
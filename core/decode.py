@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def orjson_available() -> bool:
+    """빠른 JSON 디코딩에 쓰는 orjson 패키지가 설치되어 있는지 확인"""
+    return orjson is not None
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    JSON 디코딩 (orjson이 있으면 orjson, 없으면 표준 json)
+
+    Args:
+        data (bytes | str): JSON 본문 (웹소켓 메시지 포함)
+
+    Returns:
+        Any: 디코딩한 값
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode(res) -> Any:
+    """HTTP 응답 본문을 텍스트로 바꾸지 않고 바이트에서 바로 JSON 디코딩 (res.json() 대신)"""
+    return loads(res.content)
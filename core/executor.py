@@ -0,0 +1,315 @@
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any, Callable
+
+from config import ANALYTICS_INLINE_BYTES, ANALYTICS_TIMEOUT, ANALYTICS_WORKERS
+
+# numpy는 분석 작업을 처음 실행할 때 불러옴 (서버 시작 시 불러오지 않도록)
+if TYPE_CHECKING:
+    import numpy as np
+
+# 프로세스 풀에서 실행할 수 있는 분석 함수 (이름 -> 모듈 최상위 함수)
+ANALYTICS_TASKS: dict[str, Callable] = {}
+
+# 이보다 작은 결과 배열은 공유 메모리 대신 그대로 피클로 돌려받음
+_SHARED_RESULT_BYTES = 64 * 1024
+
+
+class AnalyticsTimeoutError(TimeoutError):
+    """분석 작업이 제한 시간 안에 끝나지 않은 경우"""
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        super().__init__(f"분석 작업 {name}이(가) {timeout:g}초 안에 끝나지 않았습니다.")
+
+
+def analytics_task(fn: Callable) -> Callable:
+    """
+    프로세스 풀에서 실행할 분석 함수로 등록하는 데코레이터
+
+    함수는 모듈 최상위에 정의되어야 하며, 첫 번째 인자로 배열 딕셔너리를 받습니다.
+    """
+    ANALYTICS_TASKS[fn.__name__] = fn
+    return fn
+
+
+class _Shared:
+    """공유 메모리에 올린 배열의 위치 정보 (프로세스 간에는 이것만 피클로 전달)"""
+
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype = state
+
+
+def _share(array: "np.ndarray", blocks: list, name: str | None = None) -> _Shared:
+    import numpy as np
+
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(name=name, create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+    blocks.append(block)
+    return _Shared(block.name, array.shape, array.dtype.str)
+
+
+def _attach(ref: _Shared, blocks: list) -> "np.ndarray":
+    import numpy as np
+
+    block = shared_memory.SharedMemory(name=ref.name)
+    blocks.append(block)
+    return np.ndarray(ref.shape, np.dtype(ref.dtype), buffer=block.buf)
+
+
+def _pack(value: Any, blocks: list, prefix: str) -> Any:
+    """
+    결과 안의 큰 배열을 공유 메모리로 옮김 (dict/list/tuple 안쪽까지)
+
+    공유 메모리 이름은 {prefix}_0, {prefix}_1, ... 순서로 붙이므로, 결과를 받지 못한 부모도
+    _unlink_results로 이름만 보고 해제할 수 있습니다.
+    """
+    import numpy as np
+
+    if isinstance(value, np.ndarray) and value.nbytes >= _SHARED_RESULT_BYTES:
+        return _share(value, blocks, f"{prefix}_{len(blocks)}")
+    if isinstance(value, dict):
+        return {k: _pack(v, blocks, prefix) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_pack(v, blocks, prefix) for v in value)
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    """_pack 결과를 일반 배열로 되돌리고 공유 메모리를 해제"""
+    if isinstance(value, _Shared):
+        blocks: list = []
+        array = _attach(value, blocks).copy()
+        for block in blocks:
+            block.close()
+            block.unlink()
+        return array
+    if isinstance(value, dict):
+        return {k: _unpack(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unpack(v) for v in value)
+    return value
+
+
+def _unlink_results(prefix: str) -> None:
+    """작업자가 _pack으로 만든 결과 공유 메모리({prefix}_0, {prefix}_1, ...)를 모두 해제"""
+    index = 0
+    while True:
+        try:
+            block = shared_memory.SharedMemory(name=f"{prefix}_{index}")
+        except FileNotFoundError:
+            return
+        block.close()
+        block.unlink()
+        index += 1
+
+
+def _worker_init() -> None:
+    # stdio 전송을 쓰는 MCP 서버의 표준 출력을 작업자가 더럽히지 않도록 stderr로 돌린다
+    sys.stdout = sys.stderr
+
+
+def _run_in_worker(fn: Callable, task: _Shared, refs: dict[str, _Shared], kwargs: dict) -> Any:
+    blocks: list = []
+    try:
+        # 부모가 제한 시간 초과 시 이 작업자만 종료할 수 있도록 pid를 알림
+        _attach(task, blocks)[0] = os.getpid()
+        arrays = {name: _attach(ref, blocks) for name, ref in refs.items()}
+        result = fn(arrays, **kwargs)
+        out: list = []
+        packed = _pack(result, out, task.name)
+        for block in out:
+            block.close()
+        return packed
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class AnalyticsExecutor:
+    """
+    CPU 분석 작업용 프로세스 풀
+
+    입력 배열은 공유 메모리에 한 번 복사해 이름만 작업자에게 넘기고 (배열 피클링 없음),
+    큰 결과 배열도 같은 방식으로 돌려받습니다. 작업이 제한 시간을 넘기거나 취소되면 그 작업자
+    프로세스를 종료하고 풀을 내려놓은 뒤 다음 작업에서 새로 만들며, 작업이 남긴 결과 공유 메모리는
+    작업이 끝나는 대로 해제합니다. 작업자 수가 0이면 스레드에서 실행합니다.
+    """
+
+    def __init__(self, workers: int = ANALYTICS_WORKERS, timeout: float = ANALYTICS_TIMEOUT,
+                 inline_bytes: int = ANALYTICS_INLINE_BYTES):
+        self.workers = workers
+        self.timeout = timeout
+        self.inline_bytes = inline_bytes
+        self._pool: ProcessPoolExecutor | None = None
+
+        self.submitted = 0
+        self.inline = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.restarts = 0
+        self.busy_seconds = 0.0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            # spawn은 작업자마다 main.py를 다시 실행하므로 가능하면 fork 사용
+            context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+            # 부모와 작업자가 같은 resource tracker를 쓰도록 풀보다 먼저 띄운다
+            resource_tracker.ensure_running()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context, initializer=_worker_init,
+            )
+        return self._pool
+
+    def _replace_pool(self, pid: int = 0) -> None:
+        """
+        현재 풀을 내려놓고 다음 작업에서 새 풀을 만들도록 함
+
+        Args:
+            pid (int): 종료할 작업자 pid (0이면 실행 중인 작업이 끝날 때까지 둠)
+        """
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if pid:
+            # ProcessPoolExecutor는 실행 중인 작업을 취소할 수 없으므로 그 작업자를 종료
+            # (풀이 깨진 것으로 처리되어 남은 작업자도 풀이 정리함)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.restarts += 1
+
+    async def run(self, name: str, arrays: dict[str, "np.ndarray"], timeout: float | None = None,
+                  **kwargs) -> Any:
+        """
+        등록된 분석 함수를 실행
+
+        Args:
+            name (str): analytics_task로 등록한 함수 이름
+            arrays (dict): 함수에 넘길 NumPy 배열 (공유 메모리로 전달)
+            timeout (float, optional): 제한 시간 (초, 기본: UPBIT_ANALYTICS_TIMEOUT)
+            **kwargs: 함수에 넘길 나머지 인자 (피클 가능해야 함)
+
+        Returns:
+            Any: 함수 반환값
+
+        Raises:
+            AnalyticsTimeoutError: 제한 시간 초과
+        """
+        fn = ANALYTICS_TASKS[name]
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            if sum(a.nbytes for a in arrays.values()) < self.inline_bytes:
+                # 작은 입력은 프로세스로 보내는 비용이 계산보다 크다
+                self.inline += 1
+                return fn(arrays, **kwargs)
+            self.submitted += 1
+            if self.workers <= 0:
+                return await asyncio.wait_for(asyncio.to_thread(fn, arrays, **kwargs), timeout)
+            return await self._run_in_pool(name, fn, arrays, timeout, kwargs)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise AnalyticsTimeoutError(name, timeout) from None
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.busy_seconds += time.perf_counter() - start
+
+    async def _run_in_pool(self, name: str, fn: Callable, arrays: dict[str, "np.ndarray"],
+                           timeout: float, kwargs: dict) -> Any:
+        import numpy as np
+
+        blocks: list = []
+        try:
+            # 작업자 pid를 받는 칸 (이 블록 이름이 결과 공유 메모리 이름의 접두사)
+            task = _share(np.zeros(1, dtype=np.int64), blocks)
+            refs = {key: _share(array, blocks) for key, array in arrays.items()}
+            try:
+                future = self._get_pool().submit(_run_in_worker, fn, task, refs, kwargs)
+            except BrokenProcessPool:
+                self._replace_pool()
+                future = self._get_pool().submit(_run_in_worker, fn, task, refs, kwargs)
+            try:
+                packed = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # 결과를 받지 않으므로, 작업이 끝나거나 작업자가 종료된 뒤 결과 공유 메모리를 해제
+                future.add_done_callback(lambda _: _unlink_results(task.name))
+                self._replace_pool(int(np.ndarray(1, np.int64, buffer=blocks[0].buf)[0]))
+                raise
+            except BrokenProcessPool:
+                self._replace_pool()
+                raise
+            return _unpack(packed)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "timeout": self.timeout,
+            "submitted": self.submitted,
+            "inline": self.inline,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "restarts": self.restarts,
+            "busy_seconds": round(self.busy_seconds, 3),
+        }
+
+
+_executor: AnalyticsExecutor | None = None
+
+
+def get_executor() -> AnalyticsExecutor:
+    """서버 전체에서 공유하는 분석 작업 실행기 반환"""
+    global _executor
+    if _executor is None:
+        _executor = AnalyticsExecutor()
+    return _executor
+
+
+async def run_analytics(name: str, arrays: dict[str, "np.ndarray"], timeout: float | None = None,
+                        **kwargs) -> Any:
+    """get_executor().run 단축 함수"""
+    return await get_executor().run(name, arrays, timeout=timeout, **kwargs)
+
+
+@asynccontextmanager
+async def executor_lifespan():
+    """서버 종료 시 작업자 프로세스를 정리하는 컨텍스트"""
+    try:
+        yield
+    finally:
+        if _executor is not None:
+            await asyncio.to_thread(_executor.shutdown)
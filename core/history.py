@@ -0,0 +1,232 @@
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+from config import HISTORY_FETCH_CONCURRENCY, HISTORY_MAX_PAGES
+from core.models import Order, _number
+from core.private_api import private_request
+
+# 업비트 주문/입출금 목록 API의 페이지당 최대 개수
+PAGE_LIMIT = 100
+
+# 업비트 응답 시각(created_at)의 기준 시간대, 시간대 없는 날짜 입력도 이 기준으로 해석
+KST = timezone(timedelta(hours=9))
+
+# 압축 결과에 남기는 필드
+ORDER_FIELDS = ("uuid", "market", "side", "ord_type", "state", "price", "volume", "executed_volume",
+                "executed_funds", "paid_fee", "created_at", "identifier")
+TRANSFER_FIELDS = ("uuid", "currency", "net_type", "state", "amount", "fee", "txid", "created_at", "done_at")
+
+
+def parse_time(value: str | None, end_of_day: bool = False) -> datetime | None:
+    """
+    날짜/시각 문자열을 시간대가 있는 datetime으로 변환
+
+    Args:
+        value (str, optional): 2024-01-31 또는 ISO 8601 시각 (시간대가 없으면 KST)
+        end_of_day (bool): 날짜만 주어졌을 때 그날의 끝(다음 날 0시 직전)으로 해석할지 여부
+
+    Returns:
+        datetime | None: 변환된 시각
+    """
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    if end_of_day and len(value) == 10:
+        dt += timedelta(days=1) - timedelta(microseconds=1)
+    return dt
+
+
+async def stream_pages(path: str, params: dict, concurrency: int = HISTORY_FETCH_CONCURRENCY,
+                       max_pages: int = HISTORY_MAX_PAGES, status: dict | None = None) -> AsyncIterator[list[dict]]:
+    """
+    page/limit 방식 목록 API를 페이지 순서대로 스트리밍
+
+    첫 페이지가 가득 차 있으면 다음 페이지들을 concurrency개까지 미리 요청해 두고 (요청 수 제한은
+    공유 클라이언트가 적용), 끝까지 받은 페이지를 순서대로 내보냅니다. 한 페이지가 limit보다 짧으면 마지막 페이지로 보고
+    미리 보낸 나머지 요청을 취소합니다. 소비자가 중간에 멈추면 남은 요청도 취소됩니다.
+
+    Args:
+        path (str): API 경로 (예: /orders)
+        params (dict): page/limit을 제외한 쿼리 파라미터
+        concurrency (int): 동시에 보낼 최대 페이지 요청 수
+        max_pages (int): 최대 페이지 수 (안전 한도)
+        status (dict, optional): 마지막 페이지가 가득 찬 채로 max_pages에 닿으면 pages_exhausted=True를 기록
+            (더 오래된 항목이 남아 있을 수 있음)
+
+    Yields:
+        list[dict]: 한 페이지의 항목
+    """
+    async def fetch(page: int) -> list[dict]:
+        return await private_request("GET", path, {**params, "page": page, "limit": PAGE_LIMIT})
+
+    pending: deque[asyncio.Task] = deque()
+    next_page = 1
+    # 대부분의 목록은 한 페이지로 끝나므로 첫 페이지가 가득 찬 뒤에만 여러 페이지를 미리 요청
+    window = 1
+    try:
+        while True:
+            while len(pending) < window and next_page <= max_pages:
+                pending.append(asyncio.ensure_future(fetch(next_page)))
+                next_page += 1
+            if not pending:
+                if status is not None:
+                    status["pages_exhausted"] = True
+                return
+            page = await pending.popleft()
+            if page:
+                yield page
+            if len(page) < PAGE_LIMIT:
+                return
+            window = max(concurrency, 1)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def iter_history(path: str, params: dict, start: datetime | None = None, end: datetime | None = None,
+                       states: list[str] | None = None, status: dict | None = None) -> AsyncIterator[dict]:
+    """
+    최신순 목록 API의 항목을 기간/상태로 걸러 하나씩 스트리밍
+
+    페이지 경계가 밀려 같은 항목이 두 번 오면 uuid로 한 번만 내보내고,
+    페이지의 가장 오래된 항목이 start보다 이전이면 더 오래된 페이지는 요청하지 않습니다.
+
+    Args:
+        path (str): API 경로
+        params (dict): 쿼리 파라미터 (order_by=desc로 요청)
+        start (datetime, optional): 이 시각 이후(포함) 항목만
+        end (datetime, optional): 이 시각 이전(포함) 항목만
+        states (list[str], optional): 서버에서 거르지 못한 상태 조건
+        status (dict, optional): 페이지 한도에 닿았는지 기록 (stream_pages 참고)
+
+    Yields:
+        dict: 조건에 맞는 항목 (최신순)
+    """
+    seen: set[str] = set()
+    async for page in stream_pages(path, {**params, "order_by": "desc"}, status=status):
+        for row in page:
+            if row.get("uuid") in seen:
+                continue
+            seen.add(row.get("uuid"))
+            created = parse_time(row.get("created_at"))
+            if end and created and created > end:
+                continue
+            if start and created and created < start:
+                continue
+            if states and row.get("state") not in states:
+                continue
+            yield row
+        oldest = parse_time(page[-1].get("created_at"))
+        if start and oldest and oldest < start:
+            return
+
+
+def _rounded(groups: dict[str, dict]) -> dict[str, dict]:
+    return {key: {name: round(value, 8) if isinstance(value, float) else value for name, value in stats.items()}
+            for key, stats in groups.items()}
+
+
+def _compact(row: dict, fields: tuple[str, ...]) -> dict:
+    return {field: row[field] for field in fields if row.get(field) is not None}
+
+
+async def collect_orders(params: dict, start: datetime | None = None, end: datetime | None = None,
+                         max_rows: int = 100) -> dict:
+    """
+    주문 이력 전체를 받아 마켓/상태별로 집계하고 최근 max_rows개만 압축해 반환
+
+    Args:
+        params (dict): /orders 쿼리 파라미터 (market, states[] 등)
+        start (datetime, optional): 기간 시작
+        end (datetime, optional): 기간 끝
+        max_rows (int): 결과에 포함할 최근 주문 수
+
+    Returns:
+        dict: total, by_state, by_market (executed_value_unknown: 체결 금액을 알 수 없어 executed_value에서
+            빠진 시장가 주문 수), first/last created_at, orders(압축), truncated,
+            pages_exhausted (HISTORY_MAX_PAGES 한도에 닿아 더 오래된 주문이 빠졌을 수 있음)
+    """
+    by_state: dict[str, int] = {}
+    by_market: dict[str, dict] = {}
+    rows, total, first, last = [], 0, None, None
+    status = {"pages_exhausted": False}
+    async for order in iter_history("/orders", params, start, end, status=status):
+        total += 1
+        by_state[order["state"]] = by_state.get(order["state"], 0) + 1
+        stats = by_market.setdefault(order["market"], {
+            "count": 0, "bid": 0, "ask": 0, "executed_volume": 0.0, "executed_value": 0.0,
+            "executed_value_unknown": 0, "paid_fee": 0.0,
+        })
+        typed = Order.from_payload(order)
+        stats["count"] += 1
+        stats[typed.side] = stats.get(typed.side, 0) + 1
+        stats["executed_volume"] += typed.executed_volume
+        value = typed.executed_value
+        if value is None:
+            stats["executed_value_unknown"] += 1
+        else:
+            stats["executed_value"] += value
+        stats["paid_fee"] += typed.paid_fee
+        last = last or order.get("created_at")
+        first = order.get("created_at")
+        if len(rows) < max_rows:
+            rows.append(_compact(order, ORDER_FIELDS))
+    return {
+        "total": total,
+        "by_state": by_state,
+        "by_market": _rounded(by_market),
+        "first_created_at": first,
+        "last_created_at": last,
+        "orders": rows,
+        "truncated": total > len(rows),
+        "pages_exhausted": status["pages_exhausted"],
+    }
+
+
+async def collect_transfers(kind: str, params: dict, start: datetime | None = None, end: datetime | None = None,
+                            states: list[str] | None = None, max_rows: int = 100) -> dict:
+    """
+    입금/출금 이력 전체를 받아 통화/상태별로 집계하고 최근 max_rows개만 압축해 반환
+
+    Args:
+        kind (str): deposit 또는 withdraw
+        params (dict): 쿼리 파라미터 (currency, state 등)
+        start (datetime, optional): 기간 시작
+        end (datetime, optional): 기간 끝
+        states (list[str], optional): 상태 조건
+        max_rows (int): 결과에 포함할 최근 항목 수
+
+    Returns:
+        dict: total, by_state, by_currency, first/last created_at, transfers(압축), truncated,
+            pages_exhausted (HISTORY_MAX_PAGES 한도에 닿아 더 오래된 항목이 빠졌을 수 있음)
+    """
+    by_state: dict[str, int] = {}
+    by_currency: dict[str, dict] = {}
+    rows, total, first, last = [], 0, None, None
+    status = {"pages_exhausted": False}
+    async for item in iter_history(f"/{kind}s", params, start, end, states, status=status):
+        total += 1
+        by_state[item["state"]] = by_state.get(item["state"], 0) + 1
+        stats = by_currency.setdefault(item["currency"], {"count": 0, "amount": 0.0, "fee": 0.0})
+        stats["count"] += 1
+        stats["amount"] += _number(item.get("amount"))
+        stats["fee"] += _number(item.get("fee"))
+        last = last or item.get("created_at")
+        first = item.get("created_at")
+        if len(rows) < max_rows:
+            rows.append(_compact(item, TRANSFER_FIELDS))
+    return {
+        "type": kind,
+        "total": total,
+        "by_state": by_state,
+        "by_currency": _rounded(by_currency),
+        "first_created_at": first,
+        "last_created_at": last,
+        "transfers": rows,
+        "truncated": total > len(rows),
+        "pages_exhausted": status["pages_exhausted"],
+    }
@@ -0,0 +1,108 @@
+import sys
+import httpx
+from contextlib import asynccontextmanager
+from config import (
+    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED,
+    METRICS_ENABLED,
+    RATE_LIMIT_ENABLED,
+)
+from core.metrics import MetricsTransport, get_metrics
+from core.rate_limit import RateLimitedTransport, get_rate_limiter
+
+
+class UpbitAPIError(Exception):
+    """업비트 API가 오류 응답을 반환했을 때 발생하는 예외"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"업비트 API 오류: {status_code} - {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+# 서버 전체에서 공유하는 HTTP 클라이언트
+_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """
+    HTTP/2 사용에 필요한 h2 패키지가 설치되어 있는지 확인
+
+    Returns:
+        bool: h2 패키지 설치 여부
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    커넥션 풀과 keep-alive가 설정된 HTTP 클라이언트 생성
+
+    Returns:
+        httpx.AsyncClient: 설정이 적용된 비동기 HTTP 클라이언트
+    """
+    http2 = HTTP2_ENABLED
+    if http2 and not _http2_available():
+        # stdio 전송을 쓰는 MCP 서버의 표준 출력을 더럽히지 않도록 stderr로 출력
+        print("경고: h2 패키지가 설치되지 않아 HTTP/1.1을 사용합니다. (pip install 'httpx[http2]')", file=sys.stderr)
+        http2 = False
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+    # 지표는 요청 수 제한기 안쪽에서 기록 (대기 시간을 빼고, 429 후 재시도도 한 번씩 셈)
+    if METRICS_ENABLED:
+        transport = MetricsTransport(transport, get_metrics())
+    if RATE_LIMIT_ENABLED:
+        transport = RateLimitedTransport(transport, get_rate_limiter())
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 반환
+
+    서버 lifespan 밖에서 호출되면 (예: fastmcp dev) 최초 호출 시 생성합니다.
+
+    Returns:
+        httpx.AsyncClient: 공유 HTTP 클라이언트
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+async def close_client() -> None:
+    """공유 HTTP 클라이언트를 닫고 커넥션 풀을 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def http_lifespan():
+    """서버 실행 동안 공유 HTTP 클라이언트를 유지하는 컨텍스트"""
+    get_client()
+    try:
+        yield
+    finally:
+        await close_client()
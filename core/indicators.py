@@ -0,0 +1,252 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 블록 단위 재귀 필터에서 허용하는 감쇠 계수 지수의 최대값 (exp(300) ~ 1e130, float64 범위 안)
+_MAX_EXPONENT = 300.0
+
+
+def _nan_like(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan, dtype=np.float64)
+
+
+def _first_valid(x: np.ndarray) -> int:
+    """모든 행에서 NaN이 아닌 첫 시점 (앞쪽 NaN 구간의 길이)"""
+    valid = ~np.isnan(x)
+    if x.ndim > 1:
+        valid = valid.reshape(-1, x.shape[-1]).all(axis=0)
+    return int(np.argmax(valid)) if valid.any() else x.shape[-1]
+
+
+def recursive_filter(x: np.ndarray, alpha: float, initial: np.ndarray | float) -> np.ndarray:
+    """
+    y[t] = (1 - alpha) * y[t-1] + alpha * x[t] 을 마지막 축을 따라 계산
+
+    파이썬 반복문 대신, 감쇠 계수가 넘치지 않는 길이의 블록마다
+    y[t] = d^(t+1) * y[-1] + d^t * cumsum(alpha * x[k] * d^-k) 형태로 한 번에 계산합니다.
+
+    Args:
+        x (np.ndarray): 입력 (..., n)
+        alpha (float): 평활 계수 (0 < alpha <= 1)
+        initial (np.ndarray | float): y[-1] (행마다 다를 수 있음)
+
+    Returns:
+        np.ndarray: x와 같은 모양의 결과
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = x.shape[-1]
+    out = np.empty_like(x)
+    state = np.broadcast_to(np.asarray(initial, dtype=np.float64), x.shape[:-1]).copy()
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[...] = x
+        return out
+
+    block = max(1, min(n, int(_MAX_EXPONENT / -np.log(decay))))
+    powers = decay ** np.arange(1, block + 1)
+    inverse = decay ** -np.arange(block)
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        size = stop - start
+        weighted = np.cumsum(alpha * x[..., start:stop] * inverse[:size], axis=-1)
+        out[..., start:stop] = (
+            powers[:size] * state[..., None] + powers[:size] / decay * weighted
+        )
+        state = out[..., stop - 1]
+    return out
+
+
+def _smoothed(x: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    """앞쪽 period개의 단순 평균으로 시작하는 지수 평활 (앞쪽 NaN 구간은 건너뜀)"""
+    x = np.asarray(x, dtype=np.float64)
+    out = _nan_like(x)
+    start = _first_valid(x)
+    seed_end = start + period
+    if seed_end > x.shape[-1]:
+        return out
+    seed = x[..., start:seed_end].mean(axis=-1)
+    out[..., seed_end - 1] = seed
+    out[..., seed_end:] = recursive_filter(x[..., seed_end:], alpha, seed)
+    return out
+
+
+def sma(x: np.ndarray, period: int) -> np.ndarray:
+    """
+    단순 이동 평균
+
+    Args:
+        x (np.ndarray): 입력 (..., n)
+        period (int): 기간
+
+    Returns:
+        np.ndarray: 같은 모양의 결과 (앞쪽 period-1개는 NaN)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = _nan_like(x)
+    if period <= x.shape[-1]:
+        out[..., period - 1:] = sliding_window_view(x, period, axis=-1).mean(axis=-1)
+    return out
+
+
+def ema(x: np.ndarray, period: int) -> np.ndarray:
+    """지수 이동 평균 (alpha = 2 / (period + 1), 첫 값은 단순 평균)"""
+    return _smoothed(x, period, 2.0 / (period + 1))
+
+
+def wilder(x: np.ndarray, period: int) -> np.ndarray:
+    """와일더 평활 (alpha = 1 / period, 첫 값은 단순 평균)"""
+    return _smoothed(x, period, 1.0 / period)
+
+
+def rolling_std(x: np.ndarray, period: int) -> np.ndarray:
+    """이동 표준편차 (모표준편차)"""
+    x = np.asarray(x, dtype=np.float64)
+    out = _nan_like(x)
+    if period <= x.shape[-1]:
+        out[..., period - 1:] = sliding_window_view(x, period, axis=-1).std(axis=-1)
+    return out
+
+
+def rolling_min(x: np.ndarray, period: int) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    out = _nan_like(x)
+    if period <= x.shape[-1]:
+        out[..., period - 1:] = sliding_window_view(x, period, axis=-1).min(axis=-1)
+    return out
+
+
+def rolling_max(x: np.ndarray, period: int) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    out = _nan_like(x)
+    if period <= x.shape[-1]:
+        out[..., period - 1:] = sliding_window_view(x, period, axis=-1).max(axis=-1)
+    return out
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    """x[t] - x[t-1] (첫 값은 NaN, 모양 유지)"""
+    out = _nan_like(x)
+    out[..., 1:] = np.diff(x, axis=-1)
+    return out
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    와일더 RSI
+
+    Args:
+        close (np.ndarray): 종가 (..., n)
+        period (int): 기간
+
+    Returns:
+        np.ndarray: 0~100 값 (앞쪽 period개는 NaN)
+    """
+    delta = _diff(np.asarray(close, dtype=np.float64))
+    avg_gain = wilder(np.clip(delta, 0.0, None), period)
+    avg_loss = wilder(np.clip(-delta, 0.0, None), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0, 100.0, out)
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26,
+         signal: int = 9) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD
+
+    Returns:
+        tuple: (MACD 선, 시그널 선, 히스토그램)
+    """
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger(close: np.ndarray, period: int = 20,
+              width: float = 2.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    볼린저 밴드
+
+    Returns:
+        tuple: (상단, 중심선, 하단)
+    """
+    middle = sma(close, period)
+    std = rolling_std(close, period)
+    return middle + width * std, middle, middle - width * std
+
+
+def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               k_period: int = 14, d_period: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """
+    스토캐스틱 %K, %D (가격 범위가 0이면 %K는 50)
+
+    Returns:
+        tuple: (%K, %D)
+    """
+    lowest = rolling_min(low, k_period)
+    highest = rolling_max(high, k_period)
+    span = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.where(span > 0, (np.asarray(close, dtype=np.float64) - lowest) / span * 100.0, 50.0)
+    k = np.where(np.isnan(span), np.nan, k)
+    return k, sma(k, d_period)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """실제 변동폭 (첫 값은 고가 - 저가)"""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    prev_close = np.asarray(close, dtype=np.float64)[..., :-1]
+    tr = high - low
+    tr[..., 1:] = np.maximum.reduce([
+        tr[..., 1:], np.abs(high[..., 1:] - prev_close), np.abs(low[..., 1:] - prev_close),
+    ])
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """평균 실제 변동폭 (와일더 평활)"""
+    return wilder(true_range(high, low, close), period)
+
+
+def obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """누적 거래량 (OBV, 첫 값은 0)"""
+    direction = np.sign(np.diff(np.asarray(close, dtype=np.float64), axis=-1))
+    flow = direction * np.asarray(volume, dtype=np.float64)[..., 1:]
+    out = np.zeros(np.shape(volume), dtype=np.float64)
+    out[..., 1:] = np.cumsum(flow, axis=-1)
+    return out
+
+
+def compute_all(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                volume: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    technical_analysis / scan 에서 쓰는 지표 전체를 계산
+
+    Args:
+        high, low, close, volume (np.ndarray): 시간순 캔들 열 (..., n)
+
+    Returns:
+        dict: 지표 이름 -> 입력과 같은 모양의 배열
+    """
+    macd_line, macd_signal, macd_hist = macd(close)
+    bb_upper, bb_middle, bb_lower = bollinger(close)
+    stoch_k, stoch_d = stochastic(high, low, close)
+    return {
+        "sma5": sma(close, 5),
+        "sma10": sma(close, 10),
+        "sma20": sma(close, 20),
+        "sma50": sma(close, 50),
+        "ema12": ema(close, 12),
+        "ema26": ema(close, 26),
+        "rsi": rsi(close),
+        "macd": macd_line,
+        "macd_signal": macd_signal,
+        "macd_hist": macd_hist,
+        "bb_upper": bb_upper,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_lower,
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+        "atr": atr(high, low, close),
+        "obv": obv(close, volume),
+    }
@@ -0,0 +1,199 @@
+import ast
+import hashlib
+import importlib
+import json
+import os
+from typing import Any, Callable, Optional
+
+from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.base import Tool
+from fastmcp.utilities.func_metadata import FuncMetadata
+from pydantic import Field
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 도구 이름 -> 모듈, 설명, 입력 스키마 (python -m core.lazy_tools 로 다시 생성)
+MANIFEST_PATH = os.path.join(ROOT, "tools", "manifest.json")
+
+
+def _source_path(module: str) -> str:
+    return os.path.join(ROOT, *module.split(".")) + ".py"
+
+
+def source_hash(module: str) -> str:
+    """프로젝트 모듈 소스 파일의 해시 (모듈을 실행하지 않고 매니페스트가 최신인지 확인하는 데 사용)"""
+    with open(_source_path(module), "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def schema_sources(module: str) -> list[str]:
+    """
+    도구 스키마에 영향을 주는 프로젝트 모듈 (도구 모듈과, 최상위에서 직접 불러오는 프로젝트 모듈)
+
+    core.shaping.ResponseFormat 같은 타입이나 기본값이 다른 모듈에 있어도 그 모듈이 바뀌면
+    매니페스트가 낡은 것으로 보도록 함께 해시합니다.
+    """
+    with open(_source_path(module), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = [module]
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        modules.extend(name for name in names if name not in modules and os.path.exists(_source_path(name)))
+    return modules
+
+
+class StaleManifestError(RuntimeError):
+    """불러온 도구의 설명/입력 스키마가 매니페스트와 다른 경우"""
+
+    def __init__(self, name: str):
+        self.name = name
+        super().__init__(f"도구 {name}의 정의가 tools/manifest.json 과 다릅니다. "
+                         "python -m core.lazy_tools 로 매니페스트를 다시 생성해주세요.")
+
+
+class LazyTool(Tool):
+    """
+    매니페스트의 설명/입력 스키마로 등록하고, 처음 호출될 때 도구 모듈을 불러오는 도구
+
+    도구 목록 조회에는 매니페스트만 쓰므로 서버 시작 시 도구 모듈과 그 의존성(numpy 등)을
+    불러오지 않고, 인자 검증용 pydantic 모델도 처음 호출할 때 만듭니다.
+    """
+
+    fn: Optional[Callable] = Field(None, exclude=True)
+    fn_metadata: Optional[FuncMetadata] = None
+    module: str = Field(description="도구 함수가 있는 모듈")
+
+    @property
+    def loaded(self) -> bool:
+        return self.fn is not None
+
+    def load(self) -> None:
+        """
+        도구 모듈을 불러와 함수와 인자 검증 모델을 채움
+
+        Raises:
+            StaleManifestError: 실제 설명/입력 스키마가 목록 조회에 쓴 매니페스트와 다른 경우
+        """
+        if self.fn is not None:
+            return
+        tool = Tool.from_function(getattr(importlib.import_module(self.module), self.name))
+        if (tool.parameters, tool.description, tool.context_kwarg) != \
+                (self.parameters, self.description, self.context_kwarg):
+            raise StaleManifestError(self.name)
+        self.fn_metadata = tool.fn_metadata
+        self.fn = tool.fn
+
+    async def run(self, arguments: dict, context: Optional[Context] = None) -> Any:
+        try:
+            self.load()
+        except Exception as e:
+            raise ToolError(f"Error loading tool {self.name}: {e}") from e
+        return await super().run(arguments, context=context)
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict[str, dict]:
+    """매니페스트 읽기 (없으면 빈 dict)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {entry["name"]: entry for entry in json.load(f)["tools"]}
+    except FileNotFoundError:
+        return {}
+
+
+def build_manifest(tools: list[tuple[str, str]]) -> dict:
+    """
+    도구 모듈을 불러와 등록 정보(설명, 입력 스키마 등)를 매니페스트로 만듦
+
+    Args:
+        tools (list[tuple[str, str]]): (도구 이름, 모듈) 목록
+
+    Returns:
+        dict: 매니페스트 ({"tools": [...]}, 등록 순서 유지)
+    """
+    entries = []
+    for name, module in tools:
+        tool = Tool.from_function(getattr(importlib.import_module(module), name))
+        entries.append({
+            "name": name,
+            "module": module,
+            "sources": {source: source_hash(source) for source in schema_sources(module)},
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "context_kwarg": tool.context_kwarg,
+            "is_async": tool.is_async,
+        })
+    return {"tools": entries}
+
+
+def register_tools(mcp: FastMCP, tools: list[tuple[str, str]], path: str = MANIFEST_PATH) -> dict:
+    """
+    도구를 서버에 등록
+
+    매니페스트 항목이 있고 도구 모듈과 도구 모듈이 불러오는 프로젝트 모듈의 소스가 바뀌지 않은 도구는
+    LazyTool로 등록하고, 그 밖의 도구(매니페스트에 없거나 소스가 바뀐 도구)는 모듈을 불러와 바로 등록합니다.
+
+    Args:
+        mcp (FastMCP): 서버
+        tools (list[tuple[str, str]]): (도구 이름, 모듈) 목록 (등록 순서)
+        path (str): 매니페스트 경로
+
+    Returns:
+        dict: 지연 등록/즉시 등록한 도구 수
+    """
+    manifest = load_manifest(path)
+    hashes: dict[str, str] = {}
+    counts = {"lazy": 0, "eager": 0}
+    for name, module in tools:
+        entry = manifest.get(name)
+        if entry is not None and entry["module"] == module:
+            for source in entry["sources"]:
+                if source not in hashes:
+                    hashes[source] = source_hash(source) if os.path.exists(_source_path(source)) else None
+            if all(hashes[source] == digest for source, digest in entry["sources"].items()):
+                # fastmcp 0.4 에는 만들어 둔 Tool을 등록하는 공개 API가 없어 도구 관리자에 직접 넣는다
+                mcp._tool_manager._tools[name] = LazyTool(
+                    name=name, module=module, description=entry["description"],
+                    parameters=entry["parameters"], context_kwarg=entry["context_kwarg"],
+                    is_async=entry["is_async"],
+                )
+                counts["lazy"] += 1
+                continue
+        mcp.add_tool(getattr(importlib.import_module(module), name))
+        counts["eager"] += 1
+    return counts
+
+
+def stale_entries(tools: list[tuple[str, str]], path: str = MANIFEST_PATH) -> list[str]:
+    """매니페스트가 실제 도구 정의와 다른 도구 이름 목록 (도구 모듈을 모두 불러옴)"""
+    current = {entry["name"]: entry for entry in build_manifest(tools)["tools"]}
+    saved = load_manifest(path)
+    return [name for name in current if saved.get(name) != current[name]] + \
+        [name for name in saved if name not in current]
+
+
+if __name__ == "__main__":
+    # python -m core.lazy_tools          매니페스트 다시 생성
+    # python -m core.lazy_tools --check  매니페스트가 최신인지 확인 (아니면 종료 코드 1)
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    from tools import TOOLS
+
+    if args.check:
+        stale = stale_entries(TOOLS)
+        print(f"manifest: {len(TOOLS)} tools, {len(stale)} stale" + (f" ({', '.join(stale)})" if stale else ""))
+        sys.exit(1 if stale else 0)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(build_manifest(TOOLS), f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"wrote {MANIFEST_PATH} ({len(TOOLS)} tools)")
@@ -0,0 +1,341 @@
+import math
+from collections import deque
+from datetime import datetime, timezone
+
+from core.candle_store import load_columns
+from core.candles import current_candle_start, format_to, periods_between
+
+# 처음 상태를 만들 때 사용할 마감 캔들 수 (EMA/와일더 평활이 충분히 수렴하도록)
+WARMUP_CANDLES = 200
+
+NAN = float("nan")
+
+# 각 상태 객체는 peek(x)로 x가 다음 값일 때의 결과를 상태 변경 없이 계산하고,
+# push(x)로 x를 마감 값으로 확정합니다. 진행 중인 캔들은 peek, 마감된 캔들은 push 로 처리합니다.
+
+
+class Smoothed:
+    """처음 period개의 단순 평균으로 시작하는 지수 평활 (EMA, 와일더 평활)"""
+
+    __slots__ = ("period", "alpha", "count", "total", "state")
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.total = 0.0
+        self.state = NAN
+
+    @classmethod
+    def ema(cls, period: int) -> "Smoothed":
+        return cls(period, 2.0 / (period + 1))
+
+    @classmethod
+    def wilder(cls, period: int) -> "Smoothed":
+        return cls(period, 1.0 / period)
+
+    def peek(self, x: float) -> float:
+        if math.isnan(x):
+            return NAN
+        if self.count >= self.period:
+            return (1.0 - self.alpha) * self.state + self.alpha * x
+        if self.count == self.period - 1:
+            return (self.total + x) / self.period
+        return NAN
+
+    def push(self, x: float) -> float:
+        value = self.peek(x)
+        if math.isnan(x):
+            # 앞쪽 NaN 구간(입력이 아직 계산되지 않은 구간)은 건너뜀
+            return value
+        if self.count < self.period:
+            self.total += x
+        self.count += 1
+        if not math.isnan(value):
+            self.state = value
+        return value
+
+
+class RollingStats:
+    """최근 period개(현재 값 포함)의 평균과 모표준편차"""
+
+    __slots__ = ("period", "window", "shift", "total", "total_sq", "pushes")
+
+    def __init__(self, period: int):
+        self.period = period
+        # 현재 값과 합쳐 창이 되도록 마감 값은 period-1개만 보관
+        self.window: deque[float] = deque(maxlen=period - 1)
+        self.shift = None
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.pushes = 0
+
+    def peek(self, x: float) -> tuple[float, float]:
+        if math.isnan(x) or len(self.window) < self.period - 1:
+            return NAN, NAN
+        shift = x if self.shift is None else self.shift
+        d = x - shift
+        mean = (self.total + d) / self.period
+        var = max((self.total_sq + d * d) / self.period - mean * mean, 0.0)
+        return mean + shift, math.sqrt(var)
+
+    def push(self, x: float) -> tuple[float, float]:
+        value = self.peek(x)
+        if math.isnan(x):
+            return value
+        if self.shift is None:
+            self.shift = x
+        if self.period > 1:
+            if len(self.window) == self.window.maxlen:
+                old = self.window[0] - self.shift
+                self.total -= old
+                self.total_sq -= old * old
+            self.window.append(x)
+            d = x - self.shift
+            self.total += d
+            self.total_sq += d * d
+            self.pushes += 1
+            if self.pushes % self.period == 0:
+                # 창 크기마다 기준값을 최근 값으로 옮기고 합을 다시 계산 (분할 상환 O(1)).
+                # 큰 가격에서 제곱합의 자릿수 손실과 누적 오차를 막는다
+                self.shift = x
+                self.total = sum(v - self.shift for v in self.window)
+                self.total_sq = sum((v - self.shift) ** 2 for v in self.window)
+        return value
+
+
+class RollingExtreme:
+    """최근 period개(현재 값 포함)의 최소/최대값 (단조 덱, 분할 상환 O(1))"""
+
+    __slots__ = ("period", "sign", "window", "seen")
+
+    def __init__(self, period: int, kind: str):
+        self.period = period
+        # 최대값은 부호를 뒤집어 최소값 덱으로 처리
+        self.sign = 1.0 if kind == "min" else -1.0
+        self.window: deque[tuple[int, float]] = deque()
+        self.seen = 0
+
+    def peek(self, x: float) -> float:
+        if math.isnan(x) or self.seen < self.period - 1:
+            return NAN
+        value = self.sign * x
+        if self.window:
+            value = min(value, self.window[0][1])
+        return self.sign * value
+
+    def push(self, x: float) -> float:
+        result = self.peek(x)
+        if math.isnan(x):
+            return result
+        value = self.sign * x
+        while self.window and self.window[-1][1] >= value:
+            self.window.pop()
+        self.window.append((self.seen, value))
+        self.seen += 1
+        # 다음 값과 합쳐 창이 되도록 최근 period-1개만 유지
+        while self.window and self.window[0][0] <= self.seen - self.period:
+            self.window.popleft()
+        return result
+
+
+class LiveIndicators:
+    """
+    마켓/간격 하나의 증분 지표 상태
+
+    core.indicators.compute_all 과 같은 지표를 캔들 하나마다 O(1)로 갱신합니다.
+    마감된 캔들은 push, 진행 중인 캔들은 peek 으로 반영하므로
+    진행 중인 캔들이 여러 번 바뀌어도 상태는 마감된 캔들 기준으로 유지됩니다.
+    """
+
+    def __init__(self, market: str, interval: str):
+        self.market = market
+        self.interval = interval
+        self.last_closed: int | None = None
+        self.closed_count = 0
+        self.values: dict[str, float] = {}
+        self.live_time: int | None = None
+
+        self._sma = {period: RollingStats(period) for period in (5, 10, 50)}
+        self._bb = RollingStats(20)
+        self._ema12 = Smoothed.ema(12)
+        self._ema26 = Smoothed.ema(26)
+        self._signal = Smoothed.ema(9)
+        self._gain = Smoothed.wilder(14)
+        self._loss = Smoothed.wilder(14)
+        self._atr = Smoothed.wilder(14)
+        self._low = RollingExtreme(14, "min")
+        self._high = RollingExtreme(14, "max")
+        self._stoch_d = RollingStats(3)
+        self._prev_close = NAN
+        self._obv = 0.0
+
+    def _step(self, high: float, low: float, close: float, volume: float, commit: bool) -> dict[str, float]:
+        op = "push" if commit else "peek"
+        values = {f"sma{period}": getattr(stats, op)(close)[0] for period, stats in self._sma.items()}
+
+        bb_middle, bb_std = getattr(self._bb, op)(close)
+        values.update(sma20=bb_middle, bb_upper=bb_middle + 2 * bb_std,
+                      bb_middle=bb_middle, bb_lower=bb_middle - 2 * bb_std)
+
+        ema12 = getattr(self._ema12, op)(close)
+        ema26 = getattr(self._ema26, op)(close)
+        line = ema12 - ema26
+        signal = getattr(self._signal, op)(line)
+        values.update(ema12=ema12, ema26=ema26, macd=line, macd_signal=signal, macd_hist=line - signal)
+
+        delta = close - self._prev_close
+        avg_gain = getattr(self._gain, op)(max(delta, 0.0) if not math.isnan(delta) else NAN)
+        avg_loss = getattr(self._loss, op)(max(-delta, 0.0) if not math.isnan(delta) else NAN)
+        if avg_loss == 0:
+            values["rsi"] = 100.0
+        elif math.isnan(avg_gain) or math.isnan(avg_loss):
+            values["rsi"] = NAN
+        else:
+            values["rsi"] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        lowest = getattr(self._low, op)(low)
+        highest = getattr(self._high, op)(high)
+        span = highest - lowest
+        if math.isnan(span):
+            k = NAN
+        else:
+            k = (close - lowest) / span * 100.0 if span > 0 else 50.0
+        values["stoch_k"] = k
+        values["stoch_d"] = getattr(self._stoch_d, op)(k)[0]
+
+        tr = high - low
+        if not math.isnan(self._prev_close):
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        values["atr"] = getattr(self._atr, op)(tr)
+
+        if math.isnan(self._prev_close) or close == self._prev_close:
+            obv = self._obv
+        else:
+            obv = self._obv + (volume if close > self._prev_close else -volume)
+        values["obv"] = obv
+
+        if commit:
+            self._prev_close = close
+            self._obv = obv
+        return values
+
+    def update(self, time: int, high: float, low: float, close: float, volume: float,
+               closed: bool = True) -> dict[str, float]:
+        """
+        캔들 하나를 반영
+
+        Args:
+            time (int): 캔들 시작 시각 (epoch 초)
+            high, low, close, volume (float): 캔들 고가/저가/종가/누적 거래량
+            closed (bool): 마감된 캔들이면 True (상태에 확정), 진행 중이면 False
+
+        Returns:
+            dict: 지표 이름 -> 이 캔들 기준 값 (계산 구간이 부족하면 NaN)
+        """
+        if closed:
+            if self.last_closed is not None and time <= self.last_closed:
+                # 이미 반영한 마감 캔들
+                return self.values
+            self.values = self._step(high, low, close, volume, commit=True)
+            self.last_closed = time
+            self.closed_count += 1
+            self.live_time = None
+            return self.values
+        self.live_time = time
+        return self._step(high, low, close, volume, commit=False)
+
+    def snapshot(self) -> dict:
+        """마지막으로 확정된 지표 값 (NaN은 None)"""
+        return {name: None if math.isnan(v) else v for name, v in self.values.items()}
+
+
+class LiveIndicatorRegistry:
+    """(마켓, 간격)별 증분 지표 상태 모음"""
+
+    def __init__(self):
+        self._states: dict[tuple[str, str], LiveIndicators] = {}
+        self.closed_updates = 0
+        self.live_updates = 0
+
+    def get(self, market: str, interval: str) -> LiveIndicators:
+        key = (market, interval)
+        if key not in self._states:
+            self._states[key] = LiveIndicators(market, interval)
+        return self._states[key]
+
+    def remove(self, market: str, interval: str) -> bool:
+        return self._states.pop((market, interval), None) is not None
+
+    def watched(self) -> list[dict]:
+        return [
+            {"market": m, "interval": i, "closed_candles": s.closed_count, "last_closed": s.last_closed}
+            for (m, i), s in self._states.items()
+        ]
+
+    async def refresh(self, market: str, interval: str, include_current: bool = True) -> dict:
+        """
+        마지막으로 반영한 캔들 이후 새로 마감된 캔들만 받아 상태에 반영하고 현재 지표 값을 반환
+
+        Args:
+            market (str): 마켓 코드
+            interval (str): 캔들 간격
+            include_current (bool): 진행 중인 캔들까지 반영한 값을 반환할지 여부
+
+        Returns:
+            dict: 지표 이름 -> 값 (NaN은 None), time(기준 캔들 시작 시각) 포함
+        """
+        state = self.get(market, interval)
+        now = datetime.now(timezone.utc)
+        boundary = current_candle_start(interval, now)
+
+        count = WARMUP_CANDLES
+        if state.last_closed is not None:
+            last = datetime.fromtimestamp(state.last_closed, tz=timezone.utc)
+            count = max(periods_between(last, boundary, interval), 1)
+            if count > WARMUP_CANDLES:
+                # 오래 갱신하지 않았으면 빠진 캔들을 모두 따라가는 대신 최근 캔들로 다시 만든다
+                state = self._states[(market, interval)] = LiveIndicators(market, interval)
+                count = WARMUP_CANDLES
+        columns = await load_columns(market, interval, count + (1 if include_current else 0),
+                                     None if include_current else format_to(boundary))
+
+        times = columns["time"]
+        values = state.values
+        boundary_ts = int(boundary.timestamp())
+        # 이전 호출에서 반영한 진행 중 캔들은 이번 결과와 무관 (include_current=False 면 마감 값만 반환)
+        state.live_time = None
+        for i in range(len(times)):
+            closed = int(times[i]) < boundary_ts
+            values = state.update(
+                int(times[i]), float(columns["high_price"][i]), float(columns["low_price"][i]),
+                float(columns["trade_price"][i]), float(columns["candle_acc_trade_volume"][i]), closed,
+            )
+            if closed:
+                self.closed_updates += 1
+            else:
+                self.live_updates += 1
+
+        time = state.live_time if state.live_time is not None else state.last_closed
+        result = {name: None if math.isnan(v) else v for name, v in values.items()}
+        result["time"] = None if time is None else format_to(datetime.fromtimestamp(time, tz=timezone.utc))
+        result["in_progress"] = state.live_time is not None
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "watched": len(self._states),
+            "closed_updates": self.closed_updates,
+            "live_updates": self.live_updates,
+        }
+
+
+_registry: LiveIndicatorRegistry | None = None
+
+
+def get_indicator_registry() -> LiveIndicatorRegistry:
+    """서버 전체에서 공유하는 증분 지표 상태 반환"""
+    global _registry
+    if _registry is None:
+        _registry = LiveIndicatorRegistry()
+    return _registry
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from config import API_BASE, MARKET_CACHE_TTL, MARKET_CACHE_MAX_STALE
+from core.decode import decode
+from core.http import get_client
+
+
+class MarketCache:
+    """
+    /market/all 응답 캐시
+
+    - TTL 이내: 메모리에서 바로 반환
+    - TTL 경과 ~ 최대 허용 기간: 이전 값을 반환하면서 백그라운드에서 갱신
+    - 최대 허용 기간 경과 또는 데이터 없음: 갱신이 끝날 때까지 대기
+    동시에 들어온 호출은 하나의 요청을 공유합니다 (single-flight).
+    """
+
+    def __init__(self, ttl: float = MARKET_CACHE_TTL, max_stale: float = MARKET_CACHE_MAX_STALE):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._markets: list[dict] | None = None
+        self._codes: frozenset[str] | None = None
+        self._fetched_at = 0.0
+        self._inflight: asyncio.Task | None = None
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def _fetch(self) -> list[dict]:
+        client = get_client()
+        res = await client.get(f"{API_BASE}/market/all")
+        res.raise_for_status()
+        markets = decode(res)
+        self._markets = markets
+        self._codes = frozenset(item["market"] for item in markets)
+        self._fetched_at = time.monotonic()
+        return markets
+
+    def _refresh(self) -> asyncio.Task:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._fetch())
+            self._inflight.add_done_callback(self._on_refresh_done)
+        return self._inflight
+
+    @staticmethod
+    def _on_refresh_done(task: asyncio.Task) -> None:
+        # 백그라운드 갱신 실패는 다음 호출에서 다시 시도한다
+        if not task.cancelled():
+            task.exception()
+
+    async def get(self) -> list[dict]:
+        """
+        마켓 목록 반환
+
+        Returns:
+            list[dict]: /market/all 응답 (market, korean_name, english_name)
+
+        Raises:
+            httpx.HTTPError: 캐시가 비어 있거나 너무 오래되었는데 갱신에 실패한 경우
+        """
+        age = time.monotonic() - self._fetched_at
+        if self._markets is not None and age < self.ttl:
+            self.hits += 1
+            return self._markets
+        if self._markets is not None and age < self.ttl + self.max_stale:
+            self.stale_hits += 1
+            self._refresh()
+            return self._markets
+
+        self.misses += 1
+        return await asyncio.shield(self._refresh())
+
+    async def codes(self) -> frozenset[str]:
+        """마켓 코드 집합 반환"""
+        await self.get()
+        return self._codes
+
+    def peek_codes(self) -> frozenset[str] | None:
+        """네트워크 요청 없이 현재 캐시된 마켓 코드 집합 반환 (없으면 None)"""
+        return self._codes
+
+    def invalidate(self) -> None:
+        """다음 호출에서 이전 값을 반환하며 갱신하도록 캐시를 만료 처리"""
+        self._fetched_at = min(self._fetched_at, time.monotonic() - self.ttl)
+
+    def stats(self) -> dict:
+        return {
+            "cached_markets": len(self._markets) if self._markets is not None else 0,
+            "age_seconds": round(time.monotonic() - self._fetched_at, 3) if self._markets else None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+
+_cache: MarketCache | None = None
+
+
+def get_market_cache() -> MarketCache:
+    """서버 전체에서 공유하는 마켓 목록 캐시 반환"""
+    global _cache
+    if _cache is None:
+        _cache = MarketCache()
+    return _cache
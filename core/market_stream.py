@@ -0,0 +1,232 @@
+import asyncio
+import json
+import uuid
+from collections import deque
+from config import WS_URL, WS_TRADE_BUFFER
+from core.decode import loads
+
+STREAM_TYPES = ("ticker", "orderbook", "trade")
+
+# 재연결 대기 시간 (초): 실패할 때마다 두 배, 최대값까지
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+def websockets_available() -> bool:
+    """웹소켓 스트림에 필요한 websockets 패키지가 설치되어 있는지 확인"""
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _to_rest_shape(message: dict) -> dict:
+    """웹소켓 메시지를 REST 응답과 같은 형태로 변환"""
+    item = {k: v for k, v in message.items() if k not in ("type", "code", "stream_type")}
+    item["market"] = message["code"]
+    if message["type"] == "trade":
+        # REST /trades/ticks 필드 이름에 맞춘다
+        item["trade_date_utc"] = item.pop("trade_date", None)
+        item["trade_time_utc"] = item.pop("trade_time", None)
+        item["timestamp"] = item.pop("trade_timestamp", item.get("timestamp"))
+    return item
+
+
+class MarketStream:
+    """
+    업비트 웹소켓 시세 구독 엔진
+
+    구독한 마켓의 ticker / orderbook / trade 스트림을 받아 마켓별 최신 상태를 메모리에 유지합니다.
+    연결이 끊기면 지수 백오프로 재연결하고 기존 구독을 다시 요청합니다.
+    연결되어 있지 않은 동안에는 스냅샷을 반환하지 않으므로 호출자는 REST로 대체해야 합니다.
+    """
+
+    def __init__(self, url: str = WS_URL, trade_buffer: int = WS_TRADE_BUFFER):
+        self.url = url
+        self.trade_buffer = trade_buffer
+        self._subscriptions: dict[str, set[str]] = {t: set() for t in STREAM_TYPES}
+        self.tickers: dict[str, dict] = {}
+        self.orderbooks: dict[str, dict] = {}
+        self.trades: dict[str, deque] = {}
+        # 체결 메시지마다 (마켓 코드, 체결) 로 호출할 함수 (예: 체결 테이프)
+        self.trade_listeners: list = []
+
+        self._ws = None
+        self._task: asyncio.Task | None = None
+        self._connected = asyncio.Event()
+
+        self.messages = 0
+        self.reconnects = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    # 구독 관리
+
+    def subscriptions(self) -> dict[str, list[str]]:
+        return {t: sorted(codes) for t, codes in self._subscriptions.items()}
+
+    async def subscribe(self, codes: list[str], types: tuple[str, ...] = STREAM_TYPES) -> None:
+        """
+        마켓 스트림 구독 추가
+
+        Args:
+            codes (list[str]): 마켓 코드 목록
+            types (tuple[str]): 스트림 종류 (ticker, orderbook, trade)
+        """
+        for stream_type in types:
+            if stream_type not in STREAM_TYPES:
+                raise ValueError(f"지원하지 않는 스트림입니다: {stream_type}")
+            self._subscriptions[stream_type].update(codes)
+        self.start()
+        await self._send_subscription()
+
+    async def unsubscribe(self, codes: list[str], types: tuple[str, ...] = STREAM_TYPES) -> None:
+        """마켓 스트림 구독 해제 (보관 중인 상태도 함께 삭제)"""
+        for stream_type in types:
+            self._subscriptions[stream_type].difference_update(codes)
+            store = self._store(stream_type)
+            for code in codes:
+                store.pop(code, None)
+        if self._subscription_message() is None:
+            await self.stop()
+            return
+        await self._send_subscription()
+
+    def _subscription_message(self) -> list[dict] | None:
+        fields = [{"ticket": str(uuid.uuid4())}]
+        for stream_type, codes in self._subscriptions.items():
+            if codes:
+                fields.append({"type": stream_type, "codes": sorted(codes)})
+        if len(fields) == 1:
+            return None
+        fields.append({"format": "DEFAULT"})
+        return fields
+
+    async def _send_subscription(self) -> None:
+        message = self._subscription_message()
+        if self._ws is None or message is None:
+            return
+        try:
+            await self._ws.send(json.dumps(message))
+        except Exception:
+            # 연결이 끊긴 경우 재연결 시 다시 구독한다
+            pass
+
+    # 로컬 상태 조회
+
+    def _store(self, stream_type: str) -> dict:
+        return {"ticker": self.tickers, "orderbook": self.orderbooks, "trade": self.trades}[stream_type]
+
+    def streaming(self, code: str, stream_type: str) -> bool:
+        """연결되어 있고 해당 마켓/스트림을 구독 중인지 여부"""
+        return self.connected and code in self._subscriptions[stream_type]
+
+    def ticker(self, code: str) -> dict | None:
+        """구독 중이고 연결되어 있으면 최신 티커 반환, 아니면 None"""
+        if not self.connected or code not in self._subscriptions["ticker"]:
+            return None
+        return self.tickers.get(code)
+
+    def orderbook(self, code: str) -> dict | None:
+        """구독 중이고 연결되어 있으면 최신 호가 반환, 아니면 None"""
+        if not self.connected or code not in self._subscriptions["orderbook"]:
+            return None
+        return self.orderbooks.get(code)
+
+    def recent_trades(self, code: str) -> list[dict] | None:
+        """구독 중이고 연결되어 있으면 최근 체결 목록 반환 (최신순), 아니면 None"""
+        if not self.connected or code not in self._subscriptions["trade"]:
+            return None
+        trades = self.trades.get(code)
+        return list(reversed(trades)) if trades else None
+
+    def handle_message(self, raw: bytes | str) -> None:
+        """수신한 웹소켓 메시지 하나를 로컬 상태에 반영"""
+        message = loads(raw)
+        stream_type = message.get("type")
+        code = message.get("code")
+        if stream_type not in STREAM_TYPES or not code:
+            return
+        self.messages += 1
+        item = _to_rest_shape(message)
+        if stream_type == "trade":
+            if code not in self.trades:
+                self.trades[code] = deque(maxlen=self.trade_buffer)
+            self.trades[code].append(item)
+            for listener in self.trade_listeners:
+                listener(code, item)
+        else:
+            self._store(stream_type)[code] = item
+
+    # 연결 수명 관리
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._connected.clear()
+
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                async with connect(self.url, max_size=None) as ws:
+                    self._ws = ws
+                    await self._send_subscription()
+                    self._connected.set()
+                    delay = RECONNECT_MIN_DELAY
+                    async for raw in ws:
+                        self.handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
+            finally:
+                # 끊긴 동안의 상태는 믿을 수 없으므로 재연결 후 새로 받는다
+                self._ws = None
+                self._connected.clear()
+                self.tickers.clear()
+                self.orderbooks.clear()
+                self.trades.clear()
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def stats(self) -> dict:
+        return {
+            "connected": self.connected,
+            "subscriptions": self.subscriptions(),
+            "messages": self.messages,
+            "reconnects": self.reconnects,
+        }
+
+
+_stream: MarketStream | None = None
+
+
+def get_market_stream() -> MarketStream:
+    """서버 전체에서 공유하는 시세 스트림 반환"""
+    global _stream
+    if _stream is None:
+        _stream = MarketStream()
+    return _stream
@@ -0,0 +1,287 @@
+import sys
+import time
+from bisect import bisect_left
+from urllib.parse import urlparse
+
+import httpx
+from fastmcp import FastMCP
+
+from config import API_BASE
+
+# 지연 시간 히스토그램 구간 상한 (초, Prometheus의 le와 같이 상한 포함)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_API_PATH = urlparse(API_BASE).path.rstrip("/")
+
+
+class Histogram:
+    """
+    고정 구간 지연 시간 히스토그램
+
+    관측 한 번은 구간 검색과 덧셈 몇 번뿐이라 모든 호출에 켜 두어도 부담이 없습니다.
+    분위수는 해당 관측이 들어간 구간의 상한으로 추정합니다 (마지막 구간은 최댓값).
+    """
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float | None:
+        """q 분위수 추정값 (초, 관측이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(LATENCY_BUCKETS[i], self.max) if i < len(LATENCY_BUCKETS) else self.max
+        return self.max
+
+    def cumulative(self) -> list[int]:
+        """구간별 누적 관측 수 (마지막 값은 +Inf 구간 = 전체 수)"""
+        total, result = 0, []
+        for n in self.counts:
+            total += n
+            result.append(total)
+        return result
+
+    def snapshot(self) -> dict:
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 3)
+
+        return {
+            "count": self.count,
+            "avg_ms": ms(self.sum / self.count) if self.count else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p95_ms": ms(self.quantile(0.95)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "max_ms": ms(self.max) if self.count else None,
+        }
+
+
+def endpoint_of(path: str) -> str:
+    """요청 경로에서 API 기본 경로를 뺀 엔드포인트 이름 (예: /v1/candles/minutes/1 -> /candles/minutes/1)"""
+    if _API_PATH and path.startswith(_API_PATH):
+        return path[len(_API_PATH):] or "/"
+    return path
+
+
+def _ratio(hits: int, misses: int) -> dict:
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_ratio": round(hits / total, 4) if total else None}
+
+
+class Metrics:
+    """
+    도구 호출과 업비트 API 요청의 지연 시간/결과 집계
+
+    도구: 도구별 지연 시간 히스토그램, 결과(ok, error, error_response)별 호출 수, 실행 중인 호출 수
+    업비트 API: 엔드포인트별 지연 시간 히스토그램, 상태 코드별 응답 수, 실행 중인 요청 수
+    (요청 수 제한기 안쪽에서 재므로 429 후 재시도도 한 번씩 셉니다)
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.tools: dict[str, Histogram] = {}
+        self.tool_results: dict[str, dict[str, int]] = {}
+        self.tools_in_flight: dict[str, int] = {}
+        self.http: dict[str, Histogram] = {}
+        self.http_status: dict[str, dict[str, int]] = {}
+        self.http_in_flight = 0
+
+    def tool_started(self, name: str) -> None:
+        self.tools_in_flight[name] = self.tools_in_flight.get(name, 0) + 1
+
+    def tool_finished(self, name: str, seconds: float, result: str) -> None:
+        self.tools_in_flight[name] -= 1
+        histogram = self.tools.get(name)
+        if histogram is None:
+            histogram = self.tools[name] = Histogram()
+            self.tool_results[name] = {}
+        histogram.observe(seconds)
+        results = self.tool_results[name]
+        results[result] = results.get(result, 0) + 1
+
+    def http_started(self) -> None:
+        self.http_in_flight += 1
+
+    def http_finished(self, endpoint: str, seconds: float, status: str) -> None:
+        self.http_in_flight -= 1
+        histogram = self.http.get(endpoint)
+        if histogram is None:
+            histogram = self.http[endpoint] = Histogram()
+            self.http_status[endpoint] = {}
+        histogram.observe(seconds)
+        statuses = self.http_status[endpoint]
+        statuses[status] = statuses.get(status, 0) + 1
+
+    def caches(self) -> dict:
+        """
+        캐시 적중률 (아직 불러오지 않은 모듈의 캐시는 쓰인 적이 없으므로 건너뜀)
+
+        coalescing은 묶여서 업비트 요청을 아낀 호출을 적중으로, candle_store는 저장소에서 꺼낸
+        캔들을 적중으로 셉니다.
+        """
+        caches = {}
+        module = sys.modules.get("core.market_cache")
+        if module is not None:
+            s = module.get_market_cache().stats()
+            caches["market_list"] = _ratio(s["hits"] + s["stale_hits"], s["misses"])
+        module = sys.modules.get("core.account_state")
+        if module is not None:
+            s = module.get_account_state().stats()
+            caches["account_state"] = _ratio(s["hits"], s["misses"])
+        module = sys.modules.get("core.candle_store")
+        if module is not None:
+            s = module.get_candle_store().stats()
+            caches["candle_store"] = _ratio(s["served_from_store"], s["fetched_candles"])
+        module = sys.modules.get("core.coalesce")
+        if module is not None:
+            for name, coalescer in (("ticker", module.ticker_coalescer), ("orderbook", module.orderbook_coalescer)):
+                s = coalescer.stats()
+                caches[f"{name}_coalescing"] = _ratio(s["requests"] - s["batches"], s["batches"])
+        return caches
+
+    def stats(self) -> dict:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "tools": {
+                name: {**histogram.snapshot(), "results": dict(self.tool_results[name]),
+                       "in_flight": self.tools_in_flight.get(name, 0)}
+                for name, histogram in sorted(self.tools.items())
+            },
+            "tools_in_flight": sum(self.tools_in_flight.values()),
+            "upstream": {
+                endpoint: {**histogram.snapshot(), "status": dict(self.http_status[endpoint])}
+                for endpoint, histogram in sorted(self.http.items())
+            },
+            "upstream_in_flight": self.http_in_flight,
+            "upstream_429": sum(statuses.get("429", 0) for statuses in self.http_status.values()),
+            "caches": self.caches(),
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+        lines: list[str] = []
+
+        def histogram(metric: str, help_text: str, label: str, items: dict[str, Histogram]) -> None:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for key, h in sorted(items.items()):
+                labels = f'{label}="{_escape(key)}"'
+                for le, n in zip((*LATENCY_BUCKETS, "+Inf"), h.cumulative()):
+                    lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {n}')
+                lines.append(f"{metric}_sum{{{labels}}} {h.sum}")
+                lines.append(f"{metric}_count{{{labels}}} {h.count}")
+
+        def series(metric: str, kind: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(f"{metric}{labels} {value}" for labels, value in samples)
+
+        histogram("upbit_mcp_tool_duration_seconds", "Tool call latency.", "tool", self.tools)
+        series("upbit_mcp_tool_calls_total", "counter", "Tool calls by result.", [
+            (f'{{tool="{_escape(name)}",result="{result}"}}', n)
+            for name, results in sorted(self.tool_results.items()) for result, n in sorted(results.items())
+        ])
+        series("upbit_mcp_tools_in_flight", "gauge", "Tool calls currently running.", [
+            (f'{{tool="{_escape(name)}"}}', n) for name, n in sorted(self.tools_in_flight.items())
+        ])
+        histogram("upbit_mcp_upstream_duration_seconds", "Upbit API request latency.", "endpoint", self.http)
+        series("upbit_mcp_upstream_responses_total", "counter", "Upbit API responses by status code.", [
+            (f'{{endpoint="{_escape(endpoint)}",status="{status}"}}', n)
+            for endpoint, statuses in sorted(self.http_status.items()) for status, n in sorted(statuses.items())
+        ])
+        series("upbit_mcp_upstream_in_flight", "gauge", "Upbit API requests currently running.",
+               [("", self.http_in_flight)])
+        caches = self.caches()
+        series("upbit_mcp_cache_hits_total", "counter", "Cache hits.",
+               [(f'{{cache="{name}"}}', c["hits"]) for name, c in caches.items()])
+        series("upbit_mcp_cache_misses_total", "counter", "Cache misses.",
+               [(f'{{cache="{name}"}}', c["misses"]) for name, c in caches.items()])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """업비트 API 요청마다 엔드포인트별 지연 시간과 상태 코드를 기록하는 httpx 전송 계층"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: Metrics):
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._metrics
+        metrics.http_started()
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            metrics.http_finished(endpoint_of(request.url.path), time.perf_counter() - start, status)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _is_error_response(value) -> bool:
+    """도구가 오류를 값으로 돌려주었는지 여부 ({"error": ...} 또는 목록 도구의 [{"error": ...}])"""
+    if isinstance(value, dict):
+        return "error" in value
+    return isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict) and "error" in value[0]
+
+
+def instrument_tools(mcp: FastMCP) -> None:
+    """
+    서버에 등록된 모든 도구 호출의 지연 시간과 결과를 기록하도록 도구 관리자를 감쌈
+
+    도구가 예외를 던지면 error, {"error": ...}나 [{"error": ...}]를 돌려주면 error_response로 셉니다.
+    등록되지 않은 도구 이름은 기록하지 않습니다.
+    """
+    manager = mcp._tool_manager
+    call_tool = manager.call_tool
+    metrics = get_metrics()
+
+    async def timed_call_tool(name: str, arguments: dict, context=None):
+        if manager.get_tool(name) is None:
+            return await call_tool(name, arguments, context=context)
+        metrics.tool_started(name)
+        start = time.perf_counter()
+        result = "error"
+        try:
+            value = await call_tool(name, arguments, context=context)
+            result = "error_response" if _is_error_response(value) else "ok"
+            return value
+        finally:
+            metrics.tool_finished(name, time.perf_counter() - start, result)
+
+    # fastmcp 0.4 에는 도구 호출 미들웨어가 없어 인스턴스의 call_tool을 바꿔 끼운다
+    manager.call_tool = timed_call_tool
+
+
+_metrics: Metrics | None = None
+
+
+def get_metrics() -> Metrics:
+    """서버 전체에서 공유하는 지표 모음 반환"""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,95 @@
+def _number(value) -> float:
+    """업비트 비공개 API의 문자열 숫자를 float로 변환 (없거나 잘못된 값은 0)"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class Account:
+    """
+    /accounts 응답 항목
+
+    업비트는 잔고/평균 매수가를 문자열로 보내므로 만들 때 한 번만 숫자로 바꿔 둡니다.
+    """
+
+    __slots__ = ("currency", "unit_currency", "balance", "locked", "avg_buy_price")
+
+    def __init__(self, currency: str, unit_currency: str, balance: float, locked: float, avg_buy_price: float):
+        self.currency = currency
+        self.unit_currency = unit_currency
+        self.balance = balance
+        self.locked = locked
+        self.avg_buy_price = avg_buy_price
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Account":
+        return cls(
+            payload["currency"], payload.get("unit_currency", "KRW"),
+            _number(payload.get("balance")), _number(payload.get("locked")), _number(payload.get("avg_buy_price")),
+        )
+
+    @property
+    def quantity(self) -> float:
+        """주문에 묶인 수량까지 포함한 보유 수량"""
+        return self.balance + self.locked
+
+
+class Order:
+    """
+    /order, /orders 응답 항목 (집계에 쓰는 필드만, 숫자는 float로 변환)
+
+    price는 주문 유형마다 뜻이 다릅니다: 지정가(limit)는 주문 단가, 시장가 매수(price)는 주문 총액(KRW),
+    시장가 매도(market)는 없음(0). 그래서 체결 금액은 업비트가 준 executed_funds(또는 trades의 funds 합)로 셉니다.
+    """
+
+    __slots__ = ("uuid", "market", "side", "ord_type", "state", "created_at",
+                 "price", "volume", "remaining_volume", "executed_volume", "paid_fee", "executed_funds")
+
+    def __init__(self, uuid: str, market: str, side: str, ord_type: str, state: str, created_at: str | None,
+                 price: float, volume: float, remaining_volume: float, executed_volume: float, paid_fee: float,
+                 executed_funds: float | None = None):
+        self.uuid = uuid
+        self.market = market
+        self.side = side
+        self.ord_type = ord_type
+        self.state = state
+        self.created_at = created_at
+        self.price = price
+        self.volume = volume
+        self.remaining_volume = remaining_volume
+        self.executed_volume = executed_volume
+        self.paid_fee = paid_fee
+        self.executed_funds = executed_funds
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "Order":
+        funds = payload.get("executed_funds")
+        if funds is not None:
+            funds = _number(funds)
+        elif payload.get("trades"):
+            # /order 단건 응답은 체결 목록을 함께 줌
+            funds = sum(_number(trade.get("funds")) for trade in payload["trades"])
+        return cls(
+            payload.get("uuid"), payload.get("market"), payload.get("side"), payload.get("ord_type"),
+            payload.get("state"), payload.get("created_at"),
+            _number(payload.get("price")), _number(payload.get("volume")),
+            _number(payload.get("remaining_volume")), _number(payload.get("executed_volume")),
+            _number(payload.get("paid_fee")), funds,
+        )
+
+    @property
+    def executed_value(self) -> float | None:
+        """
+        체결 금액 (KRW 등 호가 통화)
+
+        executed_funds가 있으면 그 값, 없으면 지정가 주문만 체결 수량 x 주문 단가로 계산합니다.
+        시장가 주문(price, market 등)은 체결가를 알 수 없으므로 None (체결 수량이 0이면 0).
+        """
+        if self.executed_funds is not None:
+            return self.executed_funds
+        if not self.executed_volume:
+            return 0.0
+        if self.ord_type == "limit":
+            return self.executed_volume * self.price
+        return None
@@ -0,0 +1,174 @@
+import numpy as np
+
+
+class OrderBook:
+    """
+    호가 스냅샷의 배열 표현
+
+    매도/매수 호가를 가격·잔량 NumPy 배열로 보관하며 (최우선 호가가 0번),
+    누적 잔량·체결 예상가 등의 계산을 벡터 연산으로 수행합니다.
+    """
+
+    __slots__ = ("market", "timestamp", "ask_prices", "ask_sizes", "bid_prices", "bid_sizes")
+
+    def __init__(self, market: str, timestamp: int | None,
+                 ask_prices: np.ndarray, ask_sizes: np.ndarray,
+                 bid_prices: np.ndarray, bid_sizes: np.ndarray):
+        self.market = market
+        self.timestamp = timestamp
+        self.ask_prices = ask_prices
+        self.ask_sizes = ask_sizes
+        self.bid_prices = bid_prices
+        self.bid_sizes = bid_sizes
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "OrderBook":
+        """
+        REST /orderbook 응답 항목(또는 같은 형태의 웹소켓 메시지)으로 생성
+
+        Args:
+            payload (dict): market, timestamp, orderbook_units 를 가진 호가 데이터
+
+        Returns:
+            OrderBook: 배열 기반 호가
+        """
+        units = payload["orderbook_units"]
+        # 한 번의 순회로 (레벨 수 x 4) 배열을 만든 뒤 열로 나눈다
+        table = np.array(
+            [(u["ask_price"], u["ask_size"], u["bid_price"], u["bid_size"]) for u in units],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        return cls(
+            payload["market"], payload.get("timestamp"),
+            table[:, 0], table[:, 1], table[:, 2], table[:, 3],
+        )
+
+    @property
+    def best_ask(self) -> float | None:
+        return float(self.ask_prices[0]) if self.ask_prices.size else None
+
+    @property
+    def best_bid(self) -> float | None:
+        return float(self.bid_prices[0]) if self.bid_prices.size else None
+
+    @property
+    def mid(self) -> float | None:
+        if not self.ask_prices.size or not self.bid_prices.size:
+            return None
+        return (self.best_ask + self.best_bid) / 2
+
+    def spread(self) -> dict:
+        """최우선 호가 스프레드 (절대값과 bp)"""
+        if self.mid is None:
+            return {"absolute": None, "bps": None}
+        absolute = self.best_ask - self.best_bid
+        return {"absolute": absolute, "bps": absolute / self.mid * 10_000}
+
+    def _side(self, side: str) -> tuple[np.ndarray, np.ndarray]:
+        if side == "ask":
+            return self.ask_prices, self.ask_sizes
+        if side == "bid":
+            return self.bid_prices, self.bid_sizes
+        raise ValueError("side는 'bid' 또는 'ask'여야 합니다.")
+
+    def depth(self, side: str, levels: int | None = None) -> dict:
+        """
+        호가 한쪽의 레벨별 누적 잔량과 누적 금액
+
+        Args:
+            side (str): ask(매도 호가) 또는 bid(매수 호가)
+            levels (int, optional): 사용할 레벨 수 (기본: 전체)
+
+        Returns:
+            dict: prices, cumulative_size, cumulative_notional 목록
+        """
+        prices, sizes = self._side(side)
+        prices, sizes = prices[:levels], sizes[:levels]
+        return {
+            "prices": prices.tolist(),
+            "cumulative_size": np.cumsum(sizes).tolist(),
+            "cumulative_notional": np.cumsum(prices * sizes).tolist(),
+        }
+
+    def imbalance(self, levels: int | None = None) -> float | None:
+        """상위 N개 레벨의 (매수 잔량 - 매도 잔량) / (매수 잔량 + 매도 잔량)"""
+        bid = float(self.bid_sizes[:levels].sum())
+        ask = float(self.ask_sizes[:levels].sum())
+        total = bid + ask
+        return (bid - ask) / total if total > 0 else None
+
+    def estimate_fill(self, side: str, volume: float | None = None, amount: float | None = None,
+                      fee_rate: float = 0.0) -> dict:
+        """
+        시장가 주문의 예상 체결 결과 계산
+
+        매수(bid)는 매도 호가를, 매도(ask)는 매수 호가를 위에서부터 소진한다고 가정합니다.
+
+        Args:
+            side (str): 주문 종류 - bid(매수) 또는 ask(매도)
+            volume (float, optional): 주문 수량
+            amount (float, optional): 주문 총액 (호가 통화 기준, 예: KRW)
+            fee_rate (float): 수수료율 (예: 0.0005)
+
+        Returns:
+            dict: 체결 수량/금액, 평균 체결가(VWAP), 최종 체결가, 슬리피지, 소진 레벨 수 등
+        """
+        if (volume is None) == (amount is None):
+            raise ValueError("volume 또는 amount 중 하나만 지정해야 합니다.")
+        if side not in ("bid", "ask"):
+            raise ValueError("side는 'bid' 또는 'ask'여야 합니다.")
+
+        prices, sizes = self._side("ask" if side == "bid" else "bid")
+        if not prices.size:
+            raise ValueError("호가 데이터가 없습니다.")
+        cum_size = np.cumsum(sizes)
+        cum_notional = np.cumsum(prices * sizes)
+
+        if volume is not None:
+            target, cum = volume, cum_size
+        else:
+            target, cum = amount, cum_notional
+        idx = int(np.searchsorted(cum, target))
+
+        if idx >= prices.size:
+            # 호가창 전체로도 부족한 경우: 보이는 만큼만 체결
+            filled_volume = float(cum_size[-1])
+            filled_notional = float(cum_notional[-1])
+            levels_used = prices.size
+            fully_filled = False
+        else:
+            prev_size = float(cum_size[idx - 1]) if idx > 0 else 0.0
+            prev_notional = float(cum_notional[idx - 1]) if idx > 0 else 0.0
+            price = float(prices[idx])
+            if volume is not None:
+                filled_volume = volume
+                filled_notional = prev_notional + (volume - prev_size) * price
+            else:
+                filled_notional = amount
+                filled_volume = prev_size + (amount - prev_notional) / price
+            levels_used = idx + 1
+            fully_filled = True
+
+        vwap = filled_notional / filled_volume if filled_volume > 0 else None
+        best = float(prices[0])
+        worst = float(prices[levels_used - 1])
+        fee = filled_notional * fee_rate
+        slippage_bps = None
+        if vwap is not None:
+            direction = 1 if side == "bid" else -1
+            slippage_bps = direction * (vwap - best) / best * 10_000
+
+        return {
+            "side": side,
+            "filled_volume": filled_volume,
+            "filled_notional": filled_notional,
+            "fully_filled": fully_filled,
+            "vwap": vwap,
+            "best_price": best,
+            "worst_price": worst,
+            "levels_consumed": levels_used,
+            "slippage_bps": slippage_bps,
+            "fee": fee,
+            "total_cost": filled_notional + fee if side == "bid" else None,
+            "net_proceeds": filled_notional - fee if side == "ask" else None,
+        }
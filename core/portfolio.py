@@ -0,0 +1,164 @@
+import numpy as np
+
+from core.account_state import get_account_state
+from core.coalesce import ticker_coalescer
+from core.market_cache import get_market_cache
+from core.market_stream import get_market_stream
+from core.models import Account
+
+# 평가 기준 통화
+BASE_CURRENCY = "KRW"
+
+# KRW 마켓이 없는 자산은 BTC 마켓 가격에 KRW-BTC 가격을 곱해 평가
+BRIDGE_MARKET = "KRW-BTC"
+
+# 이 금액(KRW)보다 작은 보유분은 목록 대신 dust로 합쳐서 보고 (업비트 최소 주문 금액)
+DEFAULT_MIN_VALUE = 5000.0
+
+
+def pricing_markets(accounts: list[dict], codes: frozenset[str] | set[str]) -> dict[str, str]:
+    """
+    보유 자산별 평가에 쓸 마켓 선택 (KRW 마켓 우선, 없으면 BTC 마켓)
+
+    Args:
+        accounts (list[dict]): /accounts 응답
+        codes (set[str]): 상장된 마켓 코드 집합
+
+    Returns:
+        dict: 통화 -> 마켓 코드 (평가할 마켓이 없는 통화는 빠짐)
+    """
+    markets = {}
+    for item in accounts:
+        currency = item["currency"]
+        if currency == BASE_CURRENCY:
+            continue
+        for quote in (BASE_CURRENCY, "BTC"):
+            if f"{quote}-{currency}" in codes:
+                markets[currency] = f"{quote}-{currency}"
+                break
+    return markets
+
+
+def value_portfolio(accounts: list[dict], tickers: dict[str, dict], markets: dict[str, str],
+                    min_value: float = DEFAULT_MIN_VALUE) -> dict:
+    """
+    보유 자산의 평가금액, 평가손익, 비중, KRW 노출을 한 번에 계산
+
+    Args:
+        accounts (list[dict]): /accounts 응답
+        tickers (dict): 마켓 코드 -> 티커 (pricing_markets의 마켓과 BTC 마켓이 있으면 KRW-BTC 포함)
+        markets (dict): pricing_markets 결과
+        min_value (float): 이 금액 미만 보유분은 dust로 합침
+
+    Returns:
+        dict: 총액/손익 요약, 자산별 holdings(평가금액 순), dust, unpriced, concentration
+    """
+    assets = [Account.from_payload(a) for a in accounts]
+    cash = sum(a.quantity for a in assets if a.currency == BASE_CURRENCY)
+    bridge = float(tickers.get(BRIDGE_MARKET, {}).get("trade_price") or 0)
+
+    coins = [a for a in assets if a.currency != BASE_CURRENCY]
+    priced = [a for a in coins if markets.get(a.currency) in tickers
+              and (markets[a.currency].startswith(f"{BASE_CURRENCY}-") or bridge)]
+    unpriced = [a.currency for a in coins if a not in priced]
+
+    currency = [a.currency for a in priced]
+    market = [markets[c] for c in currency]
+    balance = np.array([a.balance for a in priced])
+    locked = np.array([a.locked for a in priced])
+    avg = np.array([a.avg_buy_price for a in priced])
+    # BTC 마켓 가격은 KRW-BTC 가격으로 환산
+    factor = np.array([1.0 if m.startswith(f"{BASE_CURRENCY}-") else bridge for m in market])
+    price = np.array([float(tickers[m]["trade_price"]) for m in market]) * factor
+    change = np.array([float(tickers[m].get("signed_change_rate") or 0) for m in market])
+
+    quantity = balance + locked
+    value = quantity * price
+    cost = quantity * avg
+    pnl = value - cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pnl_rate = np.where(cost > 0, pnl / cost, np.nan)
+    # 24시간 전 가격 대비 변화 금액 (value - value / (1 + r))
+    day_change = value * change / (1 + change)
+
+    invested = float(value.sum())
+    total = cash + invested
+    weight = value / total if total > 0 else np.zeros_like(value)
+
+    order = np.argsort(-value, kind="stable")
+    holdings, dust_count, dust_value = [], 0, 0.0
+    for i in order:
+        if value[i] < min_value:
+            dust_count += 1
+            dust_value += float(value[i])
+            continue
+        holdings.append({
+            "currency": currency[i],
+            "market": market[i],
+            "quantity": float(quantity[i]),
+            "locked": float(locked[i]),
+            "avg_buy_price": float(avg[i]),
+            "price": float(price[i]),
+            "value": round(float(value[i]), 2),
+            "weight": round(float(weight[i]), 6),
+            "unrealized_pnl": round(float(pnl[i]), 2),
+            "unrealized_pnl_rate": None if np.isnan(pnl_rate[i]) else round(float(pnl_rate[i]), 6),
+            "change_rate_24h": round(float(change[i]), 6),
+        })
+
+    cost_basis = float(cost.sum())
+    sorted_weights = np.sort(weight)[::-1]
+    return {
+        "total_value_krw": round(total, 2),
+        "cash_krw": round(cash, 2),
+        "invested_krw": round(invested, 2),
+        "cost_basis_krw": round(cost_basis, 2),
+        "unrealized_pnl_krw": round(float(pnl.sum()), 2),
+        "unrealized_pnl_rate": round(float(pnl.sum()) / cost_basis, 6) if cost_basis > 0 else None,
+        "day_change_krw": round(float(day_change.sum()), 2),
+        "exposure": {
+            # 현금 외에 KRW 가격 변동에 노출된 비중과 BTC 마켓으로 평가된(BTC 환율 영향) 비중
+            "cash_weight": round(cash / total, 6) if total > 0 else None,
+            "krw_market_weight": round(float(weight[factor == 1.0].sum()), 6),
+            "btc_market_weight": round(float(weight[factor != 1.0].sum()), 6),
+        },
+        "concentration": {
+            "top1_weight": round(float(sorted_weights[:1].sum()), 6),
+            "top3_weight": round(float(sorted_weights[:3].sum()), 6),
+            # 허핀달 지수 (코인 보유분 기준, 1에 가까울수록 한 자산에 집중)
+            "hhi": round(float(((value / invested) ** 2).sum()), 6) if invested > 0 else None,
+        },
+        "holdings": holdings,
+        "dust": {"count": dust_count, "value_krw": round(dust_value, 2)},
+        "unpriced": unpriced,
+    }
+
+
+async def load_valuation(accounts: list[dict] | None = None, min_value: float = DEFAULT_MIN_VALUE) -> dict:
+    """
+    잔고(캐시)와 필요한 티커를 한 번의 묶음 요청으로 받아 포트폴리오 평가
+
+    웹소켓으로 구독 중인 마켓은 로컬 시세를 쓰고, 나머지는 /ticker 한 번으로 함께 조회합니다.
+
+    Args:
+        accounts (list[dict], optional): 평가할 잔고 (없으면 계정에서 조회)
+        min_value (float): 이 금액 미만 보유분은 dust로 합침
+
+    Returns:
+        dict: value_portfolio 결과
+    """
+    if accounts is None:
+        accounts = await get_account_state().accounts()
+    markets = pricing_markets(accounts, await get_market_cache().codes())
+    needed = sorted(set(markets.values()) | ({BRIDGE_MARKET} if any(
+        m.startswith("BTC-") for m in markets.values()) else set()))
+
+    stream = get_market_stream()
+    tickers = {m: stream.ticker(m) for m in needed}
+    missing = [m for m, ticker in tickers.items() if ticker is None]
+    for market, result in zip(missing, await ticker_coalescer.get_many(missing)):
+        if isinstance(result, BaseException):
+            del tickers[market]
+        else:
+            tickers[market] = result
+    return value_portfolio(accounts, tickers, markets, min_value)
@@ -0,0 +1,234 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import uuid
+from functools import lru_cache
+from typing import Any, Awaitable
+from urllib.parse import unquote, urlencode
+
+import httpx
+from fastmcp import Context
+
+from config import (
+    API_BASE,
+    PRIVATE_MAX_RETRIES,
+    PRIVATE_RETRY_BACKOFF,
+    UPBIT_ACCESS_KEY,
+    UPBIT_SECRET_KEY,
+)
+from core.decode import decode
+from core.http import UpbitAPIError, get_client
+
+# 재시도해도 되는 일시적 오류 (429는 private_request가 메서드와 관계없이 새로 서명해 재시도)
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# 키가 없을 때 도구가 돌려주는 안내 문구
+MISSING_KEY_MESSAGE = "API 키가 설정되지 않았습니다. .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요."
+
+
+class MissingCredentialsError(Exception):
+    """업비트 API 키가 설정되지 않은 상태에서 비공개 API를 호출한 경우"""
+
+    def __init__(self):
+        super().__init__("API 키가 설정되지 않았습니다.")
+
+
+def encode_params(params: dict | None) -> str:
+    """
+    쿼리 파라미터를 한 번만 인코딩 (같은 문자열을 요청과 query_hash에 함께 사용)
+
+    값이 None인 항목은 빼고, 리스트 값은 states[]=wait&states[]=done 처럼 키를 반복합니다.
+    키에 []가 없어도 리스트면 []를 붙입니다.
+
+    Args:
+        params (dict, optional): 쿼리 파라미터
+
+    Returns:
+        str: URL 인코딩된 쿼리 문자열
+    """
+    if not params:
+        return ""
+    items = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            key = key if key.endswith("[]") else f"{key}[]"
+            items.extend((key, str(v)) for v in value)
+        else:
+            items.append((key, str(value)))
+    return urlencode(items)
+
+
+@lru_cache(maxsize=1024)
+def query_hash(query: str) -> str:
+    """업비트 query_hash (인코딩 전 형태의 쿼리 문자열 SHA512, 같은 쿼리는 캐시)"""
+    return hashlib.sha512(unquote(query).encode()).hexdigest()
+
+
+def _b64(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+class UpbitSigner:
+    """
+    업비트 JWT(HS256) 서명기
+
+    헤더 부분과 HMAC 키 설정은 한 번만 만들어 두고, 요청마다 nonce와 query_hash만 넣어
+    서명합니다. 결과는 PyJWT의 jwt.encode와 같은 형식입니다.
+    """
+
+    def __init__(self, access_key: str, secret_key: str):
+        self._header = _b64(b'{"alg":"HS256","typ":"JWT"}') + b"."
+        self._access_key = json.dumps(access_key)
+        self._mac = hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+    def token(self, query: str = "") -> str:
+        """
+        요청 하나에 쓸 JWT 토큰 생성 (nonce는 매번 새로 생성)
+
+        Args:
+            query (str): encode_params로 만든 쿼리 문자열 (없으면 빈 문자열)
+
+        Returns:
+            str: Authorization 헤더에 넣을 토큰
+        """
+        payload = f'{{"access_key":{self._access_key},"nonce":"{uuid.uuid4()}"'
+        if query:
+            payload += f',"query_hash":"{query_hash(query)}","query_hash_alg":"SHA512"'
+        signing_input = self._header + _b64((payload + "}").encode())
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64(mac.digest())).decode()
+
+
+_signer: UpbitSigner | None = None
+
+
+def get_signer() -> UpbitSigner:
+    """설정된 API 키로 만든 공유 서명기 반환"""
+    global _signer
+    if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
+        raise MissingCredentialsError()
+    if _signer is None:
+        _signer = UpbitSigner(UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY)
+    return _signer
+
+
+async def private_request(method: str, path: str, params: dict | None = None, retry: bool | None = None) -> Any:
+    """
+    인증이 필요한 업비트 API 호출
+
+    파라미터는 한 번 인코딩해 URL과 query_hash에 같이 쓰고, 시도마다 새 nonce로 서명합니다.
+    조회(GET)는 5xx 응답이나 네트워크 오류 시 지수 백오프로 재시도합니다. 429는 업비트가 처리하지 않은
+    요청이므로 주문/취소도 재시도합니다 (요청 수 제한 계층은 서명한 요청을 다시 보내지 않음).
+
+    Args:
+        method (str): HTTP 메서드
+        path (str): API 경로 (예: /orders)
+        params (dict, optional): 쿼리 파라미터 (리스트 값은 배열 파라미터)
+        retry (bool, optional): 5xx/네트워크 오류 시 재시도 여부 (기본: GET일 때만, 429는 항상 재시도)
+
+    Returns:
+        Any: 응답 JSON
+
+    Raises:
+        MissingCredentialsError: API 키가 없는 경우
+        UpbitAPIError: 업비트 API가 오류 응답을 반환한 경우
+    """
+    signer = get_signer()
+    query = encode_params(params)
+    url = f"{API_BASE}{path}?{query}" if query else f"{API_BASE}{path}"
+    retry = method == "GET" if retry is None else retry
+    attempts = 1 + PRIVATE_MAX_RETRIES
+    client = get_client()
+    for attempt in range(attempts):
+        if attempt:
+            await asyncio.sleep(PRIVATE_RETRY_BACKOFF * 2 ** (attempt - 1))
+        headers = {"Authorization": f"Bearer {signer.token(query)}"}
+        last = attempt + 1 == attempts
+        try:
+            res = await client.request(method, url, headers=headers)
+        except httpx.TransportError:
+            if retry and not last:
+                continue
+            raise
+        if not last and (res.status_code == 429 or (retry and res.status_code in RETRY_STATUS_CODES)):
+            continue
+        if res.status_code >= 400:
+            raise UpbitAPIError(res.status_code, res.text)
+        return decode(res)
+
+
+def new_identifier() -> str:
+    """주문 생성용 클라이언트 identifier (재시도해도 같은 주문으로 인식되도록 요청 전에 정함)"""
+    return f"mcp-{uuid.uuid4().hex}"
+
+
+async def place_order(params: dict) -> dict:
+    """
+    주문 생성 (identifier를 붙여 재시도해도 주문이 두 번 들어가지 않게 함)
+
+    identifier가 없으면 새로 만들어 붙이고, 5xx/네트워크 오류 시 같은 identifier로 재시도합니다.
+    앞선 시도가 실제로는 접수되어 identifier 중복 오류가 나면 그 주문을 조회해 반환합니다.
+
+    Args:
+        params (dict): 주문 파라미터 (market, side, ord_type, volume, price, identifier 등)
+
+    Returns:
+        dict: 생성된(또는 이미 접수된) 주문
+
+    Raises:
+        UpbitAPIError: 주문이 거부된 경우
+    """
+    params = {**params, "identifier": params.get("identifier") or new_identifier()}
+    attempts = 1 + PRIVATE_MAX_RETRIES
+    for attempt in range(attempts):
+        if attempt:
+            await asyncio.sleep(PRIVATE_RETRY_BACKOFF * 2 ** (attempt - 1))
+        try:
+            return await private_request("POST", "/orders", params, retry=False)
+        except httpx.TransportError:
+            if attempt + 1 < attempts:
+                continue
+            raise
+        except UpbitAPIError as e:
+            if e.status_code in RETRY_STATUS_CODES and attempt + 1 < attempts:
+                continue
+            if attempt and e.status_code == 400 and "identifier" in e.message:
+                # 응답을 받지 못한 앞선 시도가 실제로는 접수된 경우
+                return await private_request("GET", "/order", {"identifier": params["identifier"]})
+            raise
+
+
+async def private_tool_call(request: Awaitable, ctx: Context = None, message: str | None = None,
+                            as_list: bool = False) -> Any:
+    """
+    도구용 비공개 API 호출 래퍼 (진행/오류 로그와 오류 응답 형식을 통일)
+
+    Args:
+        request (Awaitable): private_request 또는 place_order 호출
+        ctx (Context, optional): 로그를 남길 MCP 컨텍스트
+        message (str, optional): 호출 전에 남길 진행 로그
+        as_list (bool): 목록을 반환하는 도구인지 여부 (오류도 [{"error": ...}] 형태로 반환)
+
+    Returns:
+        Any: 응답 JSON 또는 {"error": ...}
+    """
+    def failed(log: str, error: str):
+        if ctx:
+            ctx.error(log)
+        return [{"error": error}] if as_list else {"error": error}
+
+    if ctx and message and UPBIT_ACCESS_KEY:
+        ctx.info(message)
+    try:
+        return await request
+    except MissingCredentialsError as e:
+        return failed(MISSING_KEY_MESSAGE, str(e))
+    except UpbitAPIError as e:
+        return failed(f"업비트 API 오류: {e.status_code} - {e.message}", f"업비트 API 오류: {e.status_code}")
+    except Exception as e:
+        return failed(f"API 호출 중 오류 발생: {str(e)}", f"API 호출 중 오류 발생: {str(e)}")
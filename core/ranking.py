@@ -0,0 +1,66 @@
+import heapq
+from typing import Callable, Iterable
+
+
+def _volatility(ticker: dict) -> float:
+    base = ticker.get("prev_closing_price") or ticker.get("opening_price")
+    if not base:
+        return 0.0
+    return (ticker["high_price"] - ticker["low_price"]) / base
+
+
+# 랭킹 이름: (정렬 키 함수, 큰 값이 상위인지 여부)
+RANKINGS: dict[str, tuple[Callable[[dict], float], bool]] = {
+    "volume": (lambda t: t["acc_trade_price_24h"], True),
+    "gainers": (lambda t: t["signed_change_rate"], True),
+    "losers": (lambda t: t["signed_change_rate"], False),
+    "volatility": (_volatility, True),
+}
+
+
+def rank_tickers(
+    tickers: Iterable[dict],
+    rankings: Iterable[str],
+    k: int = 5,
+    exclude: dict[str, set[str]] | None = None,
+) -> dict[str, list[dict]]:
+    """
+    티커 목록을 한 번만 순회하면서 여러 랭킹의 상위 k개를 동시에 선택
+
+    전체 정렬 대신 크기 k의 힙을 랭킹마다 유지하므로 O(n log k)입니다.
+
+    Args:
+        tickers (Iterable[dict]): 티커 목록
+        rankings (Iterable[str]): 계산할 랭킹 이름 (RANKINGS의 키)
+        k (int): 랭킹별 반환 개수
+        exclude (dict, optional): 랭킹별로 제외할 마켓 코드 집합
+
+    Returns:
+        dict: 랭킹 이름 -> 상위 k개 티커 (순위순)
+    """
+    rankings = list(rankings)
+    unknown = [name for name in rankings if name not in RANKINGS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 랭킹입니다: {', '.join(unknown)}")
+
+    exclude = exclude or {}
+    heaps: dict[str, list] = {name: [] for name in rankings}
+    specs = [(name, *RANKINGS[name], exclude.get(name, ())) for name in rankings]
+
+    for i, ticker in enumerate(tickers):
+        for name, key, descending, excluded in specs:
+            if ticker["market"] in excluded:
+                continue
+            value = key(ticker)
+            # 힙에는 '작을수록 먼저 버려지는' 값이 들어가도록 부호를 맞춘다
+            item = (value if descending else -value, -i, ticker)
+            heap = heaps[name]
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+
+    return {
+        name: [ticker for _, _, ticker in sorted(heap, key=lambda x: x[:2], reverse=True)]
+        for name, heap in heaps.items()
+    }
@@ -0,0 +1,266 @@
+import asyncio
+import time
+import httpx
+from urllib.parse import urlparse
+from config import API_BASE, RATE_LIMIT_MAX_RETRIES
+
+# 업비트 요청 그룹별 초당 요청 수 (Remaining-Req 헤더는 남은 토큰만 줄이고 이 한도를 올리지 않음)
+#   market     GET /market/all
+#   candles    GET /candles/*
+#   ticker     GET /ticker, /ticker/all
+#   orderbook  GET /orderbook
+#   trades     GET /trades/ticks
+#   order      POST /orders (주문 생성)
+#   default    그 밖의 거래(Exchange) API: 주문 취소(DELETE /order), 주문/계좌/입출금 조회 등
+DEFAULT_QUOTAS = {
+    "market": 10,
+    "candles": 10,
+    "ticker": 10,
+    "orderbook": 10,
+    "trades": 10,
+    "order": 8,
+    "default": 30,
+}
+
+# 429 응답 시 그룹 전체를 쉬게 하는 시간 (초)
+BACKOFF_SECONDS = 1.0
+
+# 업비트가 요청 수를 세는 구간 길이 (초)
+WINDOW_SECONDS = 1.0
+
+_API_PATH = urlparse(API_BASE).path.rstrip("/")
+
+
+def parse_remaining_req(value: str) -> dict:
+    """
+    Remaining-Req 헤더 파싱
+
+    Args:
+        value (str): 헤더 값 (예: "group=market; min=573; sec=9")
+
+    Returns:
+        dict: {"group": str, "min": int | None, "sec": int | None}
+    """
+    result = {"group": None, "min": None, "sec": None}
+    for part in value.split(";"):
+        if "=" not in part:
+            continue
+        key, val = part.strip().split("=", 1)
+        if key == "group":
+            result["group"] = val
+        elif key in ("min", "sec"):
+            try:
+                result[key] = int(val)
+            except ValueError:
+                pass
+    return result
+
+
+def quota_group(method: str, path: str) -> str:
+    """
+    요청 경로에 해당하는 업비트 요청 수 제한 그룹 반환
+
+    Args:
+        method (str): HTTP 메서드
+        path (str): 요청 경로 (API_BASE 경로 포함 가능)
+
+    Returns:
+        str: 요청 그룹 이름
+    """
+    path = path.removeprefix(_API_PATH)
+    if path.startswith("/market/"):
+        return "market"
+    if path.startswith("/candles/"):
+        return "candles"
+    if path.startswith("/ticker"):
+        return "ticker"
+    if path.startswith("/orderbook"):
+        return "orderbook"
+    if path.startswith("/trades/"):
+        return "trades"
+    if path == "/orders" and method == "POST":
+        return "order"
+    return "default"
+
+
+class TokenBucket:
+    """
+    요청 그룹 하나에 대한 토큰 버킷
+
+    대기 중인 호출자는 asyncio.Lock의 FIFO 순서로 공정하게 처리됩니다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        토큰을 하나 얻을 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def calibrate(self, remaining_sec: int) -> None:
+        """
+        서버가 알려준 남은 요청 수(sec)로 버킷 상태를 보정
+
+        Args:
+            remaining_sec (int): 현재 1초 구간에서 남은 요청 수
+        """
+        now = time.monotonic()
+        self._refill(now)
+        # 서버가 더 많이 남았다고 해도 설정한 한도(capacity/rate)는 올리지 않고, 남은 토큰만 줄인다
+        self._tokens = min(self._tokens, remaining_sec)
+        # 서버 구간이 가득 찼으면 구간이 비워질 때까지 기다린다
+        if remaining_sec == 0:
+            self.block(WINDOW_SECONDS)
+
+    def block(self, seconds: float) -> None:
+        """일정 시간 동안 토큰 발급을 중단 (중단이 끝난 뒤에도 빈 버킷에서 다시 채우므로 몰아서 보내지 않음)"""
+        self._tokens = 0
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._updated = self._blocked_until
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 3),
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class RateLimiter:
+    """업비트 요청 그룹별 토큰 버킷 모음"""
+
+    def __init__(self, quotas: dict | None = None):
+        self._quotas = dict(DEFAULT_QUOTAS if quotas is None else quotas)
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, group: str) -> TokenBucket:
+        if group not in self._buckets:
+            rate = self._quotas.get(group, self._quotas.get("default", 10))
+            self._buckets[group] = TokenBucket(rate)
+        return self._buckets[group]
+
+    async def acquire(self, group: str) -> float:
+        return await self.bucket(group).acquire()
+
+    def update(self, group: str, headers: httpx.Headers) -> None:
+        """
+        응답의 Remaining-Req 헤더로 헤더가 알려준 그룹의 버킷을 보정
+
+        헤더의 group이 요청 그룹과 다르면 (예: 취소 응답의 default) 요청 그룹 대신 그 그룹을 보정하고,
+        알 수 없는 그룹이면 보정하지 않습니다.
+
+        Args:
+            group (str): 요청할 때 사용한 그룹 (헤더에 group이 없을 때 사용)
+            headers (httpx.Headers): 응답 헤더
+        """
+        value = headers.get("Remaining-Req")
+        if not value:
+            return
+        remaining = parse_remaining_req(value)
+        reported = remaining["group"] or group
+        if remaining["sec"] is not None and reported in self._quotas:
+            self.bucket(reported).calibrate(remaining["sec"])
+
+    def throttle(self, group: str, seconds: float = BACKOFF_SECONDS) -> None:
+        """429 응답을 받은 그룹의 토큰 발급을 잠시 중단"""
+        bucket = self.bucket(group)
+        bucket.throttled += 1
+        bucket.block(seconds)
+
+    def stats(self) -> dict:
+        return {group: bucket.stats() for group, bucket in self._buckets.items()}
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    요청 수 제한을 적용하는 httpx 전송 계층
+
+    요청 전에 그룹 토큰을 얻고, 응답 헤더로 버킷을 보정하며,
+    서명이 없는 요청(시세 조회)의 429 응답은 호출자에게 돌려주지 않고 백오프 후 재시도합니다.
+    서명한 요청은 같은 nonce를 다시 보낼 수 없으므로 그룹만 쉬게 하고 429를 돌려줍니다
+    (core.private_api.private_request가 새로 서명해 재시도).
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter,
+                 max_retries: int = RATE_LIMIT_MAX_RETRIES):
+        self._transport = transport
+        self._limiter = limiter
+        self._max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        group = quota_group(request.method, request.url.path)
+        max_retries = 0 if "Authorization" in request.headers else self._max_retries
+        attempt = 0
+        while True:
+            await self._limiter.acquire(group)
+            response = await self._transport.handle_async_request(request)
+            self._limiter.update(group, response.headers)
+            if response.status_code != 429:
+                return response
+            attempt += 1
+            self._limiter.throttle(group, BACKOFF_SECONDS * attempt)
+            if attempt > max_retries:
+                return response
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """서버 전체에서 공유하는 요청 수 제한기 반환"""
+    global _limiter
+    if _limiter is None:
+        _limiter = RateLimiter()
+    return _limiter
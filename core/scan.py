@@ -0,0 +1,151 @@
+import numpy as np
+from typing import Callable, Iterable
+from core.executor import analytics_task
+from core.indicators import compute_all
+
+# 스캔 행렬에 쌓는 캔들 열
+SCAN_FIELDS = ("high_price", "low_price", "trade_price", "candle_acc_trade_volume")
+
+
+def _crossed(diff: np.ndarray, within: int, upward: bool) -> np.ndarray:
+    """diff(예: MACD 히스토그램)의 부호가 최근 within개 캔들 안에서 바뀌었는지 (행별)"""
+    window = diff[:, -(within + 1):]
+    before, after = window[:, :-1], window[:, 1:]
+    crossed = (before <= 0) & (after > 0) if upward else (before >= 0) & (after < 0)
+    return crossed.any(axis=1)
+
+
+def _last(values: np.ndarray) -> np.ndarray:
+    return values[:, -1]
+
+
+# 신호 이름: (지표/캔들 행렬, 교차 확인 구간) -> 마켓별 bool 배열
+SIGNALS: dict[str, Callable[[dict, int], np.ndarray]] = {
+    "rsi_oversold": lambda s, n: _last(s["rsi"]) < 30,
+    "rsi_overbought": lambda s, n: _last(s["rsi"]) > 70,
+    "macd_cross_up": lambda s, n: _crossed(s["macd_hist"], n, True),
+    "macd_cross_down": lambda s, n: _crossed(s["macd_hist"], n, False),
+    "macd_above_signal": lambda s, n: _last(s["macd_hist"]) > 0,
+    "bb_lower_break": lambda s, n: _last(s["trade_price"]) < _last(s["bb_lower"]),
+    "bb_upper_break": lambda s, n: _last(s["trade_price"]) > _last(s["bb_upper"]),
+    "ma_golden_cross": lambda s, n: _crossed(s["sma5"] - s["sma20"], n, True),
+    "ma_dead_cross": lambda s, n: _crossed(s["sma5"] - s["sma20"], n, False),
+    "ma_uptrend": lambda s, n: _last(s["sma5"]) > _last(s["sma20"]),
+    "stoch_oversold": lambda s, n: (_last(s["stoch_k"]) < 20) & (_last(s["stoch_d"]) < 20),
+    "stoch_overbought": lambda s, n: (_last(s["stoch_k"]) > 80) & (_last(s["stoch_d"]) > 80),
+    "volume_spike": lambda s, n: _last(s["candle_acc_trade_volume"])
+    > 2 * s["candle_acc_trade_volume"].mean(axis=1),
+}
+
+# 정렬 기준: (마켓별 값 함수, 큰 값이 상위인지 여부)
+SORT_KEYS: dict[str, tuple[Callable[[dict], np.ndarray], bool]] = {
+    "rsi": (lambda s: _last(s["rsi"]), False),
+    "macd_hist": (lambda s: _last(s["macd_hist"]) / _last(s["trade_price"]), True),
+    "change": (lambda s: s["trade_price"][:, -1] / s["trade_price"][:, -2] - 1, True),
+    "volume_ratio": (lambda s: _last(s["candle_acc_trade_volume"])
+                     / s["candle_acc_trade_volume"].mean(axis=1), True),
+    "bb_position": (lambda s: (_last(s["trade_price"]) - _last(s["bb_lower"]))
+                    / (_last(s["bb_upper"]) - _last(s["bb_lower"])), False),
+}
+
+
+def stack_columns(columns: list[dict[str, np.ndarray]], length: int) -> dict[str, np.ndarray]:
+    """
+    마켓별 시간순 캔들 열을 (마켓 x 시간) 행렬로 쌓음 (각 행의 최근 length개 사용)
+
+    Args:
+        columns (list[dict]): 마켓별 캔들 열 (load_columns 결과, 모두 length개 이상)
+        length (int): 행렬의 시간 축 길이
+
+    Returns:
+        dict: 필드 이름 -> (마켓 수, length) 배열
+    """
+    return {
+        field: np.stack([np.asarray(c[field][-length:], dtype=np.float64) for c in columns])
+        .reshape(len(columns), length)
+        for field in SCAN_FIELDS
+    }
+
+
+def scan(
+    matrix: dict[str, np.ndarray],
+    signals: Iterable[str],
+    match: str = "all",
+    cross_within: int = 3,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], np.ndarray]:
+    """
+    (마켓 x 시간) 행렬 전체에 대해 지표와 신호를 한 번에 계산
+
+    Args:
+        matrix (dict): stack_columns 결과
+        signals (Iterable[str]): 확인할 신호 이름 (SIGNALS의 키)
+        match (str): all(모든 신호 충족) 또는 any(하나 이상 충족)
+        cross_within (int): 교차 신호를 인정하는 최근 캔들 수
+
+    Returns:
+        tuple: (지표+캔들 행렬, 신호별 마켓 bool 배열, 최종 선택 마스크)
+    """
+    signals = list(signals)
+    unknown = [name for name in signals if name not in SIGNALS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 신호입니다: {', '.join(unknown)}")
+    if match not in ("all", "any"):
+        raise ValueError("match는 'all' 또는 'any'여야 합니다.")
+
+    series = compute_all(
+        matrix["high_price"], matrix["low_price"], matrix["trade_price"], matrix["candle_acc_trade_volume"]
+    )
+    series.update(matrix)
+    rows = matrix["trade_price"].shape[0]
+    cross_within = max(1, min(cross_within, matrix["trade_price"].shape[1] - 1))
+
+    hits = {name: SIGNALS[name](series, cross_within) for name in signals}
+    if not hits:
+        selected = np.ones(rows, dtype=bool)
+    elif match == "all":
+        selected = np.logical_and.reduce(list(hits.values()))
+    else:
+        selected = np.logical_or.reduce(list(hits.values()))
+    return series, hits, selected
+
+
+def rank(series: dict[str, np.ndarray], selected: np.ndarray, sort_by: str, limit: int) -> np.ndarray:
+    """
+    선택된 마켓의 행 번호를 정렬 기준 순서로 최대 limit개 반환 (값이 없는 마켓은 뒤로)
+    """
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+    key, descending = SORT_KEYS[sort_by]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = key(series)
+    rows = np.flatnonzero(selected)
+    values = values[rows]
+    order = np.argsort(-values if descending else values, kind="stable")
+    return rows[order][:limit]
+
+
+# scan_task가 선택된 마켓마다 돌려주는 마지막 시점 값
+RESULT_FIELDS = (
+    "trade_price", "rsi", "macd", "macd_signal", "macd_hist",
+    "bb_upper", "bb_lower", "stoch_k", "stoch_d", "atr",
+)
+
+
+@analytics_task
+def scan_task(matrix: dict[str, np.ndarray], signals: list[str], match: str, cross_within: int,
+              sort_by: str, limit: int) -> dict:
+    """
+    scan + rank 를 한 번에 실행하고 선택된 마켓의 값만 돌려주는 분석 작업 (프로세스 풀용)
+
+    Returns:
+        dict: rows(정렬된 행 번호), matched(조건 충족 마켓 수),
+            values(필드 -> 행별 마지막 값), signals(행별 충족 신호 이름)
+    """
+    series, hits, selected = scan(matrix, signals, match, cross_within)
+    rows = rank(series, selected, sort_by, limit)
+    return {
+        "rows": rows.tolist(),
+        "matched": int(selected.sum()),
+        "values": {field: series[field][rows, -1].tolist() for field in RESULT_FIELDS},
+        "signals": [[name for name, hit in hits.items() if hit[row]] for row in rows],
+    }
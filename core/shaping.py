@@ -0,0 +1,76 @@
+from typing import Literal
+
+# records: 행마다 dict (업비트 응답 그대로), columnar: 필드 이름 -> 값 목록
+ResponseFormat = Literal["records", "columnar"]
+
+
+def _check_fields(rows: list[dict], fields: list[str]) -> None:
+    unknown = [field for field in fields if not any(field in row for row in rows)]
+    if rows and unknown:
+        raise ValueError(f"응답에 없는 필드입니다: {', '.join(unknown)}")
+
+
+def project(row: dict, fields: list[str] | None) -> dict:
+    """
+    dict 하나에서 요청한 필드만 남김 (오류 응답의 error 필드는 항상 유지)
+
+    Args:
+        row (dict): 업비트 응답 항목
+        fields (list[str], optional): 남길 필드 (없으면 그대로 반환)
+
+    Returns:
+        dict: fields 순서대로 필드를 담은 dict
+    """
+    if fields is None:
+        return row
+    if "error" in row:
+        return {**{field: row[field] for field in fields if field in row}, "error": row["error"]}
+    _check_fields([row], fields)
+    return {field: row[field] for field in fields}
+
+
+def to_columns(rows: list[dict], fields: list[str] | None = None) -> dict[str, list]:
+    """
+    dict 목록을 열 기반(필드 이름 -> 값 목록)으로 변환
+
+    키를 한 번만 쓰므로 행마다 필드 이름이 반복되지 않고, 숫자는 숫자 그대로 유지합니다.
+    어떤 행에 없는 필드는 None으로 채웁니다.
+
+    Args:
+        rows (list[dict]): 업비트 응답 목록
+        fields (list[str], optional): 포함할 필드 (없으면 모든 행의 필드를 처음 나온 순서대로)
+
+    Returns:
+        dict: 필드 이름 -> 값 목록 (행 순서 유지)
+    """
+    if fields is None:
+        names = list(dict.fromkeys(key for row in rows for key in row))
+    else:
+        names = list(fields) + (["error"] if any("error" in row for row in rows) else [])
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def shape(rows: list[dict], fields: list[str] | None = None,
+          format: ResponseFormat = "records") -> list[dict] | dict[str, list]:
+    """
+    목록 응답에 필드 선택과 출력 형식을 적용
+
+    Args:
+        rows (list[dict]): 업비트 응답 목록
+        fields (list[str], optional): 남길 필드 (없으면 모두)
+        format (str): records(행마다 dict) 또는 columnar(필드 이름 -> 값 목록)
+
+    Returns:
+        list[dict] | dict: records면 dict 목록, columnar면 열 기반 dict
+
+    Raises:
+        ValueError: 어떤 행에도 없는 필드를 요청한 경우
+    """
+    if fields is not None:
+        _check_fields([row for row in rows if "error" not in row], fields)
+    if format == "columnar":
+        return to_columns(rows, fields)
+    if fields is None:
+        return rows
+    return [project(row, fields) if "error" in row else {field: row.get(field) for field in fields}
+            for row in rows]
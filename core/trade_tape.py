@@ -0,0 +1,377 @@
+import asyncio
+from datetime import datetime, timezone
+
+import numpy as np
+
+from config import API_BASE, TRADE_TAPE_SIZE, TRADE_TAPE_MAX_PAGES
+from core.decode import decode
+from core.http import get_client, UpbitAPIError
+from core.market_stream import get_market_stream
+
+# /trades/ticks 한 번에 받을 수 있는 최대 체결 수
+PAGE_SIZE = 500
+
+# 흐름을 집계할 구간 (초)
+WINDOWS = (60, 300, 900)
+
+# 가장 긴 구간에서 보여줄 큰 체결 수
+LARGEST_TRADES = 5
+
+TICK_DTYPE = np.dtype([
+    ("sequential_id", np.int64),
+    ("timestamp", np.int64),
+    ("price", np.float64),
+    ("volume", np.float64),
+    # 1: 매수 체결(BID), -1: 매도 체결(ASK)
+    ("side", np.int8),
+])
+
+
+def to_ticks(trades: list[dict]) -> np.ndarray:
+    """REST/웹소켓(REST 형태로 변환된) 체결 목록을 TICK_DTYPE 배열로 변환"""
+    return np.array(
+        [(t["sequential_id"], t["timestamp"], t["trade_price"], t["trade_volume"], 1 if t["ask_bid"] == "BID" else -1)
+         for t in trades],
+        dtype=TICK_DTYPE,
+    )
+
+
+def _time(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _sums(ticks: np.ndarray) -> tuple[int, float, float, float]:
+    """체결 수, 체결량, 체결 금액, 매수 체결량"""
+    if len(ticks) == 1:
+        # 웹소켓 체결은 하나씩 들어오므로 배열 연산 대신 스칼라로 계산
+        tick = ticks[0]
+        volume = float(tick["volume"])
+        return 1, volume, float(tick["price"]) * volume, volume if tick["side"] > 0 else 0.0
+    volume = ticks["volume"]
+    return (len(ticks), float(volume.sum()), float((ticks["price"] * volume).sum()),
+            float(volume[ticks["side"] > 0].sum()))
+
+
+class RollingFlow:
+    """최근 window초 체결의 합계 (체결이 들어오고 구간을 벗어날 때 더하고 빼는 증분 방식)"""
+
+    __slots__ = ("window_ms", "start", "count", "volume", "value", "buy_volume")
+
+    def __init__(self, seconds: int):
+        self.window_ms = seconds * 1000
+        # 구간에 포함된 가장 오래된 체결의 (테이프 전체 기준) 순번
+        self.start = 0
+        self.reset(np.empty(0, TICK_DTYPE))
+
+    def reset(self, ticks: np.ndarray) -> None:
+        self.count = 0
+        self.volume = self.value = self.buy_volume = 0.0
+        self.add(_sums(ticks))
+
+    def add(self, sums: tuple[int, float, float, float], sign: int = 1) -> None:
+        count, volume, value, buy_volume = sums
+        self.count += sign * count
+        self.volume += sign * volume
+        self.value += sign * value
+        self.buy_volume += sign * buy_volume
+
+    def remove(self, ticks: np.ndarray) -> None:
+        self.add(_sums(ticks), -1)
+
+
+class TradeTape:
+    """
+    마켓 하나의 최근 체결을 담는 고정 크기 링 버퍼
+
+    체결은 시각 순으로 추가하고 이미 받은 sequential_id는 건너뛰므로, 겹치는 REST 페이지와
+    웹소켓 체결을 섞어 넣어도 한 번씩만 집계됩니다. 구간별 합계(RollingFlow)는 체결이 추가되거나
+    구간을 벗어날 때만 갱신하고, 테이프 크기만큼 추가될 때마다 버퍼에서 다시 계산해 누적 오차를 없앱니다.
+    """
+
+    def __init__(self, market: str, capacity: int = TRADE_TAPE_SIZE, windows: tuple[int, ...] = WINDOWS):
+        self.market = market
+        self.capacity = capacity
+        self.ticks = np.zeros(capacity, TICK_DTYPE)
+        self._timestamps = self.ticks["timestamp"]
+        # 지금까지 추가한 체결 수 (링 버퍼 위치는 total % capacity)
+        self.total = 0
+        self.last_timestamp = 0
+        self.duplicates = 0
+        self.flows = {seconds: RollingFlow(seconds) for seconds in windows}
+        self._ids: set[int] = set()
+        self._since_resync = 0
+
+        self.lock = asyncio.Lock()
+        # REST로 채우는 동안 들어온 웹소켓 체결 (채운 뒤 함께 추가)
+        self.loading = False
+        self.pending: list[dict] = []
+        # 마지막으로 REST로 맞춘 시점의 웹소켓 재연결 횟수 (웹소켓으로 이어 받는 중이 아니면 None)
+        self.synced_epoch: int | None = None
+
+    @property
+    def size(self) -> int:
+        return min(self.total, self.capacity)
+
+    @property
+    def oldest(self) -> int:
+        return self.total - self.size
+
+    def _range(self, start: int, end: int) -> np.ndarray:
+        """테이프 전체 기준 순번 [start, end) 체결 (복사본)"""
+        return self.ticks[np.arange(start, end) % self.capacity]
+
+    def clear(self) -> None:
+        self.total = 0
+        self.last_timestamp = 0
+        self._ids.clear()
+        self._since_resync = 0
+        for flow in self.flows.values():
+            flow.start = 0
+            flow.reset(np.empty(0, TICK_DTYPE))
+
+    def append(self, ticks: np.ndarray) -> int:
+        """
+        체결 추가 (시각 순으로 정렬, 이미 받은 sequential_id는 건너뜀)
+
+        Args:
+            ticks (np.ndarray): TICK_DTYPE 배열 (순서 무관)
+
+        Returns:
+            int: 새로 추가한 체결 수
+        """
+        if len(ticks) > 1:
+            ticks = ticks[np.lexsort((ticks["sequential_id"], ticks["timestamp"]))]
+        keep = []
+        for i, sid in enumerate(ticks["sequential_id"].tolist()):
+            if sid not in self._ids:
+                self._ids.add(sid)
+                keep.append(i)
+        self.duplicates += len(ticks) - len(keep)
+        new = ticks[keep]
+        if len(new) > self.capacity:
+            self._ids.difference_update(new["sequential_id"][:-self.capacity].tolist())
+            new = new[-self.capacity:]
+        if not len(new):
+            return 0
+
+        # 덮어쓸 체결은 구간 합계와 sequential_id 집합에서 먼저 뺀다
+        end = self.total + len(new)
+        overwritten = end - self.capacity
+        if overwritten > self.oldest:
+            self._ids.difference_update(self._range(self.oldest, overwritten)["sequential_id"].tolist())
+            for flow in self.flows.values():
+                if flow.start < overwritten:
+                    flow.remove(self._range(flow.start, overwritten))
+                    flow.start = overwritten
+
+        if len(new) == 1:
+            self.ticks[self.total % self.capacity] = new[0]
+        else:
+            self.ticks[np.arange(self.total, end) % self.capacity] = new
+        self.total = end
+        self.last_timestamp = max(self.last_timestamp, int(new["timestamp"].max()))
+        self._since_resync += len(new)
+        resync = self._since_resync >= self.capacity
+        if resync:
+            self._since_resync = 0
+        sums = _sums(new)
+        for flow in self.flows.values():
+            flow.add(sums)
+            self._evict(flow)
+            if resync:
+                flow.reset(self._range(flow.start, self.total))
+        return len(new)
+
+    def _evict(self, flow: RollingFlow) -> None:
+        """구간을 벗어난 앞쪽 체결을 합계에서 뺌 (조금씩 넓혀 가며 찾아 분할 상환 O(1))"""
+        cutoff = self.last_timestamp - flow.window_ms
+        # 체결이 하나씩 들어올 때는 보통 한두 개만 빠지므로 먼저 하나씩 확인
+        for _ in range(8):
+            if flow.start >= self.total:
+                return
+            i = flow.start % self.capacity
+            if self._timestamps[i] > cutoff:
+                return
+            flow.remove(self.ticks[i:i + 1])
+            flow.start += 1
+        step = 64
+        while flow.start < self.total:
+            segment = self._range(flow.start, min(self.total, flow.start + step))
+            newer = segment["timestamp"] > cutoff
+            k = int(newer.argmax()) if newer.any() else len(segment)
+            flow.remove(segment[:k])
+            flow.start += k
+            if k < len(segment):
+                break
+            step *= 2
+
+    def summary(self) -> dict:
+        """구간별 VWAP, 매수/매도 체결량 불균형, 분당 체결 수와 큰 체결 요약"""
+        if not self.size:
+            return {"market": self.market, "trades": 0, "windows": {}, "largest_trades": []}
+        last = self.ticks[(self.total - 1) % self.capacity]
+        last_price = float(last["price"])
+        coverage = (self.last_timestamp - int(self.ticks[self.oldest % self.capacity]["timestamp"])) / 1000
+
+        windows = {}
+        for seconds, flow in self.flows.items():
+            span = min(seconds, coverage)
+            sell_volume = flow.volume - flow.buy_volume
+            vwap = flow.value / flow.volume if flow.volume > 0 else None
+            windows[f"{seconds}s"] = {
+                "trades": flow.count,
+                # 보관 중인 체결이 구간 전체를 덮는지 여부
+                "complete": coverage >= seconds,
+                "trades_per_min": round(flow.count / span * 60, 2) if span > 0 else None,
+                "volume": round(flow.volume, 8),
+                "value": round(flow.value, 2),
+                "vwap": None if vwap is None else float(f"{vwap:.10g}"),
+                "buy_volume": round(flow.buy_volume, 8),
+                "sell_volume": round(sell_volume, 8),
+                # (매수 - 매도) / 전체 체결량, -1(매도 우위) ~ 1(매수 우위)
+                "imbalance": round((flow.buy_volume - sell_volume) / flow.volume, 6) if flow.volume > 0 else None,
+                # 마지막 체결가가 VWAP보다 얼마나 높은지
+                "price_vs_vwap": round(last_price / vwap - 1, 6) if vwap else None,
+            }
+
+        longest = self.flows[max(self.flows)]
+        segment = self._range(longest.start, self.total)
+        value = segment["price"] * segment["volume"]
+        largest = [
+            {
+                "time": _time(int(segment["timestamp"][i])),
+                "price": float(segment["price"][i]),
+                "volume": float(segment["volume"][i]),
+                "value": round(float(value[i]), 2),
+                "side": "BID" if segment["side"][i] > 0 else "ASK",
+            }
+            for i in np.argsort(-value, kind="stable")[:LARGEST_TRADES]
+        ]
+        return {
+            "market": self.market,
+            "last_price": last_price,
+            "last_time": _time(self.last_timestamp),
+            "trades": self.size,
+            "coverage_seconds": round(coverage, 3),
+            "windows": windows,
+            "largest_trades": largest,
+        }
+
+
+async def fetch_page(market: str, count: int = PAGE_SIZE, cursor: int | None = None) -> list[dict]:
+    """체결 한 페이지 조회 (최신순, cursor를 주면 그 sequential_id 이전 체결부터)"""
+    params = {"market": market, "count": str(count)}
+    if cursor is not None:
+        params["cursor"] = str(cursor)
+    client = get_client()
+    res = await client.get(f"{API_BASE}/trades/ticks", params=params)
+    if res.status_code != 200:
+        raise UpbitAPIError(res.status_code, res.text)
+    return decode(res)
+
+
+class TradeTapeRegistry:
+    """
+    마켓별 체결 테이프 모음
+
+    웹소켓으로 체결을 구독 중인 마켓은 수신한 체결을 바로 테이프에 넣고, 그 밖의 마켓(또는 재연결로
+    빠진 구간이 있을 수 있는 경우)은 호출할 때 REST로 새 체결만 커서로 이어 받아 따라잡습니다.
+    """
+
+    def __init__(self, capacity: int = TRADE_TAPE_SIZE):
+        self.capacity = capacity
+        self._tapes: dict[str, TradeTape] = {}
+        self.rest_syncs = 0
+        self.pages = 0
+        self.stream_trades = 0
+        get_market_stream().trade_listeners.append(self._on_trade)
+
+    def get(self, market: str) -> TradeTape:
+        if market not in self._tapes:
+            self._tapes[market] = TradeTape(market, self.capacity)
+        return self._tapes[market]
+
+    def remove(self, market: str) -> bool:
+        return self._tapes.pop(market, None) is not None
+
+    def _on_trade(self, code: str, trade: dict) -> None:
+        tape = self._tapes.get(code)
+        if tape is None:
+            return
+        if tape.loading:
+            tape.pending.append(trade)
+        elif tape.total:
+            # 비어 있는 테이프는 REST로 먼저 채워야 시각 순서가 맞는다
+            self.stream_trades += tape.append(to_ticks([trade]))
+
+    async def refresh(self, market: str) -> TradeTape:
+        """
+        테이프를 최신 체결까지 갱신
+
+        Args:
+            market (str): 마켓 코드
+
+        Returns:
+            TradeTape: 갱신한 테이프
+        """
+        tape = self.get(market)
+        stream = get_market_stream()
+        async with tape.lock:
+            live = stream.streaming(market, "trade")
+            if live and tape.total and tape.synced_epoch == stream.reconnects:
+                # 마지막으로 맞춘 뒤 끊김 없이 웹소켓으로 받고 있음
+                return tape
+            await self._sync(tape)
+            tape.synced_epoch = stream.reconnects if live else None
+        return tape
+
+    async def _sync(self, tape: TradeTape) -> None:
+        """
+        비어 있으면 가장 긴 구간(또는 테이프 크기)만큼 커서로 거슬러 채우고,
+        아니면 이미 가진 체결에 닿을 때까지 새 체결만 받아 추가
+        """
+        tape.loading = True
+        try:
+            rows, cursor, reached = [], None, False
+            for _ in range(TRADE_TAPE_MAX_PAGES):
+                page = await fetch_page(tape.market, PAGE_SIZE, cursor)
+                self.pages += 1
+                rows.extend(page)
+                if len(page) < PAGE_SIZE:
+                    reached = True
+                    break
+                if tape.total:
+                    if any(t["sequential_id"] in tape._ids for t in page):
+                        reached = True
+                        break
+                elif (rows[0]["timestamp"] - page[-1]["timestamp"] >= max(tape.flows) * 1000
+                      or len(rows) >= tape.capacity):
+                    break
+                cursor = page[-1]["sequential_id"]
+        finally:
+            tape.loading = False
+            pending, tape.pending = tape.pending, []
+        if tape.total and not reached:
+            # 따라잡지 못해 중간이 빠졌으면 최근 체결로 다시 채운다
+            tape.clear()
+        tape.append(to_ticks(rows + pending))
+        self.rest_syncs += 1
+
+    def stats(self) -> dict:
+        return {
+            "markets": len(self._tapes),
+            "rest_syncs": self.rest_syncs,
+            "pages": self.pages,
+            "stream_trades": self.stream_trades,
+        }
+
+
+_registry: TradeTapeRegistry | None = None
+
+
+def get_trade_tapes() -> TradeTapeRegistry:
+    """서버 전체에서 공유하는 체결 테이프 모음 반환"""
+    global _registry
+    if _registry is None:
+        _registry = TradeTapeRegistry()
+    return _registry
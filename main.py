@@ -1,18 +1,17 @@
 # main.py
+import asyncio
+import sys
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
-from config import UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY, API_BASE
-import httpx
-
-from tools.get_ticker import get_ticker
-from tools.get_orderbook import get_orderbook
-from tools.get_trades import get_trades
-from tools.get_accounts import get_accounts
-from tools.create_order import create_order
-from tools.get_orders import get_orders
-from tools.get_order import get_order
-from tools.cancel_order import cancel_order
-from tools.get_market_summary import get_market_summary
-from tools.get_deposits_withdrawals import get_deposits_withdrawals
+from config import UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY, API_BASE, WS_SUBSCRIBE, PRIVATE_WS_ENABLED, METRICS_ENABLED
+from core.http import http_lifespan
+from core.executor import executor_lifespan
+from core.account_state import get_account_state
+from core.market_stream import get_market_stream, websockets_available
+from core.lazy_tools import register_tools
+from core.metrics import instrument_tools
+
+from tools import TOOLS
 
 from prompts.explain_ticker import explain_ticker
 from prompts.analyze_portfolio import analyze_portfolio
@@ -20,14 +19,10 @@ from prompts.order_help import order_help
 from prompts.trading_strategy import trading_strategy
 
 from resources.get_market_list import get_market_list
+from resources.get_rate_limit_status import get_rate_limit_status
+from resources.get_metrics import get_server_metrics, get_prometheus_metrics
 
 
-if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
-    print("⚠️  경고: 업비트 API 키가 설정되지 않았습니다. 공개 API만 사용 가능합니다.")
-    print("     .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.")
-else:
-    print("✅ 업비트 API 키가 확인되었습니다. 모든 기능을 사용할 수 있습니다.")
-
 mcp = FastMCP(
     "Upbit MCP Server", 
     description="Upbit 암호화폐 거래소 API와 연동된 MCP 서버",
@@ -39,24 +34,54 @@ mcp = FastMCP(
     ]
 )
 
-mcp.tool()(get_ticker)
-mcp.tool()(get_orderbook)
-mcp.tool()(get_trades)
-mcp.tool()(get_accounts)
-mcp.tool()(create_order)
-mcp.tool()(get_orders)
-mcp.tool()(get_order)
-mcp.tool()(cancel_order)
-mcp.tool()(get_market_summary)
-mcp.tool()(get_deposits_withdrawals)
+# 도구 모듈은 처음 호출될 때 불러옴 (목록 조회에는 tools/manifest.json 의 스키마 사용)
+register_tools(mcp, TOOLS)
+if METRICS_ENABLED:
+    instrument_tools(mcp)
 
 mcp.resource("market://list")(get_market_list)
+mcp.resource("ratelimit://status")(get_rate_limit_status)
+mcp.resource("metrics://server", mime_type="application/json")(get_server_metrics)
+mcp.resource("metrics://prometheus", mime_type="text/plain")(get_prometheus_metrics)
 
 mcp.prompt()(explain_ticker)
 mcp.prompt()(analyze_portfolio)
 mcp.prompt()(order_help)
 mcp.prompt()(trading_strategy)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """서버 실행 동안 공유 자원(HTTP 커넥션 풀, 분석 작업자 프로세스 등)을 생성하고 종료 시 정리합니다."""
+    async with http_lifespan(), executor_lifespan():
+        stream = get_market_stream()
+        if WS_SUBSCRIBE and websockets_available():
+            await stream.subscribe(WS_SUBSCRIBE)
+        account_state = get_account_state()
+        if PRIVATE_WS_ENABLED and UPBIT_ACCESS_KEY and UPBIT_SECRET_KEY and websockets_available():
+            account_state.start()
+        try:
+            yield
+        finally:
+            await stream.stop()
+            await account_state.stop()
+
+
+async def run_stdio():
+    async with lifespan(mcp):
+        await mcp.run_stdio_async()
+
+
+def print_startup_status():
+    """API 키 설정 상태 안내 (stdio 전송을 쓰므로 표준 출력 대신 stderr로 출력)"""
+    if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
+        print("⚠️  경고: 업비트 API 키가 설정되지 않았습니다. 공개 API만 사용 가능합니다.", file=sys.stderr)
+        print("     .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.", file=sys.stderr)
+    else:
+        print("✅ 업비트 API 키가 확인되었습니다. 모든 기능을 사용할 수 있습니다.", file=sys.stderr)
+    print("업비트 MCP 서버가 시작되었습니다!", file=sys.stderr)
+
+
 if __name__ == "__main__":
-    print("업비트 MCP 서버가 시작되었습니다!")
-    mcp.run(transport="stdio")  # Claude, gomcp 연동용
\ No newline at end of file
+    print_startup_status()
+    asyncio.run(run_stdio())  # Claude, gomcp 연동용
\ No newline at end of file
@@ -1,25 +1,55 @@
-def analyze_portfolio(account_data: list[dict]) -> str:
+def _pct(rate) -> str:
+    return "정보 없음" if rate is None else f"{rate * 100:+.2f}%"
+
+
+async def analyze_portfolio(account_data: list[dict] | None = None) -> str:
     """
     사용자의 포트폴리오를 분석하는 프롬프트를 생성합니다.
+
+    잔고와 현재가를 한 번에 조회해 평가금액, 평가손익, 비중을 계산한 요약을 넣습니다.
+    account_data를 주면 계정 조회 대신 그 잔고를 평가합니다.
     """
-    portfolio_summary = ""
-    total_krw = 0
-    
-    for asset in account_data:
-        if asset['currency'] == 'KRW':
-            total_krw = float(asset['balance'])
-        else:
-            asset_value = float(asset['balance']) * (float(asset.get('avg_buy_price', 0)) or 0)
-            portfolio_summary += f"- {asset['currency']}: {asset['balance']} 개 보유 (평균 매수가: {asset.get('avg_buy_price', '정보 없음')} KRW)\n"
-    
+    # 평가에 numpy를 쓰므로 서버 시작 시가 아니라 프롬프트를 처음 만들 때 불러옴
+    from core.portfolio import load_valuation
+
+    try:
+        valuation = await load_valuation(account_data)
+    except Exception as e:
+        return f"""
+    업비트 포트폴리오 분석
+
+    포트폴리오 평가에 실패했습니다: {e}
+    get_accounts 도구로 잔고를 확인한 뒤 portfolio_valuation 도구로 다시 평가해주세요.
+    """
+
+    holdings = "\n".join(
+        f"    - {h['currency']}: {h['quantity']:g} 개, 평가 {h['value']:,.0f} 원 (비중 {h['weight'] * 100:.1f}%), "
+        f"평균 매수가 {h['avg_buy_price']:,.8g} / 현재가 {h['price']:,.8g}, "
+        f"평가손익 {h['unrealized_pnl']:+,.0f} 원 ({_pct(h['unrealized_pnl_rate'])}), 24시간 {_pct(h['change_rate_24h'])}"
+        for h in valuation["holdings"]
+    ) or "    - 보유 코인 없음"
+    dust = valuation["dust"]
+    notes = []
+    if dust["count"]:
+        notes.append(f"소액 보유 {dust['count']}종 (합계 {dust['value_krw']:,.0f} 원)은 목록에서 제외했습니다.")
+    if valuation["unpriced"]:
+        notes.append(f"시세가 없어 평가하지 못한 자산: {', '.join(valuation['unpriced'])}")
+    exposure, concentration = valuation["exposure"], valuation["concentration"]
+
     return f"""
     업비트 포트폴리오 분석
-    
-    현재 KRW 잔액: {total_krw:,.0f} 원
-    
-    보유 자산:
-    {portfolio_summary}
-    
-    위 포트폴리오에 대해 분석해주세요. 각 자산의 비중과 현재 시장 상황을 고려하여 조언을 제공해주세요.
-    필요하다면 get_ticker 도구를 통해 현재 가격 정보를 확인할 수 있습니다.
-    """
\ No newline at end of file
+
+    총 평가금액: {valuation['total_value_krw']:,.0f} 원
+    현금(KRW): {valuation['cash_krw']:,.0f} 원 (비중 {_pct(exposure['cash_weight']).lstrip('+')})
+    코인 평가금액: {valuation['invested_krw']:,.0f} 원 / 매수금액 {valuation['cost_basis_krw']:,.0f} 원
+    평가손익: {valuation['unrealized_pnl_krw']:+,.0f} 원 ({_pct(valuation['unrealized_pnl_rate'])})
+    24시간 변동: {valuation['day_change_krw']:+,.0f} 원
+    집중도: 최대 비중 {concentration['top1_weight'] * 100:.1f}%, 상위 3개 {concentration['top3_weight'] * 100:.1f}%
+
+    보유 자산 (평가금액 순):
+{holdings}
+    {' '.join(notes)}
+
+    위 포트폴리오에 대해 분석해주세요. 각 자산의 비중, 손익, 집중도와 현재 시장 상황을 고려하여 조언을 제공해주세요.
+    필요하다면 technical_analysis 도구로 개별 자산의 추세를 확인할 수 있습니다.
+    """
@@ -1,8 +1,20 @@
-import httpx
-from config import API_BASE
+import json
 
-async def get_market_list() -> list[str]:
+from fastmcp.resources import Resource
+
+from core.market_cache import get_market_cache
+
+
+class MarketListResource(Resource):
+    """마켓 캐시에서 마켓 코드 목록을 읽는 리소스"""
+
+    async def read(self) -> str:
+        markets = await get_market_cache().get()
+        return json.dumps([item["market"] for item in markets])
+
+
+# fastmcp 0.4 의 리소스는 함수를 기다리지 않고 호출하므로 동기 함수로 두고,
+# 비동기로 읽어야 하는 내용은 Resource로 돌려준다 (FunctionResource.read가 그 read를 기다림)
+def get_market_list() -> Resource:
     """Get available trading pairs from Upbit"""
-    async with httpx.AsyncClient() as client:
-        res = await client.get(f"{API_BASE}/market/all")
-        return [item["market"] for item in res.json()]
\ No newline at end of file
+    return MarketListResource(uri="market://list", name="get_market_list")
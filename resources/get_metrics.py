@@ -0,0 +1,12 @@
+from core.metrics import get_metrics
+
+
+# fastmcp 0.4 의 리소스는 함수를 기다리지 않고 호출하므로 동기 함수로 둔다
+def get_server_metrics() -> dict:
+    """Get per-tool and per-endpoint latency histograms, status counts, cache hit ratios and in-flight gauges"""
+    return get_metrics().stats()
+
+
+def get_prometheus_metrics() -> str:
+    """Get server metrics in Prometheus text exposition format"""
+    return get_metrics().prometheus()
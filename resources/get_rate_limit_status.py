@@ -0,0 +1,7 @@
+from core.rate_limit import get_rate_limiter
+
+
+# fastmcp 0.4 의 리소스는 함수를 기다리지 않고 호출하므로 동기 함수로 둔다 (async면 코루틴 repr이 반환됨)
+def get_rate_limit_status() -> dict:
+    """Get client-side rate limiter state (queue depth, wait time) per Upbit quota group"""
+    return get_rate_limiter().stats()
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.mock_upbit import MockUpbitServer
+from core import private_api
+from core.http import http_lifespan
+from core.private_api import UpbitSigner
+from core.rate_limit import DEFAULT_QUOTAS
+from tools.batch_orders import cancel_orders, create_orders
+
+SECRET_KEY = "test-secret-key"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with MockUpbitServer(latency=0.15, rate_limit={"order": DEFAULT_QUOTAS["order"], "default": 30},
+                         secret_key=SECRET_KEY) as server:
+        monkeypatch.setattr(private_api, "API_BASE", server.api_base)
+        monkeypatch.setattr(private_api, "get_signer", lambda: UpbitSigner("test-access-key", SECRET_KEY))
+        monkeypatch.setattr("tools.batch_orders.get_signer", lambda: None)
+        # 버킷의 asyncio.Lock이 앞선 테스트의 이벤트 루프에 묶이지 않도록 새로 만듦
+        monkeypatch.setattr("tools.batch_orders._pacers", {})
+        monkeypatch.setattr("core.rate_limit._limiter", None)
+        yield server
+
+
+@pytest.mark.parametrize("count", [12, 20])
+def test_create_orders_paced_to_order_quota(server, count):
+    orders = [{"market": "KRW-XRP", "side": "bid", "ord_type": "limit", "volume": "10", "price": str(500 + i)}
+              for i in range(count)]
+
+    async def run() -> tuple[dict, dict, float]:
+        async with http_lifespan():
+            start = time.perf_counter()
+            created = await create_orders(orders)
+            elapsed = time.perf_counter() - start
+            cancelled = await cancel_orders([r["order"]["uuid"] for r in created["results"]])
+        return created, cancelled, elapsed
+
+    created, cancelled, elapsed = asyncio.run(run())
+    # 한도를 넘는 주문은 실패하지 않고 줄을 서서 나감
+    assert created["failed"] == 0 and cancelled["failed"] == 0
+    assert elapsed >= count / DEFAULT_QUOTAS["order"]
+    assert server.group_counts["order"] <= count + 2
@@ -0,0 +1,71 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from core.candle_store import CANDLE_DTYPE, HISTORY_START, CandleStore
+
+START = 1_704_067_200  # 2024-01-01T00:00:00Z
+STORED = 50
+
+
+@pytest.fixture
+def store(tmp_path):
+    """상장 이후 전체 이력(분봉 50개)을 받아 둔 저장소 (업비트 요청 없이 읽힘)"""
+    store = CandleStore(str(tmp_path))
+    records = np.zeros(STORED, dtype=CANDLE_DTYPE)
+    records["time"] = START + np.arange(STORED) * 60
+    records["trade_price"] = np.arange(STORED)
+    store.series("KRW-BTC", "minute1").store(records, HISTORY_START, START + STORED * 60)
+    return store
+
+
+@pytest.mark.parametrize("count", [1, 30, STORED, STORED + 1, 70, 99, 2 * STORED])
+def test_read_returns_latest_candles_up_to_stored(store, count):
+    to = "2024-01-01T00:50:00Z"
+    rows = asyncio.run(store.read("KRW-BTC", "minute1", count, to))
+    expected = min(count, STORED)
+    assert len(rows) == expected
+    assert rows["trade_price"].tolist() == list(range(STORED - expected, STORED))
+
+
+def _live_candle(interval: str) -> dict:
+    candle = {
+        "market": "KRW-BTC",
+        "candle_date_time_utc": "2024-01-01T00:00:00",
+        "candle_date_time_kst": "2024-01-01T09:00:00",
+        "opening_price": 1.0,
+        "high_price": 2.0,
+        "low_price": 0.5,
+        "trade_price": 1.5,
+        "timestamp": 1_704_067_260_000,
+        "candle_acc_trade_price": 10.0,
+        "candle_acc_trade_volume": 5.0,
+    }
+    if interval == "minute1":
+        candle["unit"] = 1
+    elif interval == "day":
+        candle.update(prev_closing_price=1.0, change_price=0.5, change_rate=0.5)
+    else:
+        candle["first_day_of_period"] = "2024-01-01"
+    return candle
+
+
+@pytest.mark.parametrize("interval", ["minute1", "day", "week", "month"])
+def test_load_candles_keeps_live_response_shape(tmp_path, monkeypatch, interval):
+    """저장소를 거친 캔들도 업비트 응답과 같은 필드를 가져야 함 (주봉/월봉은 저장소를 거치지 않음)"""
+    import core.candle_store as candle_store
+
+    live = [_live_candle(interval)]
+
+    async def fetch_candles(market, interval, count, to=None):
+        return live
+
+    store = CandleStore(str(tmp_path))
+    store.series("KRW-BTC", interval).store(candle_store.candles_to_records(live), HISTORY_START, START + 60)
+    monkeypatch.setattr(candle_store, "CANDLE_STORE_ENABLED", True)
+    monkeypatch.setattr(candle_store, "_store", store)
+    monkeypatch.setattr(candle_store, "fetch_candles", fetch_candles)
+
+    candles = asyncio.run(candle_store.load_candles("KRW-BTC", interval, 1, "2024-01-01T00:01:00Z"))
+    assert candles == live
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import signal
+import time
+
+import numpy as np
+import pytest
+
+from core.executor import AnalyticsExecutor, AnalyticsTimeoutError, analytics_task
+
+SHM_DIR = "/dev/shm"
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(SHM_DIR), reason="POSIX 공유 메모리 목록을 볼 수 없음")
+
+
+@analytics_task
+def _slow_result(arrays: dict, seconds: float) -> np.ndarray:
+    """종료 신호를 무시하고 늦게 큰 결과를 돌려주는 작업 (결과 공유 메모리가 제한 시간 뒤에 만들어짐)"""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    time.sleep(seconds)
+    return np.ones(100_000)
+
+
+@analytics_task
+def _hang(arrays: dict, seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@analytics_task
+def _double(arrays: dict) -> np.ndarray:
+    return arrays["x"] * 2
+
+
+def _segments() -> set[str]:
+    return {name for name in os.listdir(SHM_DIR) if name.startswith("psm_")}
+
+
+@pytest.fixture
+def executor():
+    executor = AnalyticsExecutor(workers=1, inline_bytes=0)
+    yield executor
+    executor.shutdown()
+
+
+def test_timeout_kills_worker_and_pool_recovers(executor):
+    arrays = {"x": np.arange(100_000, dtype=np.float64)}
+    before = _segments()
+
+    async def scenario():
+        start = time.perf_counter()
+        with pytest.raises(AnalyticsTimeoutError):
+            await executor.run("_hang", arrays, timeout=0.2, seconds=30)
+        assert time.perf_counter() - start < 5
+        return await executor.run("_double", arrays)
+
+    result = asyncio.run(scenario())
+    assert np.array_equal(result, arrays["x"] * 2)
+    assert executor.stats()["restarts"] == 1
+    assert _segments() <= before
+
+
+def test_late_result_after_timeout_is_unlinked(executor):
+    arrays = {"x": np.zeros(10)}
+    before = _segments()
+
+    async def scenario():
+        with pytest.raises(AnalyticsTimeoutError):
+            await executor.run("_slow_result", arrays, timeout=0.1, seconds=0.5)
+
+    asyncio.run(scenario())
+    time.sleep(1.0)  # 작업자가 결과를 만들고 풀이 완료 콜백을 부를 때까지
+    assert _segments() <= before
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from core import history
+from core.history import PAGE_LIMIT, collect_orders
+from core.models import Order
+
+
+def _order(i: int, **fields) -> dict:
+    return {"uuid": f"o{i}", "market": "KRW-BTC", "side": "bid", "ord_type": "limit", "state": "done",
+            "created_at": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}+09:00", **fields}
+
+
+@pytest.fixture
+def orders(monkeypatch):
+    """최신순 주문 n개를 page/limit으로 잘라 주는 private_request"""
+    rows = []
+
+    async def private_request(method, path, params):
+        start = (params["page"] - 1) * params["limit"]
+        return rows[start:start + params["limit"]]
+
+    monkeypatch.setattr(history, "private_request", private_request)
+    return rows
+
+
+@pytest.mark.parametrize("count, max_pages, exhausted", [(250, 3, False), (300, 3, True), (300, 4, False)])
+def test_collect_orders_reports_page_limit(orders, monkeypatch, count, max_pages, exhausted):
+    orders.extend(_order(i) for i in range(count))
+    stream_pages = history.stream_pages
+    monkeypatch.setattr(history, "stream_pages",
+                        lambda path, params, status=None: stream_pages(path, params, max_pages=max_pages, status=status))
+    summary = asyncio.run(collect_orders({}))
+    assert summary["total"] == min(count, max_pages * PAGE_LIMIT)
+    assert summary["pages_exhausted"] is exhausted
+
+
+def test_executed_value_by_order_type():
+    # 지정가: 체결 수량 x 주문 단가
+    assert Order.from_payload(_order(0, price="50000", executed_volume="2")).executed_value == 100000
+    # 시장가 매수: price는 주문 총액이라 체결 금액이 아님, executed_funds 사용
+    market_buy = _order(1, ord_type="price", price="10000", executed_volume="0.2", executed_funds="9990")
+    assert Order.from_payload(market_buy).executed_value == 9990
+    # 시장가 매도: price 없음, 단건 응답의 trades funds 합 사용
+    market_sell = _order(2, side="ask", ord_type="market", executed_volume="0.3",
+                         trades=[{"funds": "6000"}, {"funds": "9000.5"}])
+    assert Order.from_payload(market_sell).executed_value == 15000.5
+    # 체결 금액을 알 수 없는 시장가 주문
+    assert Order.from_payload(_order(3, ord_type="market", executed_volume="0.3")).executed_value is None
+    assert Order.from_payload(_order(4, ord_type="market", executed_volume="0")).executed_value == 0
+
+
+def test_collect_orders_does_not_value_market_orders_by_price(orders):
+    orders.extend([
+        _order(0, price="50000", executed_volume="2"),
+        _order(1, ord_type="price", price="10000", executed_volume="0.2", executed_funds="9990"),
+        _order(2, side="ask", ord_type="market", executed_volume="0.3"),
+    ])
+    stats = asyncio.run(collect_orders({}))["by_market"]["KRW-BTC"]
+    assert stats["executed_value"] == 109990
+    assert stats["executed_value_unknown"] == 1
@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+import pytest
+from fastmcp import FastMCP
+
+from core.lazy_tools import (
+    MANIFEST_PATH, LazyTool, StaleManifestError, load_manifest, register_tools, schema_sources,
+)
+from tools import TOOLS
+
+
+def _write(tmp_path, entries: dict) -> str:
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"tools": list(entries.values())}), encoding="utf-8")
+    return str(path)
+
+
+def test_schema_sources_include_imported_type_modules():
+    assert "core.shaping" in schema_sources("tools.get_ticker")
+    assert "core.market_stream" in schema_sources("tools.subscribe_market_data")
+
+
+def test_manifest_registers_every_tool_lazily():
+    mcp = FastMCP("test")
+    assert register_tools(mcp, TOOLS) == {"lazy": len(TOOLS), "eager": 0}
+    assert all(isinstance(tool, LazyTool) and not tool.loaded for tool in mcp._tool_manager.list_tools())
+
+
+def test_changed_dependency_source_registers_eagerly(tmp_path):
+    entries = load_manifest(MANIFEST_PATH)
+    entries["get_ticker"]["sources"]["core.shaping"] = "0" * 40
+    mcp = FastMCP("test")
+    counts = register_tools(mcp, [("get_ticker", "tools.get_ticker")], path=_write(tmp_path, entries))
+    assert counts == {"lazy": 0, "eager": 1}
+    assert not isinstance(mcp._tool_manager.get_tool("get_ticker"), LazyTool)
+
+
+def test_schema_drift_fails_on_first_call(tmp_path):
+    entries = load_manifest(MANIFEST_PATH)
+    entries["get_orderbook"]["parameters"]["properties"]["symbol"]["type"] = "integer"
+    mcp = FastMCP("test")
+    register_tools(mcp, [("get_orderbook", "tools.get_orderbook")], path=_write(tmp_path, entries))
+    tool = mcp._tool_manager.get_tool("get_orderbook")
+    with pytest.raises(StaleManifestError):
+        tool.load()
+    with pytest.raises(Exception, match="manifest"):
+        asyncio.run(mcp._tool_manager.call_tool("get_orderbook", {"symbol": "KRW-BTC"}))
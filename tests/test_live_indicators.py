@@ -0,0 +1,81 @@
+import asyncio
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+import core.live_indicators as live_indicators
+from core.candles import current_candle_start
+from core.indicators import compute_all
+from core.live_indicators import LiveIndicatorRegistry, LiveIndicators
+
+RTOL = 1e-9
+
+
+def _candles(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 1_000_000 * np.exp(np.cumsum(rng.normal(0, 0.003, n)))
+    close[n // 3: n // 3 + 40] = close[n // 3]  # 거래가 멈춘 구간 (변동폭 0, 하락 0)
+    spread = rng.random(n) * 0.002
+    spread[n // 3: n // 3 + 40] = 0
+    high = close * (1 + spread)
+    low = close * (1 - spread)
+    volume = rng.random(n) * 10
+    return np.stack([high, low, close, volume])
+
+
+def _assert_matches(live: dict, batch: dict, where: str) -> None:
+    for name, expected in batch.items():
+        expected = float(expected[-1])
+        actual = live[name]
+        if math.isnan(expected):
+            assert math.isnan(actual), f"{where} {name}: live={actual} batch=nan"
+        else:
+            assert actual == pytest.approx(expected, rel=0, abs=RTOL * max(abs(expected), 1.0)), f"{where} {name}"
+
+
+def test_incremental_matches_batch_on_every_prefix():
+    # 진행 중인 캔들(peek)과 마감 캔들(push) 결과가 같은 구간을 한 번에 계산한 값과 같아야 함
+    candles = _candles(600)
+    rng = np.random.default_rng(1)
+    state = LiveIndicators("TEST", "minute1")
+    for i in range(candles.shape[1]):
+        high, low, close, volume = candles[:, i]
+        if i % 7 == 0:
+            partial = close * (1 + rng.normal(0, 0.001))
+            p_high, p_low = max(high, partial), min(low, partial)
+            live = state.update(i, p_high, p_low, partial, volume / 2, closed=False)
+            prefix = candles[:, :i + 1].copy()
+            prefix[:, i] = (p_high, p_low, partial, volume / 2)
+            _assert_matches(live, compute_all(*prefix), f"live candle {i}")
+        closed = state.update(i, high, low, close, volume, closed=True)
+        _assert_matches(closed, compute_all(*candles[:, :i + 1]), f"closed candle {i}")
+
+
+@pytest.fixture
+def fake_columns(monkeypatch):
+    """현재 시각 기준 1분 캔들을 돌려주는 load_columns (to가 있으면 마감 캔들만)"""
+    data = _candles(300)
+
+    async def load_columns(market, interval, count, to=None):
+        boundary = int(current_candle_start(interval, datetime.now(timezone.utc)).timestamp())
+        times = boundary - 60 * np.arange(data.shape[1] - 1, -1, -1)
+        keep = times <= boundary if to is None else times < boundary
+        times, rows = times[keep][-count:], data[:, keep][:, -count:]
+        return {"time": times, "high_price": rows[0], "low_price": rows[1],
+                "trade_price": rows[2], "candle_acc_trade_volume": rows[3]}
+
+    monkeypatch.setattr(live_indicators, "load_columns", load_columns)
+
+
+def test_refresh_without_current_candle_reports_closed_values(fake_columns):
+    registry = LiveIndicatorRegistry()
+    live = asyncio.run(registry.refresh("KRW-BTC", "minute1", include_current=True))
+    assert live["in_progress"] is True
+
+    closed = asyncio.run(registry.refresh("KRW-BTC", "minute1", include_current=False))
+    state = registry.get("KRW-BTC", "minute1")
+    assert closed["in_progress"] is False
+    assert closed["time"] == live_indicators.format_to(datetime.fromtimestamp(state.last_closed, tz=timezone.utc))
+    assert closed["rsi"] == state.snapshot()["rsi"]
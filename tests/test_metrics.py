@@ -0,0 +1,34 @@
+import asyncio
+
+from fastmcp import FastMCP
+
+from core import metrics
+from core.metrics import Metrics, instrument_tools
+
+
+def _error_dict() -> dict:
+    return {"error": "업비트 API 오류: 500"}
+
+
+def _error_list() -> list[dict]:
+    return [{"error": "업비트 API 오류: 500"}]
+
+
+def _records() -> list[dict]:
+    return [{"market": "KRW-BTC"}, {"market": "KRW-ETH"}]
+
+
+def test_error_values_are_counted_as_error_response(monkeypatch):
+    monkeypatch.setattr(metrics, "_metrics", Metrics())
+    mcp = FastMCP("test")
+    for fn in (_error_dict, _error_list, _records):
+        mcp.add_tool(fn)
+    instrument_tools(mcp)
+    for fn in (_error_dict, _error_list, _records):
+        asyncio.run(mcp.call_tool(fn.__name__, {}))
+    results = metrics.get_metrics().tool_results
+    assert results == {
+        "_error_dict": {"error_response": 1},
+        "_error_list": {"error_response": 1},
+        "_records": {"ok": 1},
+    }
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from core import private_api
+from core.private_api import UpbitSigner, private_request
+from core.rate_limit import DEFAULT_QUOTAS, RateLimitedTransport, RateLimiter, TokenBucket, quota_group
+
+
+def _remaining(group: str, sec: int) -> httpx.Headers:
+    return httpx.Headers({"Remaining-Req": f"group={group}; min=1800; sec={sec}"})
+
+
+def test_order_creation_and_cancel_use_separate_groups():
+    assert quota_group("POST", "/v1/orders") == "order"
+    assert quota_group("DELETE", "/v1/order") == "default"
+    assert quota_group("GET", "/v1/orders") == "default"
+
+
+@pytest.mark.parametrize("group, sec", [("default", 29), ("order", 29), ("order", 100)])
+def test_remaining_req_never_raises_the_configured_quota(group, sec):
+    limiter = RateLimiter()
+    limiter.update("order", _remaining(group, sec))
+    order = limiter.bucket("order").stats()
+    assert (order["rate"], order["capacity"]) == (DEFAULT_QUOTAS["order"], DEFAULT_QUOTAS["order"])
+    assert order["tokens"] <= DEFAULT_QUOTAS["order"]
+
+
+def test_remaining_req_calibrates_the_reported_group():
+    limiter = RateLimiter()
+    order = limiter.bucket("order")
+    # 취소 응답(default 그룹)은 주문 생성 버킷을 건드리지 않음
+    limiter.update("order", _remaining("default", 0))
+    assert order.stats()["tokens"] == DEFAULT_QUOTAS["order"]
+    assert limiter.bucket("default").stats()["tokens"] == 0
+    limiter.update("order", _remaining("order", 3))
+    assert order.stats()["tokens"] == pytest.approx(3, abs=0.1)
+
+
+class _Throttled(httpx.AsyncBaseTransport):
+    """처음 throttled번은 429, 그 뒤로 200을 주며 받은 Authorization 헤더를 기록"""
+
+    def __init__(self, throttled: int):
+        self.throttled = throttled
+        self.authorizations: list[str | None] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.authorizations.append(request.headers.get("Authorization"))
+        if len(self.authorizations) <= self.throttled:
+            return httpx.Response(429, headers={"Remaining-Req": "group=default; min=0; sec=0"},
+                                  json={"error": {"name": "too_many_requests"}})
+        return httpx.Response(200, json={"uuid": "u"})
+
+
+def _client(transport: httpx.AsyncBaseTransport) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=RateLimitedTransport(transport, RateLimiter(), max_retries=3))
+
+
+def test_transport_retries_only_unsigned_requests(monkeypatch):
+    monkeypatch.setattr("core.rate_limit.BACKOFF_SECONDS", 0.01)
+
+    async def send(headers: dict) -> tuple[int, int]:
+        upstream = _Throttled(1)
+        async with _client(upstream) as client:
+            res = await client.get("https://api.upbit.com/v1/orders", headers=headers)
+        return res.status_code, len(upstream.authorizations)
+
+    assert asyncio.run(send({})) == (200, 2)
+    assert asyncio.run(send({"Authorization": "Bearer token"})) == (429, 1)
+
+
+def test_private_request_resigns_after_429(monkeypatch):
+    monkeypatch.setattr("core.rate_limit.BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(private_api, "PRIVATE_RETRY_BACKOFF", 0.0)
+    monkeypatch.setattr(private_api, "get_signer", lambda: UpbitSigner("access", "secret"))
+    upstream = _Throttled(1)
+
+    async def cancel() -> dict:
+        async with _client(upstream) as client:
+            monkeypatch.setattr(private_api, "get_client", lambda: client)
+            return await private_request("DELETE", "/order", {"uuid": "u"})
+
+    assert asyncio.run(cancel()) == {"uuid": "u"}
+    assert len(upstream.authorizations) == 2
+    assert upstream.authorizations[0] != upstream.authorizations[1]
+
+
+def test_bucket_refills_from_empty_after_block():
+    # 중단 시간 동안 토큰이 쌓여 중단이 끝나자마자 몰아 보내면 안 됨
+    async def run() -> float:
+        bucket = TokenBucket(8)
+        bucket.block(1.0)
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 1.0 + 4 / 8 - 0.02
@@ -0,0 +1,22 @@
+import asyncio
+import json
+
+import main
+from core.market_cache import get_market_cache
+
+
+def test_market_list_resource_returns_codes(monkeypatch):
+    async def markets() -> list[dict]:
+        return [{"market": "KRW-BTC"}, {"market": "KRW-ETH"}]
+
+    monkeypatch.setattr(get_market_cache(), "get", markets)
+    assert json.loads(asyncio.run(main.mcp.read_resource("market://list"))) == ["KRW-BTC", "KRW-ETH"]
+
+
+def test_rate_limit_status_resource_returns_bucket_stats():
+    from core.rate_limit import get_rate_limiter
+
+    get_rate_limiter().bucket("ticker")
+    status = json.loads(asyncio.run(main.mcp.read_resource("ratelimit://status")))
+    assert isinstance(status, dict)
+    assert status["ticker"]["queue_depth"] == 0
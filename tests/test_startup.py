@@ -0,0 +1,8 @@
+from benchmarks.bench_startup import BUDGET_MS, check_startup, measure_imports, project_ms
+
+
+def test_startup_import_budget_and_deferred_loading():
+    # 새 프로세스에서 python -X importtime -c "import main" 을 실행해 확인
+    result, self_ms, _ = measure_imports(repeat=3)
+    assert check_startup(result, self_ms) == []
+    assert project_ms(self_ms) <= BUDGET_MS
@@ -0,0 +1,29 @@
+# main.py가 서버에 등록하는 도구 (도구 이름, 모듈), 등록 순서대로
+# 도구를 추가하거나 시그니처/설명을 바꾸면 python -m core.lazy_tools 로 tools/manifest.json 을 다시 생성
+TOOLS = [
+    ("get_ticker", "tools.get_ticker"),
+    ("get_tickers", "tools.get_ticker"),
+    ("get_orderbook", "tools.get_orderbook"),
+    ("get_orderbooks", "tools.get_orderbook"),
+    ("analyze_orderbook", "tools.analyze_orderbook"),
+    ("get_trades", "tools.get_trades"),
+    ("get_trade_flow", "tools.get_trade_flow"),
+    ("get_candles", "tools.get_candels"),
+    ("get_accounts", "tools.get_accounts"),
+    ("create_order", "tools.create_order"),
+    ("get_orders", "tools.get_orders"),
+    ("get_order", "tools.get_order"),
+    ("cancel_order", "tools.cancel_order"),
+    ("create_orders", "tools.batch_orders"),
+    ("cancel_orders", "tools.batch_orders"),
+    ("cancel_all", "tools.batch_orders"),
+    ("get_market_summary", "tools.get_market_summary"),
+    ("technical_analysis", "tools.technical_analysis"),
+    ("scan_markets", "tools.scan_markets"),
+    ("get_live_indicators", "tools.get_live_indicators"),
+    ("backtest_strategy", "tools.backtest_strategy"),
+    ("portfolio_valuation", "tools.portfolio_valuation"),
+    ("get_deposits_withdrawals", "tools.get_deposits_withdrawals"),
+    ("subscribe_market_data", "tools.subscribe_market_data"),
+    ("unsubscribe_market_data", "tools.subscribe_market_data"),
+]
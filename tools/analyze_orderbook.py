@@ -0,0 +1,61 @@
+from fastmcp import Context
+from typing import Literal, Optional
+from core.orderbook import OrderBook
+from tools.get_orderbook import get_orderbook
+
+async def analyze_orderbook(
+    market: str,
+    side: Optional[Literal["bid", "ask"]] = None,
+    volume: Optional[float] = None,
+    amount: Optional[float] = None,
+    levels: int = 5,
+    fee_rate: float = 0.0005,
+    ctx: Context = None
+) -> dict:
+    """
+    호가창을 분석하고 시장가 주문의 예상 체결 비용을 계산합니다.
+
+    전체 호가를 받아오지 않고도 스프레드, 호가 불균형, 누적 잔량과
+    주어진 수량/금액을 시장가로 체결할 때의 평균 체결가와 슬리피지를 확인할 수 있습니다.
+
+    Args:
+        market (str): 마켓 코드 (예: KRW-BTC)
+        side (str, optional): 예상 체결을 계산할 주문 종류 - bid(매수) 또는 ask(매도)
+        volume (float, optional): 주문 수량 (시장가 매도 또는 수량 기준 매수)
+        amount (float, optional): 주문 총액 (시장가 매수, 호가 통화 기준)
+        levels (int): 불균형/누적 잔량 계산에 사용할 상위 호가 레벨 수
+        fee_rate (float): 수수료율 (기본 0.05%)
+
+    Returns:
+        dict: 호가 분석 결과 및 예상 체결 정보
+    """
+    try:
+        book = OrderBook.from_payload(await get_orderbook(market))
+    except Exception as e:
+        if ctx:
+            ctx.error(f"호가 조회 중 오류 발생: {str(e)}")
+        return {"error": f"호가 조회 중 오류 발생: {str(e)}"}
+
+    result = {
+        "market": book.market,
+        "timestamp": book.timestamp,
+        "best_ask": book.best_ask,
+        "best_bid": book.best_bid,
+        "mid_price": book.mid,
+        "spread": book.spread(),
+        "imbalance": book.imbalance(levels),
+        "depth": {
+            "ask": book.depth("ask", levels),
+            "bid": book.depth("bid", levels),
+        },
+    }
+
+    if side is not None:
+        try:
+            result["fill_estimate"] = book.estimate_fill(side, volume=volume, amount=amount, fee_rate=fee_rate)
+        except ValueError as e:
+            if ctx:
+                ctx.error(str(e))
+            return {"error": str(e)}
+
+    return result
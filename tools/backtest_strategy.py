@@ -0,0 +1,151 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from fastmcp import Context
+import numpy as np
+from typing import Literal, Optional
+from config import CANDLE_FETCH_CONCURRENCY, create_error_response
+from core.backtest import DEFAULT_PARAMS, STRATEGIES, param_grid
+from core.candle_store import load_columns
+from core.candles import current_candle_start, format_to
+from core.executor import AnalyticsTimeoutError, run_analytics
+
+# MACD 시그널 선까지 계산한 뒤에도 거래할 구간이 남도록 하는 최소 캔들 수
+MIN_BACKTEST_CANDLES = 60
+
+# 한 번에 실행할 수 있는 최대 실행 수 (마켓 수 x 파라미터 조합 수)
+MAX_RUNS = 20000
+
+BACKTEST_FIELDS = ("opening_price", "high_price", "low_price", "trade_price")
+
+
+def _round(x, digits: int = 6):
+    if x is None or (isinstance(x, float) and np.isnan(x)):
+        return None
+    return round(x, digits) if isinstance(x, float) else x
+
+
+async def backtest_strategy(
+    markets: list[str],
+    strategy: Literal["ma_cross", "rsi", "bollinger", "macd", "stochastic", "overall"] = "overall",
+    interval: Literal["minute15", "minute30", "minute60", "minute240", "day", "week"] = "day",
+    count: int = 1000,
+    fee_rate: float = 0.0005,
+    ma_fast: Optional[list[int]] = None,
+    ma_slow: Optional[list[int]] = None,
+    rsi_oversold: Optional[list[float]] = None,
+    rsi_overbought: Optional[list[float]] = None,
+    bb_width: Optional[list[float]] = None,
+    sort_by: Literal["total_return", "max_drawdown", "win_rate"] = "total_return",
+    limit: int = 20,
+    ctx: Context = None
+) -> dict:
+    """
+    technical_analysis 의 매매 규칙을 과거 캔들 전체에 적용해 성과를 백테스트합니다.
+
+    규칙을 캔들마다 계산한 신호 시계열로 만들고, 신호가 나온 다음 캔들 시가에 체결한다고 보고
+    호가 단위와 수수료를 반영해 수익률, 최대 낙폭, 거래 횟수를 계산합니다. 파라미터 후보를 목록으로
+    주면 마켓 x 파라미터 조합 전체를 한 번에 실행합니다. 현물 기준으로 매수 후 보유/청산만 다룹니다.
+
+    Args:
+        markets (list[str]): 백테스트할 마켓 코드 목록 (예: ["KRW-BTC", "KRW-ETH"])
+        strategy (str): 전략 - ma_cross(단기>장기 이평 동안 보유), rsi(과매도 매수/과매수 매도),
+            bollinger(하단 돌파 매수/상단 돌파 매도), macd(MACD>시그널 동안 보유),
+            stochastic(과매도 매수/과매수 매도), overall(technical_analysis 종합 신호: 매수 고려 시 매수, 매도 고려 시 매도)
+        interval (str): 캔들 간격
+        count (int): 마켓별 사용할 최근 캔들 수 (마감된 캔들만 사용)
+        fee_rate (float): 매수/매도 수수료율 (기본: 업비트 KRW 마켓 0.05%)
+        ma_fast (list[int], optional): 단기 이동평균 기간 후보 (기본: [5])
+        ma_slow (list[int], optional): 장기 이동평균 기간 후보 (기본: [20])
+        rsi_oversold (list[float], optional): RSI 과매도 기준 후보 (기본: [30])
+        rsi_overbought (list[float], optional): RSI 과매수 기준 후보 (기본: [70])
+        bb_width (list[float], optional): 볼린저 밴드 표준편차 배수 후보 (기본: [2])
+        sort_by (str): 결과 정렬 기준 - total_return(높은 순), max_drawdown(낮은 순), win_rate(높은 순)
+        limit (int): 반환할 최대 실행 결과 수
+
+    Returns:
+        dict: 상위 실행 결과 (마켓, 파라미터, 수익률, 최대 낙폭, 거래 횟수, 승률, 보유 비율),
+            실행 수와 처리 속도, 제외된 마켓
+    """
+    if strategy not in STRATEGIES:
+        if ctx:
+            ctx.error(f"지원하지 않는 전략입니다: {strategy}")
+        return create_error_response(f"지원하지 않는 전략입니다: {strategy}")
+    if not markets:
+        return create_error_response("마켓을 하나 이상 지정해야 합니다.")
+
+    grid = {
+        "ma_fast": ma_fast, "ma_slow": ma_slow, "rsi_oversold": rsi_oversold,
+        "rsi_overbought": rsi_overbought, "bb_width": bb_width,
+    }
+    grid = {name: list(values) for name, values in grid.items() if values}
+    if any(int(p) < 1 for p in grid.get("ma_fast", []) + grid.get("ma_slow", [])):
+        return create_error_response("이동평균 기간은 1 이상이어야 합니다.")
+    combos = len(param_grid(grid)["ma_fast"])
+    if combos * len(markets) > MAX_RUNS:
+        if ctx:
+            ctx.error(f"실행 수가 너무 많습니다: {combos * len(markets)}")
+        return create_error_response(f"마켓 수 x 파라미터 조합 수는 {MAX_RUNS} 이하여야 합니다.")
+    count = max(count, MIN_BACKTEST_CANDLES, *[2 * int(p) for p in grid.get("ma_slow", [DEFAULT_PARAMS["ma_slow"]])])
+
+    # 모든 마켓이 같은 마감 캔들까지의 데이터를 쓰도록 기준 시각을 맞춘다
+    to = format_to(current_candle_start(interval, datetime.now(timezone.utc)))
+    if ctx:
+        ctx.info(f"{len(markets)}개 마켓 {interval} 캔들 {count}개 조회 중...")
+    semaphore = asyncio.Semaphore(CANDLE_FETCH_CONCURRENCY)
+
+    async def fetch(market: str) -> dict:
+        async with semaphore:
+            return await load_columns(market, interval, count, to)
+
+    results = await asyncio.gather(*[fetch(market) for market in markets], return_exceptions=True)
+
+    tested, columns, skipped = [], [], []
+    for market, result in zip(markets, results):
+        if isinstance(result, Exception):
+            skipped.append({"market": market, "reason": f"캔들 조회 실패: {str(result)}"})
+        elif len(result["trade_price"]) < MIN_BACKTEST_CANDLES:
+            skipped.append({"market": market, "reason": f"캔들 부족 ({len(result['trade_price'])}/{MIN_BACKTEST_CANDLES})"})
+        else:
+            tested.append(market)
+            columns.append(result)
+
+    if not tested:
+        return {"strategy": strategy, "interval": interval, "runs": 0, "results": [], "skipped": skipped}
+
+    # 상장 기간이 짧은 마켓이 있으면 공통 구간(가장 짧은 길이)으로 맞춘다
+    length = min(len(c["trade_price"]) for c in columns)
+    arrays = {
+        field: np.stack([np.asarray(c[field][-length:], dtype=np.float64) for c in columns])
+        for field in BACKTEST_FIELDS
+    }
+
+    start = time.perf_counter()
+    try:
+        runs = await run_analytics("backtest_task", arrays, markets=tested, strategy=strategy,
+                                   grid=grid, fee_rate=fee_rate)
+    except AnalyticsTimeoutError as e:
+        if ctx:
+            ctx.error(str(e))
+        return {"error": str(e)}
+    except ValueError as e:
+        if ctx:
+            ctx.error(str(e))
+        return create_error_response(str(e))
+    elapsed = time.perf_counter() - start
+
+    descending = sort_by != "max_drawdown"
+    runs.sort(key=lambda r: (r[sort_by] is None or np.isnan(r[sort_by]),
+                             -r[sort_by] if descending else r[sort_by]))
+    return {
+        "strategy": strategy,
+        "interval": interval,
+        "as_of": to,
+        "candles": length,
+        "fee_rate": fee_rate,
+        "runs": len(runs),
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "runs_per_second": round(len(runs) / elapsed) if elapsed > 0 else None,
+        "results": [{name: _round(value) for name, value in run.items()} for run in runs[:max(1, limit)]],
+        "skipped": skipped,
+    }
@@ -0,0 +1,219 @@
+import asyncio
+import time
+from fastmcp import Context
+from typing import Literal, Optional
+from config import ORDER_BATCH_CONCURRENCY, validate_order_params
+from core.account_state import get_account_state
+from core.private_api import (
+    MISSING_KEY_MESSAGE,
+    MissingCredentialsError,
+    get_signer,
+    place_order,
+    private_request,
+    private_tool_call,
+)
+from core.rate_limit import DEFAULT_QUOTAS, TokenBucket
+
+# 한 번에 처리할 수 있는 최대 주문/취소 수
+MAX_BATCH_SIZE = 100
+
+# 일괄 요청 발송 간격을 정하는 그룹별 버킷 (응답 헤더로 보정되지 않는 고정 한도, 몰아 보내지 않도록 용량 1)
+_pacers: dict[str, TokenBucket] = {}
+
+# 연속한 한도(초당 N회)만큼의 요청이 항상 1초보다 길게 퍼지도록 (N-1)/초보다 약간 느리게 보냄.
+# 1초 구간을 꽉 채우면 서버가 남은 요청 0(sec=0)을 알려 요청 수 제한 계층이 1초를 쉬고,
+# 구간 경계에서 도착 시각이 조금만 흔들려도 429가 남
+PACING_MARGIN = 0.95
+
+
+def _pacer(group: str) -> TokenBucket:
+    if group not in _pacers:
+        _pacers[group] = TokenBucket((DEFAULT_QUOTAS[group] - 1) * PACING_MARGIN, capacity=1)
+    return _pacers[group]
+
+
+def _positive(value) -> bool:
+    try:
+        return float(value) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_orders(orders: list[dict]) -> list[dict]:
+    """
+    일괄 주문 파라미터를 모두 검사
+
+    Args:
+        orders (list[dict]): 주문 목록
+
+    Returns:
+        list[dict]: 문제가 있는 주문의 {"index", "error"} 목록 (없으면 빈 목록)
+    """
+    invalid, identifiers = [], set()
+    for i, order in enumerate(orders):
+        ok, message = validate_order_params(order.get("market"), order.get("side"), order.get("ord_type"),
+                                            order.get("volume"), order.get("price"))
+        if ok and any(order.get(key) is not None and not _positive(order[key]) for key in ("volume", "price")):
+            ok, message = False, "volume과 price는 0보다 큰 숫자여야 합니다."
+        identifier = order.get("identifier")
+        if ok and identifier and identifier in identifiers:
+            ok, message = False, f"identifier가 중복되었습니다: {identifier}"
+        if identifier:
+            identifiers.add(identifier)
+        if not ok:
+            invalid.append({"index": i, "error": message})
+    return invalid
+
+
+async def _run_batch(requests: list, group: str, on_success, ctx: Context = None,
+                     message: str | None = None) -> dict:
+    """
+    주문/취소 요청을 업비트 요청 그룹 한도(DEFAULT_QUOTAS)에 맞춘 간격으로 동시에 보내고 입력 순서대로 결과를 모음
+
+    Args:
+        requests (list): 요청마다 호출할 코루틴 함수 목록
+        group (str): 요청이 속한 업비트 요청 그룹 (order: 주문 생성, default: 취소)
+        on_success: 성공한 응답과 요청 시각을 받아 캐시에 반영하는 함수
+        ctx (Context, optional): 로그를 남길 MCP 컨텍스트
+        message (str, optional): 시작할 때 남길 진행 로그
+
+    Returns:
+        dict: total, succeeded, failed, results ({"index", "ok", "order" 또는 "error"})
+    """
+    try:
+        get_signer()
+    except MissingCredentialsError as e:
+        if ctx:
+            ctx.error(MISSING_KEY_MESSAGE)
+        return {"error": str(e)}
+    if ctx and message:
+        ctx.info(message)
+
+    semaphore = asyncio.Semaphore(ORDER_BATCH_CONCURRENCY)
+    pacer = _pacer(group)
+
+    async def run(i: int, request) -> dict:
+        async with semaphore:
+            await pacer.acquire()
+            sent_at = time.monotonic()
+            result = await private_tool_call(request())
+        if "error" in result:
+            return {"index": i, "ok": False, "error": result["error"]}
+        on_success(result, sent_at)
+        return {"index": i, "ok": True, "order": result}
+
+    results = await asyncio.gather(*[run(i, request) for i, request in enumerate(requests)])
+    failed = [r for r in results if not r["ok"]]
+    if ctx and failed:
+        details = ", ".join(f"#{r['index']} {r['error']}" for r in failed[:5])
+        ctx.error(f"{len(requests)}건 중 {len(failed)}건 실패: {details}")
+    return {
+        "total": len(results),
+        "succeeded": len(results) - len(failed),
+        "failed": len(failed),
+        "results": results,
+    }
+
+
+async def create_orders(
+    orders: list[dict],
+    ctx: Context = None
+) -> dict:
+    """
+    업비트에 여러 주문을 한 번에 생성합니다 (예: 지정가 분할 매수).
+
+    모든 주문을 먼저 검사해 하나라도 잘못되면 아무 주문도 보내지 않습니다. 검사를 통과하면
+    업비트 주문 요청 수 제한에 맞춰 동시에 보내고, 주문마다 성공/실패를 따로 알려줍니다.
+
+    Args:
+        orders (list[dict]): 주문 목록 (최대 100개). 각 주문은 create_order와 같은 키를 가집니다 -
+            market, side(bid/ask), ord_type(limit/price/market), volume, price, identifier(선택)
+
+    Returns:
+        dict: total, succeeded, failed, results (입력 순서대로 index, ok, order 또는 error)
+    """
+    if not orders or len(orders) > MAX_BATCH_SIZE:
+        if ctx:
+            ctx.error(f"주문은 1개 이상 {MAX_BATCH_SIZE}개 이하여야 합니다.")
+        return {"error": f"주문은 1개 이상 {MAX_BATCH_SIZE}개 이하여야 합니다."}
+    invalid = validate_orders(orders)
+    if invalid:
+        if ctx:
+            ctx.error(f"잘못된 주문 {len(invalid)}건이 있어 주문하지 않았습니다.")
+        return {"error": "잘못된 주문이 있어 주문하지 않았습니다.", "invalid": invalid}
+
+    params = [
+        {
+            'market': order["market"],
+            'side': order["side"],
+            'ord_type': order["ord_type"],
+            'volume': str(order["volume"]) if order.get("volume") is not None else None,
+            'price': str(order["price"]) if order.get("price") is not None else None,
+            'identifier': order.get("identifier"),
+        }
+        for order in orders
+    ]
+    return await _run_batch(
+        [lambda p=p: place_order(p) for p in params], "order", get_account_state().order_created, ctx,
+        f"일괄 주문 생성 중: {len(orders)}건"
+    )
+
+
+async def cancel_orders(
+    uuids: list[str],
+    ctx: Context = None
+) -> dict:
+    """
+    업비트에서 여러 주문을 한 번에 취소합니다.
+
+    Args:
+        uuids (list[str]): 취소할 주문의 UUID 목록 (최대 100개, 중복은 한 번만 취소)
+
+    Returns:
+        dict: total, succeeded, failed, results (주문별 uuid, ok, order 또는 error)
+    """
+    if not uuids or len(uuids) > MAX_BATCH_SIZE:
+        if ctx:
+            ctx.error(f"취소할 주문은 1개 이상 {MAX_BATCH_SIZE}개 이하여야 합니다.")
+        return {"error": f"취소할 주문은 1개 이상 {MAX_BATCH_SIZE}개 이하여야 합니다."}
+    uuids = list(dict.fromkeys(uuids))
+    result = await _run_batch(
+        [lambda u=u: private_request("DELETE", "/order", {'uuid': u}) for u in uuids], "default",
+        get_account_state().order_cancelled, ctx, f"일괄 주문 취소 중: {len(uuids)}건"
+    )
+    for item in result.get("results", []):
+        item["uuid"] = uuids[item["index"]]
+    return result
+
+
+async def cancel_all(
+    market: Optional[str] = None,
+    side: Optional[Literal["bid", "ask"]] = None,
+    ctx: Context = None
+) -> dict:
+    """
+    대기 중인 주문을 모두 취소합니다.
+
+    Args:
+        market (str, optional): 마켓 코드 (예: KRW-BTC, 없으면 모든 마켓)
+        side (str, optional): bid(매수) 또는 ask(매도) 주문만 취소 (없으면 모두)
+
+    Returns:
+        dict: total, succeeded, failed, results (취소한 주문별 uuid, ok, order 또는 error)
+    """
+    # 다른 곳(웹/앱)에서 낸 주문도 빠지지 않도록 캐시 대신 새로 조회
+    open_orders = await private_tool_call(
+        get_account_state().open_orders(market, refresh=True), ctx, "대기 주문 조회 중...", as_list=True
+    )
+    if open_orders and "error" in open_orders[0]:
+        return open_orders[0]
+    targets = [order["uuid"] for order in open_orders if side is None or order["side"] == side]
+    results = {"total": 0, "succeeded": 0, "failed": 0, "results": []}
+    for start in range(0, len(targets), MAX_BATCH_SIZE):
+        batch = await cancel_orders(targets[start:start + MAX_BATCH_SIZE], ctx)
+        if "error" in batch:
+            return batch
+        for key in ("total", "succeeded", "failed"):
+            results[key] += batch[key]
+        results["results"].extend({**r, "index": r["index"] + start} for r in batch["results"])
+    return results
@@ -1,7 +1,8 @@
-import httpx
+import time
 from fastmcp import Context
 from typing import Literal, Optional
-from config import generate_upbit_token, UPBIT_ACCESS_KEY, API_BASE
+from core.account_state import get_account_state
+from core.private_api import place_order, private_tool_call
 
 async def create_order(
     market: str, 
@@ -9,6 +10,7 @@ async def create_order(
     ord_type: Literal["limit", "price", "market"],
     volume: Optional[str] = None,
     price: Optional[str] = None,
+    identifier: Optional[str] = None,
     ctx: Context = None
 ) -> dict:
     """
@@ -20,15 +22,12 @@ async def create_order(
         ord_type (str): 주문 타입 - limit(지정가), price(시장가 매수), market(시장가 매도)
         volume (str, optional): 주문량 (지정가, 시장가 매도 필수)
         price (str, optional): 주문 가격 (지정가 필수, 시장가 매수 필수)
+        identifier (str, optional): 주문 식별용 사용자 지정 값 (기본: 자동 생성).
+            같은 identifier로는 주문이 한 번만 접수되므로 네트워크 오류 시에도 중복 주문 없이 재시도합니다.
         
     Returns:
         dict: 주문 결과
     """
-    if not UPBIT_ACCESS_KEY:
-        if ctx:
-            ctx.error("API 키가 설정되지 않았습니다. .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.")
-        return {"error": "API 키가 설정되지 않았습니다."}
-    
     # 주문 유효성 검사
     if ord_type == "limit" and (not volume or not price):
         if ctx:
@@ -45,34 +44,18 @@ async def create_order(
             ctx.error("시장가 매도 주문에는 volume이 필요합니다.")
         return {"error": "시장가 매도 주문에는 volume이 필요합니다."}
     
-    url = f"{API_BASE}/orders"
     query_params = {
         'market': market,
         'side': side,
-        'ord_type': ord_type
+        'ord_type': ord_type,
+        'volume': volume or None,
+        'price': price or None,
+        'identifier': identifier
     }
-    
-    if volume:
-        query_params['volume'] = volume
-    
-    if price:
-        query_params['price'] = price
-    
-    headers = {
-        "Authorization": f"Bearer {generate_upbit_token(query_params)}"
-    }
-    
-    if ctx:
-        ctx.info(f"주문 생성 중: {market} {side} {ord_type}")
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.post(url, params=query_params, headers=headers)
-            if res.status_code != 201:
-                if ctx:
-                    ctx.error(f"업비트 API 오류: {res.status_code} - {res.text}")
-                return {"error": f"업비트 API 오류: {res.status_code}"}
-            return res.json()
-        except Exception as e:
-            if ctx:
-                ctx.error(f"API 호출 중 오류 발생: {str(e)}")
-            return {"error": f"API 호출 중 오류 발생: {str(e)}"}
\ No newline at end of file
+    sent_at = time.monotonic()
+    result = await private_tool_call(
+        place_order(query_params), ctx, f"주문 생성 중: {market} {side} {ord_type}"
+    )
+    if "error" not in result:
+        get_account_state().order_created(result, sent_at)
+    return result
@@ -1,35 +1,20 @@
-import httpx
 from fastmcp import Context
-from config import generate_upbit_token, UPBIT_ACCESS_KEY, API_BASE
+from core.account_state import get_account_state
+from core.private_api import private_tool_call
 
-async def get_accounts(ctx: Context = None) -> list[dict]:
+async def get_accounts(refresh: bool = False, ctx: Context = None) -> list[dict]:
     """
     업비트 계정의 잔고 정보를 조회합니다.
-    
+
+    최근 조회 결과를 잠시(UPBIT_ACCOUNT_CACHE_TTL초) 재사용하며, 주문 생성/취소가 성공하면
+    바로 새로 조회합니다.
+
+    Args:
+        refresh (bool): 캐시를 쓰지 않고 새로 조회할지 여부
+
     Returns:
         list[dict]: 보유 중인 자산 목록
     """
-    if not UPBIT_ACCESS_KEY:
-        if ctx:
-            ctx.error("API 키가 설정되지 않았습니다. .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.")
-        return [{"error": "API 키가 설정되지 않았습니다."}]
-    
-    url = f"{API_BASE}/accounts"
-    headers = {
-        "Authorization": f"Bearer {generate_upbit_token()}"
-    }
-    
-    if ctx:
-        ctx.info("계정 잔고 조회 중...")
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(url, headers=headers)
-            if res.status_code != 200:
-                if ctx:
-                    ctx.error(f"업비트 API 오류: {res.status_code} - {res.text}")
-                return [{"error": f"업비트 API 오류: {res.status_code}"}]
-            return res.json()
-        except Exception as e:
-            if ctx:
-                ctx.error(f"API 호출 중 오류 발생: {str(e)}")
-            return [{"error": f"API 호출 중 오류 발생: {str(e)}"}]
\ No newline at end of file
+    return await private_tool_call(
+        get_account_state().accounts(refresh), ctx, "계정 잔고 조회 중...", as_list=True
+    )
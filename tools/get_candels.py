@@ -1,57 +1,54 @@
 from fastmcp import Context
-import httpx
 from typing import Literal, Optional
-from config import API_BASE
+from core.candles import MAX_CANDLE_COUNT
+from core.candle_store import load_candles
+from core.http import UpbitAPIError
+from core.shaping import ResponseFormat, shape
 
 async def get_candles(
     market: str,
     interval: Literal["minute1", "minute3", "minute5", "minute10", "minute15", "minute30", "minute60", "minute240", "day", "week", "month"],
     count: int = 200,
     to: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    format: ResponseFormat = "records",
     ctx: Context = None
-) -> list[dict]:
+) -> list[dict] | dict:
     """
     업비트에서 캔들스틱 데이터를 조회합니다.
     
     Args:
         market (str): 마켓 코드 (예: KRW-BTC)
         interval (str): 시간 간격 (minute1~minute240, day, week, month)
-        count (int): 캔들 개수 (최대 200)
+        count (int): 캔들 개수 (200개 초과 시 여러 페이지를 동시에 조회, 최대 50000)
+            이미 받아 둔 구간은 로컬 저장소에서 읽고 빠진 구간만 업비트에서 받아옵니다.
         to (str, optional): 마지막 캔들 시각 (형식: yyyy-MM-dd'T'HH:mm:ss'Z' 또는 yyyy-MM-dd HH:mm:ss)
+        fields (list[str], optional): 받을 필드만 선택 (예: ["candle_date_time_kst", "trade_price", "candle_acc_trade_volume"])
+        format (str): records(캔들마다 dict) 또는 columnar(필드 이름 -> 값 목록, 응답이 작음)
         
     Returns:
-        list[dict]: 캔들스틱 데이터
+        list[dict] | dict: 캔들스틱 데이터 (최신순)
     """
-    if count > 200:
-        count = 200
+    if count > MAX_CANDLE_COUNT:
+        count = MAX_CANDLE_COUNT
         if ctx:
-            ctx.warning("최대 200개의 캔들만 조회할 수 있습니다. count를 200으로 제한합니다.")
-    
-    # interval에 따라 API 엔드포인트 선택
-    if interval.startswith("minute"):
-        url = f"{API_BASE}/candles/{interval}"
-    else:
-        url = f"{API_BASE}/candles/{interval}s"
-    
-    params = {
-        'market': market,
-        'count': str(count)
-    }
-    
-    if to:
-        params['to'] = to
+            ctx.warning(f"최대 {MAX_CANDLE_COUNT}개의 캔들만 조회할 수 있습니다. count를 {MAX_CANDLE_COUNT}으로 제한합니다.")
     
     if ctx:
         ctx.info(f"{market} {interval} 캔들 데이터 조회 중...")
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(url, params=params)
-            if res.status_code != 200:
-                if ctx:
-                    ctx.error(f"업비트 API 오류: {res.status_code} - {res.text}")
-                return [{"error": f"업비트 API 오류: {res.status_code}"}]
-            return res.json()
-        except Exception as e:
-            if ctx:
-                ctx.error(f"API 호출 중 오류 발생: {str(e)}")
-            return [{"error": f"API 호출 중 오류 발생: {str(e)}"}]
\ No newline at end of file
+    try:
+        candles = await load_candles(market, interval, count, to)
+    except UpbitAPIError as e:
+        if ctx:
+            ctx.error(f"업비트 API 오류: {e.status_code} - {e.message}")
+        return [{"error": f"업비트 API 오류: {e.status_code}"}]
+    except Exception as e:
+        if ctx:
+            ctx.error(f"API 호출 중 오류 발생: {str(e)}")
+        return [{"error": f"API 호출 중 오류 발생: {str(e)}"}]
+    try:
+        return shape(candles, fields, format)
+    except ValueError as e:
+        if ctx:
+            ctx.error(str(e))
+        return [{"error": str(e)}]
@@ -1,7 +1,7 @@
 from fastmcp import Context
-import httpx
 from typing import Literal, Optional
-from config import generate_upbit_token, UPBIT_ACCESS_KEY, API_BASE
+from core.history import collect_transfers, parse_time
+from core.private_api import private_request, private_tool_call
 
 async def get_deposits_withdrawals(
     currency: Optional[str] = None,
@@ -9,53 +9,61 @@ async def get_deposits_withdrawals(
     transaction_type: Literal["deposit", "withdraw"] = "deposit",
     page: int = 1,
     limit: int = 100,
+    states: Optional[list[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    all_pages: bool = False,
+    max_rows: int = 100,
     ctx: Context = None
-) -> list[dict]:
+) -> list[dict] | dict:
     """
     업비트 계정의 입출금 내역을 조회합니다.
-    
+
+    기본은 한 페이지만 반환합니다. all_pages=True이거나 start/end를 지정하면 전체 이력을
+    여러 페이지 동시 요청으로 모두 받아 통화/상태별 집계와 최근 항목 max_rows개를 반환합니다.
+
     Args:
         currency (str, optional): 통화 코드 (예: BTC)
         txid (str, optional): 거래 ID
         transaction_type (str): 거래 유형 - deposit(입금) 또는 withdraw(출금)
         page (int): 페이지 번호
         limit (int): 페이지당 결과 개수 (최대 100)
-        
+        states (list[str], optional): 상태 조건 (예: ["DONE"], 입금 ACCEPTED/REJECTED, 출금 CANCELED 등)
+        start (str, optional): 기간 시작 (예: 2024-01-01, 시간대 없으면 KST)
+        end (str, optional): 기간 끝 (날짜만 주면 그날 끝까지 포함)
+        all_pages (bool): 전체 이력을 모아 집계할지 여부
+        max_rows (int): 전체 조회 시 결과에 포함할 최근 항목 수
+
     Returns:
-        list[dict]: 입출금 내역
+        list[dict] | dict: 입출금 내역 (전체 조회 시 total, by_state, by_currency, transfers 등의 집계,
+            pages_exhausted=True면 페이지 한도에 닿아 더 오래된 항목이 빠졌을 수 있음)
     """
-    if not UPBIT_ACCESS_KEY:
-        if ctx:
-            ctx.error("API 키가 설정되지 않았습니다. .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.")
-        return [{"error": "API 키가 설정되지 않았습니다."}]
-    
-    url = f"{API_BASE}/{transaction_type}s"
     query_params = {
-        'page': str(page),
-        'limit': str(limit)
+        'currency': currency,
+        'txid': txid,
+        'page': page,
+        'limit': limit
     }
-    
-    if currency:
-        query_params['currency'] = currency
-    
-    if txid:
-        query_params['txid'] = txid
-    
-    headers = {
-        "Authorization": f"Bearer {generate_upbit_token(query_params)}"
-    }
-    
-    if ctx:
-        ctx.info(f"{transaction_type} 내역 조회 중")
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(url, params=query_params, headers=headers)
-            if res.status_code != 200:
-                if ctx:
-                    ctx.error(f"업비트 API 오류: {res.status_code} - {res.text}")
-                return [{"error": f"업비트 API 오류: {res.status_code}"}]
-            return res.json()
-        except Exception as e:
-            if ctx:
-                ctx.error(f"API 호출 중 오류 발생: {str(e)}")
-            return [{"error": f"API 호출 중 오류 발생: {str(e)}"}]
\ No newline at end of file
+    # 상태 하나는 서버에서 거르고, 여러 개면 받아서 거름
+    if states and len(states) == 1:
+        query_params['state'] = states[0]
+    if not (all_pages or start or end):
+        result = await private_tool_call(
+            private_request("GET", f"/{transaction_type}s", query_params), ctx, f"{transaction_type} 내역 조회 중",
+            as_list=True
+        )
+        if states and len(states) > 1 and not (result and "error" in result[0]):
+            result = [item for item in result if item.get("state") in states]
+        return result
+
+    try:
+        period = parse_time(start), parse_time(end, end_of_day=True)
+    except ValueError:
+        if ctx:
+            ctx.error(f"잘못된 날짜 형식: start={start}, end={end}")
+        return {"error": "start/end는 2024-01-31 또는 ISO 8601 형식이어야 합니다."}
+    del query_params['page'], query_params['limit']
+    return await private_tool_call(
+        collect_transfers(transaction_type, query_params, *period, states=states, max_rows=max_rows), ctx,
+        f"{transaction_type} 전체 이력 조회 중"
+    )
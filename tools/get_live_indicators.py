@@ -0,0 +1,46 @@
+from fastmcp import Context
+from typing import Literal
+from core.http import UpbitAPIError
+from core.live_indicators import get_indicator_registry
+
+
+async def get_live_indicators(
+    market: str,
+    interval: Literal["minute1", "minute3", "minute5", "minute15", "minute30", "minute60", "minute240", "day"] = "minute60",
+    include_current: bool = True,
+    ctx: Context = None
+) -> dict:
+    """
+    계속 지켜보는 마켓의 기술적 지표를 증분 방식으로 갱신해 반환합니다.
+
+    처음 호출할 때 최근 캔들로 지표 상태를 만들고, 이후에는 새로 마감된 캔들과
+    진행 중인 캔들만 반영하므로 캔들 전체를 다시 계산하지 않습니다.
+    (SMA 5/10/20/50, EMA 12/26, RSI, MACD, 볼린저 밴드, 스토캐스틱, ATR, OBV)
+
+    Args:
+        market (str): 마켓 코드 (예: KRW-BTC)
+        interval (str): 캔들 간격
+        include_current (bool): 진행 중인 캔들까지 반영한 값을 반환할지 여부
+
+    Returns:
+        dict: 지표 값과 기준 캔들 시각(time), 진행 중 캔들 포함 여부(in_progress)
+    """
+    registry = get_indicator_registry()
+    try:
+        values = await registry.refresh(market, interval, include_current)
+    except UpbitAPIError as e:
+        if ctx:
+            ctx.error(f"업비트 API 오류: {e.status_code} - {e.message}")
+        return {"error": f"업비트 API 오류: {e.status_code}"}
+    except Exception as e:
+        if ctx:
+            ctx.error(f"지표 갱신 중 오류 발생: {str(e)}")
+        return {"error": f"지표 갱신 중 오류 발생: {str(e)}"}
+
+    state = registry.get(market, interval)
+    return {
+        "market": market,
+        "interval": interval,
+        "closed_candles": state.closed_count,
+        "indicators": values,
+    }
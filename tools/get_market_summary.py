@@ -1,62 +1,90 @@
+import asyncio
 from fastmcp import Context
 import httpx
-from config import API_BASE, MAJOR_COINS, create_error_response
+from typing import Literal, Optional
+from config import API_BASE, MAJOR_COINS, TICKER_FETCH_CONCURRENCY, create_error_response
+from core.decode import decode
+from core.http import get_client
+from core.market_cache import get_market_cache
+from core.ranking import rank_tickers
+from core.shaping import ResponseFormat, shape
 
-async def get_market_summary(ctx: Context = None) -> dict:
+async def get_market_summary(
+    quote: Literal["KRW", "BTC", "USDT"] = "KRW",
+    k: int = 5,
+    rankings: list[Literal["volume", "gainers", "losers", "volatility"]] = ["volume", "gainers", "losers"],
+    fields: Optional[list[str]] = None,
+    format: ResponseFormat = "records",
+    ctx: Context = None
+) -> dict:
     """
     주요 암호화폐 시장의 요약 정보를 제공합니다.
-    
+
+    Args:
+        quote (str): 기준 통화 마켓 - KRW, BTC, USDT
+        k (int): 랭킹별 코인 개수
+        rankings (list[str]): 계산할 랭킹 - volume(거래대금), gainers(상승률), losers(하락률), volatility(변동폭)
+        fields (list[str], optional): 코인별로 받을 티커 필드만 선택
+            (예: ["market", "trade_price", "signed_change_rate", "acc_trade_price_24h"])
+        format (str): records(코인마다 dict) 또는 columnar(목록마다 필드 이름 -> 값 목록, 응답이 작음)
+
     Returns:
         dict: 주요 암호화폐 시장 요약 정보
     """
-    async with httpx.AsyncClient() as client:
-        # 마켓 정보 가져오기
-        markets_res = await client.get(f"{API_BASE}/market/all")
-        if markets_res.status_code != 200:
-            if ctx:
-                ctx.error(f"마켓 정보 조회 실패: {markets_res.status_code}")
-            return create_error_response("마켓 정보 조회에 실패했습니다.", markets_res.status_code)
-        
-        all_markets = markets_res.json()
-        krw_markets = [market for market in all_markets if market["market"].startswith("KRW-")]
-        
-        # 티커 정보 가져오기 (50개씩 나누어 요청)
-        all_tickers = []
-        chunk_size = 50
-        
-        for i in range(0, len(krw_markets), chunk_size):
-            chunk = krw_markets[i:i+chunk_size]
-            markets_param = ",".join([market["market"] for market in chunk])
-            
+    k = max(1, k)
+    client = get_client()
+    # 마켓 정보 가져오기 (캐시)
+    try:
+        all_markets = await get_market_cache().get()
+    except httpx.HTTPStatusError as e:
+        if ctx:
+            ctx.error(f"마켓 정보 조회 실패: {e.response.status_code}")
+        return create_error_response("마켓 정보 조회에 실패했습니다.", e.response.status_code)
+
+    quote_markets = [market for market in all_markets if market["market"].startswith(f"{quote}-")]
+
+    # 티커 정보 가져오기 (50개씩 나누어 동시에 요청)
+    chunk_size = 50
+    semaphore = asyncio.Semaphore(TICKER_FETCH_CONCURRENCY)
+
+    async def fetch_chunk(chunk: list[dict]) -> list[dict]:
+        markets_param = ",".join([market["market"] for market in chunk])
+        async with semaphore:
             ticker_res = await client.get(f"{API_BASE}/ticker", params={"markets": markets_param})
-            if ticker_res.status_code != 200:
-                if ctx:
-                    ctx.warning(f"일부 티커 정보 조회 실패: {ticker_res.status_code}")
-                continue
-                
-            all_tickers.extend(ticker_res.json())
-        
-        # 주요 코인 정보
-        major_coin_info = [ticker for ticker in all_tickers if ticker["market"] in MAJOR_COINS]
-        
-        # 상위 거래량 코인 (주요 코인 제외)
-        volume_sorted = sorted([t for t in all_tickers if t["market"] not in MAJOR_COINS], 
-                              key=lambda x: x["acc_trade_price_24h"], 
-                              reverse=True)
-        top_volume_coins = volume_sorted[:5]
-        
-        # 상위 상승률 코인
-        price_change_sorted = sorted(all_tickers, key=lambda x: x["signed_change_rate"], reverse=True)
-        top_gainers = price_change_sorted[:5]
-        
-        # 상위 하락률 코인
-        top_losers = price_change_sorted[-5:]
-        
-        return {
-            "timestamp": all_tickers[0]["timestamp"] if all_tickers else None,
-            "major_coins": major_coin_info,
-            "top_volume": top_volume_coins,
-            "top_gainers": top_gainers,
-            "top_losers": top_losers,
-            "krw_market_count": len(krw_markets)
-        }
\ No newline at end of file
+        if ticker_res.status_code != 200:
+            if ctx:
+                ctx.warning(f"일부 티커 정보 조회 실패: {ticker_res.status_code}")
+            return []
+        return decode(ticker_res)
+
+    chunks = await asyncio.gather(*[
+        fetch_chunk(quote_markets[i:i+chunk_size])
+        for i in range(0, len(quote_markets), chunk_size)
+    ])
+    all_tickers = [ticker for chunk in chunks for ticker in chunk]
+
+    # 주요 코인 정보
+    major_markets = {f"{quote}-{code.split('-')[1]}" for code in MAJOR_COINS}
+    major_coin_info = [ticker for ticker in all_tickers if ticker["market"] in major_markets]
+
+    # 랭킹 계산 (거래대금 랭킹은 주요 코인 제외)
+    try:
+        ranked = rank_tickers(all_tickers, rankings, k=k, exclude={"volume": major_markets})
+    except ValueError as e:
+        if ctx:
+            ctx.error(str(e))
+        return create_error_response(str(e))
+
+    try:
+        sections = {"major_coins": shape(major_coin_info, fields, format)}
+        sections.update({f"top_{name}": shape(tickers, fields, format) for name, tickers in ranked.items()})
+    except ValueError as e:
+        if ctx:
+            ctx.error(str(e))
+        return create_error_response(str(e))
+
+    return {
+        "timestamp": all_tickers[0]["timestamp"] if all_tickers else None,
+        **sections,
+        f"{quote.lower()}_market_count": len(quote_markets)
+    }
@@ -1,9 +1,24 @@
-import httpx
-from config import API_BASE
+from core.coalesce import orderbook_coalescer
+from core.market_stream import get_market_stream
 
 async def get_orderbook(symbol: str) -> dict:
     """Get orderbook snapshot for a given symbol"""
-    url = f"{API_BASE}/orderbook"
-    async with httpx.AsyncClient() as client:
-        res = await client.get(url, params={"markets": symbol})
-        return res.json()[0]
\ No newline at end of file
+    # 웹소켓으로 구독 중인 마켓은 로컬 상태에서 바로 응답
+    snapshot = get_market_stream().orderbook(symbol)
+    if snapshot is not None:
+        return snapshot
+    return await orderbook_coalescer.get(symbol)
+
+
+async def get_orderbooks(symbols: list[str]) -> list[dict]:
+    """Get orderbook snapshots for several symbols in one batched request"""
+    stream = get_market_stream()
+    snapshots = {symbol: stream.orderbook(symbol) for symbol in symbols}
+    missing = [symbol for symbol, snapshot in snapshots.items() if snapshot is None]
+    results = dict(zip(missing, await orderbook_coalescer.get_many(missing)))
+    return [
+        snapshots[symbol] if snapshots[symbol] is not None
+        else {"market": symbol, "error": str(results[symbol])} if isinstance(results[symbol], Exception)
+        else results[symbol]
+        for symbol in symbols
+    ]
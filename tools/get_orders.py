@@ -1,57 +1,72 @@
 from fastmcp import Context
-import httpx
 from typing import Optional, Literal
-from config import generate_upbit_token, UPBIT_ACCESS_KEY, API_BASE
+from core.account_state import get_account_state
+from core.history import collect_orders, parse_time
+from core.private_api import private_request, private_tool_call
 
 async def get_orders(
     market: Optional[str] = None,
     state: Literal["wait", "done", "cancel"] = "wait",
     page: int = 1,
     limit: int = 100,
+    states: Optional[list[Literal["wait", "watch", "done", "cancel"]]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    all_pages: bool = False,
+    max_rows: int = 100,
     ctx: Context = None
-) -> list[dict]:
+) -> list[dict] | dict:
     """
     업비트에서 주문 내역을 조회합니다.
-    
+
+    기본은 한 페이지만 반환합니다. all_pages=True이거나 start/end를 지정하면 전체 이력을
+    여러 페이지 동시 요청으로 모두 받아 마켓/상태별 집계와 최근 주문 max_rows개를 반환합니다.
+
     Args:
         market (str, optional): 마켓 코드 (예: KRW-BTC)
         state (str): 주문 상태 - wait(대기), done(완료), cancel(취소)
         page (int): 페이지 번호
         limit (int): 페이지당 주문 개수 (최대 100)
-        
+        states (list[str], optional): 여러 주문 상태 (지정하면 state 대신 사용)
+        start (str, optional): 기간 시작 (예: 2024-01-01 또는 2024-01-01T09:00:00+09:00, 시간대 없으면 KST)
+        end (str, optional): 기간 끝 (날짜만 주면 그날 끝까지 포함)
+        all_pages (bool): 전체 이력을 모아 집계할지 여부
+        max_rows (int): 전체 조회 시 결과에 포함할 최근 주문 수
+
     Returns:
-        list[dict]: 주문 내역
+        list[dict] | dict: 주문 내역 (전체 조회 시 total, by_state, by_market, orders 등의 집계,
+            pages_exhausted=True면 페이지 한도에 닿아 더 오래된 주문이 빠졌을 수 있음)
     """
-    if not UPBIT_ACCESS_KEY:
-        if ctx:
-            ctx.error("API 키가 설정되지 않았습니다. .env 파일에 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정해주세요.")
-        return [{"error": "API 키가 설정되지 않았습니다."}]
-    
-    url = f"{API_BASE}/orders"
     query_params = {
-        'state': state,
-        'page': str(page),
-        'limit': str(limit)
+        'market': market,
+        'page': page,
+        'limit': limit
     }
-    
-    if market:
-        query_params['market'] = market
-    
-    headers = {
-        "Authorization": f"Bearer {generate_upbit_token(query_params)}"
-    }
-    
-    if ctx:
-        ctx.info(f"주문 내역 조회 중: 상태={state}")
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(url, params=query_params, headers=headers)
-            if res.status_code != 200:
-                if ctx:
-                    ctx.error(f"업비트 API 오류: {res.status_code} - {res.text}")
-                return [{"error": f"업비트 API 오류: {res.status_code}"}]
-            return res.json()
-        except Exception as e:
-            if ctx:
-                ctx.error(f"API 호출 중 오류 발생: {str(e)}")
-            return [{"error": f"API 호출 중 오류 발생: {str(e)}"}]
\ No newline at end of file
+    if states:
+        query_params['states[]'] = list(states)
+    else:
+        query_params['state'] = state
+    if not (all_pages or start or end):
+        if state == "wait" and not states:
+            # 대기 주문은 주문 생성/취소 때 함께 갱신되는 캐시에서 페이지를 잘라 반환
+            result = await private_tool_call(
+                get_account_state().open_orders(market), ctx, f"주문 내역 조회 중: 상태={state}", as_list=True
+            )
+            if result and "error" in result[0]:
+                return result
+            return result[(page - 1) * limit: page * limit]
+        return await private_tool_call(
+            private_request("GET", "/orders", query_params), ctx, f"주문 내역 조회 중: 상태={state}", as_list=True
+        )
+
+    try:
+        period = parse_time(start), parse_time(end, end_of_day=True)
+    except ValueError:
+        if ctx:
+            ctx.error(f"잘못된 날짜 형식: start={start}, end={end}")
+        return {"error": "start/end는 2024-01-31 또는 ISO 8601 형식이어야 합니다."}
+    del query_params['page'], query_params['limit']
+    return await private_tool_call(
+        collect_orders(query_params, *period, max_rows=max_rows), ctx,
+        f"주문 전체 이력 조회 중: 상태={','.join(states or [state])}"
+    )
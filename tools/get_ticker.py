@@ -1,9 +1,43 @@
-import httpx
-from config import API_BASE
-
-async def get_ticker(symbol: str) -> dict:
-    """Get the latest ticker data from Upbit"""
-    url = f"{API_BASE}/ticker"
-    async with httpx.AsyncClient() as client:
-        res = await client.get(url, params={"markets": symbol})
-        return res.json()[0]
\ No newline at end of file
+from typing import Optional
+from core.coalesce import ticker_coalescer
+from core.market_stream import get_market_stream
+from core.shaping import ResponseFormat, project, shape
+
+async def get_ticker(symbol: str, fields: Optional[list[str]] = None) -> dict:
+    """
+    Get the latest ticker data from Upbit
+
+    Args:
+        symbol (str): 마켓 코드 (예: KRW-BTC)
+        fields (list[str], optional): 받을 필드만 선택 (예: ["trade_price", "signed_change_rate"])
+    """
+    # 웹소켓으로 구독 중인 마켓은 로컬 상태에서 바로 응답
+    snapshot = get_market_stream().ticker(symbol)
+    if snapshot is None:
+        snapshot = await ticker_coalescer.get(symbol)
+    return project(snapshot, fields)
+
+
+async def get_tickers(
+    symbols: list[str],
+    fields: Optional[list[str]] = None,
+    format: ResponseFormat = "records"
+) -> list[dict] | dict:
+    """
+    Get the latest ticker data for several symbols in one batched request
+
+    Args:
+        symbols (list[str]): 마켓 코드 목록
+        fields (list[str], optional): 받을 필드만 선택 (예: ["market", "trade_price"])
+        format (str): records(마켓마다 dict) 또는 columnar(필드 이름 -> 값 목록, 응답이 작음)
+    """
+    stream = get_market_stream()
+    snapshots = {symbol: stream.ticker(symbol) for symbol in symbols}
+    missing = [symbol for symbol, snapshot in snapshots.items() if snapshot is None]
+    results = dict(zip(missing, await ticker_coalescer.get_many(missing)))
+    return shape([
+        snapshots[symbol] if snapshots[symbol] is not None
+        else {"market": symbol, "error": str(results[symbol])} if isinstance(results[symbol], Exception)
+        else results[symbol]
+        for symbol in symbols
+    ], fields, format)
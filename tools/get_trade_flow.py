@@ -0,0 +1,33 @@
+from fastmcp import Context
+from core.http import UpbitAPIError
+from core.trade_tape import get_trade_tapes
+
+
+async def get_trade_flow(
+    market: str,
+    ctx: Context = None
+) -> dict:
+    """
+    마켓의 최근 체결 흐름을 요약합니다 (원본 체결 대신 집계 값만 반환).
+
+    처음 호출할 때 최근 체결을 커서로 이어 받아 체결 테이프를 채우고, 이후에는 새 체결만 받아 반영합니다.
+    웹소켓으로 체결을 구독 중인 마켓은 REST 호출 없이 수신한 체결로 갱신합니다.
+
+    Args:
+        market (str): 마켓 코드 (예: KRW-BTC)
+
+    Returns:
+        dict: 마지막 체결가/시각, 보관 중인 체결 수, 1분/5분/15분 구간별 VWAP, 매수/매도 체결량과
+            불균형(imbalance), 분당 체결 수(windows), 15분 구간의 큰 체결(largest_trades)
+    """
+    try:
+        tape = await get_trade_tapes().refresh(market)
+    except UpbitAPIError as e:
+        if ctx:
+            ctx.error(f"업비트 API 오류: {e.status_code} - {e.message}")
+        return {"error": f"업비트 API 오류: {e.status_code}"}
+    except Exception as e:
+        if ctx:
+            ctx.error(f"체결 조회 중 오류 발생: {str(e)}")
+        return {"error": f"체결 조회 중 오류 발생: {str(e)}"}
+    return tape.summary()
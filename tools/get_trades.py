@@ -1,9 +1,47 @@
-import httpx
+from typing import Optional
 from config import API_BASE
+from core.decode import decode
+from core.http import get_client
+from core.market_stream import get_market_stream
+from core.shaping import ResponseFormat, shape
 
-async def get_trades(symbol: str) -> list[dict]:
-    """Get recent trade ticks for a symbol"""
+async def get_trades(
+    symbol: str,
+    count: Optional[int] = None,
+    cursor: Optional[str] = None,
+    days_ago: Optional[int] = None,
+    fields: Optional[list[str]] = None,
+    format: ResponseFormat = "records"
+) -> list[dict] | dict:
+    """
+    Get recent trade ticks for a symbol
+
+    Args:
+        symbol (str): 마켓 코드 (예: KRW-BTC)
+        count (int, optional): 체결 개수 (최대 500)
+        cursor (str, optional): 이 sequential_id 이전 체결부터 조회 (이전 응답의 마지막 sequential_id)
+        days_ago (int, optional): 최근 며칠 전 체결을 조회할지 (1~7)
+        fields (list[str], optional): 받을 필드만 선택 (예: ["timestamp", "trade_price", "trade_volume", "ask_bid"])
+        format (str): records(체결마다 dict) 또는 columnar(필드 이름 -> 값 목록, 응답이 작음)
+
+    Returns:
+        list[dict] | dict: 최신순 체결 목록 (흐름 요약은 get_trade_flow 도구 사용)
+    """
+    if cursor is None and days_ago is None:
+        # 웹소켓으로 구독 중인 마켓은 수신한 체결 목록에서 바로 응답
+        trades = get_market_stream().recent_trades(symbol)
+        if trades is not None and (count is None or count <= len(trades)):
+            return shape(trades if count is None else trades[:count], fields, format)
+    params = {"market": symbol}
+    if count is not None:
+        params["count"] = str(count)
+    if cursor is not None:
+        params["cursor"] = cursor
+    if days_ago is not None:
+        params["daysAgo"] = str(days_ago)
     url = f"{API_BASE}/trades/ticks"
-    async with httpx.AsyncClient() as client:
-        res = await client.get(url, params={"market": symbol})
-        return res.json()
\ No newline at end of file
+    client = get_client()
+    res = await client.get(url, params=params)
+    trades = decode(res)
+    # 오류 응답({"error": ...})은 그대로 전달
+    return shape(trades, fields, format) if isinstance(trades, list) else trades
@@ -0,0 +1,22 @@
+from fastmcp import Context
+from core.portfolio import DEFAULT_MIN_VALUE, load_valuation
+from core.private_api import private_tool_call
+
+async def portfolio_valuation(
+    min_value: float = DEFAULT_MIN_VALUE,
+    ctx: Context = None
+) -> dict:
+    """
+    보유 자산 전체를 현재가로 평가합니다 (잔고 조회 + 필요한 티커를 한 번에 조회).
+
+    자산별 평가금액, 평가손익(평균 매수가 기준), 포트폴리오 비중, 24시간 변동과 함께
+    총 평가금액, 현금 비중, KRW/BTC 마켓 노출, 집중도를 반환합니다.
+    KRW 마켓이 없는 자산은 BTC 마켓 가격에 KRW-BTC 가격을 곱해 평가합니다.
+
+    Args:
+        min_value (float): 이 금액(KRW) 미만 보유분은 목록 대신 dust로 합쳐서 보고
+
+    Returns:
+        dict: total_value_krw, cash_krw, unrealized_pnl_krw, exposure, concentration, holdings 등
+    """
+    return await private_tool_call(load_valuation(min_value=min_value), ctx, "포트폴리오 평가 중...")
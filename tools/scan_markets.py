@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timezone
+from fastmcp import Context
+import httpx
+import numpy as np
+from typing import Literal, Optional
+from config import CANDLE_FETCH_CONCURRENCY, create_error_response
+from core.candle_store import load_columns
+from core.candles import current_candle_start, format_to
+from core.market_cache import get_market_cache
+from core.executor import AnalyticsTimeoutError, run_analytics
+from core.scan import RESULT_FIELDS, SIGNALS, SORT_KEYS, stack_columns
+
+# MACD 시그널 선까지 계산하는 데 필요한 최소 캔들 수
+MIN_SCAN_CANDLES = 35
+
+
+def _value(x) -> float | None:
+    x = float(x)
+    return None if np.isnan(x) else x
+
+
+async def scan_markets(
+    markets: Optional[list[str]] = None,
+    quote: Literal["KRW", "BTC", "USDT"] = "KRW",
+    interval: Literal["minute15", "minute30", "minute60", "minute240", "day", "week"] = "minute60",
+    signals: list[str] = ["rsi_oversold", "macd_cross_up"],
+    match: Literal["all", "any"] = "all",
+    cross_within: int = 3,
+    sort_by: Literal["rsi", "macd_hist", "change", "volume_ratio", "bb_position"] = "rsi",
+    limit: int = 20,
+    count: int = 200,
+    include_current: bool = False,
+    ctx: Context = None
+) -> dict:
+    """
+    여러 마켓의 기술적 지표를 한 번에 계산해 조건에 맞는 마켓을 찾습니다.
+
+    마켓별 캔들을 동시에 조회한 뒤 (마켓 x 시간) 행렬로 묶어 RSI, MACD, 볼린저 밴드,
+    스토캐스틱 등을 한 번에 계산합니다. 캔들은 로컬 저장소를 거치므로 반복 호출 시에는
+    새로 마감된 캔들만 받아옵니다.
+
+    Args:
+        markets (list[str], optional): 검사할 마켓 코드 목록 (기본: quote 마켓 전체)
+        quote (str): markets를 지정하지 않았을 때 사용할 기준 통화 마켓 - KRW, BTC, USDT
+        interval (str): 캔들 간격
+        signals (list[str]): 확인할 신호 목록 - rsi_oversold(RSI<30), rsi_overbought(RSI>70),
+            macd_cross_up, macd_cross_down, macd_above_signal, bb_lower_break, bb_upper_break,
+            ma_golden_cross, ma_dead_cross, ma_uptrend(SMA5>SMA20), stoch_oversold, stoch_overbought,
+            volume_spike(최근 거래량이 평균의 2배 초과)
+        match (str): all(모든 신호 충족) 또는 any(하나 이상 충족)
+        cross_within (int): 교차 신호를 인정하는 최근 캔들 수
+        sort_by (str): 정렬 기준 - rsi(낮은 순), macd_hist, change(최근 캔들 변동률), volume_ratio, bb_position(낮은 순)
+        limit (int): 반환할 최대 마켓 수
+        count (int): 마켓별 사용할 캔들 수 (최소 35)
+        include_current (bool): 진행 중인 캔들도 포함할지 여부 (기본: 마감된 캔들만 사용)
+
+    Returns:
+        dict: 조건에 맞는 마켓 목록 (정렬 순서), 검사한 마켓 수, 제외된 마켓 등
+    """
+    unknown = [name for name in signals if name not in SIGNALS]
+    if unknown:
+        if ctx:
+            ctx.error(f"지원하지 않는 신호입니다: {', '.join(unknown)}")
+        return create_error_response(f"지원하지 않는 신호입니다: {', '.join(unknown)}")
+    if sort_by not in SORT_KEYS:
+        if ctx:
+            ctx.error(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+        return create_error_response(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+    count = max(count, MIN_SCAN_CANDLES)
+
+    if not markets:
+        try:
+            all_markets = await get_market_cache().get()
+        except httpx.HTTPStatusError as e:
+            if ctx:
+                ctx.error(f"마켓 정보 조회 실패: {e.response.status_code}")
+            return create_error_response("마켓 정보 조회에 실패했습니다.", e.response.status_code)
+        markets = [item["market"] for item in all_markets if item["market"].startswith(f"{quote}-")]
+
+    # 모든 마켓이 같은 시점까지의 캔들을 쓰도록 기준 시각을 맞춘다
+    now = datetime.now(timezone.utc)
+    to = None if include_current else format_to(current_candle_start(interval, now))
+
+    if ctx:
+        ctx.info(f"{len(markets)}개 마켓 {interval} 캔들 조회 중...")
+    semaphore = asyncio.Semaphore(CANDLE_FETCH_CONCURRENCY)
+
+    async def fetch(market: str) -> dict:
+        async with semaphore:
+            return await load_columns(market, interval, count, to)
+
+    results = await asyncio.gather(*[fetch(market) for market in markets], return_exceptions=True)
+
+    scanned, columns, skipped = [], [], []
+    for market, result in zip(markets, results):
+        if isinstance(result, Exception):
+            skipped.append({"market": market, "reason": f"캔들 조회 실패: {str(result)}"})
+        elif len(result["trade_price"]) < count:
+            skipped.append({"market": market, "reason": f"캔들 부족 ({len(result['trade_price'])}/{count})"})
+        else:
+            scanned.append(market)
+            columns.append(result)
+
+    if not scanned:
+        return {"interval": interval, "scanned": 0, "matched": 0, "results": [], "skipped": skipped}
+
+    try:
+        found = await run_analytics(
+            "scan_task", stack_columns(columns, count),
+            signals=list(signals), match=match, cross_within=cross_within, sort_by=sort_by, limit=max(1, limit),
+        )
+    except AnalyticsTimeoutError as e:
+        if ctx:
+            ctx.error(str(e))
+        return {"error": str(e)}
+
+    results = []
+    for i, row in enumerate(found["rows"]):
+        values = {field: _value(found["values"][field][i]) for field in RESULT_FIELDS}
+        results.append({
+            "market": scanned[row],
+            "close": values.pop("trade_price"),
+            **values,
+            "signals": found["signals"][i],
+        })
+
+    return {
+        "interval": interval,
+        "as_of": to,
+        "scanned": len(scanned),
+        "matched": found["matched"],
+        "results": results,
+        "skipped": skipped,
+    }
@@ -0,0 +1,53 @@
+from fastmcp import Context
+from typing import Literal
+from core.market_stream import get_market_stream, websockets_available
+
+StreamType = Literal["ticker", "orderbook", "trade"]
+
+async def subscribe_market_data(
+    symbols: list[str],
+    types: list[StreamType] = ["ticker", "orderbook", "trade"],
+    ctx: Context = None
+) -> dict:
+    """
+    업비트 웹소켓 실시간 시세를 구독합니다.
+
+    구독한 마켓은 get_ticker, get_orderbook, get_trades가 REST 호출 없이 로컬 상태에서 응답합니다.
+
+    Args:
+        symbols (list[str]): 마켓 코드 목록 (예: ["KRW-BTC", "KRW-ETH"])
+        types (list[str]): 구독할 스트림 - ticker(현재가), orderbook(호가), trade(체결)
+
+    Returns:
+        dict: 현재 구독 상태
+    """
+    if not websockets_available():
+        if ctx:
+            ctx.error("websockets 패키지가 설치되지 않았습니다. pip install websockets")
+        return {"error": "websockets 패키지가 설치되지 않았습니다."}
+
+    stream = get_market_stream()
+    await stream.subscribe(symbols, tuple(types))
+    if ctx:
+        ctx.info(f"실시간 시세 구독: {', '.join(symbols)} ({', '.join(types)})")
+    return stream.stats()
+
+
+async def unsubscribe_market_data(
+    symbols: list[str],
+    types: list[StreamType] = ["ticker", "orderbook", "trade"],
+    ctx: Context = None
+) -> dict:
+    """
+    업비트 웹소켓 실시간 시세 구독을 해제합니다.
+
+    Args:
+        symbols (list[str]): 마켓 코드 목록
+        types (list[str]): 해제할 스트림 - ticker, orderbook, trade
+
+    Returns:
+        dict: 현재 구독 상태
+    """
+    stream = get_market_stream()
+    await stream.unsubscribe(symbols, tuple(types))
+    return stream.stats()